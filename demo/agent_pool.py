@@ -0,0 +1,161 @@
+"""Reusable agent instances shared across candidates and screens.
+
+Building an agent re-reads its catalog entry, constructs a fresh
+``OpenAIResponses`` model (and, on first use, a new OpenAI client with its
+own HTTP connection pool) and instantiates its tools. ``AgentPool`` keeps
+idle agents keyed by kind and configuration and hands them out one caller at
+a time, because an Agno ``Agent`` keeps per-run session state on the
+instance and cannot run two prompts concurrently. Every pooled model also
+shares one process-wide ``httpx.Client`` so sync calls reuse connections.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Optional
+
+import httpx
+from agno.agent import Agent
+
+from demo.settings import settings
+
+__all__ = [
+    "AgentPool",
+    "get_agent_pool",
+    "reset_agent_pool",
+    "shared_http_client",
+]
+
+PoolKey = tuple[str, tuple[tuple[str, Hashable], ...]]
+
+
+@dataclass
+class _PooledAgent:
+    agent: Agent
+    # Event loop the agent last ran on; its async OpenAI client is bound to it.
+    loop: Optional[weakref.ref[asyncio.AbstractEventLoop]] = field(default=None)
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class AgentPool:
+    """Thread-safe pool of idle agents keyed by kind and configuration.
+
+    Args:
+        max_idle_per_key: Idle agents kept per key; extra agents released
+            after a burst of concurrent calls are dropped.
+    """
+
+    def __init__(self, max_idle_per_key: int) -> None:
+        self.max_idle_per_key = max_idle_per_key
+        self._lock = threading.Lock()
+        self._idle: dict[PoolKey, list[_PooledAgent]] = {}
+        self.created = 0
+        self.reused = 0
+
+    @staticmethod
+    def _key(kind: str, config: dict[str, Hashable]) -> PoolKey:
+        return kind, tuple(sorted(config.items()))
+
+    @contextmanager
+    def lease(
+        self,
+        kind: str,
+        factory: Callable[..., Agent],
+        **config: Hashable,
+    ) -> Iterator[Agent]:
+        """Borrow an agent of ``kind`` built by ``factory(**config)``.
+
+        The agent is returned to the pool when the block exits, including on
+        error, so a failed call never leaks an instance.
+        """
+
+        key = self._key(kind, config)
+        with self._lock:
+            idle = self._idle.get(key)
+            entry = idle.pop() if idle else None
+            if entry is None:
+                self.created += 1
+            else:
+                self.reused += 1
+        if entry is None:
+            entry = _PooledAgent(factory(**config))
+
+        loop = _running_loop()
+        if loop is not None:
+            model = entry.agent.model
+            if (
+                entry.loop is not None
+                and entry.loop() is not loop
+                and model is not None
+                and hasattr(model, "async_client")
+            ):
+                # httpx.AsyncClient connections cannot move between loops.
+                model.async_client = None
+            entry.loop = weakref.ref(loop)
+
+        try:
+            yield entry.agent
+        finally:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.max_idle_per_key:
+                    idle.append(entry)
+
+    def stats(self) -> dict[str, Any]:
+        """Creation/reuse counters and idle agents per kind."""
+
+        with self._lock:
+            idle: dict[str, int] = {}
+            for (kind, _), entries in self._idle.items():
+                idle[kind] = idle.get(kind, 0) + len(entries)
+            return {"created": self.created, "reused": self.reused, "idle": idle}
+
+
+_pool_lock = threading.Lock()
+_pool: Optional[AgentPool] = None
+_http_client: Optional[httpx.Client] = None
+
+
+def get_agent_pool() -> AgentPool:
+    """Return the process-wide agent pool."""
+
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = AgentPool(settings.openai.agent_pool_max_idle)
+        return _pool
+
+
+def shared_http_client() -> httpx.Client:
+    """Return the ``httpx.Client`` shared by every agent model in the process."""
+
+    global _http_client
+    with _pool_lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=settings.openai.http_max_connections,
+                    max_keepalive_connections=settings.openai.http_max_connections,
+                ),
+                timeout=settings.openai.timeout,
+            )
+        return _http_client
+
+
+def reset_agent_pool() -> None:
+    """Drop pooled agents (used by tests and after config changes)."""
+
+    global _pool
+    with _pool_lock:
+        _pool = None
@@ -2,29 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+from collections.abc import AsyncIterator
 from typing import Any, Final
 
 from agno.os import AgentOS
-from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Request, status
+from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from demo.airtable_async import create_async_airtable_client
 from demo.airtable_client import AirtableClient
+from demo.airtable_outbox import OutboxDrainer, create_airtable_outbox
+from demo.airtable_writer import create_airtable_writer
+from demo.concurrency import get_concurrency_controller
 from demo.agents import (
     create_assessment_agent,
     create_incremental_search_agent,
     create_research_agent,
     create_research_parser_agent,
 )
+from demo.job_queue import ScreenJobQueue
+from demo.llm_cache import get_llm_cache
 from demo.models import ScreenWebhookPayload
+from demo.pipeline import StagedScreeningPipeline
+from demo.screen_worker import ScreenJobWorker
 from demo.screening_service import (
     LogSymbols,
     ScreenValidationError,
-    process_screen_direct,
 )
 from demo.settings import settings
+from demo.triage import get_triage_stats
+from demo.usage import get_usage_recorder
 from demo.workflow import AgentOSCandidateWorkflow
 
 LOG_FORMAT: Final[str] = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
@@ -104,7 +116,12 @@ def _init_airtable_client() -> AirtableClient:
     logger.info(
         "%s Connecting AgentOS runtime to Airtable base %s", symbols.search, base_id
     )
-    return AirtableClient(api_key, base_id)
+    return AirtableClient(
+        api_key,
+        base_id,
+        writer=create_airtable_writer(),
+        outbox=create_airtable_outbox(),
+    )
 
 
 airtable_client = _init_airtable_client()
@@ -113,6 +130,14 @@ airtable_client = _init_airtable_client()
 # Create workflow runner instance (will be updated with agent_os reference after AgentOS initialization)
 candidate_workflow_runner = AgentOSCandidateWorkflow(logger)
 
+# Stage-pipelined runner shared across screens (used when SCREEN_PIPELINE_ENABLED)
+screening_pipeline = StagedScreeningPipeline(candidate_workflow_runner)
+
+# Durable queue for /screen requests; jobs survive restarts and can be drained
+# by the in-process worker below and/or separate ``python -m demo.screen_worker``
+# processes sharing the same database file.
+screen_job_queue = ScreenJobQueue()
+
 
 def _mark_screen_failed(screen_id: str, error_message: str) -> None:
     """Mark the screen as failed with an error message."""
@@ -154,10 +179,52 @@ def _server_error_response(screen_id: str, exc: Exception) -> JSONResponse:
     )
 
 
+@contextlib.asynccontextmanager
+async def _queue_worker_lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Run a queue worker and the Airtable outbox drainer on the server loop."""
+
+    stop = asyncio.Event()
+    tasks: list[asyncio.Task[None]] = []
+    # The async client's connection pool belongs to the server loop.
+    async_airtable = create_async_airtable_client(airtable_client.outbox)
+    if settings.job_queue.inprocess_worker:
+        worker = ScreenJobWorker(
+            screen_job_queue,
+            airtable_client,
+            candidate_workflow_runner,
+            pipeline=screening_pipeline,
+            async_airtable=async_airtable,
+            logger=logger,
+        )
+        tasks.append(
+            asyncio.create_task(worker.run_forever(stop), name="screen-queue-worker")
+        )
+    if airtable_client.outbox is not None:
+        drainer = OutboxDrainer(airtable_client.outbox, airtable_client)
+        tasks.append(
+            asyncio.create_task(drainer.run_forever(stop), name="airtable-outbox")
+        )
+    try:
+        yield
+    finally:
+        # Any in-flight job keeps its lease until it expires and is then
+        # resumed by the next worker, skipping candidates already written.
+        stop.set()
+        for task in tasks:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        # Write log events still buffered by the Airtable batch writer.
+        await asyncio.to_thread(airtable_client.flush)
+        if async_airtable is not None:
+            await async_airtable.aclose()
+
+
 fastapi_app = FastAPI(
     title="Talent Signal AgentOS Runtime",
     description="FastAPI + AgentOS runtime for FirstMark Talent Signal screening",
     version="1.0.0",
+    lifespan=_queue_worker_lifespan,
 )
 
 
@@ -168,6 +235,46 @@ def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@fastapi_app.get("/metrics/concurrency")
+def concurrency_metrics() -> dict[str, Any]:
+    """Current adaptive concurrency window for candidate screening."""
+
+    controller = get_concurrency_controller()
+    if controller is None:
+        return {
+            "adaptive": False,
+            "window": settings.screening.max_concurrent_candidates,
+        }
+    return {"adaptive": True, **controller.snapshot()}
+
+
+@fastapi_app.get("/metrics/triage")
+def triage_metrics() -> dict[str, Any]:
+    """Pre-screen triage verdicts and the expensive calls they avoided."""
+
+    return {
+        "enabled": settings.screening.triage_enabled,
+        **get_triage_stats().snapshot(),
+    }
+
+
+@fastapi_app.get("/metrics/usage")
+def usage_metrics() -> dict[str, Any]:
+    """Token usage, OpenAI prompt-cache hit rate and latency per model."""
+
+    return {"models": get_usage_recorder().snapshot()}
+
+
+@fastapi_app.get("/metrics/cache")
+def cache_metrics() -> dict[str, Any]:
+    """Hit/miss counters for the parser/assessment response cache."""
+
+    cache = get_llm_cache()
+    if cache is None:
+        return {"llm": {"enabled": False}}
+    return {"llm": {"enabled": True, **cache.stats()}}
+
+
 @fastapi_app.exception_handler(RequestValidationError)
 async def request_validation_exception_handler(
     request: Request, exc: RequestValidationError
@@ -194,18 +301,17 @@ async def request_validation_exception_handler(
 @fastapi_app.post("/screen", response_model=None, status_code=202)
 def screen_endpoint(
     payload: ScreenWebhookPayload,
-    background_tasks: BackgroundTasks,
     _auth: None = Depends(verify_bearer_token),
 ) -> dict[str, Any] | JSONResponse:
     """FastAPI implementation of the Airtable webhook entrypoint.
 
     Processes screening webhook with pre-assembled Airtable data.
-    Returns 202 Accepted immediately and processes workflow in background.
-    No Airtable traversal is performed - all data comes from the webhook payload.
+    Returns 202 Accepted once the screen is persisted to the job queue; queue
+    workers run the workflow. No Airtable traversal is performed - all data
+    comes from the webhook payload.
 
     Args:
         payload: ScreenWebhookPayload with pre-assembled Airtable data
-        background_tasks: FastAPI background task queue
         _auth: Bearer token validation (enforced if AGENTOS_SECURITY_KEY is set)
 
     Returns:
@@ -226,17 +332,23 @@ def screen_endpoint(
         # Extract candidates from structured payload
         candidates = payload.get_candidates()
 
-        # Schedule workflow to run in background
-        background_tasks.add_task(
-            process_screen_direct,
-            screen_id=payload.screen_id,
-            role_spec_markdown=payload.spec_markdown,
-            candidates=candidates,
-            custom_instructions=payload.custom_instructions,
-            airtable=airtable_client,
-            logger=logger,
-            symbols=SCREEN_LOG_SYMBOLS,
-            candidate_runner=candidate_workflow_runner.run_candidate_workflow,
+        job = screen_job_queue.enqueue(
+            payload.screen_id,
+            {
+                "role_spec_markdown": payload.spec_markdown,
+                "candidates": candidates,
+                "custom_instructions": payload.custom_instructions,
+                "force_refresh": payload.force_refresh,
+                "force_rerun": payload.force_rerun,
+                "role_type": payload.role_type,
+                "budget_usd": payload.budget_usd,
+            },
+        )
+        logger.info(
+            "%s Queued screen %s as job %s",
+            symbols.search,
+            payload.screen_id,
+            job.job_id,
         )
 
         # Return 202 Accepted immediately
@@ -271,6 +383,35 @@ def screen_endpoint(
         return _server_error_response(payload.screen_id, exc)
 
 
+@fastapi_app.get("/screens/{screen_id}/status", response_model=None)
+def screen_status_endpoint(
+    screen_id: str,
+    _auth: None = Depends(verify_bearer_token),
+) -> dict[str, Any] | JSONResponse:
+    """Report queue state for the most recent job of a screen.
+
+    Args:
+        screen_id: Airtable record ID for the Screen
+        _auth: Bearer token validation (enforced if AGENTOS_SECURITY_KEY is set)
+
+    Returns:
+        Job status, attempt counts, candidate progress and the final payload
+        once the job has finished. 404 if the screen was never queued.
+    """
+
+    job = screen_job_queue.latest_for_screen(screen_id)
+    if job is None:
+        return JSONResponse(
+            status_code=404,
+            content={
+                "error": "not_found",
+                "message": f"No queued job found for screen {screen_id}.",
+                "screen_id": screen_id,
+            },
+        )
+    return job.to_status()
+
+
 # Register AgentOS runtime with existing workflow + agents.
 agent_os = AgentOS(
     id="talent-signal-os",
@@ -281,7 +422,14 @@ agent_os = AgentOS(
         create_incremental_search_agent(),
         create_assessment_agent(),
     ],
-    workflows=[candidate_workflow_runner.workflow],
+    workflows=[
+        candidate_workflow_runner.workflow,
+        candidate_workflow_runner.async_workflow,
+        # AgentOS-only entry points; /screen jobs do not fan out and these
+        # runs write nothing to Airtable.
+        candidate_workflow_runner.fanout_workflow,
+        candidate_workflow_runner.async_fanout_workflow,
+    ],
     base_app=fastapi_app,
 )
 
@@ -4,22 +4,33 @@ This module defines the three core agents (Deep Research, Incremental Search, As
 and the linear screening workflow that coordinates them.
 """
 
+import asyncio
 import json
 import logging
-from datetime import datetime
-from typing import TYPE_CHECKING, Any, Optional, TypeVar
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+from uuid import uuid4
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIResponses
 from agno.tools.reasoning import ReasoningTools
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
+from demo.agent_pool import get_agent_pool, shared_http_client
+from demo.assessment_cache import assessment_cache_key, get_assessment_cache
+from demo.background_responses import BackgroundOpenAIResponses
+from demo.blob_store import RawResearch, get_research_blob_store
+from demo.llm_cache import get_llm_cache, llm_cache_key
 from demo.models import (
     AssessmentResult,
+    AssessmentTarget,
+    BatchedAssessmentResult,
     Citation,
     ExecutiveResearchResult,
+    TriageResult,
 )
 from demo.prompts import get_prompt
+from demo.rate_limit import RateLimitedOpenAIResponses
+from demo.research_cache import research_cache_key
 from demo.screening_helpers import calculate_overall_score
 from demo.settings import settings
 
@@ -37,21 +48,24 @@ if not logger.handlers:
     logger.addHandler(handler)
 logger.setLevel(logging.INFO)
 
+DEEP_RESEARCH_MODEL = "o4-mini-deep-research"
+FAST_RESEARCH_MODEL = "gpt-5"
 
-def create_research_agent(use_deep_research: bool = True) -> Agent:
+
+def create_research_agent(
+    use_deep_research: bool = True, background: Optional[bool] = None
+) -> Agent:
     """Create research agent with flexible execution mode.
 
     Args:
         use_deep_research: When ``True``, configure the agent with
-            ``o4-mini-deep-research``. Fast mode (``False``) is deferred to
-            Phase 2.
+            ``o4-mini-deep-research``. When ``False``, return the fast agent
+            (``gpt-5`` + web search with structured output).
+        background: Submit Deep Research as a polled background response
+            (defaults to ``DEEP_RESEARCH_BACKGROUND``).
 
     Returns:
-        Agent: Configured Deep Research agent instance.
-
-    Raises:
-        NotImplementedError: If ``use_deep_research`` is ``False`` during the
-            minimal v1 implementation.
+        Agent: Configured research agent instance.
 
     Example:
         >>> agent = create_research_agent()
@@ -59,29 +73,58 @@ def create_research_agent(use_deep_research: bool = True) -> Agent:
         'o4-mini-deep-research'
 
     Notes:
-        - v1 implementation only requires ``use_deep_research=True``
-        - Fast mode (gpt-5 + web_search) is future enhancement
         - Deep Research returns markdown (NOT structured output)
         - DO NOT use ``output_schema`` with Deep Research models
+        - Fast mode returns ``ExecutiveResearchResult`` directly (no parser)
     """
     if not use_deep_research:
-        raise NotImplementedError(
-            "Fast mode (gpt-5 + web_search) is Phase 2+. "
-            "v1.0-minimal only supports Deep Research mode."
-        )
+        return create_fast_research_agent()
 
     prompt = get_prompt("deep_research")
+    if background is None:
+        background = settings.openai.deep_research_background
+    model_class = (
+        BackgroundOpenAIResponses if background else RateLimitedOpenAIResponses
+    )
 
     return Agent(
         name="Deep Research Agent",
-        model=OpenAIResponses(
-            id="o4-mini-deep-research",
+        model=model_class(
+            id=DEEP_RESEARCH_MODEL,
             max_tool_calls=1,
             timeout=settings.openai.timeout,
+            http_client=shared_http_client(),
         ),
         # CRITICAL: NO output_schema - Deep Research API doesn't support structured outputs
         **prompt.as_agent_kwargs(),
-        add_datetime_to_context=True,
+        exponential_backoff=True,
+        retries=2,
+        delay_between_retries=1,
+    )
+
+
+def create_fast_research_agent(max_tool_calls: int = 5) -> Agent:
+    """Create fast research agent (gpt-5 + web search, structured output).
+
+    Args:
+        max_tool_calls: Maximum number of web search tool calls permitted.
+
+    Returns:
+        Agent: Configured Agno agent that emits ``ExecutiveResearchResult``.
+    """
+
+    prompt = get_prompt("fast_research")
+
+    return Agent(
+        name="Fast Research Agent",
+        model=RateLimitedOpenAIResponses(
+            id=FAST_RESEARCH_MODEL,
+            max_tool_calls=max_tool_calls,
+            http_client=shared_http_client(),
+        ),
+        tools=[{"type": "web_search_preview"}],
+        output_schema=ExecutiveResearchResult,
+        **prompt.as_agent_kwargs(),
         exponential_backoff=True,
         retries=2,
         delay_between_retries=1,
@@ -95,7 +138,9 @@ def create_research_parser_agent() -> Agent:
 
     return Agent(
         name="Research Parser Agent",
-        model=OpenAIResponses(id="gpt-5-mini"),
+        model=RateLimitedOpenAIResponses(
+            id="gpt-5-mini", http_client=shared_http_client()
+        ),
         output_schema=ExecutiveResearchResult,
         **prompt.as_agent_kwargs(),
         # add_history_to_context=True,
@@ -126,11 +171,14 @@ def create_incremental_search_agent(max_tool_calls: int = 2) -> Agent:
 
     return Agent(
         name="Incremental Search Agent",
-        model=OpenAIResponses(id="gpt-5", max_tool_calls=max_tool_calls),
+        model=RateLimitedOpenAIResponses(
+            id="gpt-5",
+            max_tool_calls=max_tool_calls,
+            http_client=shared_http_client(),
+        ),
         tools=[{"type": "web_search_preview"}],
         output_schema=ExecutiveResearchResult,
         **prompt.as_agent_kwargs(),
-        add_datetime_to_context=True,
         exponential_backoff=True,
         retries=1,
         delay_between_retries=1,
@@ -153,11 +201,12 @@ def create_assessment_agent() -> Agent:
 
     return Agent(
         name="Assessment Agent",
-        model=OpenAIResponses(id="gpt-5-mini"),
+        model=RateLimitedOpenAIResponses(
+            id="gpt-5-mini", http_client=shared_http_client()
+        ),
         tools=[ReasoningTools(add_instructions=True)],
         output_schema=AssessmentResult,
         **prompt.as_agent_kwargs(),
-        add_datetime_to_context=True,
         # add_history_to_context=True,
         num_history_runs=3,
         exponential_backoff=True,
@@ -166,12 +215,62 @@ def create_assessment_agent() -> Agent:
     )
 
 
+def create_batched_assessment_agent() -> Agent:
+    """Create assessment agent that scores one candidate against several specs.
+
+    Returns:
+        Agent: Configured Agno agent that emits ``BatchedAssessmentResult``.
+    """
+
+    prompt = get_prompt("batched_assessment")
+
+    return Agent(
+        name="Batched Assessment Agent",
+        model=RateLimitedOpenAIResponses(
+            id="gpt-5-mini", http_client=shared_http_client()
+        ),
+        tools=[ReasoningTools(add_instructions=True)],
+        output_schema=BatchedAssessmentResult,
+        **prompt.as_agent_kwargs(),
+        num_history_runs=3,
+        exponential_backoff=True,
+        retries=2,
+        delay_between_retries=1,
+    )
+
+
+def create_triage_agent() -> Agent:
+    """Create the small-model agent that pre-screens candidates before research.
+
+    Returns:
+        Agent: Configured Agno agent that emits ``TriageResult``.
+    """
+
+    prompt = get_prompt("triage")
+
+    return Agent(
+        name="Triage Agent",
+        model=RateLimitedOpenAIResponses(
+            id="gpt-5-mini", http_client=shared_http_client()
+        ),
+        output_schema=TriageResult,
+        **prompt.as_agent_kwargs(),
+        exponential_backoff=True,
+        retries=1,
+        delay_between_retries=1,
+    )
+
+
 def run_research(
     candidate_name: str,
     current_title: str,
     current_company: str,
     linkedin_url: Optional[str] = None,
     use_deep_research: bool = True,
+    *,
+    raw_research: Optional[RawResearch] = None,
+    on_raw_research: Optional[Callable[[RawResearch], None]] = None,
+    run_key: Optional[str] = None,
 ) -> ExecutiveResearchResult:
     """Execute research on candidate and return structured results.
 
@@ -180,8 +279,14 @@ def run_research(
         current_title: Current job title.
         current_company: Current company name.
         linkedin_url: LinkedIn profile URL (optional).
-        use_deep_research: Toggle between deep and fast modes (v1: ``True``
-            only).
+        use_deep_research: Toggle between Deep Research (``True``) and the
+            fast single-agent mode (``False``).
+        raw_research: Deep Research output saved by an earlier attempt; it is
+            parsed again instead of repeating the Deep Research call.
+        on_raw_research: Called with the Deep Research output before it is
+            parsed, so callers can checkpoint it against parser failures.
+        run_key: Run under which the Deep Research output is written to the
+            research blob store (a random key when omitted).
 
     Returns:
         ExecutiveResearchResult: Parsed research output.
@@ -200,38 +305,147 @@ def run_research(
 
     Notes:
         - Uses Agno's built-in retry with ``exponential_backoff=True``
-        - Deep Research returns markdown via ``result.content``
+        - Deep Research returns markdown via ``result.content``, which the
+          parser agent converts into ``ExecutiveResearchResult``
+        - Fast mode returns structured output directly
         - Citations extracted from ``result.citations``
-        - No separate parser agent needed
     """
-    # Create agent
-    agent = create_research_agent(use_deep_research=use_deep_research)
+    prompt = _build_research_prompt(
+        candidate_name=candidate_name,
+        current_title=current_title,
+        current_company=current_company,
+        linkedin_url=linkedin_url,
+    )
 
-    # Build prompt
-    linkedin_section = (
-        f"\nLinkedIn: {linkedin_url}" if linkedin_url else "\nLinkedIn: Not provided"
+    if not use_deep_research:
+        with get_agent_pool().lease(
+            "research", create_research_agent, use_deep_research=False
+        ) as agent:
+            try:
+                result = agent.run(prompt)
+            except Exception as e:
+                raise RuntimeError(
+                    f"Fast research agent failed for {candidate_name}: {e}"
+                ) from e
+        return _finalize_fast_research(result)
+
+    if raw_research is None:
+        with get_agent_pool().lease(
+            "research",
+            create_research_agent,
+            use_deep_research=True,
+            background=settings.openai.deep_research_background,
+        ) as agent:
+            try:
+                result = agent.run(prompt)
+            except Exception as e:
+                raise RuntimeError(
+                    f"Research agent failed for {candidate_name} after retries: {e}"
+                ) from e
+        raw_research = _raw_research(
+            result,
+            on_raw_research,
+            research_cache_key(candidate_name, current_company, linkedin_url),
+            run_key,
+        )
+
+    research_markdown: str = raw_research["markdown"]
+    citation_dicts: list[dict[str, str]] = raw_research["citations"]
+
+    parser_prompt = _build_parser_prompt(
+        candidate_name=candidate_name,
+        current_title=current_title,
+        current_company=current_company,
+        research_markdown=research_markdown,
+        citations=citation_dicts,
     )
 
-    prompt = f"""
-Candidate: {candidate_name}
-Current Title: {current_title} at {current_company}{linkedin_section}
+    with get_agent_pool().lease(
+        "research_parser", create_research_parser_agent
+    ) as parser_agent:
+        cache_key, cached = _cached_response(
+            "research_parser", parser_agent, parser_prompt, ExecutiveResearchResult
+        )
+        parser_output: Any = cached
+        if cached is None:
+            try:
+                parser_output = parser_agent.run(parser_prompt)
+            except Exception as exc:  # pragma: no cover - API failure path
+                raise RuntimeError(
+                    f"Research parser failed for {candidate_name} after Deep Research: {exc}"
+                ) from exc
+            _store_response(
+                cache_key,
+                "research_parser",
+                parser_agent,
+                parser_output,
+                ExecutiveResearchResult,
+            )
+
+    return _finalize_research(parser_output, research_markdown, citation_dicts)
 
-Research this executive comprehensively.
-    """.strip()
 
-    # Execute research
-    try:
-        result = agent.run(prompt)
-    except Exception as e:
-        raise RuntimeError(
-            f"Research agent failed for {candidate_name} after retries: {e}"
-        ) from e
+async def arun_research(
+    candidate_name: str,
+    current_title: str,
+    current_company: str,
+    linkedin_url: Optional[str] = None,
+    use_deep_research: bool = True,
+    *,
+    raw_research: Optional[RawResearch] = None,
+    on_raw_research: Optional[Callable[[RawResearch], None]] = None,
+    run_key: Optional[str] = None,
+) -> ExecutiveResearchResult:
+    """Async counterpart of :func:`run_research` built on ``Agent.arun``.
 
-    research_markdown: str = str(result.content) if hasattr(result, "content") else ""
-    citation_dicts = _extract_citation_dicts(result)
-    fallback_citations = _convert_dicts_to_citations(citation_dicts)
+    The Deep Research call can take several minutes; awaiting it keeps the
+    event loop free to multiplex other candidates instead of pinning a thread.
+
+    Raises:
+        RuntimeError: If the research or parser agent fails after retries.
+    """
+    prompt = _build_research_prompt(
+        candidate_name=candidate_name,
+        current_title=current_title,
+        current_company=current_company,
+        linkedin_url=linkedin_url,
+    )
+
+    if not use_deep_research:
+        with get_agent_pool().lease(
+            "research", create_research_agent, use_deep_research=False
+        ) as agent:
+            try:
+                result = await agent.arun(prompt)
+            except Exception as e:
+                raise RuntimeError(
+                    f"Fast research agent failed for {candidate_name}: {e}"
+                ) from e
+        return _finalize_fast_research(result)
+
+    if raw_research is None:
+        with get_agent_pool().lease(
+            "research",
+            create_research_agent,
+            use_deep_research=True,
+            background=settings.openai.deep_research_background,
+        ) as agent:
+            try:
+                result = await agent.arun(prompt)
+            except Exception as e:
+                raise RuntimeError(
+                    f"Research agent failed for {candidate_name} after retries: {e}"
+                ) from e
+        raw_research = await _araw_research(
+            result,
+            on_raw_research,
+            research_cache_key(candidate_name, current_company, linkedin_url),
+            run_key,
+        )
+
+    research_markdown: str = raw_research["markdown"]
+    citation_dicts: list[dict[str, str]] = raw_research["citations"]
 
-    parser_agent = create_research_parser_agent()
     parser_prompt = _build_parser_prompt(
         candidate_name=candidate_name,
         current_title=current_title,
@@ -240,19 +454,147 @@ Research this executive comprehensively.
         citations=citation_dicts,
     )
 
+    with get_agent_pool().lease(
+        "research_parser", create_research_parser_agent
+    ) as parser_agent:
+        cache_key, cached = await asyncio.to_thread(
+            _cached_response,
+            "research_parser",
+            parser_agent,
+            parser_prompt,
+            ExecutiveResearchResult,
+        )
+        parser_output: Any = cached
+        if cached is None:
+            try:
+                parser_output = await parser_agent.arun(parser_prompt)
+            except Exception as exc:  # pragma: no cover - API failure path
+                raise RuntimeError(
+                    f"Research parser failed for {candidate_name} after Deep Research: {exc}"
+                ) from exc
+            await asyncio.to_thread(
+                _store_response,
+                cache_key,
+                "research_parser",
+                parser_agent,
+                parser_output,
+                ExecutiveResearchResult,
+            )
+
+    return _finalize_research(parser_output, research_markdown, citation_dicts)
+
+
+def _raw_research(
+    result: Any,
+    on_raw_research: Optional[Callable[[RawResearch], None]],
+    candidate_key: str,
+    run_key: Optional[str],
+) -> RawResearch:
+    """Capture Deep Research output before parsing.
+
+    The output is written to the research blob store (when enabled) and then
+    handed to the checkpoint callback. A failed write is logged, not raised:
+    the research itself succeeded.
+    """
+
+    raw = _capture_raw_research(result)
+    _save_raw_research(raw, candidate_key, run_key)
+    if on_raw_research is not None:
+        on_raw_research(raw)
+    return raw
+
+
+async def _araw_research(
+    result: Any,
+    on_raw_research: Optional[Callable[[RawResearch], None]],
+    candidate_key: str,
+    run_key: Optional[str],
+) -> RawResearch:
+    """Async counterpart of :func:`_raw_research`; the file write runs in a thread."""
+
+    raw = _capture_raw_research(result)
+    await asyncio.to_thread(_save_raw_research, raw, candidate_key, run_key)
+    if on_raw_research is not None:
+        on_raw_research(raw)
+    return raw
+
+
+def _capture_raw_research(result: Any) -> RawResearch:
+    return {
+        "markdown": str(result.content) if hasattr(result, "content") else "",
+        "citations": _extract_citation_dicts(result),
+    }
+
+
+def _save_raw_research(
+    raw: RawResearch, candidate_key: str, run_key: Optional[str]
+) -> None:
+    store = get_research_blob_store()
+    if store is None:
+        return
     try:
-        parser_output = parser_agent.run(parser_prompt)
-    except Exception as exc:  # pragma: no cover - API failure path
-        raise RuntimeError(
-            f"Research parser failed for {candidate_name} after Deep Research: {exc}"
-        ) from exc
+        path = store.put(candidate_key, run_key or uuid4().hex, raw)
+    except OSError as exc:
+        logger.warning("Failed to save raw Deep Research output: %s", exc)
+    else:
+        logger.info("Saved raw Deep Research output to %s", path)
+
+
+def _build_research_prompt(
+    candidate_name: str,
+    current_title: str,
+    current_company: str,
+    linkedin_url: Optional[str],
+) -> str:
+    """Create the candidate prompt supplied to the research agent.
+
+    Like every agent prompt here, fixed text comes first and per-candidate
+    values last so the provider's prompt cache can reuse the longest prefix.
+    """
+
+    linkedin = linkedin_url or "Not provided"
+
+    return (
+        "Research this executive comprehensively.\n\n"
+        f"Candidate: {candidate_name}\n"
+        f"Current Title: {current_title} at {current_company}\n"
+        f"LinkedIn: {linkedin}\n"
+        f"{_current_date_line()}"
+    )
+
+
+_DATE_LINE_PREFIX = "Today's date: "
+
+
+def _current_date_line() -> str:
+    # Replaces Agno's ``add_datetime_to_context``, which puts a
+    # microsecond timestamp in the system message and breaks prefix caching.
+    return f"{_DATE_LINE_PREFIX}{date.today().isoformat()}"
+
+
+def _without_date_line(prompt: str) -> str:
+    """Drop a trailing date line so cached responses survive midnight."""
+
+    head, separator, last = prompt.rpartition("\n")
+    if separator and last.startswith(_DATE_LINE_PREFIX):
+        return head.rstrip()
+    return prompt
+
+
+def _finalize_research(
+    parser_output: Any,
+    research_markdown: str,
+    citation_dicts: list[dict[str, str]],
+    research_model: str = DEEP_RESEARCH_MODEL,
+) -> ExecutiveResearchResult:
+    """Combine parser output with raw Deep Research markdown and citations."""
 
     structured = _coerce_model(parser_output, ExecutiveResearchResult)
 
     structured.research_markdown_raw = research_markdown
     structured.citations = _merge_citation_models(
         structured.citations,
-        fallback_citations,
+        _convert_dicts_to_citations(citation_dicts),
     )
     structured.research_summary = (
         structured.research_summary.strip()
@@ -268,11 +610,25 @@ Research this executive comprehensively.
         structured.citations,
     )
     structured.research_timestamp = datetime.now()
-    structured.research_model = "o4-mini-deep-research"
+    structured.research_model = research_model
 
     return structured
 
 
+def _finalize_fast_research(result: Any) -> ExecutiveResearchResult:
+    """Normalize fast-mode structured output like a parsed Deep Research run."""
+
+    structured = _coerce_model(result, ExecutiveResearchResult)
+    # No raw report exists in fast mode; the rendered profile stands in for it
+    # when estimating confidence and gaps.
+    return _finalize_research(
+        structured,
+        _format_research_for_assessment(structured),
+        _extract_citation_dicts(result),
+        research_model=FAST_RESEARCH_MODEL,
+    )
+
+
 def run_incremental_search(
     candidate_name: str,
     initial_research: ExecutiveResearchResult,
@@ -305,7 +661,6 @@ def run_incremental_search(
         'Casey'
     """
 
-    agent = create_incremental_search_agent()
     prompt = _build_incremental_prompt(
         candidate_name=candidate_name,
         initial_research=initial_research,
@@ -313,12 +668,55 @@ def run_incremental_search(
         role_spec_markdown=role_spec_markdown,
     )
 
-    try:
-        result = agent.run(prompt)
-    except Exception as exc:  # pragma: no cover - depends on API behavior
-        raise RuntimeError(
-            f"Incremental search failed for {candidate_name}: {exc}"
-        ) from exc
+    with get_agent_pool().lease(
+        "incremental_search", create_incremental_search_agent
+    ) as agent:
+        try:
+            result = agent.run(prompt)
+        except Exception as exc:  # pragma: no cover - depends on API behavior
+            raise RuntimeError(
+                f"Incremental search failed for {candidate_name}: {exc}"
+            ) from exc
+
+    return _merge_incremental_output(result, initial_research)
+
+
+async def arun_incremental_search(
+    candidate_name: str,
+    initial_research: ExecutiveResearchResult,
+    quality_gaps: Optional[list[str]] = None,
+    role_spec_markdown: Optional[str] = None,
+) -> ExecutiveResearchResult:
+    """Async counterpart of :func:`run_incremental_search`.
+
+    Raises:
+        RuntimeError: If the incremental search agent fails after retries.
+    """
+
+    prompt = _build_incremental_prompt(
+        candidate_name=candidate_name,
+        initial_research=initial_research,
+        quality_gaps=quality_gaps,
+        role_spec_markdown=role_spec_markdown,
+    )
+
+    with get_agent_pool().lease(
+        "incremental_search", create_incremental_search_agent
+    ) as agent:
+        try:
+            result = await agent.arun(prompt)
+        except Exception as exc:  # pragma: no cover - depends on API behavior
+            raise RuntimeError(
+                f"Incremental search failed for {candidate_name}: {exc}"
+            ) from exc
+
+    return _merge_incremental_output(result, initial_research)
+
+
+def _merge_incremental_output(
+    result: Any, initial_research: ExecutiveResearchResult
+) -> ExecutiveResearchResult:
+    """Coerce incremental agent output and merge it into the baseline research."""
 
     supplemental = _coerce_model(result, ExecutiveResearchResult)
 
@@ -455,19 +853,469 @@ def assess_candidate(
         AssessmentResult(...)
     """
 
-    agent = create_assessment_agent()
+    memo_key, memoized = _memoized_assessment(
+        research, role_spec_markdown, custom_instructions
+    )
+    if memoized is not None:
+        return memoized
+
     prompt = _build_assessment_prompt(
         research=research,
         role_spec_markdown=role_spec_markdown,
         custom_instructions=custom_instructions,
     )
 
+    with get_agent_pool().lease("assessment", create_assessment_agent) as agent:
+        cache_key, cached = _cached_response(
+            "assessment", agent, prompt, AssessmentResult
+        )
+        result: Any = cached
+        if cached is None:
+            try:
+                result = agent.run(prompt)
+            except Exception as exc:  # pragma: no cover - depends on API behavior
+                raise RuntimeError(
+                    f"Assessment agent failed for {research.exec_name}: {exc}"
+                ) from exc
+            _store_response(cache_key, "assessment", agent, result, AssessmentResult)
+
+        assessment = _finalize_assessment(result, agent, role_spec_markdown)
+    _memoize_assessment(memo_key, research, assessment)
+    return assessment
+
+
+async def aassess_candidate(
+    research: ExecutiveResearchResult,
+    role_spec_markdown: str,
+    custom_instructions: Optional[str] = None,
+) -> AssessmentResult:
+    """Async counterpart of :func:`assess_candidate` built on ``Agent.arun``.
+
+    Raises:
+        RuntimeError: If the assessment agent fails after retries.
+    """
+
+    memo_key, memoized = await asyncio.to_thread(
+        _memoized_assessment, research, role_spec_markdown, custom_instructions
+    )
+    if memoized is not None:
+        return memoized
+
+    prompt = _build_assessment_prompt(
+        research=research,
+        role_spec_markdown=role_spec_markdown,
+        custom_instructions=custom_instructions,
+    )
+
+    with get_agent_pool().lease("assessment", create_assessment_agent) as agent:
+        cache_key, cached = await asyncio.to_thread(
+            _cached_response, "assessment", agent, prompt, AssessmentResult
+        )
+        result: Any = cached
+        if cached is None:
+            try:
+                result = await agent.arun(prompt)
+            except Exception as exc:  # pragma: no cover - depends on API behavior
+                raise RuntimeError(
+                    f"Assessment agent failed for {research.exec_name}: {exc}"
+                ) from exc
+            await asyncio.to_thread(
+                _store_response,
+                cache_key,
+                "assessment",
+                agent,
+                result,
+                AssessmentResult,
+            )
+
+        assessment = _finalize_assessment(result, agent, role_spec_markdown)
+    await asyncio.to_thread(_memoize_assessment, memo_key, research, assessment)
+    return assessment
+
+
+def assess_candidate_multi(
+    research: ExecutiveResearchResult, targets: list[AssessmentTarget]
+) -> dict[str, AssessmentResult]:
+    """Score one candidate against several role specs with batched calls.
+
+    The research block is sent once per batch of up to
+    ``SCREEN_BATCHED_ASSESSMENT_MAX_SPECS`` specs instead of once per spec.
+    Batches whose output does not validate (missing, duplicate or malformed
+    assessments) fall back to one :func:`assess_candidate` call per spec.
+
+    Args:
+        research: Structured research shared by every assessment.
+        targets: Role specs to score, each identified by ``screen_id``.
+
+    Returns:
+        dict[str, AssessmentResult]: Assessments keyed by ``screen_id``.
+
+    Raises:
+        RuntimeError: If an assessment agent fails after retries.
+    """
+
+    results, pending = _split_memoized_targets(research, targets)
+    for batch in _assessment_batches(pending):
+        if len(batch) == 1:
+            results[batch[0].screen_id] = assess_candidate(
+                research, batch[0].role_spec_markdown, batch[0].custom_instructions
+            )
+            continue
+
+        prompt = _build_batched_assessment_prompt(research, batch)
+        with get_agent_pool().lease(
+            "batched_assessment", create_batched_assessment_agent
+        ) as agent:
+            cache_key, cached = _cached_response(
+                "batched_assessment", agent, prompt, BatchedAssessmentResult
+            )
+            output: Any = cached
+            if cached is None:
+                try:
+                    output = agent.run(prompt)
+                except Exception as exc:  # pragma: no cover - depends on API behavior
+                    raise RuntimeError(
+                        f"Batched assessment agent failed for {research.exec_name}: {exc}"
+                    ) from exc
+
+            try:
+                assessments = _split_batched_assessment(output, agent, batch)
+            except (TypeError, ValueError) as exc:
+                _log_batch_fallback(research, batch, exc)
+                for target in batch:
+                    results[target.screen_id] = assess_candidate(
+                        research, target.role_spec_markdown, target.custom_instructions
+                    )
+                continue
+
+            _store_response(
+                cache_key, "batched_assessment", agent, output, BatchedAssessmentResult
+            )
+            _memoize_batch(research, batch, assessments)
+            results.update(assessments)
+
+    return {target.screen_id: results[target.screen_id] for target in targets}
+
+
+async def aassess_candidate_multi(
+    research: ExecutiveResearchResult, targets: list[AssessmentTarget]
+) -> dict[str, AssessmentResult]:
+    """Async counterpart of :func:`assess_candidate_multi`.
+
+    Batches, and per-spec fallback calls, run concurrently.
+
+    Raises:
+        RuntimeError: If an assessment agent fails after retries.
+    """
+
+    results, pending = await asyncio.to_thread(
+        _split_memoized_targets, research, targets
+    )
+
+    async def assess_batch(
+        batch: list[AssessmentTarget],
+    ) -> dict[str, AssessmentResult]:
+        if len(batch) == 1:
+            return await _aassess_each(research, batch)
+
+        prompt = _build_batched_assessment_prompt(research, batch)
+        with get_agent_pool().lease(
+            "batched_assessment", create_batched_assessment_agent
+        ) as agent:
+            cache_key, cached = await asyncio.to_thread(
+                _cached_response,
+                "batched_assessment",
+                agent,
+                prompt,
+                BatchedAssessmentResult,
+            )
+            output: Any = cached
+            if cached is None:
+                try:
+                    output = await agent.arun(prompt)
+                except Exception as exc:  # pragma: no cover - depends on API behavior
+                    raise RuntimeError(
+                        f"Batched assessment agent failed for {research.exec_name}: {exc}"
+                    ) from exc
+
+            try:
+                assessments = _split_batched_assessment(output, agent, batch)
+            except (TypeError, ValueError) as exc:
+                _log_batch_fallback(research, batch, exc)
+                return await _aassess_each(research, batch)
+
+            await asyncio.to_thread(
+                _store_response,
+                cache_key,
+                "batched_assessment",
+                agent,
+                output,
+                BatchedAssessmentResult,
+            )
+            await asyncio.to_thread(_memoize_batch, research, batch, assessments)
+            return assessments
+
+    for assessments in await asyncio.gather(
+        *(assess_batch(batch) for batch in _assessment_batches(pending))
+    ):
+        results.update(assessments)
+
+    return {target.screen_id: results[target.screen_id] for target in targets}
+
+
+def triage_candidate_fit(
+    role_type: str,
+    candidate_name: str,
+    current_title: str,
+    current_company: str,
+    bio: Optional[str] = None,
+) -> TriageResult:
+    """Ask the triage agent whether a candidate is worth researching.
+
+    Raises:
+        RuntimeError: If the triage agent fails after retries.
+    """
+
+    prompt = _build_triage_prompt(
+        role_type, candidate_name, current_title, current_company, bio
+    )
+    with get_agent_pool().lease("triage", create_triage_agent) as agent:
+        cache_key, cached = _cached_response("triage", agent, prompt, TriageResult)
+        result: Any = cached
+        if cached is None:
+            try:
+                result = agent.run(prompt)
+            except Exception as exc:  # pragma: no cover - depends on API behavior
+                raise RuntimeError(
+                    f"Triage agent failed for {candidate_name}: {exc}"
+                ) from exc
+            _store_response(cache_key, "triage", agent, result, TriageResult)
+    return _coerce_model(result, TriageResult)
+
+
+async def atriage_candidate_fit(
+    role_type: str,
+    candidate_name: str,
+    current_title: str,
+    current_company: str,
+    bio: Optional[str] = None,
+) -> TriageResult:
+    """Async counterpart of :func:`triage_candidate_fit`.
+
+    Raises:
+        RuntimeError: If the triage agent fails after retries.
+    """
+
+    prompt = _build_triage_prompt(
+        role_type, candidate_name, current_title, current_company, bio
+    )
+    with get_agent_pool().lease("triage", create_triage_agent) as agent:
+        cache_key, cached = await asyncio.to_thread(
+            _cached_response, "triage", agent, prompt, TriageResult
+        )
+        result: Any = cached
+        if cached is None:
+            try:
+                result = await agent.arun(prompt)
+            except Exception as exc:  # pragma: no cover - depends on API behavior
+                raise RuntimeError(
+                    f"Triage agent failed for {candidate_name}: {exc}"
+                ) from exc
+            await asyncio.to_thread(
+                _store_response, cache_key, "triage", agent, result, TriageResult
+            )
+    return _coerce_model(result, TriageResult)
+
+
+async def _aassess_each(
+    research: ExecutiveResearchResult, targets: list[AssessmentTarget]
+) -> dict[str, AssessmentResult]:
+    assessments = await asyncio.gather(
+        *(
+            aassess_candidate(
+                research, target.role_spec_markdown, target.custom_instructions
+            )
+            for target in targets
+        )
+    )
+    return {
+        target.screen_id: assessment for target, assessment in zip(targets, assessments)
+    }
+
+
+def _split_memoized_targets(
+    research: ExecutiveResearchResult, targets: list[AssessmentTarget]
+) -> tuple[dict[str, AssessmentResult], list[AssessmentTarget]]:
+    """Separate targets with a memoized assessment from those still to score."""
+
+    results: dict[str, AssessmentResult] = {}
+    pending: list[AssessmentTarget] = []
+    for target in targets:
+        _, memoized = _memoized_assessment(
+            research, target.role_spec_markdown, target.custom_instructions
+        )
+        if memoized is None:
+            pending.append(target)
+        else:
+            results[target.screen_id] = memoized
+    return results, pending
+
+
+def _assessment_batches(
+    targets: list[AssessmentTarget],
+) -> list[list[AssessmentTarget]]:
+    size = settings.screening.batched_assessment_max_specs
+    return [targets[start : start + size] for start in range(0, len(targets), size)]
+
+
+def _spec_labels(targets: list[AssessmentTarget]) -> list[str]:
+    return [f"S{index}" for index in range(1, len(targets) + 1)]
+
+
+def _split_batched_assessment(
+    output: Any, agent: Agent, targets: list[AssessmentTarget]
+) -> dict[str, AssessmentResult]:
+    """Map a batched output back onto its targets.
+
+    Raises:
+        ValueError: If the spec_ids returned do not match the specs sent.
+        TypeError: If the output cannot be coerced into the batch model.
+    """
+
+    batch = _coerce_model(output, BatchedAssessmentResult)
+    by_label: dict[str, AssessmentResult] = {}
+    for item in batch.assessments:
+        label = item.spec_id.strip().upper()
+        if label in by_label:
+            raise ValueError(f"duplicate assessment for spec_id {label}")
+        by_label[label] = AssessmentResult.model_validate(
+            item.model_dump(exclude={"spec_id"})
+        )
+
+    labels = _spec_labels(targets)
+    if set(by_label) != set(labels):
+        raise ValueError(f"expected spec_ids {labels}, got {sorted(by_label)}")
+
+    return {
+        target.screen_id: _finalize_assessment(
+            by_label[label], agent, target.role_spec_markdown
+        )
+        for label, target in zip(labels, targets)
+    }
+
+
+def _log_batch_fallback(
+    research: ExecutiveResearchResult,
+    targets: list[AssessmentTarget],
+    exc: Exception,
+) -> None:
+    logger.warning(
+        "Batched assessment for %s did not validate (%s); "
+        "falling back to %s per-spec calls",
+        research.exec_name,
+        exc,
+        len(targets),
+    )
+
+
+def _memoize_batch(
+    research: ExecutiveResearchResult,
+    targets: list[AssessmentTarget],
+    assessments: dict[str, AssessmentResult],
+) -> None:
+    if get_assessment_cache() is None:
+        return
+    for target in targets:
+        _memoize_assessment(
+            assessment_cache_key(
+                research, target.role_spec_markdown, target.custom_instructions
+            ),
+            research,
+            assessments[target.screen_id],
+        )
+
+
+def _memoized_assessment(
+    research: ExecutiveResearchResult,
+    role_spec_markdown: str,
+    custom_instructions: Optional[str],
+) -> tuple[Optional[str], Optional[AssessmentResult]]:
+    """Return a previous assessment of unchanged research against the same spec.
+
+    Returns:
+        ``(memo_key, assessment)``; ``memo_key`` is ``None`` when memoization is off.
+    """
+
+    cache = get_assessment_cache()
+    if cache is None:
+        return None, None
+    key = assessment_cache_key(research, role_spec_markdown, custom_instructions)
+    assessment = cache.get(key)
+    if assessment is not None:
+        logger.info(
+            "Reusing assessment for %s (research and role spec unchanged)",
+            research.exec_name,
+        )
+        assessment.role_spec_used = role_spec_markdown
+    return key, assessment
+
+
+def _memoize_assessment(
+    memo_key: Optional[str],
+    research: ExecutiveResearchResult,
+    assessment: AssessmentResult,
+) -> None:
+    cache = get_assessment_cache()
+    if memo_key is None or cache is None:
+        return
+    cache.put(memo_key, assessment, exec_name=research.exec_name)
+
+
+def _cached_response(
+    prompt_name: str, agent: Agent, prompt: str, model_cls: type[ModelT]
+) -> tuple[Optional[str], Optional[ModelT]]:
+    """Look up a previous structured response for this exact agent call.
+
+    Returns:
+        ``(cache_key, response)``; ``cache_key`` is ``None`` when caching is off.
+    """
+
+    cache = get_llm_cache()
+    model_id = getattr(agent.model, "id", None)
+    if cache is None or not isinstance(model_id, str):
+        return None, None
+    key = llm_cache_key(prompt_name, model_id, _without_date_line(prompt), model_cls)
+    return key, cache.get(key, model_cls)
+
+
+def _store_response(
+    cache_key: Optional[str],
+    prompt_name: str,
+    agent: Agent,
+    output: Any,
+    model_cls: type[BaseModel],
+) -> None:
+    """Cache an agent response under ``cache_key`` if it parses as ``model_cls``."""
+
+    cache = get_llm_cache()
+    if cache_key is None or cache is None:
+        return
     try:
-        result = agent.run(prompt)
-    except Exception as exc:  # pragma: no cover - depends on API behavior
-        raise RuntimeError(
-            f"Assessment agent failed for {research.exec_name}: {exc}"
-        ) from exc
+        response = _coerce_model(output, model_cls)
+    except (TypeError, ValidationError):
+        return
+    cache.put(
+        cache_key,
+        response,
+        prompt_name=prompt_name,
+        model_id=str(getattr(agent.model, "id", "")),
+    )
+
+
+def _finalize_assessment(
+    result: Any, agent: Agent, role_spec_markdown: str
+) -> AssessmentResult:
+    """Coerce assessment output and populate computed metadata fields."""
 
     assessment = _coerce_model(result, AssessmentResult)
     assessment.overall_score = calculate_overall_score(assessment.dimension_scores)
@@ -614,11 +1462,11 @@ def _build_parser_prompt(
     markdown_block = research_markdown.strip() or "(no research markdown provided)"
 
     return (
-        f"Candidate: {candidate_name}\n"
-        f"Current Role: {current_title} at {current_company}\n\n"
         "You are a parser that converts Deep Research markdown into the "
         "ExecutiveResearchResult schema. Extract structured data, preserve "
-        "citations, and list explicit gaps when information is missing."
+        "citations, and list explicit gaps when information is missing.\n\n"
+        f"Candidate: {candidate_name}\n"
+        f"Current Role: {current_title} at {current_company}"
         "\n\nRESEARCH MARKDOWN:\n"
         f"{markdown_block}\n\nCITATIONS:\n{citations_block}"
     ).strip()
@@ -730,19 +1578,21 @@ def _build_incremental_prompt(
         else "- No citations were captured"
     )
     role_section = (
-        f"\nROLE SPECIFICATION CONTEXT:\n{role_spec_markdown.strip()}"
+        f"ROLE SPECIFICATION CONTEXT:\n{role_spec_markdown.strip()}\n\n"
         if role_spec_markdown
         else ""
     )
 
     return (
+        "Run up to TWO targeted web searches to close the gaps listed below. "
+        "Return only new information plus citations that support it.\n\n"
+        f"{role_section}"
         f"CANDIDATE: {candidate_name}\n"
         f"CURRENT ROLE: {initial_research.current_role} at {initial_research.current_company}\n\n"
         f"EXISTING SUMMARY:\n{summary}\n\n"
         f"KNOWN CITATIONS:\n{citations_section}\n\n"
-        f"IDENTIFIED GAPS:\n{gaps_section}{role_section}\n\n"
-        "Run up to TWO targeted web searches to close the gaps. Return only new "
-        "information plus citations that support it."
+        f"IDENTIFIED GAPS:\n{gaps_section}\n\n"
+        f"{_current_date_line()}"
     )
 
 
@@ -757,35 +1607,106 @@ def _merge_unique_strings(first: list[str], second: list[str]) -> list[str]:
     return seen
 
 
+_ASSESSMENT_TASK = (
+    "Follow the scoring rubric. Use ReasoningTools to think explicitly and "
+    "mark dimensions as null when evidence is insufficient. The candidate "
+    "research follows."
+)
+
+
+def _build_triage_prompt(
+    role_type: str,
+    candidate_name: str,
+    current_title: str,
+    current_company: str,
+    bio: Optional[str] = None,
+) -> str:
+    """Construct the triage prompt; the searched role type leads the prompt."""
+
+    return "\n".join(
+        [
+            f"SEARCHED ROLE TYPE: {role_type}",
+            "",
+            "CANDIDATE:",
+            f"Name: {candidate_name}",
+            f"Current Title: {current_title or 'Unknown'}",
+            f"Current Company: {current_company or 'Unknown'}",
+            f"Bio: {(bio or '').strip() or 'Not provided'}",
+        ]
+    )
+
+
 def _build_assessment_prompt(
     research: ExecutiveResearchResult,
     role_spec_markdown: str,
     custom_instructions: Optional[str],
 ) -> str:
-    """Create the prompt supplied to the assessment agent."""
+    """Create the prompt supplied to the assessment agent.
+
+    Everything shared by a screen (role spec, custom instructions, task) is
+    laid out before the per-candidate research so consecutive candidates
+    in a screen send a byte-identical prefix.
+    """
 
-    research_block = _format_research_for_assessment(research)
     prompt = [
         "ROLE SPECIFICATION:",
         role_spec_markdown.strip() or "(role specification missing)",
         "",
-        "CANDIDATE RESEARCH:",
-        research_block,
-        "",
-        "EVALUATION TASK:",
-        "Follow the scoring rubric. Use ReasoningTools to think explicitly and "
-        "mark dimensions as null when evidence is insufficient.",
     ]
-
     if custom_instructions:
+        prompt.extend(["CUSTOM INSTRUCTIONS:", custom_instructions.strip(), ""])
+    prompt.extend(
+        [
+            "EVALUATION TASK:",
+            _ASSESSMENT_TASK,
+            "",
+            "CANDIDATE RESEARCH:",
+            _format_research_for_assessment(research),
+            "",
+            _current_date_line(),
+        ]
+    )
+
+    return "\n".join(prompt).strip()
+
+
+def _build_batched_assessment_prompt(
+    research: ExecutiveResearchResult, targets: list[AssessmentTarget]
+) -> str:
+    """Create one prompt that scores ``research`` against every target spec."""
+
+    labels = _spec_labels(targets)
+    prompt: list[str] = []
+    for label, target in zip(labels, targets):
         prompt.extend(
             [
+                f"ROLE SPECIFICATION [spec_id={label}]:",
+                target.role_spec_markdown.strip() or "(role specification missing)",
                 "",
-                "CUSTOM INSTRUCTIONS:",
-                custom_instructions.strip(),
             ]
         )
+        if target.custom_instructions:
+            prompt.extend(
+                [
+                    f"CUSTOM INSTRUCTIONS [spec_id={label}]:",
+                    target.custom_instructions.strip(),
+                    "",
+                ]
+            )
 
+    prompt.extend(
+        [
+            "EVALUATION TASK:",
+            f"Return {len(targets)} assessments, one per spec_id "
+            f"({', '.join(labels)}). Score each spec independently. "
+            + _ASSESSMENT_TASK,
+            "",
+            "CANDIDATE RESEARCH:",
+            _format_research_for_assessment(research),
+            "",
+            _current_date_line(),
+        ]
+    )
     return "\n".join(prompt).strip()
 
 
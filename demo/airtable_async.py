@@ -0,0 +1,393 @@
+"""Async Airtable client on a pooled keep-alive HTTP connection.
+
+:class:`~demo.airtable_client.AirtableClient` wraps the synchronous
+``pyairtable.Api``, so every write from the async screening path pins a worker
+thread for the length of the request. :class:`AsyncAirtableClient` exposes the
+same write surface (``write_assessment``, ``log_automation_event``,
+``update_screen_status``) as coroutines on one ``httpx.AsyncClient``. Its
+connections (``AIRTABLE_HTTP_MAX_CONNECTIONS``) are kept alive and shared by
+every candidate in flight.
+
+Requests share the base's rate limiter with the sync client and are retried
+the same way: 429 always, 5xx and connection errors for updates (and for
+creates only with ``AIRTABLE_IDEMPOTENCY_FIELD``). With an outbox, mutations
+are recorded before they are sent, as in the sync client.
+
+Set ``AIRTABLE_ASYNC_CLIENT=true`` to have queue workers write assessments
+through it. ``scripts/benchmark_airtable_client.py`` compares both clients
+against a local Airtable stand-in.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+from typing import Any, Awaitable, Callable, Optional, Self, TypeVar, cast
+from urllib.parse import quote
+from uuid import uuid4
+
+import httpx
+
+from demo.airtable_client import (
+    AirtableClient,
+    RecordFields,
+    _is_transient,
+    _retry_delay,
+    _status_code,
+    assessment_fields,
+    automation_event_fields,
+    record_outbox_outcome,
+)
+from demo.airtable_outbox import OUTBOX_CREATE, OUTBOX_UPDATE, AirtableOutbox
+from demo.airtable_writer import MissingRecordIdError
+from demo.models import AssessmentResult, ExecutiveResearchResult
+from demo.rate_limit import get_airtable_rate_limiter
+from demo.settings import settings
+
+__all__ = ["AsyncAirtableClient", "create_async_airtable_client"]
+
+logger = logging.getLogger("demo.airtable_async")
+
+T = TypeVar("T")
+
+
+class AsyncAirtableClient:
+    """Write-only Airtable client for coroutines.
+
+    The ``httpx.AsyncClient`` is created on first use and bound to that event
+    loop; create one client per loop and :meth:`aclose` it on shutdown.
+    """
+
+    SCREENS_TABLE = AirtableClient.SCREENS_TABLE
+    ASSESSMENTS_TABLE = AirtableClient.ASSESSMENTS_TABLE
+    AUTOMATION_LOG_TABLE = AirtableClient.AUTOMATION_LOG_TABLE
+
+    def __init__(
+        self,
+        api_key: str,
+        base_id: str,
+        *,
+        outbox: Optional[AirtableOutbox] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        """Validate credentials; the HTTP pool is opened lazily.
+
+        Args:
+            api_key: Airtable personal access token with base permissions.
+            base_id: Base identifier, optionally with a trailing ``/table``.
+            outbox: Optional local outbox shared with the sync client.
+            http_client: Optional preconfigured client (e.g. with a mock
+                transport). It must send the ``Authorization`` header itself.
+
+        Raises:
+            ValueError: If either credential is blank.
+        """
+
+        api_key = api_key.strip()
+        base_id = base_id.strip()
+        if not api_key:
+            raise ValueError("Airtable API key is required")
+        if not base_id:
+            raise ValueError("Airtable base ID is required")
+
+        self.api_key = api_key
+        self.base_id = base_id.split("/")[0]
+        self.outbox = outbox
+        self._http = http_client
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """The pooled keep-alive client every request goes through."""
+
+        if self._http is None or self._http.is_closed:
+            config = settings.airtable
+            self._http = httpx.AsyncClient(
+                base_url=config.api_url,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                limits=httpx.Limits(
+                    max_connections=config.http_max_connections,
+                    max_keepalive_connections=config.http_max_connections,
+                ),
+                timeout=config.http_timeout_seconds,
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+
+        if self._http is not None:
+            await self._http.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def _path(self, table_name: str, record_id: Optional[str] = None) -> str:
+        path = f"/v0/{self.base_id}/{quote(table_name, safe='')}"
+        return f"{path}/{record_id}" if record_id else path
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> dict[str, Any]:
+        response = await self.http.request(method, path, **kwargs)
+        response.raise_for_status()
+        return cast(dict[str, Any], response.json())
+
+    async def _call(
+        self,
+        operation: str,
+        request: Callable[[], Awaitable[T]],
+        *,
+        retry_transient: bool = True,
+    ) -> T:
+        """Async counterpart of :meth:`AirtableClient._call`."""
+
+        limiter = get_airtable_rate_limiter(self.base_id)
+        max_retries = settings.airtable.max_retries
+        attempt = 0
+        while True:
+            if limiter is not None:
+                await limiter.aacquire()
+            try:
+                return await request()
+            except Exception as exc:
+                status = _status_code(exc)
+                retryable = status == 429 or (
+                    retry_transient and _is_transient(exc, status)
+                )
+                if not retryable or attempt >= max_retries:
+                    raise
+                delay = _retry_delay(exc, attempt)
+                if status == 429 and limiter is not None:
+                    limiter.cooldown(delay)
+                attempt += 1
+                logger.warning(
+                    f"⚠️  Airtable {operation} failed ({status or type(exc).__name__}); "
+                    f"retry {attempt}/{max_retries} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+    async def _find_by_key(
+        self, table_name: str, key_field: str, key: str
+    ) -> Optional[dict[str, Any]]:
+        found = await self._request(
+            "GET",
+            self._path(table_name),
+            params={"filterByFormula": f"{{{key_field}}}='{key}'"},
+        )
+        for record in found.get("records", []):
+            if record.get("fields", {}).get(key_field) == key:
+                return cast(dict[str, Any], record)
+        return None
+
+    async def _create(
+        self,
+        table_name: str,
+        fields: RecordFields,
+        *,
+        screen_id: Optional[str] = None,
+    ) -> str:
+        """Create one record, without duplicating it on retry (see module docs)."""
+
+        key_field = settings.airtable.idempotency_field
+        if key_field:
+            fields = {**fields, key_field: uuid4().hex}
+        attempted = False
+
+        async def attempt() -> dict[str, Any]:
+            nonlocal attempted
+            if attempted and key_field:
+                existing = await self._find_by_key(
+                    table_name, key_field, fields[key_field]
+                )
+                if existing is not None:
+                    return existing
+            attempted = True
+            return await self._request(
+                "POST", self._path(table_name), json={"fields": fields}
+            )
+
+        entry_id = None
+        if self.outbox is not None:
+            entry = await asyncio.to_thread(
+                self.outbox.append,
+                table_name,
+                OUTBOX_CREATE,
+                fields,
+                screen_id=screen_id,
+            )
+            entry_id = entry.entry_id
+        try:
+            record = await self._call(
+                f"create in {table_name}", attempt, retry_transient=bool(key_field)
+            )
+            record_id = record.get("id")
+            if not isinstance(record_id, str) or not record_id:
+                raise MissingRecordIdError(
+                    f"{table_name} record created but Airtable did not return record ID"
+                )
+        except Exception as exc:
+            await asyncio.to_thread(
+                functools.partial(
+                    record_outbox_outcome,
+                    self.outbox,
+                    entry_id,
+                    None,
+                    exc,
+                    operation=OUTBOX_CREATE,
+                )
+            )
+            raise
+        await asyncio.to_thread(record_outbox_outcome, self.outbox, entry_id, record_id)
+        return record_id
+
+    async def _update(
+        self,
+        table_name: str,
+        record_id: str,
+        fields: RecordFields,
+        *,
+        screen_id: Optional[str] = None,
+    ) -> None:
+        entry_id = None
+        if self.outbox is not None:
+            entry = await asyncio.to_thread(
+                self.outbox.append,
+                table_name,
+                OUTBOX_UPDATE,
+                fields,
+                screen_id=screen_id,
+                record_id=record_id,
+            )
+            entry_id, fields = entry.entry_id, entry.fields
+        try:
+            await self._call(
+                f"update of {record_id}",
+                lambda: self._request(
+                    "PATCH", self._path(table_name, record_id), json={"fields": fields}
+                ),
+            )
+        except Exception as exc:
+            await asyncio.to_thread(
+                record_outbox_outcome, self.outbox, entry_id, None, exc
+            )
+            raise
+        await asyncio.to_thread(record_outbox_outcome, self.outbox, entry_id, record_id)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    async def write_assessment(
+        self,
+        screen_id: str,
+        candidate_id: str,
+        assessment: AssessmentResult,
+        research: Optional[ExecutiveResearchResult] = None,
+        role_spec_markdown: Optional[str] = None,
+        assessment_markdown: Optional[str] = None,
+    ) -> str:
+        """Async counterpart of :meth:`AirtableClient.write_assessment`."""
+
+        fields = assessment_fields(
+            screen_id, candidate_id, assessment, research, assessment_markdown
+        )
+        try:
+            return await self._create(
+                self.ASSESSMENTS_TABLE, fields, screen_id=screen_id
+            )
+        except MissingRecordIdError:
+            raise
+        except Exception as exc:
+            raise RuntimeError(
+                f"Failed to write assessment for candidate {candidate_id}"
+            ) from exc
+
+    async def log_automation_event(
+        self,
+        action: str,
+        event_type: str,
+        related_table: str,
+        related_record_ids: list[str],
+        event_summary: str,
+        error_message: Optional[str] = None,
+        webhook_payload: Optional[dict[str, Any]] = None,
+        screen_id: Optional[str] = None,
+        assessment_ids: Optional[list[str]] = None,
+    ) -> str:
+        """Async counterpart of :meth:`AirtableClient.log_automation_event`."""
+
+        payload = automation_event_fields(
+            action,
+            event_type,
+            related_table,
+            related_record_ids,
+            event_summary,
+            error_message=error_message,
+            webhook_payload=webhook_payload,
+            screen_id=screen_id,
+            assessment_ids=assessment_ids,
+        )
+        try:
+            record_id = await self._create(
+                self.AUTOMATION_LOG_TABLE, payload, screen_id=screen_id
+            )
+        except Exception as exc:
+            logger.error(f"❌ Failed to log automation event: {exc}")
+            raise RuntimeError(f"Failed to log automation event: {action}") from exc
+        logger.info(f"✅ Logged automation event: {record_id} ({action})")
+        return record_id
+
+    async def update_screen_status(
+        self,
+        screen_id: str,
+        status: str,
+        error_message: Optional[str] = None,
+        fields: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Async counterpart of :meth:`AirtableClient.update_screen_status`."""
+
+        screen_id = screen_id.strip()
+        status = status.strip()
+        if not screen_id:
+            raise ValueError("screen_id is required")
+        if not status:
+            raise ValueError("status is required")
+
+        try:
+            await self._update(
+                self.SCREENS_TABLE,
+                screen_id,
+                {**(fields or {}), "Status": status},
+                screen_id=screen_id,
+            )
+            if error_message is not None:
+                await self.log_automation_event(
+                    action="Candidate Assessment",
+                    event_type="System Update",
+                    related_table="Platform-Screens",
+                    related_record_ids=[screen_id],
+                    event_summary=f"Screen {screen_id} failed: {error_message}",
+                    error_message=error_message,
+                    screen_id=screen_id,
+                )
+        except Exception as exc:
+            raise RuntimeError(
+                f"Failed to update screen {screen_id} status to {status}"
+            ) from exc
+
+
+def create_async_airtable_client(
+    outbox: Optional[AirtableOutbox] = None,
+) -> Optional[AsyncAirtableClient]:
+    """Build a client from ``settings.airtable``, or ``None`` when disabled."""
+
+    config = settings.airtable
+    if not config.async_client:
+        return None
+    return AsyncAirtableClient(config.api_key, config.base_id, outbox=outbox)
@@ -3,19 +3,54 @@
 This module exposes :class:`AirtableClient`, a minimal helper for write operations only.
 All read operations (traversals, lookups) are handled by Airtable formulas and sent
 via webhook payload. Python only writes results back to Airtable.
+
+Every request draws from a per-base token bucket (``AIRTABLE_REQUESTS_PER_SECOND``)
+and is retried with jittered exponential backoff on 429 and 5xx responses.
+A create whose outcome is unknown (5xx or connection error) is only retried
+when ``AIRTABLE_IDEMPOTENCY_FIELD`` names a text field: each create carries
+a unique key in it, and records that already exist for those keys are
+reused instead of created twice.
+
+With an outbox (:mod:`demo.airtable_outbox`), every create and update is
+recorded locally before it is sent, so results whose delivery fails are
+retried later or replayed instead of being lost. Without an idempotency field,
+creates with an unknown outcome are only replayed on request.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Final, Optional
-
+import random
+import time
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from typing import Any, Callable, Final, Optional, TypeVar
+from uuid import uuid4
+
+import httpx
+import requests
 from pyairtable import Api, Table
-
+from pyairtable.api.types import RecordDict
+
+from demo.airtable_outbox import (
+    OUTBOX_CREATE,
+    OUTBOX_UPDATE,
+    AirtableOutbox,
+    OutboxEntry,
+)
+from demo.airtable_writer import AirtableBatchWriter, MissingRecordIdError
 from demo.models import AssessmentResult, ExecutiveResearchResult
+from demo.rate_limit import get_airtable_rate_limiter
+from demo.settings import settings
 
-__all__: list[str] = ["AirtableClient"]
+__all__: list[str] = [
+    "AirtableClient",
+    "assessment_fields",
+    "automation_event_fields",
+    "outbox_retryable",
+    "record_outbox_outcome",
+]
 
 logger = logging.getLogger("demo.airtable_client")
 if not logger.handlers:
@@ -24,25 +59,206 @@ if not logger.handlers:
     logger.addHandler(handler)
 logger.setLevel(logging.INFO)
 
+T = TypeVar("T")
+RecordFields = dict[str, Any]
+
+
+def _status_code(exc: Exception) -> Optional[int]:
+    return getattr(getattr(exc, "response", None), "status_code", None)
+
+
+def _is_transient(exc: Exception, status: Optional[int]) -> bool:
+    """Failures where Airtable may or may not have applied the request."""
+
+    if status is not None:
+        return status >= 500
+    return isinstance(
+        exc, (requests.ConnectionError, requests.Timeout, httpx.TransportError)
+    )
+
+
+def _retry_delay(exc: Exception, attempt: int) -> float:
+    """Exponential backoff with jitter, honouring ``Retry-After`` when sent."""
+
+    config = settings.airtable
+    # ``2**attempt`` is typed Any (a negative exponent would give a float).
+    ceiling: float = min(
+        config.retry_max_seconds, config.retry_base_seconds * 2**attempt
+    )
+    delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        retry_after: float = float(headers.get("Retry-After", 0))
+    except (TypeError, ValueError):
+        retry_after = 0.0
+    return max(delay, retry_after)
+
+
+def assessment_fields(
+    screen_id: str,
+    candidate_id: str,
+    assessment: AssessmentResult,
+    research: Optional[ExecutiveResearchResult] = None,
+    assessment_markdown: Optional[str] = None,
+) -> RecordFields:
+    """Platform-Assessments fields for a completed assessment.
+
+    See :meth:`AirtableClient.write_assessment` for the fields written.
+    """
+
+    if not screen_id or not candidate_id:
+        raise ValueError("screen_id and candidate_id are required")
+
+    fields: RecordFields = {
+        "Screen": [screen_id],
+        "Candidate": [candidate_id],
+        "Status": "Complete",
+        "Assessment JSON": assessment.model_dump_json(),
+        "Overall Confidence": assessment.overall_confidence,
+        "Topline Summary": assessment.summary,
+        "Assessment Model": assessment.assessment_model,
+        "Assessment Timestamp": assessment.assessment_timestamp.isoformat(),
+    }
+
+    # Only set Overall Score if not None (prevents Airtable API error)
+    if assessment.overall_score is not None:
+        fields["Overall Score"] = assessment.overall_score
+
+    # Note: Role Spec markdown audit trail is stored in Assessment JSON (assessment.role_spec_used)
+    # The role_spec_markdown parameter is used to populate assessment.role_spec_used before JSON serialization
+    # No separate Airtable field exists for this data - it's embedded in the Assessment JSON field
+
+    if research is not None:
+        fields["Research JSON"] = research.model_dump_json()
+        fields["Research Model"] = research.research_model
+        # Preserve Deep Research markdown so recruiters can review the raw output
+        if research.research_markdown_raw:
+            fields["Research Markdown Report"] = research.research_markdown_raw
+
+    if assessment_markdown:
+        fields["Assessment Markdown Report"] = assessment_markdown
+
+    return fields
+
+
+def automation_event_fields(
+    action: str,
+    event_type: str,
+    related_table: str,
+    related_record_ids: list[str],
+    event_summary: str,
+    error_message: Optional[str] = None,
+    webhook_payload: Optional[dict[str, Any]] = None,
+    screen_id: Optional[str] = None,
+    assessment_ids: Optional[list[str]] = None,
+) -> RecordFields:
+    """Operations-Automation_Log fields for one automation event.
+
+    See :meth:`AirtableClient.submit_automation_event` for the arguments.
+    """
+
+    payload: RecordFields = {
+        "Action": action,
+        "Event Type": event_type,
+        "Related Table": related_table,
+        "Related Record ID(s)": ", ".join(related_record_ids),
+        "Event Summary": event_summary,
+        "Timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+    if error_message:
+        payload["Error Message"] = error_message
+
+    if webhook_payload:
+        payload["Webhook Payload JSON"] = json.dumps(webhook_payload, indent=2)
+
+    if screen_id:
+        payload["Platform-Screens"] = [screen_id]
+
+    if assessment_ids:
+        payload["Platform-Assessments"] = assessment_ids
+
+    return payload
+
+
+def outbox_retryable(operation: str, exc: BaseException) -> bool:
+    """Whether a failed outbox delivery may be re-sent automatically.
+
+    A create whose outcome is unknown (5xx or connection error) may already
+    exist in Airtable. Without ``AIRTABLE_IDEMPOTENCY_FIELD`` there is no way
+    to tell, so it is left failed for an explicit replay instead.
+    """
+
+    if operation != OUTBOX_CREATE or settings.airtable.idempotency_field:
+        return True
+    return not (isinstance(exc, Exception) and _is_transient(exc, _status_code(exc)))
+
+
+def record_outbox_outcome(
+    outbox: Optional[AirtableOutbox],
+    entry_id: Optional[str],
+    record_id: Optional[str],
+    exc: Optional[BaseException] = None,
+    *,
+    operation: str = OUTBOX_UPDATE,
+) -> None:
+    """Mark an outbox entry delivered or failed after an inline attempt."""
+
+    if outbox is None or entry_id is None:
+        return
+    try:
+        if exc is None:
+            outbox.mark_delivered(entry_id, record_id)
+        elif isinstance(exc, MissingRecordIdError):
+            # The record exists; re-sending it would create a duplicate.
+            outbox.mark_delivered(entry_id, None)
+        else:
+            status = outbox.mark_failed(
+                entry_id, str(exc), retry=outbox_retryable(operation, exc)
+            )
+            logger.warning(f"⚠️  Airtable write kept in outbox ({status}): {exc}")
+    except Exception as outbox_exc:  # pragma: no cover - local disk failure
+        logger.error(f"❌ Failed to update outbox entry {entry_id}: {outbox_exc}")
+
 
 class AirtableClient:
     """Minimal typed wrapper around pyairtable for write operations only.
 
     All read operations (traversals, lookups) are handled by Airtable formulas.
     Python only writes results back to Airtable.
+
+    With a ``writer``, record creates (assessments, deferred candidates and
+    automation-log events) are buffered and sent in batches; the ``submit_*``
+    methods return futures for the new record IDs, the ``write_*`` and
+    ``log_*`` methods wait for them. Call :meth:`flush` when a screen ends.
+
+    With an ``outbox``, each create and screen update is appended to it
+    first and marked delivered or failed after the attempt; an
+    :class:`~demo.airtable_outbox.OutboxDrainer` retries the failures through
+    :meth:`deliver_outbox_entry`.
     """
 
     SCREENS_TABLE: Final[str] = "Platform-Screens"
     ASSESSMENTS_TABLE: Final[str] = "Platform-Assessments"
     AUTOMATION_LOG_TABLE: Final[str] = "Operations-Automation_Log"
 
-    def __init__(self, api_key: str, base_id: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        base_id: str,
+        writer: Optional[AirtableBatchWriter] = None,
+        outbox: Optional[AirtableOutbox] = None,
+    ) -> None:
         """Instantiate the Airtable client and table handles.
 
         Args:
             api_key: Airtable personal access token with base permissions.
             base_id: Base identifier (``appXXXX``) optionally containing a
                 trailing ``/table`` suffix from Airtable's UI URLs.
+            writer: Optional batch writer for record creates. Without one,
+                every create is its own request.
+            outbox: Optional local outbox that keeps every mutation until
+                Airtable has accepted it.
 
         Raises:
             ValueError: If either credential is blank.
@@ -61,7 +277,14 @@ class AirtableClient:
 
         self.api_key: str = api_key
         self.base_id: str = clean_base_id
-        self.api: Api = Api(api_key)
+        # Retries are handled by ``_call`` so they share the base's rate limit.
+        self.api: Api = Api(
+            api_key, retry_strategy=None, endpoint_url=settings.airtable.api_url
+        )
+        self.writer: Optional[AirtableBatchWriter] = writer
+        if writer is not None:
+            writer.send = self._batch_create
+        self.outbox: Optional[AirtableOutbox] = outbox
 
         # Only instantiate tables we write to (no read-only tables)
         self.screens: Table = self.api.table(self.base_id, self.SCREENS_TABLE)
@@ -70,6 +293,280 @@ class AirtableClient:
             self.base_id, self.AUTOMATION_LOG_TABLE
         )
 
+    def _table(self, table_name: str) -> Table:
+        tables = {
+            self.SCREENS_TABLE: self.screens,
+            self.ASSESSMENTS_TABLE: self.assessments,
+            self.AUTOMATION_LOG_TABLE: self.automation_log,
+        }
+        if table_name not in tables:
+            raise ValueError(f"Unknown Airtable table: {table_name}")
+        return tables[table_name]
+
+    def _call(
+        self,
+        operation: str,
+        request: Callable[[], T],
+        *,
+        retry_transient: bool = True,
+    ) -> T:
+        """Run one Airtable request under the base's rate limit.
+
+        429 responses are always retried (Airtable did not apply the
+        request); 5xx and connection errors only when ``retry_transient``.
+        The last failure is re-raised once ``AIRTABLE_MAX_RETRIES`` is spent.
+        """
+
+        limiter = get_airtable_rate_limiter(self.base_id)
+        max_retries = settings.airtable.max_retries
+        attempt = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                return request()
+            except Exception as exc:
+                status = _status_code(exc)
+                retryable = status == 429 or (
+                    retry_transient and _is_transient(exc, status)
+                )
+                if not retryable or attempt >= max_retries:
+                    raise
+                delay = _retry_delay(exc, attempt)
+                if status == 429 and limiter is not None:
+                    limiter.cooldown(delay)
+                attempt += 1
+                logger.warning(
+                    f"⚠️  Airtable {operation} failed ({status or type(exc).__name__}); "
+                    f"retry {attempt}/{max_retries} in {delay:.1f}s"
+                )
+                time.sleep(delay)
+
+    def _create(
+        self,
+        table: Table,
+        records: list[RecordFields],
+        create: Callable[[list[RecordFields]], list[RecordDict]],
+        *,
+        check_existing: bool = False,
+    ) -> list[RecordDict]:
+        """Create ``records`` via ``create`` without duplicating them on retry.
+
+        With an idempotency field, a retry first looks up the keys of the
+        pending records and only re-sends those Airtable does not have;
+        ``check_existing`` does the same before the first attempt.
+        """
+
+        key_field = settings.airtable.idempotency_field
+        operation = f"create in {table.name}"
+        if not key_field:
+            return self._call(operation, lambda: create(records), retry_transient=False)
+
+        created: dict[str, RecordDict] = {}
+        attempted = check_existing
+
+        def attempt() -> list[RecordDict]:
+            nonlocal attempted
+            if attempted:
+                created.update(self._find_by_keys(table, key_field, records))
+            attempted = True
+            pending = [fields for fields in records if fields[key_field] not in created]
+            if pending:
+                for fields, record in zip(pending, create(pending)):
+                    created[fields[key_field]] = record
+            return [created[fields[key_field]] for fields in records]
+
+        return self._call(operation, attempt)
+
+    def _find_by_keys(
+        self, table: Table, key_field: str, records: list[RecordFields]
+    ) -> dict[str, RecordDict]:
+        keys = [fields[key_field] for fields in records]
+        formula = "OR({})".format(",".join(f"{{{key_field}}}='{key}'" for key in keys))
+        found = table.all(formula=formula)
+        return {
+            record["fields"][key_field]: record
+            for record in found
+            if record.get("fields", {}).get(key_field) in keys
+        }
+
+    def _batch_create(
+        self, table: Table, records: list[RecordFields], typecast: bool
+    ) -> list[RecordDict]:
+        return self._create(
+            table,
+            records,
+            lambda pending: table.batch_create(pending, typecast=typecast),
+        )
+
+    def _create_one(
+        self,
+        table: Table,
+        fields: RecordFields,
+        typecast: bool,
+        *,
+        check_existing: bool = False,
+    ) -> str:
+        (record,) = self._create(
+            table,
+            [fields],
+            lambda pending: [
+                table.create(pending[0], typecast=True)
+                if typecast
+                else table.create(pending[0])
+            ],
+            check_existing=check_existing,
+        )
+        record_id = record.get("id")
+        if not record_id:
+            raise MissingRecordIdError(
+                f"{table.name} record created but Airtable did not return record ID"
+            )
+        return record_id
+
+    def _record_outcome(
+        self,
+        entry_id: Optional[str],
+        record_id: Optional[str],
+        exc: Optional[BaseException] = None,
+        *,
+        operation: str = OUTBOX_UPDATE,
+    ) -> None:
+        record_outbox_outcome(
+            self.outbox, entry_id, record_id, exc, operation=operation
+        )
+
+    def _submit(
+        self,
+        table_name: str,
+        fields: dict[str, Any],
+        error: str,
+        *,
+        typecast: bool = False,
+        screen_id: Optional[str] = None,
+    ) -> Future[str]:
+        """Create a record now, or queue it on the batch writer.
+
+        The record is appended to the outbox (if any) before it is sent.
+        Failures surface from the returned future as ``RuntimeError(error)``
+        chained to the Airtable error, or as :class:`MissingRecordIdError`.
+        """
+
+        table = self._table(table_name)
+        key_field = settings.airtable.idempotency_field
+        if key_field:
+            fields = {**fields, key_field: uuid4().hex}
+        entry_id = (
+            self.outbox.append(
+                table_name,
+                OUTBOX_CREATE,
+                fields,
+                screen_id=screen_id,
+                typecast=typecast,
+            ).entry_id
+            if self.outbox is not None
+            else None
+        )
+        result: Future[str] = Future()
+
+        def resolve(created: Future[str]) -> None:
+            exc = created.exception()
+            self._record_outcome(
+                entry_id,
+                created.result() if exc is None else None,
+                exc,
+                operation=OUTBOX_CREATE,
+            )
+            try:
+                result.set_result(created.result())
+            except MissingRecordIdError as exc:
+                result.set_exception(exc)
+            except Exception as exc:
+                wrapped = RuntimeError(error)
+                wrapped.__cause__ = exc
+                result.set_exception(wrapped)
+
+        if self.writer is not None:
+            self.writer.create(table, fields, typecast=typecast).add_done_callback(
+                resolve
+            )
+            return result
+
+        created: Future[str] = Future()
+        try:
+            created.set_result(self._create_one(table, fields, typecast))
+        except Exception as exc:
+            created.set_exception(exc)
+        resolve(created)
+        return result
+
+    def _update(
+        self,
+        table_name: str,
+        record_id: str,
+        fields: dict[str, Any],
+        *,
+        screen_id: Optional[str] = None,
+    ) -> None:
+        """Update a record, recording the change in the outbox first.
+
+        With an outbox, fields of earlier undelivered updates to the record
+        are merged into this PATCH (see
+        :meth:`~demo.airtable_outbox.AirtableOutbox.append`).
+        """
+
+        table = self._table(table_name)
+        entry_id = None
+        if self.outbox is not None:
+            entry = self.outbox.append(
+                table_name,
+                OUTBOX_UPDATE,
+                fields,
+                screen_id=screen_id,
+                record_id=record_id,
+            )
+            entry_id, fields = entry.entry_id, entry.fields
+        try:
+            self._call(
+                f"update of {record_id}", lambda: table.update(record_id, fields)
+            )
+        except Exception as exc:
+            self._record_outcome(entry_id, None, exc)
+            raise
+        self._record_outcome(entry_id, record_id)
+
+    def deliver_outbox_entry(self, entry: OutboxEntry) -> Optional[str]:
+        """Send a stored outbox mutation to Airtable.
+
+        Creates check the idempotency field for a record from an earlier
+        attempt before creating one. Without the field, a create is only
+        re-sent automatically if its earlier failure showed that Airtable
+        rejected it (see :func:`outbox_retryable`).
+
+        Returns:
+            The created or updated record ID.
+        """
+
+        table = self._table(entry.table_name)
+        if entry.operation == OUTBOX_UPDATE:
+            record_id = entry.record_id
+            if not record_id:
+                raise ValueError(f"Outbox update {entry.entry_id} has no record_id")
+            self._call(
+                f"update of {record_id}",
+                lambda: table.update(record_id, entry.fields),
+            )
+            return record_id
+        return self._create_one(
+            table, entry.fields, entry.typecast, check_existing=True
+        )
+
+    def flush(self) -> None:
+        """Write any buffered creates (no-op without a batch writer)."""
+
+        if self.writer is not None:
+            self.writer.flush()
+
     def write_assessment(
         self,
         screen_id: str,
@@ -110,54 +607,116 @@ class AirtableClient:
             Newly-created assessment record ID.
         """
 
+        return self.submit_assessment(
+            screen_id,
+            candidate_id,
+            assessment,
+            research=research,
+            role_spec_markdown=role_spec_markdown,
+            assessment_markdown=assessment_markdown,
+        ).result()
+
+    def submit_assessment(
+        self,
+        screen_id: str,
+        candidate_id: str,
+        assessment: AssessmentResult,
+        research: Optional[ExecutiveResearchResult] = None,
+        role_spec_markdown: Optional[str] = None,
+        assessment_markdown: Optional[str] = None,
+    ) -> Future[str]:
+        """Queue the assessment write of :meth:`write_assessment`.
+
+        Returns:
+            Future resolving to the new assessment record ID.
+        """
+
+        fields = assessment_fields(
+            screen_id, candidate_id, assessment, research, assessment_markdown
+        )
+
+        return self._submit(
+            self.ASSESSMENTS_TABLE,
+            fields,
+            f"Failed to write assessment for candidate {candidate_id}",
+            screen_id=screen_id,
+        )
+
+    def write_deferred_assessment(
+        self,
+        screen_id: str,
+        candidate_id: str,
+        reason: str,
+    ) -> str:
+        """Record a candidate that was not screened because the budget ran out.
+
+        Creates a Platform-Assessments record with Status "Deferred" and the
+        reason as Topline Summary, so recruiters can re-run those candidates
+        with a larger budget. ``typecast`` lets Airtable add the "Deferred"
+        option to the Status field on first use.
+
+        Args:
+            screen_id: Parent screen record ID.
+            candidate_id: Candidate record ID.
+            reason: Why the candidate was deferred.
+
+        Returns:
+            Newly-created assessment record ID.
+        """
+
         if not screen_id or not candidate_id:
             raise ValueError("screen_id and candidate_id are required")
 
         fields: dict[str, Any] = {
             "Screen": [screen_id],
             "Candidate": [candidate_id],
-            "Status": "Complete",
-            "Assessment JSON": assessment.model_dump_json(),
-            "Overall Confidence": assessment.overall_confidence,
-            "Topline Summary": assessment.summary,
-            "Assessment Model": assessment.assessment_model,
-            "Assessment Timestamp": assessment.assessment_timestamp.isoformat(),
+            "Status": "Deferred",
+            "Topline Summary": reason,
         }
+        return self._submit(
+            self.ASSESSMENTS_TABLE,
+            fields,
+            f"Failed to record deferred candidate {candidate_id}",
+            typecast=True,
+            screen_id=screen_id,
+        ).result()
 
-        # Only set Overall Score if not None (prevents Airtable API error)
-        if assessment.overall_score is not None:
-            fields["Overall Score"] = assessment.overall_score
-
-        # Note: Role Spec markdown audit trail is stored in Assessment JSON (assessment.role_spec_used)
-        # The role_spec_markdown parameter is used to populate assessment.role_spec_used before JSON serialization
-        # No separate Airtable field exists for this data - it's embedded in the Assessment JSON field
-
-        if research is not None:
-            fields["Research JSON"] = research.model_dump_json()
-            fields["Research Model"] = research.research_model
-            # Preserve Deep Research markdown so recruiters can review the raw output
-            if research.research_markdown_raw:
-                fields["Research Markdown Report"] = research.research_markdown_raw
-
-        if assessment_markdown:
-            fields["Assessment Markdown Report"] = assessment_markdown
+    def log_automation_event(
+        self,
+        action: str,
+        event_type: str,
+        related_table: str,
+        related_record_ids: list[str],
+        event_summary: str,
+        error_message: Optional[str] = None,
+        webhook_payload: Optional[dict[str, Any]] = None,
+        screen_id: Optional[str] = None,
+        assessment_ids: Optional[list[str]] = None,
+    ) -> str:
+        """Write an automation event to Operations-Automation_Log and wait for it.
 
-        try:
-            record = self.assessments.create(fields)
-        except Exception as exc:  # pragma: no cover - passthrough from API
-            raise RuntimeError(
-                f"Failed to write assessment for candidate {candidate_id}"
-            ) from exc
+        Takes the arguments of :meth:`submit_automation_event`.
 
-        record_id = record.get("id")
-        if not record_id:
-            raise RuntimeError(
-                f"Assessment created but Airtable did not return record ID for candidate {candidate_id}"
-            )
+        Returns:
+            Created log record ID (recXXXX)
 
-        return record_id
+        Raises:
+            RuntimeError: If log creation fails
+        """
 
-    def log_automation_event(
+        return self.submit_automation_event(
+            action,
+            event_type,
+            related_table,
+            related_record_ids,
+            event_summary,
+            error_message=error_message,
+            webhook_payload=webhook_payload,
+            screen_id=screen_id,
+            assessment_ids=assessment_ids,
+        ).result()
+
+    def submit_automation_event(
         self,
         action: str,
         event_type: str,
@@ -168,8 +727,8 @@ class AirtableClient:
         webhook_payload: Optional[dict[str, Any]] = None,
         screen_id: Optional[str] = None,
         assessment_ids: Optional[list[str]] = None,
-    ) -> str:
-        """Write an automation event to Operations-Automation_Log.
+    ) -> Future[str]:
+        """Queue an automation event to Operations-Automation_Log.
 
         Args:
             action: Action type (e.g., "Candidate Assessment", "Ingest People File")
@@ -183,47 +742,44 @@ class AirtableClient:
             assessment_ids: Optional list of assessment record IDs to link
 
         Returns:
-            Created log record ID (recXXXX)
-
-        Raises:
-            RuntimeError: If log creation fails
+            Future resolving to the created log record ID (recXXXX), or
+            raising ``RuntimeError`` if log creation fails.
         """
-        from datetime import datetime, timezone
-
-        payload: dict[str, Any] = {
-            "Action": action,
-            "Event Type": event_type,
-            "Related Table": related_table,
-            "Related Record ID(s)": ", ".join(related_record_ids),
-            "Event Summary": event_summary,
-            "Timestamp": datetime.now(timezone.utc).isoformat(),
-        }
-
-        if error_message:
-            payload["Error Message"] = error_message
-
-        if webhook_payload:
-            payload["Webhook Payload JSON"] = json.dumps(webhook_payload, indent=2)
 
-        if screen_id:
-            payload["Platform-Screens"] = [screen_id]
-
-        if assessment_ids:
-            payload["Platform-Assessments"] = assessment_ids
+        payload = automation_event_fields(
+            action,
+            event_type,
+            related_table,
+            related_record_ids,
+            event_summary,
+            error_message=error_message,
+            webhook_payload=webhook_payload,
+            screen_id=screen_id,
+            assessment_ids=assessment_ids,
+        )
 
-        try:
-            record = self.automation_log.create(payload)
-            logger.info(f"✅ Logged automation event: {record['id']} ({action})")
-            return record["id"]
-        except Exception as exc:  # pragma: no cover - API failure path
-            logger.error(f"❌ Failed to log automation event: {exc}")
-            raise RuntimeError(f"Failed to log automation event: {action}") from exc
+        def report(logged: Future[str]) -> None:
+            exc = logged.exception()
+            if exc is None:
+                logger.info(f"✅ Logged automation event: {logged.result()} ({action})")
+            else:
+                logger.error(f"❌ Failed to log automation event: {exc.__cause__}")
+
+        future = self._submit(
+            self.AUTOMATION_LOG_TABLE,
+            payload,
+            f"Failed to log automation event: {action}",
+            screen_id=screen_id,
+        )
+        future.add_done_callback(report)
+        return future
 
     def update_screen_status(
         self,
         screen_id: str,
         status: str,
         error_message: Optional[str] = None,
+        fields: Optional[dict[str, Any]] = None,
     ) -> None:
         """Update Platform-Screens status field and optionally log errors.
 
@@ -233,6 +789,8 @@ class AirtableClient:
             error_message: Optional error message. If provided, creates an
                 Operations-Automation_Log entry linked to this screen, which
                 makes the error visible via the lookup field in the Screens table.
+            fields: Optional extra Screens fields written in the same PATCH
+                (e.g. the final progress summary).
         """
 
         screen_id = screen_id.strip()
@@ -242,10 +800,10 @@ class AirtableClient:
         if not status:
             raise ValueError("status is required")
 
-        payload: dict[str, Any] = {"Status": status}
+        payload: dict[str, Any] = {**(fields or {}), "Status": status}
 
         try:
-            self.screens.update(screen_id, payload)
+            self._update(self.SCREENS_TABLE, screen_id, payload, screen_id=screen_id)
 
             # Log error to Operations-Automation_Log if provided
             if error_message is not None:
@@ -262,3 +820,22 @@ class AirtableClient:
             raise RuntimeError(
                 f"Failed to update screen {screen_id} status to {status}"
             ) from exc
+
+    def update_screen_fields(self, screen_id: str, fields: dict[str, Any]) -> None:
+        """Write arbitrary fields (e.g. progress) to a Platform-Screens record.
+
+        Args:
+            screen_id: Airtable record identifier for the screen.
+            fields: Field values to PATCH onto the record.
+        """
+
+        screen_id = screen_id.strip()
+        if not screen_id:
+            raise ValueError("screen_id is required")
+        if not fields:
+            return
+
+        try:
+            self._update(self.SCREENS_TABLE, screen_id, fields, screen_id=screen_id)
+        except Exception as exc:
+            raise RuntimeError(f"Failed to update screen {screen_id}") from exc
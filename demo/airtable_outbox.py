@@ -0,0 +1,518 @@
+"""Local SQLite outbox for Airtable mutations.
+
+:class:`~demo.airtable_client.AirtableClient` appends every create and update
+here before sending it, and marks the entry delivered once Airtable accepts
+it. An entry whose delivery fails stays pending with its full field payload,
+so a finished assessment and its research survive an Airtable outage. The
+:class:`OutboxDrainer` retries pending entries with exponential backoff until
+``AIRTABLE_OUTBOX_MAX_ATTEMPTS`` is spent and the entry is marked failed.
+A create that may have reached Airtable (5xx or connection error) is marked
+failed at once unless ``AIRTABLE_IDEMPOTENCY_FIELD`` lets a retry detect it.
+
+Failed deliveries for one screen can be replayed from the stored payloads,
+without re-running any model calls::
+
+    python -m demo.airtable_outbox status recScreen123
+    python -m demo.airtable_outbox replay recScreen123
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+from uuid import uuid4
+
+from demo.settings import settings
+
+if TYPE_CHECKING:
+    from demo.airtable_client import AirtableClient
+
+__all__ = [
+    "OUTBOX_CREATE",
+    "OUTBOX_DELIVERED",
+    "OUTBOX_FAILED",
+    "OUTBOX_PENDING",
+    "OUTBOX_SUPERSEDED",
+    "OUTBOX_UPDATE",
+    "AirtableOutbox",
+    "OutboxDrainer",
+    "OutboxEntry",
+    "create_airtable_outbox",
+]
+
+logger = logging.getLogger("demo.airtable_outbox")
+
+OUTBOX_CREATE = "create"
+OUTBOX_UPDATE = "update"
+
+OUTBOX_PENDING = "pending"
+OUTBOX_DELIVERED = "delivered"
+OUTBOX_FAILED = "failed"
+# An undelivered update replaced by a newer update of the same record.
+OUTBOX_SUPERSEDED = "superseded"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS airtable_outbox (
+    entry_id TEXT PRIMARY KEY,
+    screen_id TEXT,
+    table_name TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    record_id TEXT,
+    fields TEXT NOT NULL,
+    typecast INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    delivered_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_airtable_outbox_status
+    ON airtable_outbox (status, available_at);
+CREATE INDEX IF NOT EXISTS idx_airtable_outbox_screen
+    ON airtable_outbox (screen_id, status);
+"""
+
+
+@dataclass
+class OutboxEntry:
+    """One Airtable mutation and its delivery state."""
+
+    entry_id: str
+    screen_id: Optional[str]
+    table_name: str
+    operation: str
+    record_id: Optional[str]
+    fields: dict[str, Any]
+    typecast: bool
+    status: str
+    attempts: int
+    available_at: float
+    created_at: float
+    updated_at: float
+    last_error: Optional[str] = None
+    delivered_at: Optional[float] = None
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> OutboxEntry:
+        return cls(
+            entry_id=row["entry_id"],
+            screen_id=row["screen_id"],
+            table_name=row["table_name"],
+            operation=row["operation"],
+            record_id=row["record_id"],
+            fields=json.loads(row["fields"]),
+            typecast=bool(row["typecast"]),
+            status=row["status"],
+            attempts=row["attempts"],
+            available_at=row["available_at"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            last_error=row["last_error"],
+            delivered_at=row["delivered_at"],
+        )
+
+
+class AirtableOutbox:
+    """Persistent log of Airtable mutations stored in a local SQLite database.
+
+    Every method opens its own connection, so one outbox can be shared between
+    threads and several processes can use the same file.
+
+    The first delivery attempt happens inline, right after :meth:`append`;
+    the entry is leased for ``lease_seconds`` so the drainer leaves it alone
+    meanwhile.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str | Path] = None,
+        *,
+        max_attempts: Optional[int] = None,
+        retry_backoff_seconds: Optional[float] = None,
+        lease_seconds: Optional[float] = None,
+    ) -> None:
+        config = settings.outbox
+        self.db_path = Path(db_path or config.db_path)
+        self.max_attempts = max_attempts or config.max_attempts
+        self.retry_backoff_seconds = (
+            config.retry_backoff_seconds
+            if retry_backoff_seconds is None
+            else retry_backoff_seconds
+        )
+        self.lease_seconds = lease_seconds or config.lease_seconds
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction that takes the database lock up front."""
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+
+    def append(
+        self,
+        table_name: str,
+        operation: str,
+        fields: dict[str, Any],
+        *,
+        screen_id: Optional[str] = None,
+        record_id: Optional[str] = None,
+        typecast: bool = False,
+    ) -> OutboxEntry:
+        """Record a mutation before its first (inline) delivery attempt.
+
+        An update supersedes any undelivered update of the same record, so a
+        retried older status never overwrites a newer one. Fields of the
+        superseded updates that the new one does not set are carried into it,
+        so the stored entry (and its inline attempt) sends one merged PATCH.
+
+        Returns:
+            The new entry, with the merged fields for an update.
+        """
+
+        if operation not in (OUTBOX_CREATE, OUTBOX_UPDATE):
+            raise ValueError(f"Unknown outbox operation: {operation}")
+        if operation == OUTBOX_UPDATE and not record_id:
+            raise ValueError("record_id is required for updates")
+
+        entry_id = uuid4().hex
+        now = time.time()
+        with self._transaction() as conn:
+            if operation == OUTBOX_UPDATE:
+                undelivered = (
+                    OUTBOX_UPDATE,
+                    table_name,
+                    record_id,
+                    OUTBOX_PENDING,
+                    OUTBOX_FAILED,
+                )
+                where = (
+                    "WHERE operation = ? AND table_name = ? AND record_id = ? "
+                    "AND status IN (?, ?)"
+                )
+                merged: dict[str, Any] = {}
+                for row in conn.execute(
+                    f"SELECT fields FROM airtable_outbox {where} ORDER BY created_at",
+                    undelivered,
+                ):
+                    merged.update(json.loads(row["fields"]))
+                fields = {**merged, **fields}
+                conn.execute(
+                    f"UPDATE airtable_outbox SET status = ?, updated_at = ? {where}",
+                    (OUTBOX_SUPERSEDED, now, *undelivered),
+                )
+            conn.execute(
+                "INSERT INTO airtable_outbox (entry_id, screen_id, table_name, "
+                "operation, record_id, fields, typecast, status, attempts, "
+                "available_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?, ?)",
+                (
+                    entry_id,
+                    screen_id,
+                    table_name,
+                    operation,
+                    record_id,
+                    json.dumps(fields, default=str),
+                    int(typecast),
+                    OUTBOX_PENDING,
+                    now + self.lease_seconds,
+                    now,
+                    now,
+                ),
+            )
+        return OutboxEntry(
+            entry_id=entry_id,
+            screen_id=screen_id,
+            table_name=table_name,
+            operation=operation,
+            record_id=record_id,
+            fields=fields,
+            typecast=typecast,
+            status=OUTBOX_PENDING,
+            attempts=1,
+            available_at=now + self.lease_seconds,
+            created_at=now,
+            updated_at=now,
+        )
+
+    # ------------------------------------------------------------------
+    # Delivery
+    # ------------------------------------------------------------------
+
+    def claim(
+        self, limit: int, *, screen_id: Optional[str] = None
+    ) -> list[OutboxEntry]:
+        """Lease up to ``limit`` pending entries whose retry delay has elapsed."""
+
+        now = time.time()
+        query = "SELECT * FROM airtable_outbox WHERE status = ? AND available_at <= ?"
+        params: list[Any] = [OUTBOX_PENDING, now]
+        if screen_id is not None:
+            query += " AND screen_id = ?"
+            params.append(screen_id)
+        query += " ORDER BY created_at LIMIT ?"
+        params.append(limit)
+        with self._transaction() as conn:
+            rows = conn.execute(query, params).fetchall()
+            conn.executemany(
+                "UPDATE airtable_outbox SET attempts = attempts + 1, "
+                "available_at = ?, updated_at = ? WHERE entry_id = ?",
+                [(now + self.lease_seconds, now, row["entry_id"]) for row in rows],
+            )
+            entry_ids = [row["entry_id"] for row in rows]
+            claimed = [
+                conn.execute(
+                    "SELECT * FROM airtable_outbox WHERE entry_id = ?", (entry_id,)
+                ).fetchone()
+                for entry_id in entry_ids
+            ]
+        return [OutboxEntry.from_row(row) for row in claimed]
+
+    def mark_delivered(self, entry_id: str, record_id: Optional[str]) -> None:
+        """Record a successful delivery (and the created record's ID)."""
+
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE airtable_outbox SET status = ?, "
+                "record_id = COALESCE(?, record_id), last_error = NULL, "
+                "updated_at = ?, delivered_at = ? WHERE entry_id = ?",
+                (OUTBOX_DELIVERED, record_id, now, now, entry_id),
+            )
+
+    def mark_failed(
+        self, entry_id: str, error: str, *, retry: bool = True
+    ) -> Optional[str]:
+        """Record a failed attempt.
+
+        The entry is retried with exponential backoff while attempts remain
+        (and ``retry`` is set); otherwise it is marked failed and waits for a
+        replay.
+
+        Returns:
+            The entry's new status, or ``None`` if it no longer exists or was
+            superseded.
+        """
+
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts FROM airtable_outbox WHERE entry_id = ? "
+                "AND status = ?",
+                (entry_id, OUTBOX_PENDING),
+            ).fetchone()
+            if row is None:
+                return None
+            if retry and row["attempts"] < self.max_attempts:
+                delay = self.retry_backoff_seconds * (2 ** (row["attempts"] - 1))
+                conn.execute(
+                    "UPDATE airtable_outbox SET available_at = ?, last_error = ?, "
+                    "updated_at = ? WHERE entry_id = ?",
+                    (now + delay, error, now, entry_id),
+                )
+                return OUTBOX_PENDING
+            conn.execute(
+                "UPDATE airtable_outbox SET status = ?, last_error = ?, "
+                "updated_at = ? WHERE entry_id = ?",
+                (OUTBOX_FAILED, error, now, entry_id),
+            )
+            return OUTBOX_FAILED
+
+    def requeue(self, screen_id: str) -> int:
+        """Make a screen's failed and waiting entries deliverable now.
+
+        Returns:
+            Number of entries re-queued.
+        """
+
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE airtable_outbox SET status = ?, attempts = 0, "
+                "available_at = ?, updated_at = ? "
+                "WHERE screen_id = ? AND status IN (?, ?)",
+                (OUTBOX_PENDING, now, now, screen_id, OUTBOX_PENDING, OUTBOX_FAILED),
+            )
+            return cursor.rowcount
+
+    # ------------------------------------------------------------------
+    # Status
+    # ------------------------------------------------------------------
+
+    def entries(
+        self, screen_id: str, status: Optional[str] = None
+    ) -> list[OutboxEntry]:
+        """Return a screen's entries in the order they were appended."""
+
+        query = "SELECT * FROM airtable_outbox WHERE screen_id = ?"
+        params: list[Any] = [screen_id]
+        if status is not None:
+            query += " AND status = ?"
+            params.append(status)
+        with self._connect() as conn:
+            rows = conn.execute(query + " ORDER BY created_at", params).fetchall()
+        return [OutboxEntry.from_row(row) for row in rows]
+
+    def counts(self, screen_id: Optional[str] = None) -> dict[str, int]:
+        """Number of entries per status, optionally for one screen."""
+
+        query = "SELECT status, COUNT(*) AS n FROM airtable_outbox"
+        params: tuple[Any, ...] = ()
+        if screen_id is not None:
+            query += " WHERE screen_id = ?"
+            params = (screen_id,)
+        with self._connect() as conn:
+            rows = conn.execute(query + " GROUP BY status", params).fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+
+class OutboxDrainer:
+    """Deliver due outbox entries through an :class:`AirtableClient`."""
+
+    def __init__(
+        self,
+        outbox: AirtableOutbox,
+        airtable: AirtableClient,
+        *,
+        batch_size: int = 25,
+        poll_seconds: Optional[float] = None,
+    ) -> None:
+        self.outbox = outbox
+        self.airtable = airtable
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds or settings.outbox.poll_seconds
+
+    def drain_once(self, screen_id: Optional[str] = None) -> dict[str, int]:
+        """Deliver every entry that is due now.
+
+        Returns:
+            Number of entries delivered and failed (including those that will
+            be retried later).
+        """
+
+        from demo.airtable_client import outbox_retryable
+
+        summary = {"delivered": 0, "failed": 0}
+        while entries := self.outbox.claim(self.batch_size, screen_id=screen_id):
+            for entry in entries:
+                try:
+                    record_id = self.airtable.deliver_outbox_entry(entry)
+                except Exception as exc:
+                    status = self.outbox.mark_failed(
+                        entry.entry_id,
+                        str(exc),
+                        retry=outbox_retryable(entry.operation, exc),
+                    )
+                    summary["failed"] += 1
+                    logger.warning(
+                        "⚠️  Outbox %s of %s (screen %s) failed, now %s: %s",
+                        entry.operation,
+                        entry.table_name,
+                        entry.screen_id,
+                        status,
+                        exc,
+                    )
+                else:
+                    self.outbox.mark_delivered(entry.entry_id, record_id)
+                    summary["delivered"] += 1
+        return summary
+
+    async def run_forever(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Drain the outbox every ``poll_seconds`` until ``stop`` is set."""
+
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            try:
+                summary = await asyncio.to_thread(self.drain_once)
+            except Exception:  # pragma: no cover - keep the drainer alive
+                logger.exception("❌ Airtable outbox drain failed")
+            else:
+                if summary["delivered"]:
+                    logger.info(
+                        "✅ Delivered %s Airtable outbox entries", summary["delivered"]
+                    )
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(stop.wait(), timeout=self.poll_seconds)
+
+
+def create_airtable_outbox() -> Optional[AirtableOutbox]:
+    """Build the outbox from ``settings.outbox``, or ``None`` when disabled."""
+
+    if not settings.outbox.enabled:
+        return None
+    return AirtableOutbox()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Inspect or replay a screen's outbox entries."""
+
+    from demo.airtable_client import AirtableClient
+
+    parser = argparse.ArgumentParser(
+        prog="python -m demo.airtable_outbox",
+        description="Inspect and replay Airtable writes stored in the local outbox.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    status_cmd = commands.add_parser("status", help="List a screen's entries")
+    status_cmd.add_argument("screen_id")
+    replay_cmd = commands.add_parser(
+        "replay", help="Re-deliver a screen's failed and pending entries now"
+    )
+    replay_cmd.add_argument("screen_id")
+    args = parser.parse_args(argv)
+
+    outbox = AirtableOutbox()
+    if args.command == "status":
+        for entry in outbox.entries(args.screen_id):
+            print(
+                f"{entry.status:<10} {entry.operation:<6} {entry.table_name:<28} "
+                f"attempts={entry.attempts} record={entry.record_id or '-'}"
+                + (f" error={entry.last_error}" if entry.last_error else "")
+            )
+        return 0
+
+    requeued = outbox.requeue(args.screen_id)
+    client = AirtableClient(settings.airtable.api_key, settings.airtable.base_id)
+    summary = OutboxDrainer(outbox, client).drain_once(args.screen_id)
+    print(
+        f"Replayed {requeued} entries for {args.screen_id}: "
+        f"{summary['delivered']} delivered, {summary['failed']} failed"
+    )
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    logging.basicConfig(level=logging.INFO)
+    raise SystemExit(main())
@@ -0,0 +1,238 @@
+"""Write-behind buffer that coalesces Airtable record creates.
+
+Airtable allows about five requests per second per base, and every
+``Table.create`` is one request. Once research runs in parallel, a screen's
+assessment, deferred and automation-log writes queue up behind that limit.
+:class:`AirtableBatchWriter` instead collects creates per table and sends
+them as ``Table.batch_create`` calls of up to ten records (Airtable's
+per-request maximum). A buffer is flushed when it is full, when its oldest
+record has waited ``AIRTABLE_BATCH_FLUSH_SECONDS``, or when the caller
+flushes explicitly at the end of a screen.
+
+``create`` returns a :class:`concurrent.futures.Future` that resolves to the
+new record ID once its batch is written, or raises the batch's error.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, wait
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any, Callable, Optional
+
+from pyairtable import Table
+from pyairtable.api.types import RecordDict
+
+from demo.settings import settings
+
+__all__ = [
+    "MAX_BATCH_SIZE",
+    "AirtableBatchWriter",
+    "MissingRecordIdError",
+    "create_airtable_writer",
+]
+
+logger = logging.getLogger("demo.airtable_writer")
+
+# Airtable rejects batch requests with more than ten records.
+MAX_BATCH_SIZE = 10
+
+_BufferKey = tuple[Table, bool]
+BatchSender = Callable[[Table, list[dict[str, Any]], bool], list[RecordDict]]
+
+
+def _batch_create(
+    table: Table, records: list[dict[str, Any]], typecast: bool
+) -> list[RecordDict]:
+    return table.batch_create(records, typecast=typecast)
+
+
+class MissingRecordIdError(RuntimeError):
+    """Airtable accepted a create but returned no record ID for it."""
+
+
+@dataclass
+class _PendingCreate:
+    fields: dict[str, Any]
+    future: Future[str] = field(default_factory=Future)
+    queued_at: float = field(default_factory=monotonic)
+
+
+class AirtableBatchWriter:
+    """Buffer record creates per table and write them with ``batch_create``.
+
+    Thread-safe: creates may come from any thread. Full buffers are written
+    by the thread whose create filled them; time-based flushes run on a
+    daemon thread started with the first create.
+
+    Each batch is written by ``send`` (``Table.batch_create`` by default);
+    :class:`~demo.airtable_client.AirtableClient` points it at its
+    rate-limited, retrying create.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = MAX_BATCH_SIZE,
+        flush_seconds: float = 0.5,
+    ) -> None:
+        if not 1 <= batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}")
+        if flush_seconds <= 0:
+            raise ValueError("flush_seconds must be positive")
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self._buffers: dict[_BufferKey, list[_PendingCreate]] = {}
+        self._unresolved: set[Future[str]] = set()
+        self._cond = threading.Condition()
+        self._timer: Optional[threading.Thread] = None
+        self._closed = False
+        self.send: BatchSender = _batch_create
+
+    def create(
+        self, table: Table, fields: dict[str, Any], *, typecast: bool = False
+    ) -> Future[str]:
+        """Queue one record for ``table`` and return a future for its ID."""
+
+        pending = _PendingCreate(fields)
+        key = (table, typecast)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Airtable batch writer is closed")
+            buffer = self._buffers.setdefault(key, [])
+            buffer.append(pending)
+            self._unresolved.add(pending.future)
+            full = self._take(key) if len(buffer) >= self.batch_size else None
+            self._start_timer()
+            self._cond.notify()
+        pending.future.add_done_callback(self._resolved)
+        if full:
+            self._write(key, full)
+        return pending.future
+
+    def flush(self) -> None:
+        """Write every buffered record and wait for in-flight batches."""
+
+        with self._cond:
+            batches = [
+                (key, batch)
+                for key in list(self._buffers)
+                for batch in self._take_all(key)
+            ]
+            unresolved = set(self._unresolved)
+        for key, batch in batches:
+            self._write(key, batch)
+        wait(unresolved)
+
+    def close(self) -> None:
+        """Stop the flush thread and write whatever is still buffered."""
+
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            timer = self._timer
+        if timer is not None:
+            timer.join()
+        self.flush()
+
+    # ------------------------------------------------------------------
+    # Buffers (callers hold ``self._cond``)
+    # ------------------------------------------------------------------
+
+    def _take(self, key: _BufferKey) -> list[_PendingCreate]:
+        buffer = self._buffers[key]
+        batch, self._buffers[key] = (
+            buffer[: self.batch_size],
+            buffer[self.batch_size :],
+        )
+        if not self._buffers[key]:
+            del self._buffers[key]
+        return batch
+
+    def _take_all(self, key: _BufferKey) -> list[list[_PendingCreate]]:
+        batches: list[list[_PendingCreate]] = []
+        while key in self._buffers:
+            batches.append(self._take(key))
+        return batches
+
+    def _due(self, now: float) -> list[tuple[_BufferKey, list[_PendingCreate]]]:
+        return [
+            (key, batch)
+            for key, buffer in list(self._buffers.items())
+            if now - buffer[0].queued_at >= self.flush_seconds
+            for batch in self._take_all(key)
+        ]
+
+    def _seconds_until_due(self, now: float) -> Optional[float]:
+        if not self._buffers:
+            return None
+        oldest = min(buffer[0].queued_at for buffer in self._buffers.values())
+        return max(0.0, oldest + self.flush_seconds - now)
+
+    def _start_timer(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Thread(
+                target=self._run_timer, name="airtable-batch-writer", daemon=True
+            )
+            self._timer.start()
+
+    def _resolved(self, future: Future[str]) -> None:
+        with self._cond:
+            self._unresolved.discard(future)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _run_timer(self) -> None:
+        while True:
+            with self._cond:
+                due = self._due(monotonic())
+                while not due and not self._closed:
+                    self._cond.wait(self._seconds_until_due(monotonic()))
+                    due = self._due(monotonic())
+                if not due:
+                    return
+            for key, batch in due:
+                self._write(key, batch)
+
+    def _write(self, key: _BufferKey, batch: list[_PendingCreate]) -> None:
+        table, typecast = key
+        try:
+            records = self.send(table, [pending.fields for pending in batch], typecast)
+        except Exception as exc:
+            logger.error(
+                "❌ Batch create of %s records in %s failed: %s",
+                len(batch),
+                table.name,
+                exc,
+            )
+            for pending in batch:
+                pending.future.set_exception(exc)
+            return
+
+        logger.debug("Created %s records in %s", len(batch), table.name)
+        for index, pending in enumerate(batch):
+            record_id = records[index].get("id") if index < len(records) else None
+            if record_id:
+                pending.future.set_result(record_id)
+            else:
+                pending.future.set_exception(
+                    MissingRecordIdError(
+                        f"{table.name} record created but Airtable did not return "
+                        "record ID"
+                    )
+                )
+
+
+def create_airtable_writer() -> Optional[AirtableBatchWriter]:
+    """Build a writer from ``settings.airtable``, or ``None`` when disabled."""
+
+    config = settings.airtable
+    if not config.batch_writes:
+        return None
+    return AirtableBatchWriter(
+        batch_size=config.batch_size, flush_seconds=config.batch_flush_seconds
+    )
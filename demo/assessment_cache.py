@@ -0,0 +1,139 @@
+"""Memoized candidate assessments keyed by what the score actually depends on.
+
+Recruiters often re-trigger a screen after a trivial edit to the Screen
+record. The candidate research and role spec are unchanged, so the finished
+``AssessmentResult`` is stored under a key built from hashes of the research
+content, the role spec, the custom instructions and the assessment prompt
+version, and returned without calling the assessment agent again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from demo.models import AssessmentResult, ExecutiveResearchResult
+from demo.prompts import prompt_fingerprint
+from demo.settings import settings
+
+__all__ = [
+    "AssessmentCache",
+    "assessment_cache_key",
+    "get_assessment_cache",
+    "research_content_hash",
+    "reset_assessment_cache",
+]
+
+# Fields that change on every research run without changing its content.
+_VOLATILE_RESEARCH_FIELDS = {"research_timestamp"}
+
+
+def _sha256(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def research_content_hash(research: ExecutiveResearchResult) -> str:
+    """Hash of the research content, ignoring when it was produced."""
+
+    payload = research.model_dump(mode="json", exclude=_VOLATILE_RESEARCH_FIELDS)
+    return _sha256(json.dumps(payload, sort_keys=True))
+
+
+def _text_hash(text: Optional[str]) -> str:
+    # The assessment prompt strips both inputs, so surrounding whitespace and
+    # line-ending differences cannot change the score.
+    normalized = (text or "").replace("\r\n", "\n").strip()
+    return _sha256(normalized)
+
+
+def assessment_cache_key(
+    research: ExecutiveResearchResult,
+    role_spec_markdown: str,
+    custom_instructions: Optional[str] = None,
+) -> str:
+    """Stable key for an assessment of ``research`` against a role spec."""
+
+    parts = (
+        research_content_hash(research),
+        _text_hash(role_spec_markdown),
+        _text_hash(custom_instructions),
+        prompt_fingerprint("assessment"),
+    )
+    return _sha256("|".join(parts))
+
+
+class AssessmentCache:
+    """SQLite-backed store of finished ``AssessmentResult`` objects."""
+
+    def __init__(self, db_path: str | Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS assessment_cache ("
+                "key TEXT PRIMARY KEY, exec_name TEXT NOT NULL, "
+                "payload TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+
+    def get(self, key: str) -> Optional[AssessmentResult]:
+        """Return the memoized assessment for ``key``, if any."""
+
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT payload FROM assessment_cache WHERE key = ?", (key,)
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        return AssessmentResult.model_validate_json(row[0])
+
+    def put(self, key: str, assessment: AssessmentResult, *, exec_name: str) -> None:
+        """Store (or replace) the assessment for ``key``."""
+
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO assessment_cache "
+                "(key, exec_name, payload, created_at) VALUES (?, ?, ?, ?)",
+                (key, exec_name, assessment.model_dump_json(), time.time()),
+            )
+        finally:
+            conn.close()
+
+
+_cache_lock = threading.Lock()
+_cache: Optional[AssessmentCache] = None
+
+
+def get_assessment_cache() -> Optional[AssessmentCache]:
+    """Return the shared assessment cache, or ``None`` when it is disabled."""
+
+    global _cache
+    config = settings.cache
+    if not config.assessment_enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = AssessmentCache(config.db_path)
+        return _cache
+
+
+def reset_assessment_cache() -> None:
+    """Drop the shared cache handle (used by tests and after config changes)."""
+
+    global _cache
+    with _cache_lock:
+        _cache = None
@@ -0,0 +1,182 @@
+"""Deep Research submitted as a background response and polled to completion.
+
+A foreground Deep Research call holds one HTTP request open for the whole
+multi-minute run, so every outstanding candidate pins a connection (and, on
+the sync path, a worker thread) for up to ``OPENAI_TIMEOUT`` seconds. With
+``DEEP_RESEARCH_BACKGROUND`` enabled the research agent instead creates the
+response with ``background=True`` and polls ``responses.retrieve`` every
+``DEEP_RESEARCH_POLL_SECONDS``. Between polls the async path only awaits
+``asyncio.sleep``, so one event loop keeps dozens of research jobs
+outstanding without a thread or connection per job.
+
+A response that is still running after ``DEEP_RESEARCH_MAX_WAIT_SECONDS`` is
+cancelled and reported as a timeout.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Optional, Union
+
+from agno.exceptions import ModelProviderError
+from agno.models.message import Message
+from agno.models.openai import OpenAIResponses
+from agno.models.response import ModelResponse
+from agno.run.agent import RunOutput
+from openai import APIStatusError, OpenAIError
+from openai.types.responses import Response
+from pydantic import BaseModel
+
+from demo.rate_limit import RateLimitedOpenAIResponses
+from demo.settings import settings
+
+__all__ = ["BackgroundOpenAIResponses", "BackgroundResponseTimeout"]
+
+logger = logging.getLogger("demo.background_responses")
+
+_PENDING_STATUSES = frozenset({"queued", "in_progress"})
+
+
+class BackgroundResponseTimeout(TimeoutError):
+    """A background response did not finish within the configured wait."""
+
+
+class _BackgroundResponses(OpenAIResponses):
+    """``invoke``/``ainvoke`` that submit a background response and poll it."""
+
+    def _background_request(
+        self,
+        messages: list[Message],
+        response_format: Optional[Union[dict[str, Any], type[BaseModel]]],
+        tools: Optional[list[dict[str, Any]]],
+        tool_choice: Optional[Union[str, dict[str, Any]]],
+    ) -> dict[str, Any]:
+        params = self.get_request_params(
+            messages=messages,
+            response_format=response_format,
+            tools=tools,
+            tool_choice=tool_choice,
+        )
+        # Background responses must be stored so they can be retrieved.
+        params["store"] = True
+        return {
+            "model": self.id,
+            "input": self._format_messages(messages),
+            "background": True,
+            **params,
+        }
+
+    def _provider_error(self, exc: OpenAIError) -> ModelProviderError:
+        if isinstance(exc, APIStatusError):
+            return ModelProviderError(
+                message=exc.message,
+                status_code=exc.status_code,
+                model_name=self.name,
+                model_id=self.id,
+            )
+        return ModelProviderError(
+            message=str(exc), model_name=self.name, model_id=self.id
+        )
+
+    def _log_submitted(self, response: Response) -> None:
+        logger.info(
+            "Submitted background %s response %s (%s)",
+            self.id,
+            response.id,
+            response.status,
+        )
+
+    def _timeout(self, response: Response, waited: float) -> BackgroundResponseTimeout:
+        return BackgroundResponseTimeout(
+            f"Background response {response.id} still {response.status} "
+            f"after {waited:.0f}s; cancelled"
+        )
+
+    def _finish(
+        self,
+        response: Response,
+        response_format: Optional[Union[dict[str, Any], type[BaseModel]]],
+    ) -> ModelResponse:
+        if response.status != "completed" and response.error is None:
+            reason = getattr(response.incomplete_details, "reason", None)
+            raise ModelProviderError(
+                message=(
+                    f"Background response {response.id} ended as {response.status}"
+                    + (f" ({reason})" if reason else "")
+                ),
+                model_name=self.name,
+                model_id=self.id,
+            )
+        return self._parse_provider_response(response, response_format=response_format)
+
+    def invoke(
+        self,
+        messages: list[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[dict[str, Any], type[BaseModel]]] = None,
+        tools: Optional[list[dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, dict[str, Any]]] = None,
+        run_response: Optional[RunOutput] = None,
+    ) -> ModelResponse:
+        request = self._background_request(
+            messages, response_format, tools, tool_choice
+        )
+        client = self.get_client()
+        config = settings.openai
+        assistant_message.metrics.start_timer()  # type: ignore[no-untyped-call]
+        started_at = time.monotonic()
+        try:
+            response = client.responses.create(**request)
+            self._log_submitted(response)
+            while response.status in _PENDING_STATUSES:
+                waited = time.monotonic() - started_at
+                if waited >= config.deep_research_max_wait_seconds:
+                    client.responses.cancel(response.id)
+                    raise self._timeout(response, waited)
+                time.sleep(config.deep_research_poll_seconds)
+                response = client.responses.retrieve(response.id)
+        except OpenAIError as exc:
+            raise self._provider_error(exc) from exc
+        assistant_message.metrics.stop_timer()
+        return self._finish(response, response_format)
+
+    async def ainvoke(
+        self,
+        messages: list[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[dict[str, Any], type[BaseModel]]] = None,
+        tools: Optional[list[dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, dict[str, Any]]] = None,
+        run_response: Optional[RunOutput] = None,
+    ) -> ModelResponse:
+        request = self._background_request(
+            messages, response_format, tools, tool_choice
+        )
+        client = self.get_async_client()
+        config = settings.openai
+        assistant_message.metrics.start_timer()  # type: ignore[no-untyped-call]
+        started_at = time.monotonic()
+        try:
+            response = await client.responses.create(**request)
+            self._log_submitted(response)
+            while response.status in _PENDING_STATUSES:
+                waited = time.monotonic() - started_at
+                if waited >= config.deep_research_max_wait_seconds:
+                    await client.responses.cancel(response.id)
+                    raise self._timeout(response, waited)
+                await asyncio.sleep(config.deep_research_poll_seconds)
+                response = await client.responses.retrieve(response.id)
+        except OpenAIError as exc:
+            raise self._provider_error(exc) from exc
+        assistant_message.metrics.stop_timer()
+        return self._finish(response, response_format)
+
+
+class BackgroundOpenAIResponses(RateLimitedOpenAIResponses, _BackgroundResponses):
+    """Rate-limited model whose calls run as polled background responses.
+
+    Rate limiting and usage recording wrap the whole submit/poll cycle, like
+    a foreground call.
+    """
@@ -0,0 +1,122 @@
+"""Local blob store for raw Deep Research output.
+
+The Deep Research call is the most expensive step of a screen, but its output
+only becomes an ``ExecutiveResearchResult`` after the parser agent succeeds.
+``run_research`` therefore writes the raw markdown and citation dicts here as
+soon as the call returns, as one JSON file per candidate and run:
+
+    RESEARCH_BLOB_DIR/<candidate key>/<run key>.json
+
+The candidate key is :func:`demo.research_cache.research_cache_key`; the
+workflow uses its session ID (screen + candidate) as the run key, so a parser
+failure, a crashed worker or a later re-parse picks the blob up again instead
+of repeating Deep Research.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from demo.settings import settings
+
+__all__ = [
+    "RawResearch",
+    "ResearchBlobStore",
+    "get_research_blob_store",
+    "reset_research_blob_store",
+]
+
+# Deep Research output before parsing: {"markdown": str, "citations": [...]}.
+RawResearch = dict[str, Any]
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def _safe_name(value: str) -> str:
+    name = _UNSAFE.sub("_", value).strip("._")
+    if not name:
+        raise ValueError(f"Invalid blob key: {value!r}")
+    return name
+
+
+class ResearchBlobStore:
+    """Directory of raw Deep Research outputs keyed by candidate and run."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def path(self, candidate_key: str, run_key: str) -> Path:
+        return self.root / _safe_name(candidate_key) / f"{_safe_name(run_key)}.json"
+
+    def put(self, candidate_key: str, run_key: str, raw: RawResearch) -> Path:
+        """Write ``raw`` atomically, replacing any earlier blob for the run."""
+
+        path = self.path(candidate_key, run_key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(raw, handle, default=str)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return path
+
+    def get(
+        self,
+        candidate_key: str,
+        run_key: str,
+        max_age_seconds: Optional[float] = None,
+    ) -> Optional[RawResearch]:
+        """Return the stored output, or ``None`` if there is no readable blob.
+
+        Blobs older than ``max_age_seconds`` are ignored.
+        """
+
+        path = self.path(candidate_key, run_key)
+        try:
+            if (
+                max_age_seconds is not None
+                and time.time() - path.stat().st_mtime > max_age_seconds
+            ):
+                return None
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(raw, dict) or not isinstance(raw.get("markdown"), str):
+            return None
+        raw.setdefault("citations", [])
+        return raw
+
+
+_store_lock = threading.Lock()
+_store: Optional[ResearchBlobStore] = None
+
+
+def get_research_blob_store() -> Optional[ResearchBlobStore]:
+    """Return the shared blob store, or ``None`` when it is disabled."""
+
+    global _store
+    config = settings.cache
+    if not config.research_blob_enabled:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = ResearchBlobStore(config.research_blob_dir)
+        return _store
+
+
+def reset_research_blob_store() -> None:
+    """Drop the shared store handle (used by tests and after config changes)."""
+
+    global _store
+    with _store_lock:
+        _store = None
@@ -0,0 +1,316 @@
+"""Per-screen spend budgets for candidate screening.
+
+A screen of fifty candidates launches fifty Deep Research runs unless
+something stops it. :class:`ScreenBudget` caps a screen's spend in dollars
+and/or tokens:
+
+- every model call made while the budget is active (see :func:`use_budget`)
+  is added to its running totals, priced with ``OPENAI_MODEL_PRICES``, and
+  attributed to the workflow step that made it (:func:`budget_step`);
+- each Deep Research launch first reserves its estimated cost
+  (:func:`deep_research_allowance`), so concurrent candidates cannot all
+  start research against the same remaining headroom;
+- once the remaining budget cannot cover another launch,
+  :class:`BudgetExhaustedError` is raised and the candidate is deferred.
+
+:func:`order_by_expected_fit` puts the candidates most likely to fit first,
+using only their titles, so the budget is spent on them before it runs out.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from demo.models import CandidateDict
+from demo.settings import settings
+from demo.triage import TRIAGE_ADVANCE, triage_by_title
+from demo.usage import ModelUsage, track_usage
+
+__all__ = [
+    "BudgetExhaustedError",
+    "ScreenBudget",
+    "budget_step",
+    "current_budget",
+    "deep_research_allowance",
+    "order_by_expected_fit",
+    "usage_cost",
+    "use_budget",
+]
+
+logger = logging.getLogger("demo.budget")
+
+
+class BudgetExhaustedError(RuntimeError):
+    """Raised instead of launching Deep Research once the budget is spent.
+
+    Args:
+        message: Human-readable reason, recorded on the deferred candidate.
+        budget: The budget that refused the launch.
+    """
+
+    def __init__(self, message: str, budget: Optional[ScreenBudget] = None) -> None:
+        super().__init__(message)
+        self.budget = budget
+
+
+def usage_cost(
+    model_id: str,
+    usage: ModelUsage,
+    prices: Optional[dict[str, dict[str, float]]] = None,
+) -> float:
+    """Dollar cost of ``usage`` for ``model_id``; unknown models cost nothing."""
+
+    price = (prices or settings.budget.model_prices).get(model_id)
+    if price is None:
+        return 0.0
+    uncached = usage.input_tokens - usage.cached_tokens
+    cost = (
+        uncached * price.get("input", 0.0)
+        + usage.cached_tokens * price.get("cached_input", price.get("input", 0.0))
+        + usage.output_tokens * price.get("output", 0.0)
+    )
+    return cost / 1_000_000
+
+
+def _tokens(usage: dict[str, ModelUsage]) -> int:
+    return sum(
+        model.input_tokens + model.output_tokens for model in list(usage.values())
+    )
+
+
+class ScreenBudget:
+    """Dollar/token cap for one screen, shared by all of its candidates.
+
+    Args:
+        max_usd: Spend cap in dollars, or ``None`` for no dollar cap.
+        max_tokens: Cap on input plus output tokens, or ``None``.
+        deep_research_estimate_usd: Dollars reserved per Deep Research launch
+            until its actual usage is known.
+        deep_research_estimate_tokens: Tokens reserved per launch.
+        prices: Per-model prices; defaults to ``OPENAI_MODEL_PRICES``.
+    """
+
+    def __init__(
+        self,
+        max_usd: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        *,
+        deep_research_estimate_usd: float = 0.0,
+        deep_research_estimate_tokens: int = 0,
+        prices: Optional[dict[str, dict[str, float]]] = None,
+    ) -> None:
+        self.max_usd = max_usd
+        self.max_tokens = max_tokens
+        self.deep_research_estimate_usd = deep_research_estimate_usd
+        self.deep_research_estimate_tokens = deep_research_estimate_tokens
+        self.prices = prices or dict(settings.budget.model_prices)
+        self.usage: dict[str, ModelUsage] = {}
+        self._steps: dict[str, dict[str, ModelUsage]] = {}
+        self._lock = threading.Lock()
+        self._reserved_usd = 0.0
+        self._reserved_tokens = 0
+        self.deep_research_launched = 0
+        self.deep_research_refused = 0
+
+    @classmethod
+    def from_settings(
+        cls,
+        max_usd: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Optional[ScreenBudget]:
+        """Budget from ``SCREEN_BUDGET_*`` (with per-screen overrides).
+
+        Returns ``None`` when neither a dollar nor a token cap is configured.
+        """
+
+        config = settings.budget
+        max_usd = max_usd or config.max_usd
+        max_tokens = max_tokens or config.max_tokens
+        if max_usd is None and max_tokens is None:
+            return None
+        return cls(
+            max_usd,
+            max_tokens,
+            deep_research_estimate_usd=config.deep_research_estimate_usd,
+            deep_research_estimate_tokens=config.deep_research_estimate_tokens,
+            prices=config.model_prices,
+        )
+
+    def _cost(self, usage: dict[str, ModelUsage]) -> float:
+        return sum(
+            usage_cost(model_id, model, self.prices)
+            for model_id, model in list(usage.items())
+        )
+
+    @property
+    def spent_usd(self) -> float:
+        return self._cost(self.usage)
+
+    @property
+    def spent_tokens(self) -> int:
+        return _tokens(self.usage)
+
+    def _fits(self, usd: float, tokens: int) -> bool:
+        if self.max_usd is not None and self.spent_usd + usd > self.max_usd:
+            return False
+        if self.max_tokens is not None and self.spent_tokens + tokens > self.max_tokens:
+            return False
+        return True
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether the budget cannot cover another Deep Research launch."""
+
+        with self._lock:
+            return not self._fits(
+                self._reserved_usd + self.deep_research_estimate_usd,
+                self._reserved_tokens + self.deep_research_estimate_tokens,
+            )
+
+    @contextmanager
+    def reserve_deep_research(self) -> Iterator[None]:
+        """Hold the estimated cost of one Deep Research run while it executes.
+
+        Raises:
+            BudgetExhaustedError: The launch does not fit in the budget.
+        """
+
+        usd = self.deep_research_estimate_usd
+        tokens = self.deep_research_estimate_tokens
+        with self._lock:
+            if not self._fits(self._reserved_usd + usd, self._reserved_tokens + tokens):
+                self.deep_research_refused += 1
+                message = (
+                    f"Screen budget exhausted (${self.spent_usd:.2f} of "
+                    f"{self._limit_label()} spent); Deep Research deferred"
+                )
+                logger.warning(message)
+                raise BudgetExhaustedError(message, self)
+            self._reserved_usd += usd
+            self._reserved_tokens += tokens
+            self.deep_research_launched += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._reserved_usd -= usd
+                self._reserved_tokens -= tokens
+
+    def _limit_label(self) -> str:
+        limits = []
+        if self.max_usd is not None:
+            limits.append(f"${self.max_usd:.2f}")
+        if self.max_tokens is not None:
+            limits.append(f"{self.max_tokens} tokens")
+        return " / ".join(limits)
+
+    def step_usage(self, step: str) -> dict[str, ModelUsage]:
+        """Usage totals attributed to ``step`` (created on first use)."""
+
+        with self._lock:
+            return self._steps.setdefault(step, {})
+
+    def snapshot(self) -> dict[str, Any]:
+        """Caps, spend so far and spend per workflow step."""
+
+        with self._lock:
+            steps = {
+                step: {
+                    "spent_usd": round(self._cost(usage), 4),
+                    "tokens": _tokens(usage),
+                }
+                for step, usage in sorted(self._steps.items())
+            }
+        return {
+            "max_usd": self.max_usd,
+            "max_tokens": self.max_tokens,
+            "spent_usd": round(self.spent_usd, 4),
+            "spent_tokens": self.spent_tokens,
+            "exhausted": self.exhausted,
+            "deep_research_launched": self.deep_research_launched,
+            "deep_research_refused": self.deep_research_refused,
+            "steps": steps,
+        }
+
+
+_current: ContextVar[Optional[ScreenBudget]] = ContextVar("screen_budget", default=None)
+
+
+def current_budget() -> Optional[ScreenBudget]:
+    """Budget of the screen whose candidate is running in this context."""
+
+    return _current.get()
+
+
+@contextmanager
+def use_budget(budget: Optional[ScreenBudget]) -> Iterator[None]:
+    """Charge model calls made inside the block to ``budget`` (if any)."""
+
+    if budget is None:
+        yield
+        return
+    token = _current.set(budget)
+    try:
+        with track_usage(budget.usage):
+            yield
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def budget_step(step: str) -> Iterator[None]:
+    """Attribute model calls inside the block to ``step`` of the active budget."""
+
+    budget = _current.get()
+    if budget is None:
+        yield
+        return
+    with track_usage(budget.step_usage(step)):
+        yield
+
+
+@contextmanager
+def deep_research_allowance(use_deep_research: bool = True) -> Iterator[None]:
+    """Reserve budget for a Deep Research launch; no-op without a budget.
+
+    Raises:
+        BudgetExhaustedError: The active budget cannot cover the launch.
+    """
+
+    budget = _current.get()
+    if budget is None or not use_deep_research:
+        yield
+        return
+    with budget.reserve_deep_research():
+        yield
+
+
+def _fit_rank(candidate: CandidateDict, role_type: str) -> int:
+    title = candidate.get("title") or candidate.get("current_title") or ""
+    decision = triage_by_title(title, role_type)
+    if decision.verdict != TRIAGE_ADVANCE:
+        return 2
+    return 0 if decision.conclusive else 1
+
+
+def order_by_expected_fit(
+    candidates: list[CandidateDict], role_type: Optional[str]
+) -> list[int]:
+    """Indices of ``candidates`` with the likeliest fits first.
+
+    Titles in the searched role family come first, then titles that do not
+    indicate a role family, then titles from another family. Payload order is
+    kept within each group, and when ``role_type`` is unknown.
+    """
+
+    if not role_type:
+        return list(range(len(candidates)))
+    return sorted(
+        range(len(candidates)),
+        key=lambda index: _fit_rank(candidates[index], role_type),
+    )
@@ -0,0 +1,270 @@
+"""Adaptive (AIMD) concurrency control for candidate screening.
+
+A fixed ``SCREEN_MAX_CONCURRENT_CANDIDATES`` is either too timid when the
+OpenAI quota has headroom or triggers rate-limit storms when it does not. The
+controller here grows the number of in-flight candidates by a constant step on
+every success and multiplies it down on congestion (HTTP 429 or an expired
+``settings.openai.timeout``), the same additive-increase/multiplicative-decrease
+scheme TCP uses. One controller is shared per process because the quota is.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import httpx
+import openai
+from agno.exceptions import ModelProviderError
+
+from demo.settings import settings
+
+__all__ = [
+    "CONGESTION_RATE_LIMIT",
+    "CONGESTION_TIMEOUT",
+    "AdaptiveConcurrencyController",
+    "classify_congestion",
+    "get_concurrency_controller",
+    "reset_concurrency_controller",
+]
+
+logger = logging.getLogger("demo.concurrency")
+
+CONGESTION_RATE_LIMIT = "rate_limit"
+CONGESTION_TIMEOUT = "timeout"
+
+
+def _exception_chain(exc: BaseException) -> list[BaseException]:
+    chain: list[BaseException] = []
+    current: Optional[BaseException] = exc
+    while current is not None and current not in chain:
+        chain.append(current)
+        current = current.__cause__ or current.__context__
+    return chain
+
+
+def classify_congestion(
+    exc: BaseException, elapsed: Optional[float] = None
+) -> Optional[str]:
+    """Return the congestion signal carried by ``exc``, if any.
+
+    Agents wrap provider errors (``RuntimeError`` → ``ModelProviderError`` →
+    ``openai`` error), so the whole ``__cause__`` chain is inspected. A failure
+    that took at least ``settings.openai.timeout`` seconds also counts as a
+    timeout even when the original exception was swallowed.
+    """
+
+    for error in _exception_chain(exc):
+        if isinstance(error, openai.RateLimitError):
+            return CONGESTION_RATE_LIMIT
+        if isinstance(error, ModelProviderError) and error.status_code == 429:
+            return CONGESTION_RATE_LIMIT
+        if isinstance(
+            error, (openai.APITimeoutError, httpx.TimeoutException, TimeoutError)
+        ):
+            return CONGESTION_TIMEOUT
+    if elapsed is not None and elapsed >= settings.openai.timeout:
+        return CONGESTION_TIMEOUT
+    return None
+
+
+@dataclass(frozen=True)
+class _Ticket:
+    """Handed out by ``acquire``; records when the slot was taken."""
+
+    started_at: float
+
+
+class AdaptiveConcurrencyController:
+    """AIMD window over in-flight candidates, usable from threads and coroutines.
+
+    Args:
+        initial: Starting window size.
+        min_limit: Window never shrinks below this.
+        max_limit: Window never grows beyond this.
+        increase: Amount added to the window per successful candidate.
+        decrease_factor: Multiplier applied to the window on congestion.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        min_limit: int = 1,
+        max_limit: int,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self._limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._successes = 0
+        self._congestion_events = 0
+        self._last_decrease = float("-inf")
+        self._cond = threading.Condition()
+        self._async_waiters: deque[
+            tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]
+        ] = deque()
+
+    @property
+    def window(self) -> int:
+        """Current number of candidates allowed in flight."""
+
+        return max(self.min_limit, math.floor(self._limit))
+
+    def snapshot(self) -> dict[str, Any]:
+        """Metric view of the controller state."""
+
+        with self._cond:
+            return {
+                "window": self.window,
+                "limit": round(self._limit, 2),
+                "in_flight": self._in_flight,
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "successes": self._successes,
+                "congestion_events": self._congestion_events,
+            }
+
+    # ------------------------------------------------------------------
+    # Slots
+    # ------------------------------------------------------------------
+
+    def _try_take(self) -> Optional[_Ticket]:
+        if self._in_flight < self.window:
+            self._in_flight += 1
+            return _Ticket(started_at=time.monotonic())
+        return None
+
+    def acquire(self) -> _Ticket:
+        """Block the calling thread until a slot in the window is free."""
+
+        with self._cond:
+            while (ticket := self._try_take()) is None:
+                self._cond.wait()
+            return ticket
+
+    async def aacquire(self) -> _Ticket:
+        """Wait on the event loop until a slot in the window is free."""
+
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                ticket = self._try_take()
+                if ticket is not None:
+                    return ticket
+                waiter: asyncio.Future[None] = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._cond:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+                raise
+
+    def release(
+        self,
+        ticket: _Ticket,
+        *,
+        succeeded: bool,
+        congestion: Optional[str] = None,
+    ) -> None:
+        """Return a slot and adjust the window from the candidate's outcome.
+
+        Successes grow the window, congestion shrinks it, and other failures
+        (bad data, parser errors) leave it unchanged.
+        """
+
+        with self._cond:
+            self._in_flight -= 1
+            if congestion is not None:
+                self._on_congestion(congestion, ticket.started_at)
+            elif succeeded:
+                self._on_success()
+            self._wake()
+
+    def signal_congestion(self, kind: str, started_at: float) -> None:
+        """Shrink the window for a congestion signal observed outside a slot.
+
+        Called by the rate-limited model wrapper so 429s that Agno retries
+        successfully still slow the screen down. ``started_at`` is the
+        ``time.monotonic()`` value when the failing API call began.
+        """
+
+        with self._cond:
+            self._on_congestion(kind, started_at)
+
+    # ------------------------------------------------------------------
+    # AIMD
+    # ------------------------------------------------------------------
+
+    def _on_success(self) -> None:
+        self._successes += 1
+        previous = self.window
+        self._limit = min(float(self.max_limit), self._limit + self.increase)
+        if self.window != previous:
+            logger.info("Concurrency window increased to %s", self.window)
+
+    def _on_congestion(self, kind: str, started_at: float) -> None:
+        self._congestion_events += 1
+        # Requests that were already in flight when the window last shrank saw
+        # the same congestion episode; only back off once per episode.
+        if started_at <= self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        logger.warning(
+            "Concurrency window reduced to %s after upstream %s", self.window, kind
+        )
+
+    def _wake(self) -> None:
+        self._cond.notify_all()
+        while self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            loop.call_soon_threadsafe(_resolve, waiter)
+
+
+def _resolve(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+_controller_lock = threading.Lock()
+_controller: Optional[AdaptiveConcurrencyController] = None
+
+
+def get_concurrency_controller() -> Optional[AdaptiveConcurrencyController]:
+    """Return the process-wide controller, or ``None`` when adaptivity is off."""
+
+    global _controller
+    config = settings.screening
+    if not config.adaptive_concurrency:
+        return None
+    with _controller_lock:
+        if _controller is None:
+            _controller = AdaptiveConcurrencyController(
+                config.max_concurrent_candidates,
+                min_limit=config.adaptive_min_candidates,
+                max_limit=config.adaptive_max_candidates,
+                increase=config.adaptive_increase,
+                decrease_factor=config.adaptive_decrease_factor,
+            )
+        return _controller
+
+
+def reset_concurrency_controller() -> None:
+    """Discard the shared controller (used by tests and after config changes)."""
+
+    global _controller
+    with _controller_lock:
+        _controller = None
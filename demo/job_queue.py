@@ -0,0 +1,414 @@
+"""Durable SQLite-backed job queue for screen requests.
+
+Jobs survive process restarts: a worker leases a job for a fixed period and
+extends the lease with heartbeats while it runs. If the worker dies the lease
+expires and another worker picks the job up again. Successful candidate
+results are checkpointed per job so a resumed job only re-runs candidates that
+had not been written to Airtable yet.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, Optional
+from uuid import uuid4
+
+from demo.settings import settings
+
+__all__ = [
+    "JOB_FAILED",
+    "JOB_QUEUED",
+    "JOB_RUNNING",
+    "JOB_SUCCEEDED",
+    "ScreenJob",
+    "ScreenJobQueue",
+]
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS screen_jobs (
+    job_id TEXT PRIMARY KEY,
+    screen_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    last_error TEXT,
+    result TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_screen_jobs_screen ON screen_jobs (screen_id);
+CREATE INDEX IF NOT EXISTS idx_screen_jobs_status ON screen_jobs (status, available_at);
+CREATE TABLE IF NOT EXISTS screen_job_candidates (
+    job_id TEXT NOT NULL,
+    candidate_id TEXT NOT NULL,
+    result TEXT NOT NULL,
+    completed_at REAL NOT NULL,
+    PRIMARY KEY (job_id, candidate_id)
+);
+"""
+
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+@dataclass
+class ScreenJob:
+    """A queued screen request and its delivery state."""
+
+    job_id: str
+    screen_id: str
+    payload: dict[str, Any]
+    status: str
+    attempts: int
+    max_attempts: int
+    available_at: float
+    created_at: float
+    updated_at: float
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[float] = None
+    last_error: Optional[str] = None
+    result: Optional[dict[str, Any]] = None
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    completed_candidates: int = field(default=0)
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row, completed_candidates: int = 0) -> ScreenJob:
+        return cls(
+            job_id=row["job_id"],
+            screen_id=row["screen_id"],
+            payload=json.loads(row["payload"]),
+            status=row["status"],
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            available_at=row["available_at"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            lease_owner=row["lease_owner"],
+            lease_expires_at=row["lease_expires_at"],
+            last_error=row["last_error"],
+            result=json.loads(row["result"]) if row["result"] else None,
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+            completed_candidates=completed_candidates,
+        )
+
+    def to_status(self) -> dict[str, Any]:
+        """Public status payload for ``GET /screens/{screen_id}/status``."""
+
+        candidates = self.payload.get("candidates") or []
+        return {
+            "screen_id": self.screen_id,
+            "job_id": self.job_id,
+            "status": self.status,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "candidates_total": len(candidates),
+            "candidates_completed": self.completed_candidates,
+            "created_at": _iso(self.created_at),
+            "updated_at": _iso(self.updated_at),
+            "started_at": _iso(self.started_at),
+            "finished_at": _iso(self.finished_at),
+            "error": self.last_error,
+            "result": self.result,
+        }
+
+
+class ScreenJobQueue:
+    """Persistent queue of screen jobs stored in a local SQLite database.
+
+    Every method opens its own connection, so one queue instance can be shared
+    between threads and several worker processes can use the same file.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str | Path] = None,
+        *,
+        max_attempts: Optional[int] = None,
+        retry_backoff_seconds: Optional[float] = None,
+    ) -> None:
+        self.db_path = Path(db_path or settings.job_queue.db_path)
+        self.max_attempts = max_attempts or settings.job_queue.max_attempts
+        self.retry_backoff_seconds = (
+            settings.job_queue.retry_backoff_seconds
+            if retry_backoff_seconds is None
+            else retry_backoff_seconds
+        )
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction that takes the database lock up front."""
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+
+    def enqueue(self, screen_id: str, payload: dict[str, Any]) -> ScreenJob:
+        """Queue a screen for processing.
+
+        If the screen already has a queued or running job, that job is returned
+        instead of creating a duplicate (Airtable may deliver a webhook twice).
+        """
+
+        now = time.time()
+        with self._transaction() as conn:
+            existing = conn.execute(
+                "SELECT * FROM screen_jobs WHERE screen_id = ? AND status IN (?, ?) "
+                "ORDER BY created_at DESC LIMIT 1",
+                (screen_id, JOB_QUEUED, JOB_RUNNING),
+            ).fetchone()
+            if existing is not None:
+                return ScreenJob.from_row(existing)
+
+            job_id = uuid4().hex
+            conn.execute(
+                "INSERT INTO screen_jobs (job_id, screen_id, payload, status, "
+                "attempts, max_attempts, available_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, 0, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    screen_id,
+                    json.dumps(payload, default=str),
+                    JOB_QUEUED,
+                    self.max_attempts,
+                    now,
+                    now,
+                    now,
+                ),
+            )
+            row = conn.execute(
+                "SELECT * FROM screen_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return ScreenJob.from_row(row)
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def lease(self, worker_id: str, lease_seconds: float) -> Optional[ScreenJob]:
+        """Claim the oldest runnable job, or return ``None`` if there is none.
+
+        Runnable jobs are queued jobs whose retry delay has elapsed and running
+        jobs whose lease expired (their worker stopped heartbeating). An expired
+        job that has used all of its attempts is marked failed instead.
+        """
+
+        while True:
+            now = time.time()
+            with self._transaction() as conn:
+                row = conn.execute(
+                    "SELECT * FROM screen_jobs WHERE "
+                    "(status = ? AND available_at <= ?) OR "
+                    "(status = ? AND lease_expires_at < ?) "
+                    "ORDER BY created_at LIMIT 1",
+                    (JOB_QUEUED, now, JOB_RUNNING, now),
+                ).fetchone()
+                if row is None:
+                    return None
+
+                if (
+                    row["status"] == JOB_RUNNING
+                    and row["attempts"] >= row["max_attempts"]
+                ):
+                    conn.execute(
+                        "UPDATE screen_jobs SET status = ?, lease_owner = NULL, "
+                        "lease_expires_at = NULL, last_error = ?, updated_at = ?, "
+                        "finished_at = ? WHERE job_id = ?",
+                        (
+                            JOB_FAILED,
+                            row["last_error"] or "Worker lease expired",
+                            now,
+                            now,
+                            row["job_id"],
+                        ),
+                    )
+                    continue
+
+                conn.execute(
+                    "UPDATE screen_jobs SET status = ?, attempts = attempts + 1, "
+                    "lease_owner = ?, lease_expires_at = ?, updated_at = ?, "
+                    "started_at = COALESCE(started_at, ?) WHERE job_id = ?",
+                    (
+                        JOB_RUNNING,
+                        worker_id,
+                        now + lease_seconds,
+                        now,
+                        now,
+                        row["job_id"],
+                    ),
+                )
+                leased = conn.execute(
+                    "SELECT * FROM screen_jobs WHERE job_id = ?", (row["job_id"],)
+                ).fetchone()
+            return ScreenJob.from_row(leased)
+
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """Extend a lease. Returns ``False`` if the worker no longer owns the job."""
+
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE screen_jobs SET lease_expires_at = ?, updated_at = ? "
+                "WHERE job_id = ? AND lease_owner = ? AND status = ?",
+                (now + lease_seconds, now, job_id, worker_id, JOB_RUNNING),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: str, worker_id: str, result: dict[str, Any]) -> bool:
+        """Mark a leased job as succeeded and store its response payload."""
+
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE screen_jobs SET status = ?, result = ?, last_error = NULL, "
+                "lease_owner = NULL, lease_expires_at = NULL, updated_at = ?, "
+                "finished_at = ? WHERE job_id = ? AND lease_owner = ?",
+                (
+                    JOB_SUCCEEDED,
+                    json.dumps(result, default=str),
+                    now,
+                    now,
+                    job_id,
+                    worker_id,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def fail(
+        self, job_id: str, worker_id: str, error: str, *, retry: bool = True
+    ) -> Optional[str]:
+        """Record a failed attempt.
+
+        The job is re-queued with exponential backoff while attempts remain and
+        ``retry`` is true; otherwise it is marked failed.
+
+        Returns:
+            The job's new status, or ``None`` if the worker no longer owns it.
+        """
+
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM screen_jobs "
+                "WHERE job_id = ? AND lease_owner = ?",
+                (job_id, worker_id),
+            ).fetchone()
+            if row is None:
+                return None
+
+            if retry and row["attempts"] < row["max_attempts"]:
+                delay = self.retry_backoff_seconds * (2 ** (row["attempts"] - 1))
+                conn.execute(
+                    "UPDATE screen_jobs SET status = ?, available_at = ?, "
+                    "last_error = ?, lease_owner = NULL, lease_expires_at = NULL, "
+                    "updated_at = ? WHERE job_id = ?",
+                    (JOB_QUEUED, now + delay, error, now, job_id),
+                )
+                return JOB_QUEUED
+
+            conn.execute(
+                "UPDATE screen_jobs SET status = ?, last_error = ?, "
+                "lease_owner = NULL, lease_expires_at = NULL, updated_at = ?, "
+                "finished_at = ? WHERE job_id = ?",
+                (JOB_FAILED, error, now, now, job_id),
+            )
+            return JOB_FAILED
+
+    def record_candidate_result(
+        self, job_id: str, candidate_id: str, result: dict[str, Any]
+    ) -> None:
+        """Checkpoint a candidate whose assessment has been written to Airtable."""
+
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO screen_job_candidates "
+                "(job_id, candidate_id, result, completed_at) VALUES (?, ?, ?, ?)",
+                (job_id, candidate_id, json.dumps(result, default=str), time.time()),
+            )
+
+    def completed_candidate_results(self, job_id: str) -> dict[str, dict[str, Any]]:
+        """Return checkpointed candidate results for a job keyed by candidate ID."""
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT candidate_id, result FROM screen_job_candidates "
+                "WHERE job_id = ?",
+                (job_id,),
+            ).fetchall()
+        return {row["candidate_id"]: json.loads(row["result"]) for row in rows}
+
+    # ------------------------------------------------------------------
+    # Status
+    # ------------------------------------------------------------------
+
+    def get_job(self, job_id: str) -> Optional[ScreenJob]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM screen_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            return self._with_progress(conn, row)
+
+    def latest_for_screen(self, screen_id: str) -> Optional[ScreenJob]:
+        """Return the most recent job for a screen, if any."""
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM screen_jobs WHERE screen_id = ? "
+                "ORDER BY created_at DESC LIMIT 1",
+                (screen_id,),
+            ).fetchone()
+            return self._with_progress(conn, row)
+
+    @staticmethod
+    def _with_progress(
+        conn: sqlite3.Connection, row: Optional[sqlite3.Row]
+    ) -> Optional[ScreenJob]:
+        if row is None:
+            return None
+        (completed,) = conn.execute(
+            "SELECT COUNT(*) FROM screen_job_candidates WHERE job_id = ?",
+            (row["job_id"],),
+        ).fetchone()
+        return ScreenJob.from_row(row, completed_candidates=completed)
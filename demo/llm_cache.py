@@ -0,0 +1,231 @@
+"""Content-addressed cache of structured agent responses.
+
+The research parser and assessment agents are close to pure functions of the
+prompt they receive, the model that answers it and the catalog entry that
+configures the agent. Re-running a screen would otherwise pay for every call
+again, so the validated output model is stored under a hash of those inputs
+(plus the output schema) and served from disk on the next identical call.
+
+The store is bounded by ``LLM_CACHE_MAX_MB``; least recently used entries are
+evicted first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from demo.prompts import prompt_fingerprint
+from demo.settings import settings
+
+__all__ = [
+    "LLMResponseCache",
+    "get_llm_cache",
+    "llm_cache_key",
+    "reset_llm_cache",
+]
+
+logger = logging.getLogger("demo.llm_cache")
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def llm_cache_key(
+    prompt_name: str,
+    model_id: str,
+    prompt: str,
+    output_schema: type[BaseModel],
+) -> str:
+    """Hash everything that determines an agent's structured response."""
+
+    material = json.dumps(
+        {
+            "prompt_name": prompt_name,
+            "catalog": prompt_fingerprint(prompt_name),
+            "model_id": model_id,
+            "schema": output_schema.model_json_schema(),
+            "prompt": prompt,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed, size-bounded LRU store of agent output models.
+
+    Args:
+        db_path: SQLite file; shared with the other caches in ``CACHE_DB_PATH``.
+        max_bytes: Total payload size kept before LRU eviction kicks in.
+    """
+
+    def __init__(self, db_path: str | Path, max_bytes: int) -> None:
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._counter_lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, prompt_name TEXT NOT NULL, "
+                "model_id TEXT NOT NULL, payload TEXT NOT NULL, "
+                "size INTEGER NOT NULL, created_at REAL NOT NULL, "
+                "last_used_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS llm_cache_lru ON llm_cache (last_used_at)"
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._counter_lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def get(self, key: str, model_cls: type[ModelT]) -> Optional[ModelT]:
+        """Return the cached response for ``key`` and mark it recently used."""
+
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT payload FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE llm_cache SET last_used_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+        finally:
+            conn.close()
+
+        if row is None:
+            self._count("misses")
+            return None
+        try:
+            response = model_cls.model_validate_json(row[0])
+        except ValidationError:
+            logger.warning("Dropping unreadable LLM cache entry %s", key[:12])
+            self.invalidate(key)
+            self._count("misses")
+            return None
+        self._count("hits")
+        return response
+
+    def put(
+        self, key: str, response: BaseModel, *, prompt_name: str, model_id: str
+    ) -> None:
+        """Store ``response`` and evict least recently used entries over budget."""
+
+        payload = response.model_dump_json()
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, prompt_name, model_id, "
+                "payload, size, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, prompt_name, model_id, payload, size, now, now),
+            )
+            evicted = self._evict(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        if evicted:
+            self._count("evictions", evicted)
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        (total,) = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM llm_cache"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return 0
+        victims: list[str] = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM llm_cache ORDER BY last_used_at ASC"
+        ):
+            if total <= self.max_bytes:
+                break
+            victims.append(key)
+            total -= size
+        conn.executemany(
+            "DELETE FROM llm_cache WHERE key = ?", [(key,) for key in victims]
+        )
+        return len(victims)
+
+    def invalidate(self, key: str) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+        finally:
+            conn.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for this process plus the on-disk footprint."""
+
+        conn = self._connect()
+        try:
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()
+        finally:
+            conn.close()
+        with self._counter_lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "evictions": self.evictions,
+                "entries": entries,
+                "bytes": size,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_cache_lock = threading.Lock()
+_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Return the shared response cache, or ``None`` when it is disabled."""
+
+    global _cache
+    config = settings.cache
+    if not config.llm_enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResponseCache(
+                config.db_path, int(config.llm_max_mb * 1024 * 1024)
+            )
+        return _cache
+
+
+def reset_llm_cache() -> None:
+    """Drop the shared cache handle (used by tests and after config changes)."""
+
+    global _cache
+    with _cache_lock:
+        _cache = None
@@ -118,6 +118,43 @@ class AssessmentResult(BaseModel):
     role_spec_used: Optional[str] = None
 
 
+class TriageResult(BaseModel):
+    """Small-model verdict on whether a candidate is worth researching."""
+
+    verdict: Literal["advance", "deprioritize", "drop"]
+    reason: str  # One sentence
+
+
+class SpecAssessmentResult(AssessmentResult):
+    """Assessment for one labelled role spec inside a multi-spec call."""
+
+    spec_id: str
+
+
+class BatchedAssessmentResult(BaseModel):
+    """Structured output of one assessment call covering several role specs."""
+
+    assessments: list[SpecAssessmentResult]
+
+
+class AssessmentTarget(BaseModel):
+    """One screen/role spec a candidate is scored against in a fan-out run."""
+
+    screen_id: str
+    role_spec_markdown: str
+    custom_instructions: Optional[str] = None
+
+
+class CandidateFanoutResult(BaseModel):
+    """Research shared by a candidate's assessments across several role specs."""
+
+    session_id: str
+    research: Optional[ExecutiveResearchResult] = None
+    # Keyed by screen_id
+    assessments: dict[str, AssessmentResult] = Field(default_factory=dict)
+    errors: dict[str, str] = Field(default_factory=dict)
+
+
 class RoleSpecData(BaseModel):
     """Role spec data from role_spec_slug.role_spec."""
 
@@ -197,6 +234,9 @@ class ScreenSlugData(BaseModel):
     role_spec_slug: RoleSpecSlug
     search_slug: SearchSlug
     candidate_slugs: list[CandidateSlug]
+    force_refresh: bool = False
+    force_rerun: bool = False
+    budget_usd: Optional[float] = Field(default=None, gt=0)
 
 
 class ScreenWebhookPayload(BaseModel):
@@ -257,6 +297,11 @@ class ScreenWebhookPayload(BaseModel):
         role = self.screen_slug.search_slug.role
         return role.role_title or role.role_type
 
+    @property
+    def role_type(self) -> str:
+        """Get role type (e.g. ``CFO``) from search info."""
+        return self.screen_slug.search_slug.role.role_type
+
     @property
     def portco_name(self) -> str:
         """Get portfolio company name."""
@@ -268,6 +313,21 @@ class ScreenWebhookPayload(BaseModel):
         # Not in current payload structure, but can be added
         return None
 
+    @property
+    def force_refresh(self) -> bool:
+        """Whether cached Deep Research should be ignored for this screen."""
+        return self.screen_slug.force_refresh
+
+    @property
+    def force_rerun(self) -> bool:
+        """Whether stored workflow progress should be discarded for this screen."""
+        return self.screen_slug.force_rerun
+
+    @property
+    def budget_usd(self) -> Optional[float]:
+        """Per-screen spend cap overriding ``SCREEN_BUDGET_USD``, if set."""
+        return self.screen_slug.budget_usd
+
     def get_candidates(self) -> list[CandidateDict]:
         """Get candidate data as structured list.
 
@@ -0,0 +1,313 @@
+"""Stage-pipelined candidate screening with per-stage worker pools.
+
+``AgentOSCandidateWorkflow`` runs research → quality check → incremental search →
+assessment back-to-back for each candidate. Deep Research takes minutes while
+assessment takes tens of seconds, so this module feeds the same step executors
+from asyncio queues with independently sized worker pools. Assessment of
+candidate N overlaps research of candidate N+1 and each stage can be tuned for
+throughput on its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from uuid import uuid4
+
+from agno.db.base import SessionType
+from agno.run import RunContext
+from agno.session.workflow import WorkflowSession
+from agno.workflow.types import StepInput
+
+from demo.budget import ScreenBudget, current_budget, use_budget
+from demo.models import AssessmentResult, CandidateDict, ExecutiveResearchResult
+from demo.screening_service import LogSymbols
+from demo.settings import settings
+from demo.workflow import AgentOSCandidateWorkflow
+
+__all__ = ["StagedScreeningPipeline"]
+
+_LOG_SYMBOLS = LogSymbols()
+
+
+@dataclass
+class _PipelineJob:
+    """A candidate travelling through the pipeline stages."""
+
+    session_id: str
+    step_input: StepInput
+    run_context: RunContext
+    future: asyncio.Future[tuple[AssessmentResult, Optional[ExecutiveResearchResult]]]
+    candidate_name: str = "candidate"
+    # Stage workers run in their own contexts, so the caller's screen budget
+    # travels with the job.
+    budget: Optional[ScreenBudget] = None
+
+
+@dataclass
+class _StageStats:
+    """Counters for one pipeline stage."""
+
+    workers: int
+    busy: int = 0
+    processed: int = 0
+    failed: int = 0
+    queue: asyncio.Queue[_PipelineJob] = field(default_factory=asyncio.Queue)
+
+
+class StagedScreeningPipeline:
+    """Queue-fed screening pipeline reusing the workflow's async step executors.
+
+    Call :meth:`run_candidate` with the same arguments as
+    ``AgentOSCandidateWorkflow.arun_candidate_workflow``; it can therefore be
+    passed directly as the ``candidate_runner`` of ``aprocess_screen_direct``.
+    Workers are started lazily on the running event loop.
+    """
+
+    STAGES = ("research", "quality", "assessment")
+
+    def __init__(
+        self,
+        workflow_runner: AgentOSCandidateWorkflow,
+        *,
+        research_workers: Optional[int] = None,
+        quality_workers: Optional[int] = None,
+        assessment_workers: Optional[int] = None,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.runner = workflow_runner
+        self.logger = logger or workflow_runner.logger
+        self._pool_sizes = {
+            "research": research_workers or settings.screening.research_workers,
+            "quality": quality_workers or settings.screening.quality_workers,
+            "assessment": assessment_workers or settings.screening.assessment_workers,
+        }
+        self._stages: dict[str, _StageStats] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Agno creates its session table lazily; serialise writes so concurrent
+        # first upserts on a fresh database do not race on ``CREATE TABLE``.
+        self._persist_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        """Start worker tasks on the current loop (restarting after loop changes)."""
+
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._tasks:
+            return
+
+        self._loop = loop
+        self._stages = {
+            stage: _StageStats(workers=self._pool_sizes[stage]) for stage in self.STAGES
+        }
+        self._tasks = [
+            loop.create_task(self._worker(stage), name=f"pipeline-{stage}-{index}")
+            for stage in self.STAGES
+            for index in range(self._pool_sizes[stage])
+        ]
+        self.logger.info(
+            "%s Screening pipeline started (research=%s, quality=%s, assessment=%s)",
+            _LOG_SYMBOLS.search,
+            self._pool_sizes["research"],
+            self._pool_sizes["quality"],
+            self._pool_sizes["assessment"],
+        )
+
+    async def shutdown(self) -> None:
+        """Cancel all stage workers. Pending candidates fail with ``CancelledError``."""
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._loop = None
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return queue depth and worker utilisation for each stage."""
+
+        return {
+            stage: {
+                "workers": stats.workers,
+                "busy": stats.busy,
+                "queued": stats.queue.qsize(),
+                "processed": stats.processed,
+                "failed": stats.failed,
+            }
+            for stage, stats in self._stages.items()
+        }
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def run_candidate(
+        self,
+        candidate_data: CandidateDict,
+        role_spec_markdown: str,
+        screen_id: str,
+        custom_instructions: Optional[str] = None,
+        *,
+        force_refresh: bool = False,
+        role_type: Optional[str] = None,
+        force_rerun: bool = False,
+    ) -> tuple[AssessmentResult, Optional[ExecutiveResearchResult]]:
+        """Enqueue a candidate and wait until it clears the assessment stage.
+
+        Like the workflow, a candidate whose earlier run failed part-way
+        resumes from its first incomplete step unless ``force_rerun`` is set.
+        """
+
+        self._ensure_started()
+        session_id, run_input = self.runner._build_run_input(
+            candidate_data,
+            role_spec_markdown,
+            screen_id,
+            custom_instructions,
+            force_refresh=force_refresh,
+            role_type=role_type,
+            force_rerun=force_rerun,
+        )
+        job = _PipelineJob(
+            session_id=session_id,
+            step_input=StepInput(input=run_input),
+            run_context=RunContext(
+                run_id=str(uuid4()), session_id=session_id, session_state={}
+            ),
+            future=asyncio.get_running_loop().create_future(),
+            candidate_name=str(candidate_data.get("name") or session_id),
+            budget=current_budget(),
+        )
+        await self._stages["research"].queue.put(job)
+        return await job.future
+
+    # ------------------------------------------------------------------
+    # Stage execution
+    # ------------------------------------------------------------------
+
+    async def _worker(self, stage: str) -> None:
+        stats = self._stages[stage]
+        while True:
+            job = await stats.queue.get()
+            stats.busy += 1
+            try:
+                if job.future.done():
+                    continue
+                with use_budget(job.budget):
+                    await self._run_stage(stage, job)
+                stats.processed += 1
+            except Exception as exc:
+                stats.failed += 1
+                self.logger.error(
+                    "%s Pipeline %s stage failed for %s: %s",
+                    _LOG_SYMBOLS.error,
+                    stage,
+                    job.candidate_name,
+                    exc,
+                )
+                await self._persist(job)
+                if not job.future.done():
+                    job.future.set_exception(exc)
+            finally:
+                stats.busy -= 1
+                stats.queue.task_done()
+
+    async def _run_stage(self, stage: str, job: _PipelineJob) -> None:
+        runner = self.runner
+        if stage == "research":
+            job.run_context.session_state = await self._stored_session_state(
+                job.session_id
+            )
+            triage = await runner._atriage_step(job.step_input, job.run_context)
+            if triage.stop:
+                await self._persist(job)
+                job.future.set_result(self._outputs(job))
+                return
+            await runner._adeep_research_step(job.step_input, job.run_context)
+            await self._stages["quality"].queue.put(job)
+        elif stage == "quality":
+            runner._quality_check_step(job.step_input, job.run_context)
+            await runner._aincremental_search_step(job.step_input, job.run_context)
+            await self._stages["assessment"].queue.put(job)
+        else:
+            await runner._aassessment_step(job.step_input, job.run_context)
+            await self._persist(job)
+            job.future.set_result(self._outputs(job))
+
+    async def _stored_session_state(self, session_id: str) -> dict[str, Any]:
+        """Session state persisted by an earlier run of ``session_id``, if any."""
+
+        db = self.runner.async_workflow.db
+        if db is None:
+            return {}
+
+        def load() -> dict[str, Any]:
+            session = db.get_session(session_id, session_type=SessionType.WORKFLOW)
+            if not isinstance(session, WorkflowSession):
+                return {}
+            state = (session.session_data or {}).get("session_state")
+            return dict(state) if isinstance(state, dict) else {}
+
+        try:
+            return await asyncio.to_thread(load)
+        except Exception as exc:  # pragma: no cover - resume is best effort
+            self.logger.warning(
+                "⚠️  Failed to load pipeline session %s: %s", session_id, exc
+            )
+            return {}
+
+    def _workflow_data(self, job: _PipelineJob) -> dict[str, Any]:
+        session_state = job.run_context.session_state or {}
+        workflow_data = session_state.get("workflow_data")
+        return workflow_data if isinstance(workflow_data, dict) else {}
+
+    def _outputs(
+        self, job: _PipelineJob
+    ) -> tuple[AssessmentResult, Optional[ExecutiveResearchResult]]:
+        state = self._workflow_data(job)
+        assessment = AssessmentResult.model_validate(state["assessment"])
+        research_data = state.get("research")
+        research = (
+            ExecutiveResearchResult.model_validate(research_data)
+            if research_data
+            else None
+        )
+        return assessment, research
+
+    async def _persist(self, job: _PipelineJob) -> None:
+        """Store the job's session state so it is visible like a workflow session."""
+
+        db = self.runner.async_workflow.db
+        if db is None:
+            return
+
+        def upsert() -> None:
+            with self._persist_lock:
+                existing = db.get_session(
+                    job.session_id, session_type=SessionType.WORKFLOW
+                )
+                if isinstance(existing, WorkflowSession):
+                    session = existing
+                else:
+                    session = WorkflowSession(
+                        session_id=job.session_id,
+                        workflow_id=self.runner.async_workflow.id,
+                        workflow_name=self.runner.async_workflow.name,
+                    )
+                session_data = dict(session.session_data or {})
+                session_data["session_state"] = job.run_context.session_state or {}
+                session.session_data = session_data
+                db.upsert_session(session)
+
+        try:
+            await asyncio.to_thread(upsert)
+        except Exception as exc:  # pragma: no cover - persistence is best effort
+            self.logger.warning(
+                "⚠️  Failed to persist pipeline session %s: %s", job.session_id, exc
+            )
@@ -1,5 +1,5 @@
 """Central prompt utilities for Talent Signal agents."""
 
-from .library import PromptContext, get_prompt
+from .library import PromptContext, get_prompt, prompt_fingerprint
 
-__all__ = ["PromptContext", "get_prompt"]
+__all__ = ["PromptContext", "get_prompt", "prompt_fingerprint"]
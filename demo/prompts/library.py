@@ -7,6 +7,8 @@ touching code. Each entry aligns with the context-engineering guidance in
 
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -60,6 +62,21 @@ def _format_value(value: Any, fmt: dict[str, Any]) -> Any:
     return value
 
 
+def prompt_fingerprint(name: str) -> str:
+    """Return a stable hash of the raw catalog entry for ``name``.
+
+    Used to invalidate cached agent responses whenever the prompt is edited.
+    """
+
+    try:
+        entry = _CATALOG_DATA[name]
+    except KeyError as exc:  # pragma: no cover - developer error path
+        raise KeyError(f"Prompt '{name}' not found in catalog {_CATALOG_PATH}") from exc
+
+    encoded = json.dumps(entry, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
 def get_prompt(name: str, **format_kwargs: Any) -> PromptContext:
     """Return prompt context for ``name`` with optional placeholder values."""
 
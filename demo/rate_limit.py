@@ -0,0 +1,477 @@
+"""Shared per-model OpenAI and per-base Airtable rate limiting.
+
+Every agent model is a :class:`RateLimitedOpenAIResponses`, which takes one
+request and an estimated token count from the model's token buckets before
+each API call and reconciles the estimate with actual usage afterwards. The
+buckets are shared by all agents in the process (``memory`` backend) or by
+every process using the same SQLite file (``sqlite`` backend), so concurrent
+screens stay under the account quota instead of discovering it through 429s.
+
+:class:`RequestRateLimiter` applies the same buckets to request-only limits
+such as Airtable's five requests per second per base.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Protocol
+
+from agno.exceptions import ModelProviderError
+from agno.models.message import Message
+from agno.models.openai import OpenAIResponses
+from agno.models.response import ModelResponse
+
+from demo.concurrency import (
+    CONGESTION_RATE_LIMIT,
+    classify_congestion,
+    get_concurrency_controller,
+)
+from demo.settings import settings
+from demo.usage import get_usage_recorder
+
+__all__ = [
+    "ModelRateLimiter",
+    "RateLimitedOpenAIResponses",
+    "RequestRateLimiter",
+    "estimate_tokens",
+    "get_airtable_rate_limiter",
+    "get_rate_limiter",
+    "reset_rate_limiters",
+]
+
+_CHARS_PER_TOKEN = 4
+
+
+@dataclass(frozen=True)
+class _BucketRequest:
+    key: str
+    capacity: float
+    rate_per_second: float
+    amount: float
+
+
+class _BucketStore(Protocol):
+    def take(self, requests: list[_BucketRequest]) -> float: ...
+
+    def adjust(self, request: _BucketRequest) -> None: ...
+
+
+def _refill(level: float, elapsed: float, request: _BucketRequest) -> float:
+    return min(request.capacity, level + max(elapsed, 0.0) * request.rate_per_second)
+
+
+def _wait_for(levels: list[float], requests: list[_BucketRequest]) -> float:
+    """Seconds until every bucket holds its requested amount (0 if it does now)."""
+
+    wait = 0.0
+    for level, request in zip(levels, requests):
+        needed = min(request.amount, request.capacity)
+        if level < needed:
+            wait = max(wait, (needed - level) / request.rate_per_second)
+    return wait
+
+
+class _MemoryBucketStore:
+    """Token buckets shared by every thread and event loop in this process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._state: dict[str, tuple[float, float]] = {}
+
+    def _level(self, request: _BucketRequest, now: float) -> float:
+        level, updated = self._state.get(request.key, (request.capacity, now))
+        return _refill(level, now - updated, request)
+
+    def take(self, requests: list[_BucketRequest]) -> float:
+        with self._lock:
+            now = time.monotonic()
+            levels = [self._level(request, now) for request in requests]
+            wait = _wait_for(levels, requests)
+            if wait == 0.0:
+                levels = [
+                    level - min(request.amount, request.capacity)
+                    for level, request in zip(levels, requests)
+                ]
+            for level, request in zip(levels, requests):
+                self._state[request.key] = (level, now)
+            return wait
+
+    def adjust(self, request: _BucketRequest) -> None:
+        with self._lock:
+            now = time.monotonic()
+            level = self._level(request, now) - request.amount
+            self._state[request.key] = (level, now)
+
+
+class _SqliteBucketStore:
+    """Token buckets persisted in SQLite so separate worker processes share them."""
+
+    def __init__(self, db_path: str | Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+                "key TEXT PRIMARY KEY, level REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+
+    def _levels(
+        self, conn: sqlite3.Connection, requests: list[_BucketRequest], now: float
+    ) -> list[float]:
+        levels = []
+        for request in requests:
+            row = conn.execute(
+                "SELECT level, updated_at FROM rate_limit_buckets WHERE key = ?",
+                (request.key,),
+            ).fetchone()
+            level, updated = row if row else (request.capacity, now)
+            levels.append(_refill(level, now - updated, request))
+        return levels
+
+    def _store(
+        self,
+        conn: sqlite3.Connection,
+        levels: list[float],
+        requests: list[_BucketRequest],
+        now: float,
+    ) -> None:
+        conn.executemany(
+            "INSERT OR REPLACE INTO rate_limit_buckets (key, level, updated_at) "
+            "VALUES (?, ?, ?)",
+            [(request.key, level, now) for level, request in zip(levels, requests)],
+        )
+
+    def take(self, requests: list[_BucketRequest]) -> float:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            levels = self._levels(conn, requests, now)
+            wait = _wait_for(levels, requests)
+            if wait == 0.0:
+                levels = [
+                    level - min(request.amount, request.capacity)
+                    for level, request in zip(levels, requests)
+                ]
+            self._store(conn, levels, requests, now)
+            conn.execute("COMMIT")
+            return wait
+        finally:
+            conn.close()
+
+    def adjust(self, request: _BucketRequest) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            (level,) = self._levels(conn, [request], now)
+            self._store(conn, [level - request.amount], [request], now)
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+
+class ModelRateLimiter:
+    """Requests-per-minute and tokens-per-minute limiter for one model."""
+
+    def __init__(
+        self,
+        model_id: str,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        store: _BucketStore,
+    ) -> None:
+        self.model_id = model_id
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._store = store
+
+    def _requests(self, tokens: int) -> list[_BucketRequest]:
+        return [
+            _BucketRequest(
+                key=f"{self.model_id}:requests",
+                capacity=self.requests_per_minute,
+                rate_per_second=self.requests_per_minute / 60,
+                amount=1,
+            ),
+            _BucketRequest(
+                key=f"{self.model_id}:tokens",
+                capacity=self.tokens_per_minute,
+                rate_per_second=self.tokens_per_minute / 60,
+                amount=tokens,
+            ),
+        ]
+
+    def acquire(self, tokens: int) -> None:
+        """Block until one request and ``tokens`` tokens are available."""
+
+        requests = self._requests(tokens)
+        while (wait := self._store.take(requests)) > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int) -> None:
+        """Async counterpart of :meth:`acquire`; sleeps without blocking the loop."""
+
+        requests = self._requests(tokens)
+        while (wait := await asyncio.to_thread(self._store.take, requests)) > 0:
+            await asyncio.sleep(wait)
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: Optional[int]) -> None:
+        """Correct the token bucket once the real usage of a call is known."""
+
+        if actual_tokens is None or actual_tokens == estimated_tokens:
+            return
+        _, token_bucket = self._requests(actual_tokens - estimated_tokens)
+        self._store.adjust(token_bucket)
+
+    def cooldown(self, seconds: float) -> None:
+        """Pause the model for ``seconds`` after the API reported a rate limit."""
+
+        request_bucket, _ = self._requests(0)
+        drained = _BucketRequest(
+            key=request_bucket.key,
+            capacity=request_bucket.capacity,
+            rate_per_second=request_bucket.rate_per_second,
+            amount=request_bucket.capacity + request_bucket.rate_per_second * seconds,
+        )
+        self._store.adjust(drained)
+
+
+class RequestRateLimiter:
+    """Requests-per-second limiter for one API scope, such as an Airtable base."""
+
+    def __init__(
+        self, key: str, requests_per_second: float, store: _BucketStore
+    ) -> None:
+        self.key = key
+        self.requests_per_second = requests_per_second
+        self._store = store
+
+    def _request(self, amount: float = 1) -> _BucketRequest:
+        return _BucketRequest(
+            key=f"{self.key}:requests",
+            capacity=max(self.requests_per_second, 1.0),
+            rate_per_second=self.requests_per_second,
+            amount=amount,
+        )
+
+    def acquire(self) -> None:
+        """Block until one request is available."""
+
+        requests = [self._request()]
+        while (wait := self._store.take(requests)) > 0:
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        """Async counterpart of :meth:`acquire`; sleeps without blocking the loop."""
+
+        requests = [self._request()]
+        while (wait := await asyncio.to_thread(self._store.take, requests)) > 0:
+            await asyncio.sleep(wait)
+
+    def cooldown(self, seconds: float) -> None:
+        """Pause the scope for ``seconds`` after the API reported a rate limit."""
+
+        bucket = self._request()
+        self._store.adjust(
+            self._request(bucket.capacity + bucket.rate_per_second * seconds)
+        )
+
+
+_registry_lock = threading.Lock()
+_limiters: dict[str, ModelRateLimiter] = {}
+_airtable_limiters: dict[str, RequestRateLimiter] = {}
+_store: Optional[_BucketStore] = None
+
+
+def _bucket_store() -> _BucketStore:
+    global _store
+    if _store is None:
+        if settings.rate_limit.backend == "sqlite":
+            _store = _SqliteBucketStore(settings.rate_limit.db_path)
+        else:
+            _store = _MemoryBucketStore()
+    return _store
+
+
+def get_rate_limiter(model_id: str) -> Optional[ModelRateLimiter]:
+    """Return the shared limiter for ``model_id`` or ``None`` if it is unlimited."""
+
+    config = settings.rate_limit
+    limits = config.limits.get(model_id)
+    if not config.enabled or not limits:
+        return None
+    with _registry_lock:
+        limiter = _limiters.get(model_id)
+        if limiter is None:
+            limiter = ModelRateLimiter(
+                model_id,
+                requests_per_minute=limits["rpm"],
+                tokens_per_minute=limits["tpm"],
+                store=_bucket_store(),
+            )
+            _limiters[model_id] = limiter
+        return limiter
+
+
+def get_airtable_rate_limiter(base_id: str) -> Optional[RequestRateLimiter]:
+    """Return the shared limiter for an Airtable base or ``None`` if disabled."""
+
+    config = settings.airtable
+    if not config.rate_limit_enabled:
+        return None
+    with _registry_lock:
+        limiter = _airtable_limiters.get(base_id)
+        if limiter is None:
+            limiter = RequestRateLimiter(
+                f"airtable:{base_id}",
+                requests_per_second=config.requests_per_second,
+                store=_bucket_store(),
+            )
+            _airtable_limiters[base_id] = limiter
+        return limiter
+
+
+def reset_rate_limiters() -> None:
+    """Drop all limiter state (used by tests and after configuration changes)."""
+
+    global _store
+    with _registry_lock:
+        _limiters.clear()
+        _airtable_limiters.clear()
+        _store = None
+
+
+def estimate_tokens(messages: list[Message]) -> int:
+    """Rough token estimate for a request: prompt characters plus an output budget."""
+
+    characters = sum(len(message.get_content_string()) for message in messages)
+    return characters // _CHARS_PER_TOKEN + settings.rate_limit.output_token_estimate
+
+
+def _actual_tokens(response: Optional[ModelResponse]) -> Optional[int]:
+    usage = response.response_usage if response is not None else None
+    if usage is None or not usage.total_tokens:
+        return None
+    return usage.total_tokens
+
+
+class RateLimitedOpenAIResponses(OpenAIResponses):
+    """``OpenAIResponses`` that draws from the shared per-model token buckets.
+
+    Every call's token usage, prompt-cache hits and latency are also recorded
+    in :mod:`demo.usage`, whether or not a limit is configured for the model.
+    """
+
+    def _limiter(self) -> Optional[ModelRateLimiter]:
+        return get_rate_limiter(self.id)
+
+    def _on_error(
+        self,
+        limiter: Optional[ModelRateLimiter],
+        exc: ModelProviderError,
+        started_at: float,
+    ) -> None:
+        congestion = classify_congestion(exc)
+        if congestion == CONGESTION_RATE_LIMIT and limiter is not None:
+            limiter.cooldown(settings.rate_limit.cooldown_seconds)
+        controller = get_concurrency_controller()
+        if congestion is not None and controller is not None:
+            controller.signal_congestion(congestion, started_at)
+
+    def _on_response(
+        self,
+        limiter: Optional[ModelRateLimiter],
+        estimate: int,
+        response: Optional[ModelResponse],
+        started_at: float,
+    ) -> None:
+        if limiter is not None:
+            limiter.reconcile(estimate, _actual_tokens(response))
+        get_usage_recorder().record(
+            self.id,
+            response.response_usage if response is not None else None,
+            time.monotonic() - started_at,
+        )
+
+    def invoke(
+        self, messages: list[Message], *args: Any, **kwargs: Any
+    ) -> ModelResponse:
+        limiter = self._limiter()
+        estimate = estimate_tokens(messages)
+        if limiter is not None:
+            limiter.acquire(estimate)
+        started_at = time.monotonic()
+        try:
+            response = super().invoke(messages, *args, **kwargs)
+        except ModelProviderError as exc:
+            self._on_error(limiter, exc, started_at)
+            raise
+        self._on_response(limiter, estimate, response, started_at)
+        return response
+
+    async def ainvoke(
+        self, messages: list[Message], *args: Any, **kwargs: Any
+    ) -> ModelResponse:
+        limiter = self._limiter()
+        estimate = estimate_tokens(messages)
+        if limiter is not None:
+            await limiter.aacquire(estimate)
+        started_at = time.monotonic()
+        try:
+            response = await super().ainvoke(messages, *args, **kwargs)
+        except ModelProviderError as exc:
+            self._on_error(limiter, exc, started_at)
+            raise
+        self._on_response(limiter, estimate, response, started_at)
+        return response
+
+    def invoke_stream(
+        self, messages: list[Message], *args: Any, **kwargs: Any
+    ) -> Iterator[ModelResponse]:
+        limiter = self._limiter()
+        estimate = estimate_tokens(messages)
+        if limiter is not None:
+            limiter.acquire(estimate)
+        started_at = time.monotonic()
+        last_usage: Optional[ModelResponse] = None
+        try:
+            for chunk in super().invoke_stream(messages, *args, **kwargs):
+                if chunk.response_usage is not None:
+                    last_usage = chunk
+                yield chunk
+        except ModelProviderError as exc:
+            self._on_error(limiter, exc, started_at)
+            raise
+        self._on_response(limiter, estimate, last_usage, started_at)
+
+    async def ainvoke_stream(
+        self, messages: list[Message], *args: Any, **kwargs: Any
+    ) -> AsyncIterator[ModelResponse]:
+        limiter = self._limiter()
+        estimate = estimate_tokens(messages)
+        if limiter is not None:
+            await limiter.aacquire(estimate)
+        started_at = time.monotonic()
+        last_usage: Optional[ModelResponse] = None
+        try:
+            async for chunk in super().ainvoke_stream(messages, *args, **kwargs):
+                if chunk.response_usage is not None:
+                    last_usage = chunk
+                yield chunk
+        except ModelProviderError as exc:
+            self._on_error(limiter, exc, started_at)
+            raise
+        self._on_response(limiter, estimate, last_usage, started_at)
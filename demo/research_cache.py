@@ -0,0 +1,170 @@
+"""Cross-screen cache of Deep Research results keyed by candidate identity.
+
+The same executives are screened for several portfolio companies, and each
+screen otherwise pays for another multi-minute ``o4-mini-deep-research`` call.
+Research does not depend on the role spec, so the parsed
+``ExecutiveResearchResult`` is stored under a key derived from the normalized
+name, company and LinkedIn URL and reused until it is older than
+``RESEARCH_CACHE_TTL_HOURS``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+from demo.models import ExecutiveResearchResult
+from demo.settings import settings
+
+__all__ = [
+    "ResearchCache",
+    "get_research_cache",
+    "research_cache_key",
+    "reset_research_cache",
+]
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def _normalize_text(value: str) -> str:
+    ascii_value = (
+        unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    )
+    return _NON_ALNUM.sub(" ", ascii_value.lower()).strip()
+
+
+def _normalize_linkedin(url: str) -> str:
+    url = url.strip()
+    if not url:
+        return ""
+    parsed = urlparse(url if "://" in url else f"https://{url}")
+    host = parsed.netloc.lower().removeprefix("www.")
+    host = re.sub(r"^[a-z]{2}\.linkedin\.com$", "linkedin.com", host)
+    return f"{host}{parsed.path.rstrip('/').lower()}"
+
+
+def research_cache_key(
+    candidate_name: str, current_company: str, linkedin_url: Optional[str] = None
+) -> str:
+    """Stable cache key for a candidate identity.
+
+    Case, accents, punctuation, URL scheme, ``www.``/country subdomains and
+    trailing slashes are ignored so Airtable formatting differences still hit.
+    """
+
+    identity = "|".join(
+        (
+            _normalize_text(candidate_name),
+            _normalize_text(current_company),
+            _normalize_linkedin(linkedin_url or ""),
+        )
+    )
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+class ResearchCache:
+    """SQLite-backed store of ``ExecutiveResearchResult`` objects with a TTL."""
+
+    def __init__(self, db_path: str | Path, ttl_seconds: float) -> None:
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS research_cache ("
+                "key TEXT PRIMARY KEY, candidate_name TEXT NOT NULL, "
+                "current_company TEXT NOT NULL, linkedin_url TEXT, "
+                "payload TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+
+    def get(self, key: str) -> Optional[ExecutiveResearchResult]:
+        """Return the cached research for ``key`` if it is still fresh."""
+
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT payload, created_at FROM research_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        payload, created_at = row
+        if time.time() - created_at > self.ttl_seconds:
+            return None
+        return ExecutiveResearchResult.model_validate_json(payload)
+
+    def put(
+        self,
+        key: str,
+        research: ExecutiveResearchResult,
+        *,
+        candidate_name: str,
+        current_company: str,
+        linkedin_url: Optional[str] = None,
+    ) -> None:
+        """Store (or replace) the research for ``key``."""
+
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO research_cache (key, candidate_name, "
+                "current_company, linkedin_url, payload, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    candidate_name,
+                    current_company,
+                    linkedin_url or None,
+                    research.model_dump_json(),
+                    time.time(),
+                ),
+            )
+        finally:
+            conn.close()
+
+    def invalidate(self, key: str) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM research_cache WHERE key = ?", (key,))
+        finally:
+            conn.close()
+
+
+_cache_lock = threading.Lock()
+_cache: Optional[ResearchCache] = None
+
+
+def get_research_cache() -> Optional[ResearchCache]:
+    """Return the shared research cache, or ``None`` when it is disabled."""
+
+    global _cache
+    config = settings.cache
+    if not config.research_enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResearchCache(config.db_path, config.research_ttl_hours * 3600)
+        return _cache
+
+
+def reset_research_cache() -> None:
+    """Drop the shared cache handle (used by tests and after config changes)."""
+
+    global _cache
+    with _cache_lock:
+        _cache = None
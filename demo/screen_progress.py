@@ -0,0 +1,171 @@
+"""Debounced progress reporting for running screens.
+
+Screens otherwise show only Processing until the last candidate finishes.
+:class:`ScreenProgressReporter` counts a screen's completed, failed, deferred
+and in-flight candidates and writes a one-line summary such as
+``12/40 assessed, 1 failed, 4 in progress`` to the Platform-Screens record.
+It is only written once ``SCREEN_PROGRESS_FIELD`` names a field set aside for
+it, so shared fields such as the admin notes are never overwritten.
+
+Writes are debounced: however many candidates start or finish, at most one
+PATCH is sent per ``SCREEN_PROGRESS_INTERVAL_SECONDS``, carrying the latest
+counts. The final summary is not sent on its own; :meth:`close` returns it so
+it goes out in the same PATCH as the Complete status.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from time import monotonic
+from typing import Any, Optional
+
+from demo.airtable_client import AirtableClient
+from demo.settings import settings
+
+__all__ = ["ScreenProgressReporter", "create_screen_progress"]
+
+logger = logging.getLogger("demo.screen_progress")
+
+
+class ScreenProgressReporter:
+    """Track one screen's candidate counts and push them to Airtable.
+
+    Thread-safe: counts may change from worker threads or the event loop.
+    Changes never block on Airtable; pushes run on a short-lived timer thread
+    scheduled at most once per ``interval_seconds``.
+    """
+
+    def __init__(
+        self,
+        airtable: AirtableClient,
+        screen_id: str,
+        total: int,
+        *,
+        field: str,
+        interval_seconds: float,
+    ) -> None:
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive")
+        self.airtable = airtable
+        self.screen_id = screen_id
+        self.total = total
+        self.field = field
+        self.interval_seconds = interval_seconds
+        self.completed = 0
+        self.failed = 0
+        self.deferred = 0
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        # Held while a PATCH is in flight so ``close`` can wait for it.
+        self._push_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._last_push = float("-inf")
+        self._pushed: Optional[str] = None
+        self._closed = False
+
+    def started(self) -> None:
+        """Record that a candidate began processing."""
+
+        with self._lock:
+            self.in_flight += 1
+            self._schedule()
+
+    def finished(
+        self, result: Optional[dict[str, Any]], error: Optional[dict[str, str]]
+    ) -> None:
+        """Record a started candidate's outcome."""
+
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            if result is not None and result.get("status") == "deferred":
+                self.deferred += 1
+            elif result is not None:
+                self.completed += 1
+            if error is not None:
+                self.failed += 1
+            self._schedule()
+
+    def resumed(self, count: int) -> None:
+        """Count candidates already assessed by an earlier attempt."""
+
+        if count <= 0:
+            return
+        with self._lock:
+            self.completed += count
+            self._schedule()
+
+    def summary(self) -> str:
+        """Return the progress line written to Airtable."""
+
+        with self._lock:
+            return self._summary()
+
+    def close(self) -> dict[str, Any]:
+        """Stop pushing and return the final progress fields.
+
+        Waits for a PATCH already in flight, so the caller's write (normally
+        the Complete status, carrying these fields) lands last.
+        """
+
+        with self._lock:
+            self._closed = True
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            fields = {self.field: self._summary()}
+        with self._push_lock:
+            return fields
+
+    # ------------------------------------------------------------------
+    # Internals (``_summary`` and ``_schedule`` expect ``self._lock`` held)
+    # ------------------------------------------------------------------
+
+    def _summary(self) -> str:
+        parts = [f"{self.completed}/{self.total} assessed", f"{self.failed} failed"]
+        if self.deferred:
+            parts.append(f"{self.deferred} deferred")
+        parts.append(f"{self.in_flight} in progress")
+        return ", ".join(parts)
+
+    def _schedule(self) -> None:
+        if self._closed or self._timer is not None:
+            return
+        delay = max(0.0, self._last_push + self.interval_seconds - monotonic())
+        self._timer = threading.Timer(delay, self._push)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _push(self) -> None:
+        with self._push_lock:
+            with self._lock:
+                self._timer = None
+                text = self._summary()
+                if self._closed or text == self._pushed:
+                    return
+                self._last_push = monotonic()
+                self._pushed = text
+            try:
+                self.airtable.update_screen_fields(self.screen_id, {self.field: text})
+            except Exception as exc:
+                # Progress is informational; the outbox keeps the PATCH anyway.
+                logger.warning(
+                    f"⚠️  Failed to report progress for screen {self.screen_id}: {exc}"
+                )
+
+
+def create_screen_progress(
+    airtable: AirtableClient, screen_id: str, total: int
+) -> Optional[ScreenProgressReporter]:
+    """Build a reporter from ``settings.screening``, or ``None`` when disabled."""
+
+    config = settings.screening
+    if not config.progress_enabled or not config.progress_field:
+        return None
+    return ScreenProgressReporter(
+        airtable,
+        screen_id,
+        total,
+        field=config.progress_field,
+        interval_seconds=config.progress_interval_seconds,
+    )
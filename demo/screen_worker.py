@@ -0,0 +1,308 @@
+"""Worker that drains the durable screen job queue.
+
+The API process runs one worker on its event loop by default
+(``SCREEN_QUEUE_INPROCESS_WORKER``). Additional workers can be scaled
+independently of the API::
+
+    python -m demo.screen_worker
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import logging
+import os
+import socket
+from typing import Any, Awaitable, Optional, Protocol
+from uuid import uuid4
+
+from demo.airtable_async import AsyncAirtableClient, create_async_airtable_client
+from demo.airtable_client import AirtableClient
+from demo.airtable_outbox import OutboxDrainer, create_airtable_outbox
+from demo.airtable_writer import create_airtable_writer
+from demo.budget import ScreenBudget
+from demo.job_queue import JOB_FAILED, ScreenJob, ScreenJobQueue
+from demo.models import AssessmentResult, CandidateDict, ExecutiveResearchResult
+from demo.pipeline import StagedScreeningPipeline
+from demo.screening_service import (
+    AsyncCandidateRunner,
+    LogSymbols,
+    ScreenValidationError,
+    aprocess_screen_direct,
+)
+from demo.settings import settings
+from demo.workflow import AgentOSCandidateWorkflow
+
+__all__ = ["ScreenJobWorker", "main"]
+
+_LOG_SYMBOLS = LogSymbols()
+
+
+class _CandidateWorkflowRunner(Protocol):
+    """Candidate runner that also takes the job's per-screen options."""
+
+    def __call__(
+        self,
+        candidate_data: CandidateDict,
+        role_spec_markdown: str,
+        screen_id: str,
+        custom_instructions: Optional[str] = None,
+        *,
+        force_refresh: bool = False,
+        role_type: Optional[str] = None,
+        force_rerun: bool = False,
+    ) -> Awaitable[tuple[AssessmentResult, Optional[ExecutiveResearchResult]]]: ...
+
+
+class ScreenJobWorker:
+    """Lease screen jobs, heartbeat while running them, and record the outcome."""
+
+    def __init__(
+        self,
+        queue: ScreenJobQueue,
+        airtable: AirtableClient,
+        workflow_runner: AgentOSCandidateWorkflow,
+        *,
+        pipeline: Optional[StagedScreeningPipeline] = None,
+        async_airtable: Optional[AsyncAirtableClient] = None,
+        logger: Optional[logging.Logger] = None,
+        worker_id: Optional[str] = None,
+        lease_seconds: Optional[float] = None,
+        heartbeat_seconds: Optional[float] = None,
+        poll_seconds: Optional[float] = None,
+        concurrency: Optional[int] = None,
+    ) -> None:
+        self.queue = queue
+        self.airtable = airtable
+        self.workflow_runner = workflow_runner
+        self.pipeline = pipeline
+        self.async_airtable = async_airtable
+        self.logger = logger or workflow_runner.logger
+        self.worker_id = (
+            worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        )
+        self.lease_seconds = lease_seconds or settings.job_queue.lease_seconds
+        self.heartbeat_seconds = (
+            heartbeat_seconds or settings.job_queue.heartbeat_seconds
+        )
+        self.poll_seconds = poll_seconds or settings.job_queue.poll_seconds
+        self.concurrency = concurrency or settings.job_queue.worker_concurrency
+
+    def _candidate_runner(
+        self, candidate_count: int
+    ) -> tuple[_CandidateWorkflowRunner, Optional[int]]:
+        # In pipelined mode every candidate is enqueued up front and the stage
+        # worker pools govern throughput instead of the per-screen limit.
+        if settings.screening.pipeline_enabled and self.pipeline is not None:
+            return self.pipeline.run_candidate, max(candidate_count, 1)
+        return self.workflow_runner.arun_candidate_workflow, None
+
+    async def run_once(self) -> bool:
+        """Lease and process a single job. Returns ``False`` if the queue was empty."""
+
+        job = await asyncio.to_thread(
+            self.queue.lease, self.worker_id, self.lease_seconds
+        )
+        if job is None:
+            return False
+        await self.process(job)
+        return True
+
+    async def run_forever(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Poll the queue until ``stop`` is set, running up to ``concurrency`` jobs."""
+
+        stop = stop or asyncio.Event()
+        self.logger.info(
+            "%s Screen worker %s polling %s (%s concurrent jobs)",
+            _LOG_SYMBOLS.search,
+            self.worker_id,
+            self.queue.db_path,
+            self.concurrency,
+        )
+        # Each loop holds at most one lease, so overlapping screens progress
+        # together and can share in-flight research.
+        await asyncio.gather(*(self._poll(stop) for _ in range(self.concurrency)))
+
+    async def _poll(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception:  # pragma: no cover - keep the worker alive
+                self.logger.exception(
+                    "%s Screen worker %s failed to poll queue",
+                    _LOG_SYMBOLS.error,
+                    self.worker_id,
+                )
+                processed = False
+            if not processed:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(stop.wait(), timeout=self.poll_seconds)
+
+    async def process(self, job: ScreenJob) -> None:
+        """Run a leased job while heartbeating, then complete or fail it."""
+
+        self.logger.info(
+            "%s Processing screen %s (job %s, attempt %s/%s)",
+            _LOG_SYMBOLS.search,
+            job.screen_id,
+            job.job_id,
+            job.attempts,
+            job.max_attempts,
+        )
+        work = asyncio.create_task(self._execute(job))
+        heartbeat = asyncio.create_task(self._heartbeat(job, work))
+        try:
+            result = await work
+        except asyncio.CancelledError:
+            if not heartbeat.done():
+                # The worker itself is shutting down; leave the lease to expire
+                # so another worker resumes the job.
+                raise
+            self.logger.error(
+                "%s Lost lease on job %s; abandoning screen %s",
+                _LOG_SYMBOLS.error,
+                job.job_id,
+                job.screen_id,
+            )
+            return
+        except ScreenValidationError as exc:
+            await asyncio.to_thread(
+                self.queue.fail, job.job_id, self.worker_id, exc.message, retry=False
+            )
+            return
+        except Exception as exc:
+            error = str(exc) or exc.__class__.__name__
+            status = await asyncio.to_thread(
+                self.queue.fail, job.job_id, self.worker_id, error
+            )
+            self.logger.error(
+                "%s Screen %s attempt %s failed (%s): %s",
+                _LOG_SYMBOLS.error,
+                job.screen_id,
+                job.attempts,
+                status,
+                error,
+            )
+            if status == JOB_FAILED:
+                await asyncio.to_thread(self._mark_screen_failed, job.screen_id, error)
+            return
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+
+        await asyncio.to_thread(self.queue.complete, job.job_id, self.worker_id, result)
+
+    async def _execute(self, job: ScreenJob) -> dict[str, Any]:
+        payload = job.payload
+        candidates = payload.get("candidates") or []
+        completed = await asyncio.to_thread(
+            self.queue.completed_candidate_results, job.job_id
+        )
+        workflow_runner, max_concurrency = self._candidate_runner(len(candidates))
+        options: dict[str, Any] = {}
+        if payload.get("force_refresh"):
+            options["force_refresh"] = True
+        if payload.get("force_rerun"):
+            options["force_rerun"] = True
+        if payload.get("role_type"):
+            options["role_type"] = payload["role_type"]
+        candidate_runner: AsyncCandidateRunner = functools.partial(
+            workflow_runner, **options
+        )
+
+        def checkpoint(result: dict[str, Any]) -> None:
+            self.queue.record_candidate_result(
+                job.job_id, str(result["candidate_id"]), result
+            )
+
+        return await aprocess_screen_direct(
+            screen_id=job.screen_id,
+            role_spec_markdown=payload.get("role_spec_markdown", ""),
+            candidates=candidates,
+            custom_instructions=payload.get("custom_instructions"),
+            airtable=self.airtable,
+            logger=self.logger,
+            symbols=_LOG_SYMBOLS,
+            candidate_runner=candidate_runner,
+            max_concurrency=max_concurrency,
+            completed_results=completed,
+            on_result=checkpoint,
+            budget=ScreenBudget.from_settings(payload.get("budget_usd")),
+            role_type=payload.get("role_type"),
+            async_airtable=self.async_airtable,
+        )
+
+    async def _heartbeat(self, job: ScreenJob, work: asyncio.Task[Any]) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            owned = await asyncio.to_thread(
+                self.queue.heartbeat, job.job_id, self.worker_id, self.lease_seconds
+            )
+            if not owned:
+                work.cancel()
+                return
+
+    def _mark_screen_failed(self, screen_id: str, error_message: str) -> None:
+        try:
+            self.airtable.update_screen_status(
+                screen_id, status="Failed", error_message=error_message
+            )
+        except Exception:  # pragma: no cover - best effort logging
+            self.logger.exception(
+                "%s Unable to update failure status for screen %s",
+                _LOG_SYMBOLS.error,
+                screen_id,
+            )
+
+
+def main() -> None:  # pragma: no cover - process entrypoint
+    """Run a standalone queue worker until interrupted."""
+
+    logging.basicConfig(
+        level=getattr(logging, settings.app.log_level.upper(), logging.INFO),
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    )
+    logger = logging.getLogger("talent-signal.worker")
+    workflow_runner = AgentOSCandidateWorkflow(logger)
+    worker = ScreenJobWorker(
+        ScreenJobQueue(),
+        AirtableClient(
+            settings.airtable.api_key,
+            settings.airtable.base_id,
+            writer=create_airtable_writer(),
+            outbox=create_airtable_outbox(),
+        ),
+        workflow_runner,
+        pipeline=StagedScreeningPipeline(workflow_runner),
+        logger=logger,
+    )
+
+    async def run() -> None:
+        outbox = worker.airtable.outbox
+        # The async client's connection pool belongs to this event loop.
+        worker.async_airtable = create_async_airtable_client(outbox)
+        try:
+            if outbox is None:
+                await worker.run_forever()
+                return
+            await asyncio.gather(
+                worker.run_forever(),
+                OutboxDrainer(outbox, worker.airtable).run_forever(),
+            )
+        finally:
+            if worker.async_airtable is not None:
+                await worker.async_airtable.aclose()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        logger.info("%s Screen worker stopped", _LOG_SYMBOLS.success)
+    finally:
+        worker.airtable.flush()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
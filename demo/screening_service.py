@@ -2,22 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from time import perf_counter
-from typing import Any, Callable, Optional
+from time import monotonic, perf_counter
+from typing import Any, Awaitable, Callable, Optional
 
+from demo.airtable_async import AsyncAirtableClient
 from demo.airtable_client import AirtableClient
+from demo.budget import (
+    BudgetExhaustedError,
+    ScreenBudget,
+    order_by_expected_fit,
+    use_budget,
+)
+from demo.concurrency import (
+    AdaptiveConcurrencyController,
+    classify_congestion,
+    get_concurrency_controller,
+)
 from demo.models import AssessmentResult, CandidateDict, ExecutiveResearchResult
+from demo.screen_progress import ScreenProgressReporter, create_screen_progress
 from demo.screening_helpers import (
     render_assessment_markdown_inline,
     validate_candidates,
 )
+from demo.settings import settings
 
 __all__ = [
     "LogSymbols",
     "ScreenValidationError",
+    "aprocess_screen_direct",
     "process_screen_direct",
 ]
 
@@ -25,6 +42,11 @@ CandidateRunner = Callable[
     [CandidateDict, str, str, Optional[str]],
     tuple[AssessmentResult, Optional[ExecutiveResearchResult]],
 ]
+AsyncCandidateRunner = Callable[
+    [CandidateDict, str, str, Optional[str]],
+    Awaitable[tuple[AssessmentResult, Optional[ExecutiveResearchResult]]],
+]
+ResultCallback = Callable[[dict[str, Any]], None]
 
 
 @dataclass(frozen=True)
@@ -60,6 +82,9 @@ def _update_screen_status_and_log_webhook(
 ) -> None:
     """Update screen status to Processing and log webhook trigger event.
 
+    The log event is queued rather than awaited; it is written with the
+    screen's other Airtable creates.
+
     Args:
         screen_id: Airtable record ID for the Screen.
         airtable: Airtable client for status updates and logging.
@@ -68,20 +93,416 @@ def _update_screen_status_and_log_webhook(
     """
     airtable.update_screen_status(screen_id, status="Processing")
 
+    def warn_on_failure(logged: Future[str]) -> None:
+        # Don't fail the workflow if logging fails, just warn
+        if logged.exception() is not None:
+            logger.warning(f"⚠️  Failed to log webhook event: {logged.exception()}")
+
     try:
-        airtable.log_automation_event(
+        airtable.submit_automation_event(
             action="Candidate Assessment",
             event_type="Webhook Event",
             related_table="Platform-Screens",
             related_record_ids=[screen_id],
             event_summary=f"Webhook triggered for screen {screen_id}",
             screen_id=screen_id,
-        )
+        ).add_done_callback(warn_on_failure)
     except Exception as exc:
-        # Don't fail the workflow if logging fails, just warn
         logger.warning(f"⚠️  Failed to log webhook event: {exc}")
 
 
+CandidateOutcome = tuple[Optional[dict[str, Any]], Optional[dict[str, str]]]
+
+
+def _candidate_identity(
+    candidate: CandidateDict,
+    logger: logging.Logger,
+    symbols: LogSymbols,
+) -> tuple[Optional[str], str, Optional[dict[str, str]]]:
+    """Resolve candidate ID and display name, or an error entry if the ID is missing."""
+
+    candidate_id = candidate.get("id")
+    candidate_name = candidate.get("name", candidate_id or "Unknown")
+
+    if not candidate_id:
+        logger.error(
+            "%s Candidate record missing ID; skipping record.",
+            symbols.error,
+        )
+        return (
+            None,
+            candidate_name,
+            {
+                "candidate_id": "unknown",
+                "error": "Candidate record missing ID.",
+            },
+        )
+
+    candidate_id_str = str(candidate_id)
+
+    logger.debug(
+        "📦 PROCESSING CANDIDATE (ID: %s, Name: %s):\n%s",
+        candidate_id_str,
+        candidate_name,
+        json.dumps(candidate, indent=2, default=str),
+    )
+    return candidate_id_str, candidate_name, None
+
+
+def _write_candidate_assessment(
+    candidate: CandidateDict,
+    candidate_id: str,
+    assessment: AssessmentResult,
+    research: Optional[ExecutiveResearchResult],
+    role_spec_markdown: str,
+    screen_id: str,
+    airtable: AirtableClient,
+) -> str:
+    """Render the inline summary and persist the assessment to Airtable."""
+
+    inline_markdown = render_assessment_markdown_inline(candidate, assessment, research)
+    return airtable.write_assessment(
+        screen_id=screen_id,
+        candidate_id=candidate_id,
+        assessment=assessment,
+        research=research,
+        role_spec_markdown=role_spec_markdown,
+        assessment_markdown=inline_markdown,
+    )
+
+
+async def _awrite_candidate_assessment(
+    candidate: CandidateDict,
+    candidate_id: str,
+    assessment: AssessmentResult,
+    research: Optional[ExecutiveResearchResult],
+    role_spec_markdown: str,
+    screen_id: str,
+    airtable: AirtableClient,
+    async_airtable: Optional[AsyncAirtableClient],
+) -> str:
+    """Persist the assessment with ``async_airtable``, or ``airtable`` in a thread."""
+
+    if async_airtable is None:
+        return await asyncio.to_thread(
+            _write_candidate_assessment,
+            candidate,
+            candidate_id,
+            assessment,
+            research,
+            role_spec_markdown,
+            screen_id,
+            airtable,
+        )
+    inline_markdown = render_assessment_markdown_inline(candidate, assessment, research)
+    return await async_airtable.write_assessment(
+        screen_id=screen_id,
+        candidate_id=candidate_id,
+        assessment=assessment,
+        research=research,
+        role_spec_markdown=role_spec_markdown,
+        assessment_markdown=inline_markdown,
+    )
+
+
+def _candidate_failure(
+    candidate_id: str,
+    candidate_name: str,
+    exc: Exception,
+    logger: logging.Logger,
+    symbols: LogSymbols,
+) -> CandidateOutcome:
+    logger.error(
+        "%s Candidate %s failed during screening: %s",
+        symbols.error,
+        candidate_name,
+        exc,
+    )
+    return None, {
+        "candidate_id": candidate_id,
+        "error": str(exc),
+    }
+
+
+def _candidate_success(
+    candidate_id: str,
+    candidate_name: str,
+    assessment_record_id: str,
+    assessment: AssessmentResult,
+    logger: logging.Logger,
+    symbols: LogSymbols,
+) -> CandidateOutcome:
+    logger.info(
+        "%s Candidate %s screened successfully (score=%s)",
+        symbols.success,
+        candidate_name,
+        assessment.overall_score,
+    )
+    return {
+        "candidate_id": candidate_id,
+        "assessment_id": assessment_record_id,
+        "overall_score": assessment.overall_score,
+        "confidence": assessment.overall_confidence,
+        "summary": assessment.summary,
+        "assessed_at": assessment.assessment_timestamp.isoformat(),
+    }, None
+
+
+def _defer_candidate(
+    candidate_id: str,
+    candidate_name: str,
+    exc: BudgetExhaustedError,
+    screen_id: str,
+    airtable: AirtableClient,
+    logger: logging.Logger,
+    symbols: LogSymbols,
+) -> CandidateOutcome:
+    """Record a candidate skipped by the screen budget as deferred."""
+
+    try:
+        record_id = airtable.write_deferred_assessment(
+            screen_id=screen_id, candidate_id=candidate_id, reason=str(exc)
+        )
+    except Exception as write_exc:
+        return _candidate_failure(
+            candidate_id, candidate_name, write_exc, logger, symbols
+        )
+    logger.warning("%s Candidate %s deferred: %s", symbols.error, candidate_name, exc)
+    return {
+        "candidate_id": candidate_id,
+        "assessment_id": record_id,
+        "status": "deferred",
+        "reason": str(exc),
+    }, None
+
+
+def _process_single_candidate(
+    candidate: CandidateDict,
+    role_spec_markdown: str,
+    screen_id: str,
+    airtable: AirtableClient,
+    candidate_runner: CandidateRunner,
+    logger: logging.Logger,
+    symbols: LogSymbols,
+    custom_instructions: Optional[str] = None,
+    budget: Optional[ScreenBudget] = None,
+) -> CandidateOutcome:
+    """Run one candidate through the workflow and persist its assessment.
+
+    Exceptions are caught and converted to an error entry so that a single
+    failing candidate never aborts the rest of the batch. Model calls are
+    charged to ``budget``; a candidate whose Deep Research no longer fits in
+    it is recorded as deferred.
+
+    Returns:
+        Tuple of (result, error) where exactly one element is populated.
+    """
+    candidate_id, candidate_name, id_error = _candidate_identity(
+        candidate, logger, symbols
+    )
+    if candidate_id is None:
+        return None, id_error
+
+    try:
+        with use_budget(budget):
+            assessment, research = candidate_runner(
+                candidate,
+                role_spec_markdown,
+                screen_id,
+                custom_instructions,
+            )
+        assessment_record_id = _write_candidate_assessment(
+            candidate,
+            candidate_id,
+            assessment,
+            research,
+            role_spec_markdown,
+            screen_id,
+            airtable,
+        )
+    except BudgetExhaustedError as exc:
+        return _defer_candidate(
+            candidate_id, candidate_name, exc, screen_id, airtable, logger, symbols
+        )
+    except Exception as exc:
+        # Catch all exceptions to continue processing remaining candidates
+        return _candidate_failure(candidate_id, candidate_name, exc, logger, symbols)
+
+    return _candidate_success(
+        candidate_id, candidate_name, assessment_record_id, assessment, logger, symbols
+    )
+
+
+async def _aprocess_single_candidate(
+    candidate: CandidateDict,
+    role_spec_markdown: str,
+    screen_id: str,
+    airtable: AirtableClient,
+    candidate_runner: AsyncCandidateRunner,
+    logger: logging.Logger,
+    symbols: LogSymbols,
+    custom_instructions: Optional[str] = None,
+    budget: Optional[ScreenBudget] = None,
+    async_airtable: Optional[AsyncAirtableClient] = None,
+) -> CandidateOutcome:
+    """Async counterpart of :func:`_process_single_candidate`.
+
+    The assessment is written with ``async_airtable`` when given; otherwise
+    the blocking Airtable write is offloaded to a worker thread so the event
+    loop keeps serving other candidates' LLM calls.
+    """
+    candidate_id, candidate_name, id_error = _candidate_identity(
+        candidate, logger, symbols
+    )
+    if candidate_id is None:
+        return None, id_error
+
+    try:
+        with use_budget(budget):
+            assessment, research = await candidate_runner(
+                candidate,
+                role_spec_markdown,
+                screen_id,
+                custom_instructions,
+            )
+        assessment_record_id = await _awrite_candidate_assessment(
+            candidate,
+            candidate_id,
+            assessment,
+            research,
+            role_spec_markdown,
+            screen_id,
+            airtable,
+            async_airtable,
+        )
+    except BudgetExhaustedError as exc:
+        return await asyncio.to_thread(
+            _defer_candidate,
+            candidate_id,
+            candidate_name,
+            exc,
+            screen_id,
+            airtable,
+            logger,
+            symbols,
+        )
+    except Exception as exc:
+        # Catch all exceptions to continue processing remaining candidates
+        return _candidate_failure(candidate_id, candidate_name, exc, logger, symbols)
+
+    return _candidate_success(
+        candidate_id, candidate_name, assessment_record_id, assessment, logger, symbols
+    )
+
+
+def _adaptive_runner(
+    candidate_runner: CandidateRunner,
+    controller: AdaptiveConcurrencyController,
+) -> CandidateRunner:
+    """Gate a candidate runner on the AIMD window and feed back its outcome."""
+
+    def run(
+        candidate: CandidateDict,
+        role_spec_markdown: str,
+        screen_id: str,
+        custom_instructions: Optional[str],
+    ) -> tuple[AssessmentResult, Optional[ExecutiveResearchResult]]:
+        ticket = controller.acquire()
+        try:
+            outcome = candidate_runner(
+                candidate, role_spec_markdown, screen_id, custom_instructions
+            )
+        except Exception as exc:
+            controller.release(
+                ticket,
+                succeeded=False,
+                congestion=classify_congestion(exc, monotonic() - ticket.started_at),
+            )
+            raise
+        except BaseException:
+            controller.release(ticket, succeeded=False)
+            raise
+        controller.release(ticket, succeeded=True)
+        return outcome
+
+    return run
+
+
+def _aadaptive_runner(
+    candidate_runner: AsyncCandidateRunner,
+    controller: AdaptiveConcurrencyController,
+) -> AsyncCandidateRunner:
+    """Async counterpart of :func:`_adaptive_runner`."""
+
+    async def run(
+        candidate: CandidateDict,
+        role_spec_markdown: str,
+        screen_id: str,
+        custom_instructions: Optional[str],
+    ) -> tuple[AssessmentResult, Optional[ExecutiveResearchResult]]:
+        ticket = await controller.aacquire()
+        try:
+            outcome = await candidate_runner(
+                candidate, role_spec_markdown, screen_id, custom_instructions
+            )
+        except Exception as exc:
+            controller.release(
+                ticket,
+                succeeded=False,
+                congestion=classify_congestion(exc, monotonic() - ticket.started_at),
+            )
+            raise
+        except BaseException:
+            controller.release(ticket, succeeded=False)
+            raise
+        controller.release(ticket, succeeded=True)
+        return outcome
+
+    return run
+
+
+def _processing_order(
+    candidates: list[CandidateDict],
+    role_type: Optional[str],
+    budget: Optional[ScreenBudget],
+) -> list[int]:
+    """Candidate indices in the order they should start.
+
+    Under a budget the likeliest fits go first so they are researched before
+    the budget runs out; otherwise payload order is kept.
+    """
+
+    if budget is None:
+        return list(range(len(candidates)))
+    return order_by_expected_fit(candidates, role_type)
+
+
+def _in_payload_order(
+    order: list[int], outcomes: list[CandidateOutcome]
+) -> list[CandidateOutcome]:
+    """Undo :func:`_processing_order` so payloads list candidates as received."""
+
+    restored: list[CandidateOutcome] = [(None, None)] * len(outcomes)
+    for position, index in enumerate(order):
+        restored[index] = outcomes[position]
+    return restored
+
+
+def _collect_outcomes(
+    outcomes: list[CandidateOutcome],
+) -> tuple[list[dict[str, Any]], list[dict[str, str]]]:
+    """Split ordered candidate outcomes into results and errors lists."""
+
+    results: list[dict[str, Any]] = []
+    errors: list[dict[str, str]] = []
+    for result, error in outcomes:
+        if result is not None:
+            results.append(result)
+        if error is not None:
+            errors.append(error)
+    return results, errors
+
+
 def _process_candidate_batch(
     candidates: list[CandidateDict],
     role_spec_markdown: str,
@@ -91,9 +512,17 @@ def _process_candidate_batch(
     logger: logging.Logger,
     symbols: LogSymbols,
     custom_instructions: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
+    budget: Optional[ScreenBudget] = None,
+    role_type: Optional[str] = None,
+    progress: Optional[ScreenProgressReporter] = None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, str]]]:
     """Process a batch of candidates through the screening workflow.
 
+    Candidates run concurrently on a bounded thread pool because each workflow
+    spends almost all of its time waiting on the OpenAI API. Results and errors
+    are returned in the same order as the input candidates.
+
     Args:
         candidates: List of candidate dicts with keys: id, name, title, company, etc.
         role_spec_markdown: Complete role specification markdown.
@@ -103,100 +532,161 @@ def _process_candidate_batch(
         logger: Logger for workflow progress.
         symbols: Logging glyphs for consistent output.
         custom_instructions: Optional recruiter-provided overrides.
+        max_concurrency: Fixed cap on candidates in flight at once. When
+            omitted, the shared adaptive (AIMD) controller sizes the window, or
+            ``settings.screening.max_concurrent_candidates`` if adaptivity is off.
+        budget: Optional spend cap shared by the batch; candidates then start
+            in order of expected fit for ``role_type``.
+        role_type: Searched role type (e.g. ``CFO``) used for that ordering.
+        progress: Optional reporter told as each candidate starts and finishes.
 
     Returns:
         Tuple of (results list, errors list). Results contain assessment metadata,
         errors contain candidate_id and error message.
     """
-    results: list[dict[str, Any]] = []
-    errors: list[dict[str, str]] = []
+    if not candidates:
+        return [], []
+
+    controller = None if max_concurrency else get_concurrency_controller()
+    if controller is not None:
+        candidate_runner = _adaptive_runner(candidate_runner, controller)
+        limit = controller.max_limit
+    else:
+        limit = max_concurrency or settings.screening.max_concurrent_candidates
+    workers = max(1, min(limit, len(candidates)))
+
+    def run(candidate: CandidateDict) -> CandidateOutcome:
+        if progress is not None:
+            progress.started()
+        outcome = _process_single_candidate(
+            candidate=candidate,
+            role_spec_markdown=role_spec_markdown,
+            screen_id=screen_id,
+            airtable=airtable,
+            candidate_runner=candidate_runner,
+            logger=logger,
+            symbols=symbols,
+            custom_instructions=custom_instructions,
+            budget=budget,
+        )
+        if progress is not None:
+            progress.finished(*outcome)
+        return outcome
+
+    order = _processing_order(candidates, role_type, budget)
+    ordered = [candidates[index] for index in order]
+    if workers == 1:
+        return _collect_outcomes(
+            _in_payload_order(order, [run(candidate) for candidate in ordered])
+        )
 
-    for candidate in candidates:
-        candidate_id = candidate.get("id")
-        candidate_name = candidate.get("name", candidate_id or "Unknown")
+    logger.info(
+        "%s Screening %s candidates with up to %s in flight",
+        symbols.search,
+        len(candidates),
+        controller.window if controller is not None else workers,
+    )
+    # ``executor.map`` yields in submission order, so mapping back through
+    # ``order`` keeps input ordering in the payload regardless of completion.
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix=f"screen-{screen_id}"
+    ) as executor:
+        outcomes = list(executor.map(run, ordered))
 
-        if not candidate_id:
-            logger.error(
-                "%s Candidate record missing ID; skipping record.",
-                symbols.error,
-            )
-            errors.append(
-                {
-                    "candidate_id": "unknown",
-                    "error": "Candidate record missing ID.",
-                }
-            )
-            continue
+    return _collect_outcomes(_in_payload_order(order, outcomes))
 
-        candidate_id_str = str(candidate_id)
 
-        logger.debug(
-            "📦 PROCESSING CANDIDATE (ID: %s, Name: %s):\n%s",
-            candidate_id_str,
-            candidate_name,
-            json.dumps(candidate, indent=2, default=str),
-        )
+async def _aprocess_candidate_batch(
+    candidates: list[CandidateDict],
+    role_spec_markdown: str,
+    screen_id: str,
+    airtable: AirtableClient,
+    candidate_runner: AsyncCandidateRunner,
+    logger: logging.Logger,
+    symbols: LogSymbols,
+    custom_instructions: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
+    completed_results: Optional[dict[str, dict[str, Any]]] = None,
+    on_result: Optional[ResultCallback] = None,
+    budget: Optional[ScreenBudget] = None,
+    role_type: Optional[str] = None,
+    progress: Optional[ScreenProgressReporter] = None,
+    async_airtable: Optional[AsyncAirtableClient] = None,
+) -> tuple[list[dict[str, Any]], list[dict[str, str]]]:
+    """Async counterpart of :func:`_process_candidate_batch`.
 
-        try:
-            assessment, research = candidate_runner(
-                candidate,
-                role_spec_markdown,
-                screen_id,
-                custom_instructions,
-            )
-            inline_markdown = render_assessment_markdown_inline(
-                candidate, assessment, research
-            )
-            assessment_record_id = airtable.write_assessment(
-                screen_id=screen_id,
-                candidate_id=candidate_id_str,
-                assessment=assessment,
-                research=research,
+    Candidates are multiplexed on the running event loop, bounded by a
+    semaphore (or the adaptive controller window), and returned in input order. Candidates whose ID appears in
+    ``completed_results`` are not re-run; their stored result is reused. Each
+    new successful, non-deferred result is passed to ``on_result`` (in a
+    worker thread) so callers can checkpoint progress.
+    """
+    if not candidates:
+        return [], []
+
+    controller = None if max_concurrency else get_concurrency_controller()
+    if controller is not None:
+        candidate_runner = _aadaptive_runner(candidate_runner, controller)
+        limit = controller.max_limit
+    else:
+        limit = max_concurrency or settings.screening.max_concurrent_candidates
+    semaphore = asyncio.Semaphore(max(1, limit))
+    completed = completed_results or {}
+
+    async def run(candidate: CandidateDict) -> CandidateOutcome:
+        previous = completed.get(str(candidate.get("id")))
+        if previous is not None:
+            return previous, None
+        async with semaphore:
+            if progress is not None:
+                progress.started()
+            outcome = await _aprocess_single_candidate(
+                candidate=candidate,
                 role_spec_markdown=role_spec_markdown,
-                assessment_markdown=inline_markdown,
-            )
-            results.append(
-                {
-                    "candidate_id": candidate_id_str,
-                    "assessment_id": assessment_record_id,
-                    "overall_score": assessment.overall_score,
-                    "confidence": assessment.overall_confidence,
-                    "summary": assessment.summary,
-                    "assessed_at": assessment.assessment_timestamp.isoformat(),
-                }
-            )
-            logger.info(
-                "%s Candidate %s screened successfully (score=%s)",
-                symbols.success,
-                candidate_name,
-                assessment.overall_score,
-            )
-        except Exception as exc:
-            # Catch all exceptions to continue processing remaining candidates
-            logger.error(
-                "%s Candidate %s failed during screening: %s",
-                symbols.error,
-                candidate_name,
-                exc,
-            )
-            errors.append(
-                {
-                    "candidate_id": candidate_id_str,
-                    "error": str(exc),
-                }
+                screen_id=screen_id,
+                airtable=airtable,
+                candidate_runner=candidate_runner,
+                logger=logger,
+                symbols=symbols,
+                custom_instructions=custom_instructions,
+                budget=budget,
+                async_airtable=async_airtable,
             )
-        finally:
-            for report_path in report_paths:
-                if report_path.exists():
-                    try:
-                        report_path.unlink()
-                    except OSError:
-                        logger.debug(
-                            "Unable to delete temporary report file %s",
-                            report_path,
-                        )
+        if progress is not None:
+            progress.finished(*outcome)
+        result, _ = outcome
+        # Deferred candidates are still owed an assessment, so a resumed
+        # attempt must run them again.
+        if result is not None and not _is_deferred(result) and on_result is not None:
+            await asyncio.to_thread(on_result, result)
+        return outcome
+
+    if completed:
+        resumed = sum(1 for c in candidates if str(c.get("id")) in completed)
+        logger.info(
+            "%s Resuming screen %s: %s candidates already assessed",
+            symbols.search,
+            screen_id,
+            resumed,
+        )
+        if progress is not None:
+            progress.resumed(resumed)
+
+    logger.info(
+        "%s Screening %s candidates with up to %s in flight",
+        symbols.search,
+        len(candidates),
+        controller.window if controller is not None else min(limit, len(candidates)),
+    )
+    # Tasks take semaphore slots in start order; ``gather`` returns results in
+    # argument order, which ``order`` maps back to payload ordering.
+    order = _processing_order(candidates, role_type, budget)
+    outcomes = await asyncio.gather(*(run(candidates[index]) for index in order))
+    return _collect_outcomes(_in_payload_order(order, list(outcomes)))
 
-    return results, errors
+
+def _is_deferred(result: dict[str, Any]) -> bool:
+    return result.get("status") == "deferred"
 
 
 def _log_completion_event(
@@ -209,6 +699,9 @@ def _log_completion_event(
 ) -> None:
     """Log completion event to Airtable automation log.
 
+    Flushes the client's buffered creates, so every write of the screen has
+    reached Airtable when this returns.
+
     Args:
         screen_id: Airtable record ID for the Screen.
         results: List of successful assessment results.
@@ -219,18 +712,22 @@ def _log_completion_event(
     """
     try:
         assessment_ids = [r["assessment_id"] for r in results if "assessment_id" in r]
-        airtable.log_automation_event(
+        deferred = sum(1 for r in results if _is_deferred(r))
+        deferred_note = f"{deferred} deferred (budget), " if deferred else ""
+        logged = airtable.submit_automation_event(
             action="Candidate Assessment",
             event_type="State Change",
             related_table="Platform-Screens",
             related_record_ids=[screen_id],
             event_summary=(
-                f"Screen {screen_id} completed: {len(results)} successful, "
-                f"{len(errors)} failed, {duration:.1f}s elapsed"
+                f"Screen {screen_id} completed: {len(results) - deferred} successful, "
+                f"{len(errors)} failed, {deferred_note}{duration:.1f}s elapsed"
             ),
             screen_id=screen_id,
             assessment_ids=assessment_ids if assessment_ids else None,
         )
+        airtable.flush()
+        logged.result()
     except Exception as exc:
         # Don't fail the workflow if logging fails, just warn
         logger.warning(f"⚠️  Failed to log completion event: {exc}")
@@ -242,33 +739,109 @@ def _format_response_payload(
     results: list[dict[str, Any]],
     errors: list[dict[str, str]],
     duration: float,
+    budget: Optional[ScreenBudget] = None,
 ) -> dict[str, Any]:
     """Format response payload for webhook endpoint.
 
     Args:
         screen_id: Airtable record ID for the Screen.
         candidates_total: Total number of candidates processed.
-        results: List of successful assessment results.
+        results: List of successful and deferred candidate results.
         errors: List of error dicts.
         duration: Execution time in seconds.
+        budget: Screen budget, reported with spend per step when set.
 
     Returns:
-        Formatted response dict with status, counts, results, and optional errors.
+        Formatted response dict with status, counts, results, and optional
+        errors, deferred candidates and budget.
     """
+    deferred = [result for result in results if _is_deferred(result)]
+    processed = [result for result in results if not _is_deferred(result)]
     payload: dict[str, Any] = {
-        "status": "success" if not errors else "partial",
+        "status": "success" if not errors and not deferred else "partial",
         "screen_id": screen_id,
         "candidates_total": candidates_total,
-        "candidates_processed": len(results),
+        "candidates_processed": len(processed),
         "candidates_failed": len(errors),
         "execution_time_seconds": round(duration, 2),
-        "results": results,
+        "results": processed,
     }
     if errors:
         payload["errors"] = errors
+    if deferred:
+        payload["candidates_deferred"] = len(deferred)
+        payload["deferred"] = deferred
+    if budget is not None:
+        payload["budget"] = budget.snapshot()
     return payload
 
 
+def _validate_screen_candidates(
+    screen_id: str,
+    candidates: list[CandidateDict],
+    airtable: AirtableClient,
+) -> None:
+    """Validate candidates, marking the screen failed before raising."""
+
+    try:
+        validate_candidates(candidates)
+    except ValueError as exc:
+        airtable.update_screen_status(
+            screen_id,
+            status="Failed",
+            error_message=str(exc),
+        )
+        raise ScreenValidationError(
+            str(exc),
+            {"candidates": str(exc)},
+        ) from exc
+
+
+def _finalize_screen(
+    screen_id: str,
+    candidates_total: int,
+    results: list[dict[str, Any]],
+    errors: list[dict[str, str]],
+    start_ts: float,
+    airtable: AirtableClient,
+    logger: logging.Logger,
+    glyphs: LogSymbols,
+    budget: Optional[ScreenBudget] = None,
+    progress: Optional[ScreenProgressReporter] = None,
+) -> dict[str, Any]:
+    """Mark the screen complete, log the completion event and build the payload.
+
+    The final progress summary, if any, is written in the same PATCH as the
+    Complete status.
+    """
+
+    # Update final status
+    airtable.update_screen_status(
+        screen_id,
+        status="Complete",
+        fields=progress.close() if progress is not None else None,
+    )
+
+    duration = perf_counter() - start_ts
+
+    # Log completion event
+    _log_completion_event(screen_id, results, errors, duration, airtable, logger)
+
+    # Format and return response
+    response_payload = _format_response_payload(
+        screen_id, candidates_total, results, errors, duration, budget
+    )
+
+    logger.info(
+        "%s Screen %s completed (%s successes, %s failures)",
+        glyphs.success if not errors else glyphs.error,
+        screen_id,
+        len(results),
+        len(errors),
+    )
+    return response_payload
+
+
 def process_screen_direct(
     screen_id: str,
     role_spec_markdown: str,
@@ -279,6 +852,9 @@ def process_screen_direct(
     logger: logging.Logger,
     symbols: LogSymbols | None = None,
     candidate_runner: CandidateRunner,
+    max_concurrency: Optional[int] = None,
+    budget: Optional[ScreenBudget] = None,
+    role_type: Optional[str] = None,
 ) -> dict[str, Any]:
     """Execute screening workflow with pre-parsed candidate data.
 
@@ -294,6 +870,12 @@ def process_screen_direct(
         logger: Logger for workflow progress.
         symbols: Optional logging glyphs.
         candidate_runner: Function to run candidate workflow.
+        max_concurrency: Optional fixed cap on candidates processed in parallel.
+            Defaults to the adaptive concurrency window.
+        budget: Optional spend cap for the screen. Candidates start in order
+            of expected fit, and those whose Deep Research no longer fits are
+            deferred (reported in the payload and written to Airtable).
+        role_type: Searched role type used to order candidates under a budget.
 
     Returns:
         Summary payload with results for all candidates.
@@ -305,18 +887,8 @@ def process_screen_direct(
     _update_screen_status_and_log_webhook(screen_id, airtable, logger, glyphs)
 
     # Validate candidates
-    try:
-        validate_candidates(candidates)
-    except ValueError as exc:
-        airtable.update_screen_status(
-            screen_id,
-            status="Failed",
-            error_message=str(exc),
-        )
-        raise ScreenValidationError(
-            str(exc),
-            {"candidates": str(exc)},
-        ) from exc
+    _validate_screen_candidates(screen_id, candidates, airtable)
+    progress = create_screen_progress(airtable, screen_id, len(candidates))
 
     # Process all candidates
     results, errors = _process_candidate_batch(
@@ -328,26 +900,113 @@ def process_screen_direct(
         logger=logger,
         symbols=glyphs,
         custom_instructions=custom_instructions,
+        max_concurrency=max_concurrency,
+        budget=budget,
+        role_type=role_type,
+        progress=progress,
     )
 
-    # Update final status
-    airtable.update_screen_status(screen_id, status="Complete")
+    return _finalize_screen(
+        screen_id,
+        len(candidates),
+        results,
+        errors,
+        start_ts,
+        airtable,
+        logger,
+        glyphs,
+        budget,
+        progress,
+    )
 
-    duration = perf_counter() - start_ts
 
-    # Log completion event
-    _log_completion_event(screen_id, results, errors, duration, airtable, logger)
+async def aprocess_screen_direct(
+    screen_id: str,
+    role_spec_markdown: str,
+    candidates: list[CandidateDict],
+    custom_instructions: Optional[str],
+    airtable: AirtableClient,
+    *,
+    logger: logging.Logger,
+    symbols: LogSymbols | None = None,
+    candidate_runner: AsyncCandidateRunner,
+    max_concurrency: Optional[int] = None,
+    completed_results: Optional[dict[str, dict[str, Any]]] = None,
+    on_result: Optional[ResultCallback] = None,
+    budget: Optional[ScreenBudget] = None,
+    role_type: Optional[str] = None,
+    async_airtable: Optional[AsyncAirtableClient] = None,
+) -> dict[str, Any]:
+    """Async counterpart of :func:`process_screen_direct`.
 
-    # Format and return response
-    response_payload = _format_response_payload(
-        screen_id, len(candidates), results, errors, duration
+    Candidate workflows are awaited on the running event loop so long-lived
+    LLM calls are multiplexed rather than each pinning a thread. Synchronous
+    Airtable calls are offloaded with ``asyncio.to_thread``.
+
+    Args:
+        screen_id: Airtable record ID for the Screen.
+        role_spec_markdown: Complete role specification markdown.
+        candidates: List of candidate dicts from webhook payload.
+        custom_instructions: Optional screen-specific guidance.
+        airtable: Airtable client for writing results.
+        logger: Logger for workflow progress.
+        symbols: Optional logging glyphs.
+        candidate_runner: Coroutine function to run the candidate workflow.
+        max_concurrency: Optional fixed cap on candidates in flight at once.
+            Defaults to the adaptive concurrency window.
+        completed_results: Results from a previous attempt keyed by candidate
+            ID; those candidates are skipped (used when resuming queued jobs).
+        on_result: Optional callback invoked with each new successful result
+            (deferred candidates excluded, so a resumed attempt assesses them).
+        budget: Optional spend cap for the screen (see
+            :func:`process_screen_direct`).
+        role_type: Searched role type used to order candidates under a budget.
+        async_airtable: Optional async client used for the per-candidate
+            assessment writes instead of offloading ``airtable`` to threads.
+            Screen status and automation-log writes still use ``airtable``.
+
+    Returns:
+        Summary payload with results for all candidates.
+    """
+    glyphs = symbols or LogSymbols()
+    start_ts = perf_counter()
+
+    await asyncio.to_thread(
+        _update_screen_status_and_log_webhook, screen_id, airtable, logger, glyphs
+    )
+    await asyncio.to_thread(
+        _validate_screen_candidates, screen_id, candidates, airtable
     )
+    progress = create_screen_progress(airtable, screen_id, len(candidates))
 
-    logger.info(
-        "%s Screen %s completed (%s successes, %s failures)",
-        glyphs.success if not errors else glyphs.error,
+    results, errors = await _aprocess_candidate_batch(
+        candidates=candidates,
+        role_spec_markdown=role_spec_markdown,
+        screen_id=screen_id,
+        airtable=airtable,
+        candidate_runner=candidate_runner,
+        logger=logger,
+        symbols=glyphs,
+        custom_instructions=custom_instructions,
+        max_concurrency=max_concurrency,
+        completed_results=completed_results,
+        on_result=on_result,
+        budget=budget,
+        role_type=role_type,
+        progress=progress,
+        async_airtable=async_airtable,
+    )
+
+    return await asyncio.to_thread(
+        _finalize_screen,
         screen_id,
-        len(results),
-        len(errors),
+        len(candidates),
+        results,
+        errors,
+        start_ts,
+        airtable,
+        logger,
+        glyphs,
+        budget,
+        progress,
     )
-    return response_payload
@@ -5,7 +5,7 @@ providing typed configuration objects for the application.
 """
 
 from pathlib import Path
-from typing import Any, Literal, TypeVar
+from typing import Any, Literal, Optional, TypeVar
 
 from dotenv import load_dotenv
 from pydantic import Field
@@ -46,7 +46,21 @@ class OpenAIConfig(BaseEnvSettings):
 
     api_key: str = Field(..., alias="OPENAI_API_KEY")
     use_deep_research: bool = Field(default=True, alias="USE_DEEP_RESEARCH")
+    research_tiered: bool = Field(default=False, alias="RESEARCH_TIERED")
     timeout: int = Field(default=300, alias="OPENAI_TIMEOUT")
+    deep_research_background: bool = Field(
+        default=False, alias="DEEP_RESEARCH_BACKGROUND"
+    )
+    deep_research_poll_seconds: float = Field(
+        default=5.0, gt=0, alias="DEEP_RESEARCH_POLL_SECONDS"
+    )
+    deep_research_max_wait_seconds: float = Field(
+        default=1800.0, gt=0, alias="DEEP_RESEARCH_MAX_WAIT_SECONDS"
+    )
+    agent_pool_max_idle: int = Field(default=8, ge=1, alias="AGENT_POOL_MAX_IDLE")
+    http_max_connections: int = Field(
+        default=32, ge=1, alias="OPENAI_HTTP_MAX_CONNECTIONS"
+    )
 
 
 class AirtableConfig(BaseEnvSettings):
@@ -56,6 +70,31 @@ class AirtableConfig(BaseEnvSettings):
 
     api_key: str = Field(..., alias="AIRTABLE_API_KEY")
     base_id: str = Field(..., alias="AIRTABLE_BASE_ID")
+    batch_writes: bool = Field(default=True, alias="AIRTABLE_BATCH_WRITES")
+    batch_size: int = Field(default=10, ge=1, le=10, alias="AIRTABLE_BATCH_SIZE")
+    batch_flush_seconds: float = Field(
+        default=0.5, gt=0, alias="AIRTABLE_BATCH_FLUSH_SECONDS"
+    )
+    rate_limit_enabled: bool = Field(default=True, alias="AIRTABLE_RATE_LIMIT_ENABLED")
+    requests_per_second: float = Field(
+        default=5.0, gt=0, alias="AIRTABLE_REQUESTS_PER_SECOND"
+    )
+    max_retries: int = Field(default=5, ge=0, alias="AIRTABLE_MAX_RETRIES")
+    retry_base_seconds: float = Field(
+        default=1.0, ge=0, alias="AIRTABLE_RETRY_BASE_SECONDS"
+    )
+    retry_max_seconds: float = Field(
+        default=30.0, ge=0, alias="AIRTABLE_RETRY_MAX_SECONDS"
+    )
+    idempotency_field: str = Field(default="", alias="AIRTABLE_IDEMPOTENCY_FIELD")
+    api_url: str = Field(default="https://api.airtable.com", alias="AIRTABLE_API_URL")
+    async_client: bool = Field(default=False, alias="AIRTABLE_ASYNC_CLIENT")
+    http_max_connections: int = Field(
+        default=10, ge=1, alias="AIRTABLE_HTTP_MAX_CONNECTIONS"
+    )
+    http_timeout_seconds: float = Field(
+        default=30.0, gt=0, alias="AIRTABLE_HTTP_TIMEOUT_SECONDS"
+    )
 
     @property
     def clean_base_id(self) -> str:
@@ -86,6 +125,83 @@ class AgentOSConfig(BaseEnvSettings):
     security_key: str | None = Field(default=None, alias="AGENTOS_SECURITY_KEY")
 
 
+DEFAULT_MODEL_RATE_LIMITS: dict[str, dict[str, int]] = {
+    "o4-mini-deep-research": {"rpm": 50, "tpm": 200_000},
+    "gpt-5": {"rpm": 500, "tpm": 500_000},
+    "gpt-5-mini": {"rpm": 500, "tpm": 500_000},
+}
+
+
+class RateLimitConfig(BaseEnvSettings):
+    """Shared per-model OpenAI request/token rate limits."""
+
+    model_config = SettingsConfigDict(populate_by_name=True)
+
+    enabled: bool = Field(default=True, alias="OPENAI_RATE_LIMIT_ENABLED")
+    backend: Literal["memory", "sqlite"] = Field(
+        default="memory", alias="OPENAI_RATE_LIMIT_BACKEND"
+    )
+    db_path: str = Field(
+        default="tmp/rate_limits.db", alias="OPENAI_RATE_LIMIT_DB_PATH"
+    )
+    limits: dict[str, dict[str, int]] = Field(
+        default_factory=lambda: dict(DEFAULT_MODEL_RATE_LIMITS),
+        alias="OPENAI_RATE_LIMITS",
+    )
+    output_token_estimate: int = Field(
+        default=1000, ge=0, alias="OPENAI_RATE_LIMIT_OUTPUT_TOKEN_ESTIMATE"
+    )
+    cooldown_seconds: float = Field(
+        default=10.0, ge=0, alias="OPENAI_RATE_LIMIT_COOLDOWN_SECONDS"
+    )
+
+
+# USD per million tokens; cached input is billed at the discounted rate.
+DEFAULT_MODEL_PRICES: dict[str, dict[str, float]] = {
+    "o4-mini-deep-research": {"input": 2.0, "cached_input": 0.5, "output": 8.0},
+    "gpt-5": {"input": 1.25, "cached_input": 0.125, "output": 10.0},
+    "gpt-5-mini": {"input": 0.25, "cached_input": 0.025, "output": 2.0},
+}
+
+
+class BudgetConfig(BaseEnvSettings):
+    """Per-screen spend caps and the model prices used to enforce them."""
+
+    model_config = SettingsConfigDict(populate_by_name=True)
+
+    max_usd: Optional[float] = Field(default=None, gt=0, alias="SCREEN_BUDGET_USD")
+    max_tokens: Optional[int] = Field(default=None, gt=0, alias="SCREEN_BUDGET_TOKENS")
+    deep_research_estimate_usd: float = Field(
+        default=1.0, ge=0, alias="SCREEN_BUDGET_DEEP_RESEARCH_ESTIMATE_USD"
+    )
+    deep_research_estimate_tokens: int = Field(
+        default=150_000, ge=0, alias="SCREEN_BUDGET_DEEP_RESEARCH_ESTIMATE_TOKENS"
+    )
+    model_prices: dict[str, dict[str, float]] = Field(
+        default_factory=lambda: dict(DEFAULT_MODEL_PRICES),
+        alias="OPENAI_MODEL_PRICES",
+    )
+
+
+class CacheConfig(BaseEnvSettings):
+    """Persistent caches that let repeat screens skip expensive LLM calls."""
+
+    model_config = SettingsConfigDict(populate_by_name=True)
+
+    db_path: str = Field(default="tmp/cache.db", alias="CACHE_DB_PATH")
+    research_enabled: bool = Field(default=True, alias="RESEARCH_CACHE_ENABLED")
+    research_ttl_hours: float = Field(
+        default=720.0, gt=0, alias="RESEARCH_CACHE_TTL_HOURS"
+    )
+    research_blob_enabled: bool = Field(default=True, alias="RESEARCH_BLOB_ENABLED")
+    research_blob_dir: str = Field(
+        default="tmp/research_blobs", alias="RESEARCH_BLOB_DIR"
+    )
+    assessment_enabled: bool = Field(default=True, alias="ASSESSMENT_CACHE_ENABLED")
+    llm_enabled: bool = Field(default=True, alias="LLM_CACHE_ENABLED")
+    llm_max_mb: float = Field(default=256.0, gt=0, alias="LLM_CACHE_MAX_MB")
+
+
 class QualityCheckConfig(BaseEnvSettings):
     """Quality check configuration for research validation."""
 
@@ -94,6 +210,91 @@ class QualityCheckConfig(BaseEnvSettings):
     min_citations: int = Field(default=3, alias="MIN_CITATIONS")
 
 
+class ScreeningConfig(BaseEnvSettings):
+    """Batch execution configuration for screening runs."""
+
+    model_config = SettingsConfigDict(populate_by_name=True)
+
+    max_concurrent_candidates: int = Field(
+        default=4, ge=1, alias="SCREEN_MAX_CONCURRENT_CANDIDATES"
+    )
+    pipeline_enabled: bool = Field(default=False, alias="SCREEN_PIPELINE_ENABLED")
+    research_workers: int = Field(default=8, ge=1, alias="SCREEN_RESEARCH_WORKERS")
+    quality_workers: int = Field(default=4, ge=1, alias="SCREEN_QUALITY_WORKERS")
+    assessment_workers: int = Field(default=4, ge=1, alias="SCREEN_ASSESSMENT_WORKERS")
+    adaptive_concurrency: bool = Field(
+        default=True, alias="SCREEN_ADAPTIVE_CONCURRENCY"
+    )
+    adaptive_min_candidates: int = Field(
+        default=1, ge=1, alias="SCREEN_ADAPTIVE_MIN_CANDIDATES"
+    )
+    adaptive_max_candidates: int = Field(
+        default=16, ge=1, alias="SCREEN_ADAPTIVE_MAX_CANDIDATES"
+    )
+    adaptive_increase: float = Field(
+        default=1.0, gt=0, alias="SCREEN_ADAPTIVE_INCREASE"
+    )
+    adaptive_decrease_factor: float = Field(
+        default=0.5, gt=0, lt=1, alias="SCREEN_ADAPTIVE_DECREASE_FACTOR"
+    )
+    triage_enabled: bool = Field(default=False, alias="SCREEN_TRIAGE_ENABLED")
+    triage_model_check: bool = Field(default=True, alias="SCREEN_TRIAGE_MODEL_CHECK")
+    batched_assessment: bool = Field(default=True, alias="SCREEN_BATCHED_ASSESSMENT")
+    batched_assessment_max_specs: int = Field(
+        default=4, ge=2, alias="SCREEN_BATCHED_ASSESSMENT_MAX_SPECS"
+    )
+    progress_enabled: bool = Field(default=True, alias="SCREEN_PROGRESS_ENABLED")
+    # Progress is written only to a Screens field chosen for it; empty = off.
+    progress_field: str = Field(default="", alias="SCREEN_PROGRESS_FIELD")
+    progress_interval_seconds: float = Field(
+        default=10.0, gt=0, alias="SCREEN_PROGRESS_INTERVAL_SECONDS"
+    )
+
+
+class JobQueueConfig(BaseEnvSettings):
+    """Durable screen job queue configuration."""
+
+    model_config = SettingsConfigDict(populate_by_name=True)
+
+    db_path: str = Field(default="tmp/screen_jobs.db", alias="SCREEN_QUEUE_DB_PATH")
+    max_attempts: int = Field(default=3, ge=1, alias="SCREEN_QUEUE_MAX_ATTEMPTS")
+    lease_seconds: float = Field(
+        default=300.0, gt=0, alias="SCREEN_QUEUE_LEASE_SECONDS"
+    )
+    heartbeat_seconds: float = Field(
+        default=30.0, gt=0, alias="SCREEN_QUEUE_HEARTBEAT_SECONDS"
+    )
+    poll_seconds: float = Field(default=2.0, gt=0, alias="SCREEN_QUEUE_POLL_SECONDS")
+    retry_backoff_seconds: float = Field(
+        default=30.0, ge=0, alias="SCREEN_QUEUE_RETRY_BACKOFF_SECONDS"
+    )
+    inprocess_worker: bool = Field(default=True, alias="SCREEN_QUEUE_INPROCESS_WORKER")
+    worker_concurrency: int = Field(
+        default=4, ge=1, alias="SCREEN_QUEUE_WORKER_CONCURRENCY"
+    )
+
+
+class OutboxConfig(BaseEnvSettings):
+    """Local outbox of Airtable mutations awaiting delivery."""
+
+    model_config = SettingsConfigDict(populate_by_name=True)
+
+    enabled: bool = Field(default=True, alias="AIRTABLE_OUTBOX_ENABLED")
+    db_path: str = Field(
+        default="tmp/airtable_outbox.db", alias="AIRTABLE_OUTBOX_DB_PATH"
+    )
+    max_attempts: int = Field(default=8, ge=1, alias="AIRTABLE_OUTBOX_MAX_ATTEMPTS")
+    lease_seconds: float = Field(
+        default=300.0, gt=0, alias="AIRTABLE_OUTBOX_LEASE_SECONDS"
+    )
+    poll_seconds: float = Field(
+        default=15.0, gt=0, alias="AIRTABLE_OUTBOX_POLL_SECONDS"
+    )
+    retry_backoff_seconds: float = Field(
+        default=30.0, ge=0, alias="AIRTABLE_OUTBOX_RETRY_BACKOFF_SECONDS"
+    )
+
+
 TEnvSettings = TypeVar("TEnvSettings", bound=BaseEnvSettings)
 
 
@@ -114,6 +315,12 @@ class Settings:
         self.server = _load_settings(ServerConfig)
         self.quality = _load_settings(QualityCheckConfig)
         self.agentos = _load_settings(AgentOSConfig)
+        self.screening = _load_settings(ScreeningConfig)
+        self.job_queue = _load_settings(JobQueueConfig)
+        self.outbox = _load_settings(OutboxConfig)
+        self.rate_limit = _load_settings(RateLimitConfig)
+        self.cache = _load_settings(CacheConfig)
+        self.budget = _load_settings(BudgetConfig)
 
 
 # Global settings instance
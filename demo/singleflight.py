@@ -0,0 +1,126 @@
+"""In-flight call coalescing ("single flight") for expensive, idempotent work.
+
+Two screens that arrive minutes apart with overlapping candidates would each
+start a multi-minute Deep Research run for the same person. ``SingleFlight``
+lets the first caller for a key do the work while later callers for the same
+key wait for, and share, its outcome. Callers may be threads (sync workflow
+runs) or coroutines on any event loop (queue workers, the stage pipeline).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Awaitable, Callable, Generic, TypeVar
+
+__all__ = ["SingleFlight"]
+
+T = TypeVar("T")
+
+
+class _Abandoned(Exception):
+    """Set on a call whose leader was cancelled; followers retry as leader."""
+
+
+class SingleFlight(Generic[T]):
+    """Coalesce concurrent calls that share a key into a single execution.
+
+    The result (or exception) of the leading call is handed to every caller
+    that joined while it was running. Nothing is cached once the call
+    finishes; a later caller for the same key starts a new execution.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, concurrent.futures.Future[T]] = {}
+        self.executions = 0
+        self.joined = 0
+
+    def in_flight(self) -> int:
+        """Number of keys currently being executed."""
+
+        with self._lock:
+            return len(self._calls)
+
+    def _claim(self, key: str) -> tuple[concurrent.futures.Future[T], bool]:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.joined += 1
+                return call, False
+            call = concurrent.futures.Future()
+            self._calls[key] = call
+            self.executions += 1
+            return call, True
+
+    def _finish(
+        self,
+        key: str,
+        call: concurrent.futures.Future[T],
+        *,
+        result: T | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+        if error is not None:
+            call.set_exception(error)
+        else:
+            call.set_result(result)  # type: ignore[arg-type]
+
+    def do(self, key: str, fn: Callable[[], T]) -> tuple[T, bool]:
+        """Run ``fn`` for ``key`` unless another caller already is.
+
+        Returns:
+            ``(result, joined)`` where ``joined`` is ``True`` when the result
+            came from a call started by someone else.
+        """
+
+        while True:
+            call, leader = self._claim(key)
+            if not leader:
+                try:
+                    return call.result(), True
+                except _Abandoned:
+                    continue
+            try:
+                result = fn()
+            except Exception as exc:
+                self._finish(key, call, error=exc)
+                raise
+            except BaseException:
+                self._finish(key, call, error=_Abandoned(key))
+                raise
+            self._finish(key, call, result=result)
+            return result, False
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Async variant of :meth:`do`; waiting never blocks the event loop.
+
+        Cancelling a follower only stops that follower. Cancelling the leader
+        hands the work to one of the waiting followers.
+        """
+
+        while True:
+            call, leader = self._claim(key)
+            if not leader:
+                try:
+                    # shield() so a cancelled follower does not cancel the
+                    # shared future other callers are waiting on.
+                    return await asyncio.shield(asyncio.wrap_future(call)), True
+                except _Abandoned:
+                    continue
+            try:
+                result = await fn()
+            except Exception as exc:
+                self._finish(key, call, error=exc)
+                raise
+            except BaseException:
+                # Cancellation (or interpreter shutdown) is not the work's
+                # outcome; let a follower take over instead.
+                self._finish(key, call, error=_Abandoned(key))
+                raise
+            self._finish(key, call, result=result)
+            return result, False
@@ -0,0 +1,218 @@
+"""Cheap pre-screen triage ahead of Deep Research.
+
+Bulk screens mix founders, CEOs and CTOs into a CFO search, and every one of
+them would otherwise get a multi-minute Deep Research run. Triage compares
+the candidate's normalized title with the search's ``role_type`` first:
+
+- a title in the searched role family advances without any model call;
+- an unrecognised title or a title in a different family is inconclusive and,
+  when ``SCREEN_TRIAGE_MODEL_CHECK`` is on, goes to a small-model check that
+  can advance, deprioritize or drop the candidate;
+- without the model check an inconclusive mismatch is only deprioritized, so a
+  title rule alone never drops anyone.
+
+Deprioritized candidates get fast research only (no Deep Research escalation);
+dropped candidates are written back with a triage assessment and no research.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+from demo.models import AssessmentResult, TriageResult
+
+__all__ = [
+    "TRIAGE_ADVANCE",
+    "TRIAGE_DEPRIORITIZE",
+    "TRIAGE_DROP",
+    "TriageDecision",
+    "TriageStats",
+    "get_triage_stats",
+    "normalize_title",
+    "reset_triage_stats",
+    "triage_assessment",
+    "triage_by_title",
+]
+
+TRIAGE_ADVANCE = "advance"
+TRIAGE_DEPRIORITIZE = "deprioritize"
+TRIAGE_DROP = "drop"
+
+# Role families recognised in titles and role types. "CPO" is ambiguous
+# (product or people), so it maps to both.
+_ROLE_FAMILIES: dict[str, re.Pattern[str]] = {
+    family: re.compile(pattern, re.IGNORECASE)
+    for family, pattern in {
+        "finance": r"\bcfo\b|chief financial|\bfinanc|controller|treasurer|fp&a|accounting",
+        "technology": r"\bcto\b|\bcio\b|chief (technology|technologist|information)"
+        r"|engineer|technical|\bai\b|architect",
+        "executive": r"\bceo\b|chief executive|\bpresident\b|general manager|\bgm\b"
+        r"|managing director",
+        "operations": r"\bcoo\b|chief operating|operations|\bops\b",
+        "product": r"\bcpo\b|chief product|\bproduct\b",
+        "revenue": r"\bcro\b|chief revenue|\bsales\b|revenue|business development",
+        "marketing": r"\bcmo\b|chief marketing|marketing|\bgrowth\b|\bbrand\b"
+        r"|community|content",
+        "people": r"\bcpo\b|chief people|\bchro\b|\bpeople\b|talent|human resources"
+        r"|\bhr\b",
+        "design": r"design",
+    }.items()
+}
+
+
+def normalize_title(title: Optional[str]) -> frozenset[str]:
+    """Role families mentioned in a free-text title or role type.
+
+    Example:
+        >>> sorted(normalize_title("Cofounder & CTO"))
+        ['technology']
+    """
+
+    if not title:
+        return frozenset()
+    return frozenset(
+        family for family, pattern in _ROLE_FAMILIES.items() if pattern.search(title)
+    )
+
+
+@dataclass(frozen=True)
+class TriageDecision:
+    """Outcome of triaging one candidate against the searched role type.
+
+    Attributes:
+        verdict: ``advance``, ``deprioritize`` or ``drop``.
+        reason: Short human-readable justification.
+        method: ``title`` for rule-based decisions, ``model`` for model checks.
+        conclusive: ``False`` when the title alone could not decide and a
+            model check may override the verdict.
+        title_roles: Role families recognised in the candidate's title.
+    """
+
+    verdict: str
+    reason: str
+    method: str = "title"
+    conclusive: bool = True
+    title_roles: tuple[str, ...] = ()
+
+    def with_model_result(self, result: TriageResult) -> TriageDecision:
+        return TriageDecision(
+            verdict=result.verdict,
+            reason=result.reason,
+            method="model",
+            title_roles=self.title_roles,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload["title_roles"] = list(self.title_roles)
+        return payload
+
+
+def triage_by_title(current_title: str, role_type: str) -> TriageDecision:
+    """Rule-based triage from the candidate title and the search role type."""
+
+    target = normalize_title(role_type)
+    roles = normalize_title(current_title)
+    title_roles = tuple(sorted(roles))
+    if not target:
+        return TriageDecision(
+            TRIAGE_ADVANCE,
+            f"Role type {role_type!r} is not a recognised role family",
+            title_roles=title_roles,
+        )
+    if roles & target:
+        return TriageDecision(
+            TRIAGE_ADVANCE,
+            f"Title {current_title!r} matches {role_type}",
+            title_roles=title_roles,
+        )
+    if not roles:
+        return TriageDecision(
+            TRIAGE_ADVANCE,
+            f"Title {current_title!r} does not indicate a role family",
+            conclusive=False,
+            title_roles=title_roles,
+        )
+    return TriageDecision(
+        TRIAGE_DEPRIORITIZE,
+        f"Title {current_title!r} is a {'/'.join(title_roles)} role, not {role_type}",
+        conclusive=False,
+        title_roles=title_roles,
+    )
+
+
+def triage_assessment(
+    decision: TriageDecision, role_type: str, role_spec_markdown: Optional[str]
+) -> AssessmentResult:
+    """Assessment written back for a candidate that triage dropped."""
+
+    return AssessmentResult(
+        overall_score=None,
+        overall_confidence="Low",
+        dimension_scores=[],
+        summary=(
+            f"Not researched: pre-screen triage ruled the candidate out for "
+            f"{role_type}. {decision.reason}"
+        ),
+        assessment_model=f"triage:{decision.method}",
+        role_spec_used=role_spec_markdown,
+    )
+
+
+class TriageStats:
+    """Process-wide triage counters, including the expensive calls avoided."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.evaluated = 0
+        self.model_checks = 0
+        self.verdicts = {TRIAGE_ADVANCE: 0, TRIAGE_DEPRIORITIZE: 0, TRIAGE_DROP: 0}
+        self.deep_research_avoided = 0
+        self.assessments_avoided = 0
+
+    def record(self, decision: TriageDecision, *, deep_research_planned: bool) -> None:
+        with self._lock:
+            self.evaluated += 1
+            self.model_checks += decision.method == "model"
+            self.verdicts[decision.verdict] += 1
+            if decision.verdict != TRIAGE_ADVANCE and deep_research_planned:
+                self.deep_research_avoided += 1
+            if decision.verdict == TRIAGE_DROP:
+                self.assessments_avoided += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "evaluated": self.evaluated,
+                "model_checks": self.model_checks,
+                "advanced": self.verdicts[TRIAGE_ADVANCE],
+                "deprioritized": self.verdicts[TRIAGE_DEPRIORITIZE],
+                "dropped": self.verdicts[TRIAGE_DROP],
+                "deep_research_avoided": self.deep_research_avoided,
+                "assessments_avoided": self.assessments_avoided,
+            }
+
+
+_stats_lock = threading.Lock()
+_stats: Optional[TriageStats] = None
+
+
+def get_triage_stats() -> TriageStats:
+    """Return the process-wide triage counters."""
+
+    global _stats
+    with _stats_lock:
+        if _stats is None:
+            _stats = TriageStats()
+        return _stats
+
+
+def reset_triage_stats() -> None:
+    """Discard triage counters (used by tests)."""
+
+    global _stats
+    with _stats_lock:
+        _stats = None
@@ -0,0 +1,183 @@
+"""Per-model token usage, prompt-cache hits and latency for OpenAI calls.
+
+OpenAI caches the longest previously seen prompt prefix automatically and
+reports the reused part as ``input_tokens_details.cached_tokens`` (exposed by
+Agno as ``Metrics.cache_read_tokens``). Recording it next to call latency
+shows whether the stable-prefix prompt layout is actually hitting the cache
+and how much faster cached calls are.
+
+:func:`track_usage` additionally collects the calls made inside a block (the
+current thread or asyncio task), which lets callers attribute tokens to one
+unit of work such as a research tier. Blocks nest: a call is added to every
+enclosing scope, so a screen budget and a research tier both see it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from agno.models.metrics import Metrics
+
+__all__ = [
+    "ModelUsage",
+    "UsageRecorder",
+    "get_usage_recorder",
+    "reset_usage_recorder",
+    "track_usage",
+]
+
+logger = logging.getLogger("demo.usage")
+
+
+@dataclass
+class ModelUsage:
+    """Running totals for one model id."""
+
+    calls: int = 0
+    cached_calls: int = 0
+    input_tokens: int = 0
+    cached_tokens: int = 0
+    output_tokens: int = 0
+    latency_seconds: float = 0.0
+    cached_latency_seconds: float = 0.0
+
+    def add(
+        self,
+        input_tokens: int,
+        cached_tokens: int,
+        output_tokens: int,
+        latency_seconds: float,
+    ) -> None:
+        self.calls += 1
+        self.input_tokens += input_tokens
+        self.cached_tokens += cached_tokens
+        self.output_tokens += output_tokens
+        self.latency_seconds += latency_seconds
+        if cached_tokens:
+            self.cached_calls += 1
+            self.cached_latency_seconds += latency_seconds
+
+    def snapshot(self) -> dict[str, Any]:
+        uncached_calls = self.calls - self.cached_calls
+        uncached_latency = self.latency_seconds - self.cached_latency_seconds
+        return {
+            "calls": self.calls,
+            "cached_calls": self.cached_calls,
+            "input_tokens": self.input_tokens,
+            "cached_tokens": self.cached_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_hit_rate": (
+                round(self.cached_tokens / self.input_tokens, 3)
+                if self.input_tokens
+                else None
+            ),
+            "avg_latency_cached": (
+                round(self.cached_latency_seconds / self.cached_calls, 3)
+                if self.cached_calls
+                else None
+            ),
+            "avg_latency_uncached": (
+                round(uncached_latency / uncached_calls, 3) if uncached_calls else None
+            ),
+        }
+
+
+class UsageRecorder:
+    """Thread-safe aggregation of ``Metrics`` reported by model responses."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._models: dict[str, ModelUsage] = {}
+
+    def record(
+        self, model_id: str, metrics: Optional[Metrics], latency_seconds: float
+    ) -> None:
+        """Add one call's usage; calls without usage metrics are ignored."""
+
+        if metrics is None:
+            return
+        input_tokens = metrics.input_tokens or 0
+        cached_tokens = metrics.cache_read_tokens or 0
+        output_tokens = metrics.output_tokens or 0
+        scopes = _scopes.get()
+        with self._lock:
+            for models in (self._models, *scopes):
+                models.setdefault(model_id, ModelUsage()).add(
+                    input_tokens, cached_tokens, output_tokens, latency_seconds
+                )
+        logger.debug(
+            "%s call: %s input tokens (%s cached) in %.2fs",
+            model_id,
+            input_tokens,
+            cached_tokens,
+            latency_seconds,
+        )
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Usage per model id."""
+
+        with self._lock:
+            return {
+                model_id: usage.snapshot()
+                for model_id, usage in sorted(self._models.items())
+            }
+
+
+_scopes: ContextVar[tuple[dict[str, ModelUsage], ...]] = ContextVar(
+    "usage_scopes", default=()
+)
+
+
+@contextmanager
+def track_usage(
+    usage: Optional[dict[str, ModelUsage]] = None,
+) -> Iterator[dict[str, ModelUsage]]:
+    """Collect per-model usage of the model calls made inside the block.
+
+    Calls are attributed through a context variable, so they are seen from the
+    same thread and from asyncio tasks (or ``asyncio.to_thread`` calls)
+    started inside the block.
+
+    Args:
+        usage: Existing totals to add to, e.g. a budget shared by several
+            concurrent blocks. A fresh dict is used when omitted.
+    """
+
+    usage = {} if usage is None else usage
+    scopes = _scopes.get()
+    if any(scope is usage for scope in scopes):
+        yield usage
+        return
+    token = _scopes.set((*scopes, usage))
+    try:
+        yield usage
+    finally:
+        _scopes.reset(token)
+
+
+_recorder_lock = threading.Lock()
+_recorder: Optional[UsageRecorder] = None
+
+
+def get_usage_recorder() -> UsageRecorder:
+    """Return the process-wide usage recorder."""
+
+    global _recorder
+    with _recorder_lock:
+        if _recorder is None:
+            _recorder = UsageRecorder()
+        return _recorder
+
+
+def reset_usage_recorder() -> None:
+    """Discard recorded usage (used by tests)."""
+
+    global _recorder
+    with _recorder_lock:
+        _recorder = None
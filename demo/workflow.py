@@ -6,9 +6,15 @@ the four-step screening process (research → quality check → incremental sear
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Sequence, cast
 
 from agno.db.base import SessionType
 from agno.db.sqlite import SqliteDb
@@ -18,11 +24,32 @@ from agno.workflow import Step, Workflow
 from agno.workflow.types import StepInput, StepOutput
 
 from demo.agents import (
+    aassess_candidate,
+    aassess_candidate_multi,
+    arun_incremental_search,
+    arun_research,
     assess_candidate,
+    assess_candidate_multi,
+    atriage_candidate_fit,
     run_incremental_search,
     run_research,
+    triage_candidate_fit,
 )
-from demo.models import AssessmentResult, CandidateDict
+from demo.blob_store import get_research_blob_store
+from demo.budget import (
+    BudgetExhaustedError,
+    budget_step,
+    current_budget,
+    deep_research_allowance,
+)
+from demo.models import (
+    AssessmentResult,
+    AssessmentTarget,
+    CandidateDict,
+    CandidateFanoutResult,
+    ExecutiveResearchResult,
+)
+from demo.research_cache import get_research_cache, research_cache_key
 from demo.screening_helpers import (
     check_research_quality,
     extract_candidate_context,
@@ -30,6 +57,17 @@ from demo.screening_helpers import (
 )
 from demo.screening_service import LogSymbols
 from demo.settings import settings
+from demo.singleflight import SingleFlight
+from demo.triage import (
+    TRIAGE_ADVANCE,
+    TRIAGE_DEPRIORITIZE,
+    TRIAGE_DROP,
+    TriageDecision,
+    get_triage_stats,
+    triage_assessment,
+    triage_by_title,
+)
+from demo.usage import ModelUsage, track_usage
 
 # Use centralized log symbols from screening_service
 _LOG_SYMBOLS = LogSymbols()
@@ -37,6 +75,34 @@ LOG_SEARCH = _LOG_SYMBOLS.search
 LOG_SUCCESS = _LOG_SYMBOLS.success
 LOG_ERROR = _LOG_SYMBOLS.error
 
+# Deep Research runs in flight, shared by every workflow runner in the process
+# so overlapping screens wait on one run per candidate instead of duplicating it.
+# Each outcome is (research, cache_hit, per-tier report).
+_research_flights: SingleFlight[
+    tuple[ExecutiveResearchResult, bool, list[dict[str, Any]]]
+] = SingleFlight()
+
+
+# Run input keys that control how a run executes rather than what it produces.
+_RUN_CONTROL_KEYS = frozenset({"session_id", "force_rerun"})
+
+
+def _run_fingerprint(input_data: dict[str, Any]) -> str:
+    """Hash of the run input; a stored run only resumes for identical input."""
+
+    material = {
+        key: value for key, value in input_data.items() if key not in _RUN_CONTROL_KEYS
+    }
+    payload = json.dumps(material, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _deprioritized(state: dict[str, Any] | None) -> bool:
+    """Whether triage limited this candidate to fast research."""
+
+    triage = (state or {}).get("triage") or {}
+    return triage.get("verdict") == TRIAGE_DEPRIORITIZE
+
 
 class AgentOSCandidateWorkflow:
     """AgentOS-aware workflow that runs the four candidate screening steps."""
@@ -46,22 +112,97 @@ class AgentOSCandidateWorkflow:
         self.agent_os = agent_os
         db_path = Path("tmp") / "agno_sessions.db"
         db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.workflow = Workflow(
-            id="talent-signal-candidate-workflow",
+        db = SqliteDb(
+            db_file=str(db_path),
+        )
+        self.workflow = self._build_workflow(
+            workflow_id="talent-signal-candidate-workflow",
             name="Talent Signal Candidate Workflow",
+            db=db,
+            research_executor=self._deep_research_step,
+            incremental_executor=self._incremental_search_step,
+            assessment_executor=self._assessment_step,
+            triage_executor=self._triage_step,
+        )
+        # Agno refuses to run coroutine executors from ``Workflow.run``, so the
+        # async pipeline gets its own workflow sharing the same session database.
+        self.async_workflow = self._build_workflow(
+            workflow_id="talent-signal-candidate-workflow-async",
+            name="Talent Signal Candidate Workflow (async)",
+            db=db,
+            research_executor=self._adeep_research_step,
+            incremental_executor=self._aincremental_search_step,
+            assessment_executor=self._aassessment_step,
+            triage_executor=self._atriage_step,
+        )
+        # Research once, assess against several role specs: same first three
+        # steps, but the final step scores every target from the shared research.
+        # Exposed through AgentOS only; the /screen queue path does not use it.
+        self.fanout_workflow = self._build_workflow(
+            workflow_id="talent-signal-candidate-fanout-workflow",
+            name="Talent Signal Candidate Fan-out Workflow",
+            db=db,
+            research_executor=self._deep_research_step,
+            incremental_executor=self._incremental_search_step,
+            assessment_executor=self._fanout_assessment_step,
+            assessment_name="assessments",
+            assessment_description="Score the shared research against every role spec",
+        )
+        self.async_fanout_workflow = self._build_workflow(
+            workflow_id="talent-signal-candidate-fanout-workflow-async",
+            name="Talent Signal Candidate Fan-out Workflow (async)",
+            db=db,
+            research_executor=self._adeep_research_step,
+            incremental_executor=self._aincremental_search_step,
+            assessment_executor=self._afanout_assessment_step,
+            assessment_name="assessments",
+            assessment_description="Score the shared research against every role spec",
+        )
+
+    def _build_workflow(
+        self,
+        workflow_id: str,
+        name: str,
+        db: SqliteDb,
+        research_executor: Any,
+        incremental_executor: Any,
+        assessment_executor: Any,
+        assessment_name: str = "assessment",
+        assessment_description: str = "Score the candidate against the role spec",
+        triage_executor: Any = None,
+    ) -> Workflow:
+        """Assemble the four-step screening workflow around the given executors.
+
+        When ``triage_executor`` is given, a ``triage`` step runs first and can
+        stop the run before any research for a clear mismatch.
+        """
+
+        triage_steps = (
+            [
+                Step(
+                    name="triage",
+                    description="Pre-screen the candidate against the role type",
+                    executor=cast(Any, triage_executor),
+                )
+            ]
+            if triage_executor is not None
+            else []
+        )
+        return Workflow(
+            id=workflow_id,
+            name=name,
             description="Deep research → quality check → optional incremental search → assessment",
-            db=SqliteDb(
-                db_file=str(db_path),
-            ),
+            db=db,
             stream_events=True,
             # AgentOS supplies ``RunContext`` to step executors, but the public type
             # signature exposes ``Callable[[StepInput], StepOutput]``. ``cast`` keeps
             # type-checking happy without altering runtime behavior.
             steps=[
+                *triage_steps,
                 Step(
                     name="deep_research",
                     description="Run Deep Research agent",
-                    executor=cast(Any, self._deep_research_step),
+                    executor=cast(Any, research_executor),
                 ),
                 Step(
                     name="quality_check",
@@ -71,28 +212,28 @@ class AgentOSCandidateWorkflow:
                 Step(
                     name="incremental_search",
                     description="Run incremental search when the quality gate fails",
-                    executor=cast(Any, self._incremental_search_step),
+                    executor=cast(Any, incremental_executor),
                 ),
                 Step(
-                    name="assessment",
-                    description="Score the candidate against the role spec",
-                    executor=cast(Any, self._assessment_step),
+                    name=assessment_name,
+                    description=assessment_description,
+                    executor=cast(Any, assessment_executor),
                 ),
             ],
         )
 
-    def run_candidate_workflow(
-        self,
+    @staticmethod
+    def _build_run_input(
         candidate_data: CandidateDict,
         role_spec_markdown: str,
         screen_id: str,
-        custom_instructions: str | None = None,
-    ) -> tuple[AssessmentResult, Any]:
-        """Run the candidate screening workflow.
+        custom_instructions: str | None,
+        force_refresh: bool = False,
+        role_type: str | None = None,
+        force_rerun: bool = False,
+    ) -> tuple[str, dict[str, Any]]:
+        """Return the deterministic session ID and workflow input payload."""
 
-        Returns:
-            Tuple of (assessment, research) where research is ExecutiveResearchResult or None.
-        """
         candidate_id = (
             candidate_data.get("id")
             or candidate_data.get("record_id")
@@ -106,7 +247,48 @@ class AgentOSCandidateWorkflow:
             "screen_id": screen_id,
             "session_id": session_id,
             "custom_instructions": custom_instructions,
+            "force_refresh": force_refresh,
+            "role_type": role_type,
+            "force_rerun": force_rerun,
         }
+        return session_id, run_input
+
+    def run_candidate_workflow(
+        self,
+        candidate_data: CandidateDict,
+        role_spec_markdown: str,
+        screen_id: str,
+        custom_instructions: str | None = None,
+        *,
+        force_refresh: bool = False,
+        role_type: str | None = None,
+        force_rerun: bool = False,
+    ) -> tuple[AssessmentResult, Any]:
+        """Run the candidate screening workflow.
+
+        The session ID is deterministic per screen and candidate. When an
+        earlier run of that session stopped part-way with the same input, the
+        steps it completed are skipped and the run resumes from the first
+        incomplete step (including Deep Research output that was saved before
+        a parser failure).
+
+        Args:
+            force_refresh: Ignore cached research and run Deep Research again.
+            role_type: Searched role type (e.g. ``CFO``) used by the triage step.
+            force_rerun: Discard any stored progress and run every step.
+
+        Returns:
+            Tuple of (assessment, research) where research is ExecutiveResearchResult or None.
+        """
+        session_id, run_input = self._build_run_input(
+            candidate_data,
+            role_spec_markdown,
+            screen_id,
+            custom_instructions,
+            force_refresh=force_refresh,
+            role_type=role_type,
+            force_rerun=force_rerun,
+        )
 
         # Use direct workflow reference.
         # AgentOS tracks workflows registered during initialization (see agentos_app.py),
@@ -121,9 +303,179 @@ class AgentOSCandidateWorkflow:
         )
         run_output = workflow_to_run.run(input=run_input, session_id=session_id)
 
+        return self._collect_run_outputs(workflow_to_run, run_output, session_id)
+
+    async def arun_candidate_workflow(
+        self,
+        candidate_data: CandidateDict,
+        role_spec_markdown: str,
+        screen_id: str,
+        custom_instructions: str | None = None,
+        *,
+        force_refresh: bool = False,
+        role_type: str | None = None,
+        force_rerun: bool = False,
+    ) -> tuple[AssessmentResult, Any]:
+        """Async counterpart of :meth:`run_candidate_workflow` using ``Workflow.arun``.
+
+        Returns:
+            Tuple of (assessment, research) where research is ExecutiveResearchResult or None.
+        """
+        session_id, run_input = self._build_run_input(
+            candidate_data,
+            role_spec_markdown,
+            screen_id,
+            custom_instructions,
+            force_refresh=force_refresh,
+            role_type=role_type,
+            force_rerun=force_rerun,
+        )
+        workflow_to_run = self.async_workflow
+
+        self.logger.info(
+            "%s Executing workflow %s with session_id=%s",
+            LOG_SEARCH,
+            workflow_to_run.id or workflow_to_run.name,
+            session_id,
+        )
+        run_output = await workflow_to_run.arun(input=run_input, session_id=session_id)
+
+        return self._collect_run_outputs(workflow_to_run, run_output, session_id)
+
+    @staticmethod
+    def _build_fanout_input(
+        candidate_data: CandidateDict,
+        targets: list[AssessmentTarget],
+        force_refresh: bool = False,
+        force_rerun: bool = False,
+    ) -> tuple[str, dict[str, Any]]:
+        """Return the session ID and input payload for a fan-out run.
+
+        The session is keyed by the candidate and the set of screens, so the
+        shared research artifact lives in one session record that lists every
+        assessment made from it.
+        """
+
+        if not targets:
+            raise ValueError("Fan-out requires at least one assessment target")
+        candidate_id = (
+            candidate_data.get("id")
+            or candidate_data.get("record_id")
+            or candidate_data.get("airtable_id")
+            or "candidate"
+        )
+        screens = "|".join(sorted(target.screen_id for target in targets))
+        screens_hash = hashlib.sha256(screens.encode("utf-8")).hexdigest()[:12]
+        session_id = f"fanout_{candidate_id}_{screens_hash}"
+        run_input = {
+            "candidate": candidate_data,
+            # Context for incremental search, which runs once for all specs.
+            "role_spec_markdown": "\n\n---\n\n".join(
+                target.role_spec_markdown.strip() for target in targets
+            ),
+            "targets": [target.model_dump() for target in targets],
+            "session_id": session_id,
+            "force_refresh": force_refresh,
+            "force_rerun": force_rerun,
+        }
+        return session_id, run_input
+
+    def run_candidate_fanout(
+        self,
+        candidate_data: CandidateDict,
+        targets: list[AssessmentTarget],
+        *,
+        force_refresh: bool = False,
+        force_rerun: bool = False,
+    ) -> CandidateFanoutResult:
+        """Research a candidate once and assess it against every target spec.
+
+        Assessments run in parallel. A failed assessment is reported in
+        ``errors`` without discarding the others. Interrupted runs resume like
+        :meth:`run_candidate_workflow` unless ``force_rerun`` is set.
+
+        This is an AgentOS (and library) entry point only: ``/screen``, the
+        queue worker and :mod:`demo.screening_service` run one screen per job
+        through :meth:`arun_candidate_workflow`, and nothing here writes the
+        per-screen assessments to Airtable. Callers that need them recorded
+        write each entry of ``assessments`` themselves.
+        """
+        session_id, run_input = self._build_fanout_input(
+            candidate_data,
+            targets,
+            force_refresh=force_refresh,
+            force_rerun=force_rerun,
+        )
+        workflow_to_run = self.fanout_workflow
+        self.logger.info(
+            "%s Executing workflow %s with session_id=%s (%s role specs)",
+            LOG_SEARCH,
+            workflow_to_run.id or workflow_to_run.name,
+            session_id,
+            len(targets),
+        )
+        run_output = workflow_to_run.run(input=run_input, session_id=session_id)
+        return self._collect_fanout_outputs(workflow_to_run, run_output, session_id)
+
+    async def arun_candidate_fanout(
+        self,
+        candidate_data: CandidateDict,
+        targets: list[AssessmentTarget],
+        *,
+        force_refresh: bool = False,
+        force_rerun: bool = False,
+    ) -> CandidateFanoutResult:
+        """Async counterpart of :meth:`run_candidate_fanout`."""
+        session_id, run_input = self._build_fanout_input(
+            candidate_data,
+            targets,
+            force_refresh=force_refresh,
+            force_rerun=force_rerun,
+        )
+        workflow_to_run = self.async_fanout_workflow
+        self.logger.info(
+            "%s Executing workflow %s with session_id=%s (%s role specs)",
+            LOG_SEARCH,
+            workflow_to_run.id or workflow_to_run.name,
+            session_id,
+            len(targets),
+        )
+        run_output = await workflow_to_run.arun(input=run_input, session_id=session_id)
+        return self._collect_fanout_outputs(workflow_to_run, run_output, session_id)
+
+    def _collect_fanout_outputs(
+        self, workflow: Workflow, run_output: Any, session_id: str
+    ) -> CandidateFanoutResult:
+        """Verify session persistence and extract the per-screen assessments."""
+
+        if workflow.db and not workflow.db.get_session(
+            session_id, session_type=SessionType.WORKFLOW
+        ):
+            raise RuntimeError(f"Session {session_id} was not persisted to database.")
+
+        content = getattr(run_output, "content", None)
+        if not isinstance(content, dict) or "assessments" not in content:
+            raise RuntimeError(
+                f"Fan-out workflow did not produce assessments for session {session_id}."
+            )
+        return CandidateFanoutResult(
+            session_id=session_id,
+            research=self._extract_research_from_output(run_output, session_id),
+            assessments={
+                screen_id: AssessmentResult.model_validate(assessment)
+                for screen_id, assessment in content["assessments"].items()
+            },
+            errors=content.get("errors") or {},
+        )
+
+    def _collect_run_outputs(
+        self, workflow: Workflow, run_output: Any, session_id: str
+    ) -> tuple[AssessmentResult, Any]:
+        """Verify session persistence and extract assessment + research outputs."""
+
         # Verify session was persisted to database (fail-fast check)
-        if workflow_to_run.db:
-            session = workflow_to_run.db.get_session(
+        if workflow.db:
+            session = workflow.db.get_session(
                 session_id, session_type=SessionType.WORKFLOW
             )
             if not session:
@@ -296,23 +648,112 @@ class AgentOSCandidateWorkflow:
     # Step helpers
     # ------------------------------------------------------------------
 
-    def _deep_research_step(
+    def _prepare_research_step(
         self, step_input: StepInput, run_context: RunContext
-    ) -> StepOutput:
-        # Initialize session state if needed
+    ) -> tuple[dict[str, Any], dict[str, str], StepOutput | None]:
+        """Seed workflow state and log the start of research.
+
+        The third element is the step output to return straight away when
+        research already completed in an earlier run of this session.
+        """
+
+        state, context = self._seed_workflow_state(step_input, run_context)
+        resumed = self._resumed_step(state, "deep_research")
+        if resumed is None:
+            self.logger.info(
+                "%s Starting deep research for %s (%s at %s)",
+                LOG_SEARCH,
+                context["candidate_name"],
+                context["current_title"],
+                context["current_company"],
+            )
+        return state, context, resumed
+
+    @staticmethod
+    def _workflow_state(run_context: RunContext) -> dict[str, Any]:
         if run_context.session_state is None:
             run_context.session_state = {}
+        return cast(
+            dict[str, Any], run_context.session_state.setdefault("workflow_data", {})
+        )
+
+    def _start_run(
+        self,
+        state: dict[str, Any],
+        input_data: dict[str, Any],
+        run_context: RunContext,
+    ) -> None:
+        """Resume or reset stored progress at the first step of a new run.
+
+        Agno reloads ``workflow_data`` from the session database, so a run
+        that stopped part-way leaves its completed steps behind. They are kept
+        when the input is unchanged and the earlier run did not finish;
+        otherwise (or with ``force_rerun``) the state starts empty.
+        """
+
+        if state.get("run_id") == run_context.run_id:
+            return
+        fingerprint = _run_fingerprint(input_data)
+        completed = list(state.get("completed_steps") or [])
+        resume = (
+            bool(completed)
+            and not input_data.get("force_rerun")
+            and not state.get("run_complete")
+            and state.get("input_fingerprint") == fingerprint
+        )
+        if resume:
+            self.logger.info(
+                "%s Resuming session %s after completed steps: %s",
+                LOG_SEARCH,
+                run_context.session_id,
+                ", ".join(completed),
+            )
+        else:
+            state.clear()
+        state["run_id"] = run_context.run_id
+        state["input_fingerprint"] = fingerprint
+        state["run_complete"] = False
+
+    def _resumed_step(self, state: dict[str, Any], step_name: str) -> StepOutput | None:
+        """Output for a step that completed in an earlier run, else ``None``."""
+
+        if step_name not in (state.get("completed_steps") or []):
+            return None
+        self.logger.info(
+            "%s Skipping %s for %s (completed in an earlier run)",
+            LOG_SUCCESS,
+            step_name,
+            state.get("candidate_name", "candidate"),
+        )
+        return StepOutput(
+            step_name=step_name,
+            executor_name="resume",
+            success=True,
+            content={"resumed": True},
+        )
+
+    @staticmethod
+    def _mark_step_done(
+        state: dict[str, Any], step_name: str, *, final: bool = False
+    ) -> None:
+        completed = state.setdefault("completed_steps", [])
+        if step_name not in completed:
+            completed.append(step_name)
+        if final:
+            state["run_complete"] = True
 
-        # Initialize workflow state structure
-        if "workflow_data" not in run_context.session_state:
-            run_context.session_state["workflow_data"] = {}
+    def _seed_workflow_state(
+        self, step_input: StepInput, run_context: RunContext
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """Seed workflow state from the run input and return candidate context."""
 
-        state = run_context.session_state["workflow_data"]
+        state = self._workflow_state(run_context)
 
         # Extract input data
         input_data: dict[str, Any] = (
             step_input.input if isinstance(step_input.input, dict) else {}
         )
+        self._start_run(state, input_data, run_context)
         raw_candidate = input_data.get("candidate")
         if isinstance(raw_candidate, dict):
             candidate: CandidateDict = cast(CandidateDict, raw_candidate)
@@ -321,35 +762,563 @@ class AgentOSCandidateWorkflow:
         # Note: candidate may be legacy format dict, but extract_candidate_context handles both
         context = extract_candidate_context(candidate)
 
-        # Store initial state
-        state.setdefault("screen_id", input_data.get("screen_id"))
-        state.setdefault("candidate", candidate)
-        state.setdefault("role_spec_markdown", input_data.get("role_spec_markdown", ""))
-        if "custom_instructions" not in state:
-            state["custom_instructions"] = input_data.get("custom_instructions")
+        # Store initial state (stale values from other inputs were reset above)
+        state["screen_id"] = input_data.get("screen_id")
+        state["candidate"] = candidate
+        state["role_spec_markdown"] = input_data.get("role_spec_markdown", "")
+        state["custom_instructions"] = input_data.get("custom_instructions")
+        state["force_refresh"] = bool(input_data.get("force_refresh"))
+        state["force_rerun"] = bool(input_data.get("force_rerun"))
+        state["session_id"] = input_data.get("session_id") or run_context.session_id
+        if "targets" in input_data:
+            state["targets"] = input_data["targets"]
+        if input_data.get("role_type"):
+            state["role_type"] = input_data["role_type"]
         state.update(context)
+        return state, context
+
+    def _title_triage(
+        self, state: dict[str, Any], context: dict[str, str]
+    ) -> TriageDecision | None:
+        """Rule-based triage, or ``None`` when triage does not apply."""
+
+        role_type = state.get("role_type")
+        if not settings.screening.triage_enabled or not role_type:
+            return None
+        return triage_by_title(context["current_title"], role_type)
+
+    @staticmethod
+    def _needs_model_triage(decision: TriageDecision | None) -> bool:
+        return (
+            decision is not None
+            and not decision.conclusive
+            and settings.screening.triage_model_check
+        )
+
+    def _triage_fit_kwargs(
+        self, state: dict[str, Any], context: dict[str, str]
+    ) -> dict[str, Any]:
+        candidate = state.get("candidate") or {}
+        return {
+            "role_type": state["role_type"],
+            "candidate_name": context["candidate_name"],
+            "current_title": context["current_title"],
+            "current_company": context["current_company"],
+            "bio": candidate.get("bio") if isinstance(candidate, dict) else None,
+        }
+
+    def _log_triage_failure(self, context: dict[str, str], exc: Exception) -> None:
+        self.logger.warning(
+            "%s Triage model check failed for %s; keeping title decision: %s",
+            LOG_ERROR,
+            context["candidate_name"],
+            exc,
+        )
 
+    def _triage_step(
+        self, step_input: StepInput, run_context: RunContext
+    ) -> StepOutput:
+        state, context = self._seed_workflow_state(step_input, run_context)
+        resumed = self._resumed_step(state, "triage")
+        if resumed is not None:
+            return resumed
+        decision = self._title_triage(state, context)
+        if decision is not None and self._needs_model_triage(decision):
+            try:
+                with budget_step("triage"):
+                    decision = decision.with_model_result(
+                        triage_candidate_fit(**self._triage_fit_kwargs(state, context))
+                    )
+            except Exception as exc:
+                self._log_triage_failure(context, exc)
+        return self._complete_triage_step(state, context, decision)
+
+    async def _atriage_step(
+        self, step_input: StepInput, run_context: RunContext
+    ) -> StepOutput:
+        state, context = self._seed_workflow_state(step_input, run_context)
+        resumed = self._resumed_step(state, "triage")
+        if resumed is not None:
+            return resumed
+        decision = self._title_triage(state, context)
+        if decision is not None and self._needs_model_triage(decision):
+            try:
+                with budget_step("triage"):
+                    decision = decision.with_model_result(
+                        await atriage_candidate_fit(
+                            **self._triage_fit_kwargs(state, context)
+                        )
+                    )
+            except Exception as exc:
+                self._log_triage_failure(context, exc)
+        return self._complete_triage_step(state, context, decision)
+
+    def _complete_triage_step(
+        self,
+        state: dict[str, Any],
+        context: dict[str, str],
+        decision: TriageDecision | None,
+    ) -> StepOutput:
+        """Record the triage decision; a drop stops the run before research."""
+
+        self._mark_step_done(
+            state,
+            "triage",
+            final=decision is not None and decision.verdict == TRIAGE_DROP,
+        )
+        if decision is None:
+            state["triage"] = None
+            return StepOutput(
+                step_name="triage",
+                executor_name="triage_candidate",
+                success=True,
+                content={"triage": None},
+            )
+
+        state["triage"] = decision.as_dict()
+        get_triage_stats().record(
+            decision, deep_research_planned=True in self._research_tiers()
+        )
         self.logger.info(
-            "%s Starting deep research for %s (%s at %s)",
-            LOG_SEARCH,
+            "%s Triage for %s (%s) → %s via %s: %s",
+            LOG_SUCCESS if decision.verdict == TRIAGE_ADVANCE else LOG_SEARCH,
+            context["candidate_name"],
+            context["current_title"] or "no title",
+            decision.verdict,
+            decision.method,
+            decision.reason,
+        )
+        if decision.verdict != TRIAGE_DROP:
+            return StepOutput(
+                step_name="triage",
+                executor_name="triage_candidate",
+                success=True,
+                content={"triage": state["triage"]},
+            )
+
+        assessment = triage_assessment(
+            decision, state["role_type"], state.get("role_spec_markdown")
+        )
+        state["assessment"] = assessment.model_dump(mode="json")
+        state["research"] = None
+        return StepOutput(
+            step_name="triage",
+            executor_name="triage_candidate",
+            success=True,
+            content={"assessment": state["assessment"], "triage": state["triage"]},
+            stop=True,
+        )
+
+    @staticmethod
+    def _research_kwargs(
+        context: dict[str, str],
+        use_deep_research: bool,
+        state: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Keyword arguments for ``run_research``/``arun_research``.
+
+        With workflow ``state``, the raw Deep Research output is checkpointed
+        there (and in the research blob store under the session ID) so a
+        parser failure is retried without a second Deep Research run.
+        """
+
+        kwargs: dict[str, Any] = {
+            "candidate_name": context["candidate_name"],
+            "current_title": context["current_title"],
+            "current_company": context["current_company"],
+            "linkedin_url": context["linkedin_url"],
+            "use_deep_research": use_deep_research,
+        }
+        if use_deep_research and state is not None:
+            kwargs["raw_research"] = state.get("research_raw")
+            kwargs["on_raw_research"] = functools.partial(
+                state.__setitem__, "research_raw"
+            )
+            kwargs["run_key"] = state.get("session_id")
+        return kwargs
+
+    def _load_raw_research(
+        self, state: dict[str, Any], context: dict[str, str]
+    ) -> None:
+        """Recover Deep Research output saved for this session before a crash.
+
+        Forced runs ignore the blob store, and so does a session whose state
+        already holds the output.
+        """
+
+        store = get_research_blob_store()
+        session_id = state.get("session_id")
+        if (
+            store is None
+            or not session_id
+            or state.get("research_raw") is not None
+            or state.get("force_refresh")
+            or state.get("force_rerun")
+        ):
+            return
+        raw = store.get(
+            self._research_cache_key(context),
+            session_id,
+            # Older output would be re-run by the research cache as well.
+            max_age_seconds=settings.cache.research_ttl_hours * 3600,
+        )
+        if raw is not None:
+            self.logger.info(
+                "%s Re-parsing saved Deep Research output for %s",
+                LOG_SUCCESS,
+                context["candidate_name"],
+            )
+            state["research_raw"] = raw
+
+    @staticmethod
+    def _research_tiers(state: dict[str, Any] | None = None) -> list[bool]:
+        """Research modes to try in order (``True`` = Deep Research)."""
+
+        if not settings.openai.use_deep_research or _deprioritized(state):
+            return [False]
+        if settings.openai.research_tiered and not (state or {}).get("research_raw"):
+            # Saved Deep Research output makes the deep tier free to re-parse.
+            return [False, True]
+        return [True]
+
+    def _record_research_tier(
+        self,
+        tiers: list[dict[str, Any]],
+        context: dict[str, str],
+        use_deep_research: bool,
+        started_at: float,
+        usage: dict[str, ModelUsage],
+        quality_ok: bool | None = None,
+        error: Exception | None = None,
+        escalate: bool = False,
+    ) -> None:
+        """Append one tier's latency, token usage and outcome to ``tiers``."""
+
+        tier = "deep" if use_deep_research else "fast"
+        report: dict[str, Any] = {
+            "tier": tier,
+            "seconds": round(time.perf_counter() - started_at, 2),
+            "input_tokens": sum(model.input_tokens for model in usage.values()),
+            "cached_tokens": sum(model.cached_tokens for model in usage.values()),
+            "output_tokens": sum(model.output_tokens for model in usage.values()),
+            "models": sorted(usage),
+            "quality_ok": quality_ok,
+            "escalated": escalate,
+        }
+        if error is not None:
+            report["error"] = str(error)
+        tiers.append(report)
+
+        if escalate:
+            self.logger.warning(
+                "%s %s research for %s %s after %.1fs; escalating to Deep Research",
+                LOG_SEARCH,
+                tier.capitalize(),
+                context["candidate_name"],
+                "failed" if error is not None else "did not meet the quality bar",
+                report["seconds"],
+            )
+        else:
+            self.logger.info(
+                "%s %s research for %s finished in %.1fs (%s input / %s output tokens)",
+                LOG_SUCCESS,
+                tier.capitalize(),
+                context["candidate_name"],
+                report["seconds"],
+                report["input_tokens"],
+                report["output_tokens"],
+            )
+
+    def _record_budget_stop(
+        self, tiers: list[dict[str, Any]], context: dict[str, str]
+    ) -> None:
+        """Keep the fast research when the budget cannot cover the escalation."""
+
+        tiers.append({"tier": "deep", "skipped": "budget_exhausted"})
+        self.logger.warning(
+            "%s Screen budget exhausted; keeping fast research for %s",
+            LOG_ERROR,
+            context["candidate_name"],
+        )
+
+    def _run_research_tiers(
+        self,
+        context: dict[str, str],
+        modes: list[bool] | None = None,
+        state: dict[str, Any] | None = None,
+    ) -> tuple[ExecutiveResearchResult, list[dict[str, Any]]]:
+        """Run fast research first when tiered, escalating on a quality miss."""
+
+        modes = modes or self._research_tiers()
+        tiers: list[dict[str, Any]] = []
+        fallback: ExecutiveResearchResult | None = None
+        for index, use_deep_research in enumerate(modes):
+            last = index == len(modes) - 1
+            started_at = time.perf_counter()
+            kwargs = self._research_kwargs(context, use_deep_research, state)
+            # Re-parsing checkpointed Deep Research output launches nothing.
+            launches = use_deep_research and kwargs.get("raw_research") is None
+            with track_usage() as usage:
+                try:
+                    with deep_research_allowance(launches):
+                        research = run_research(**kwargs)
+                except BudgetExhaustedError:
+                    if fallback is None:
+                        raise
+                    self._record_budget_stop(tiers, context)
+                    return fallback, tiers
+                except Exception as exc:
+                    if last:
+                        raise
+                    self._record_research_tier(
+                        tiers,
+                        context,
+                        use_deep_research,
+                        started_at,
+                        usage,
+                        error=exc,
+                        escalate=True,
+                    )
+                    continue
+            # The last tier is judged by the quality_check step instead.
+            quality_ok = None if last else check_research_quality(research)
+            escalate = not last and not quality_ok
+            self._record_research_tier(
+                tiers,
+                context,
+                use_deep_research,
+                started_at,
+                usage,
+                quality_ok=quality_ok,
+                escalate=escalate,
+            )
+            if not escalate:
+                return research, tiers
+            fallback = research
+        raise RuntimeError("No research tiers configured")
+
+    async def _arun_research_tiers(
+        self,
+        context: dict[str, str],
+        modes: list[bool] | None = None,
+        state: dict[str, Any] | None = None,
+    ) -> tuple[ExecutiveResearchResult, list[dict[str, Any]]]:
+        """Async counterpart of :meth:`_run_research_tiers`."""
+
+        modes = modes or self._research_tiers()
+        tiers: list[dict[str, Any]] = []
+        fallback: ExecutiveResearchResult | None = None
+        for index, use_deep_research in enumerate(modes):
+            last = index == len(modes) - 1
+            started_at = time.perf_counter()
+            kwargs = self._research_kwargs(context, use_deep_research, state)
+            # Re-parsing checkpointed Deep Research output launches nothing.
+            launches = use_deep_research and kwargs.get("raw_research") is None
+            with track_usage() as usage:
+                try:
+                    with deep_research_allowance(launches):
+                        research = await arun_research(**kwargs)
+                except BudgetExhaustedError:
+                    if fallback is None:
+                        raise
+                    self._record_budget_stop(tiers, context)
+                    return fallback, tiers
+                except Exception as exc:
+                    if last:
+                        raise
+                    self._record_research_tier(
+                        tiers,
+                        context,
+                        use_deep_research,
+                        started_at,
+                        usage,
+                        error=exc,
+                        escalate=True,
+                    )
+                    continue
+            # The last tier is judged by the quality_check step instead.
+            quality_ok = None if last else check_research_quality(research)
+            escalate = not last and not quality_ok
+            self._record_research_tier(
+                tiers,
+                context,
+                use_deep_research,
+                started_at,
+                usage,
+                quality_ok=quality_ok,
+                escalate=escalate,
+            )
+            if not escalate:
+                return research, tiers
+            fallback = research
+        raise RuntimeError("No research tiers configured")
+
+    @staticmethod
+    def _research_cache_key(context: dict[str, str]) -> str:
+        return research_cache_key(
             context["candidate_name"],
-            context["current_title"],
             context["current_company"],
+            context["linkedin_url"],
         )
-        research = run_research(
+
+    def _cached_research(
+        self, state: dict[str, Any], context: dict[str, str]
+    ) -> ExecutiveResearchResult | None:
+        """Look up fresh research for this candidate unless a refresh was forced."""
+
+        cache = get_research_cache()
+        if cache is None or state.get("force_refresh"):
+            return None
+        research = cache.get(self._research_cache_key(context))
+        if research is not None:
+            self.logger.info(
+                "%s Reusing cached research for %s (researched %s)",
+                LOG_SUCCESS,
+                context["candidate_name"],
+                research.research_timestamp.isoformat(),
+            )
+        return research
+
+    def _store_research(
+        self, context: dict[str, str], research: ExecutiveResearchResult
+    ) -> None:
+        cache = get_research_cache()
+        if cache is None:
+            return
+        cache.put(
+            self._research_cache_key(context),
+            research,
             candidate_name=context["candidate_name"],
-            current_title=context["current_title"],
             current_company=context["current_company"],
             linkedin_url=context["linkedin_url"],
-            use_deep_research=settings.openai.use_deep_research,
         )
+
+    @staticmethod
+    def _complete_research_step(
+        state: dict[str, Any],
+        research: ExecutiveResearchResult,
+        cache_hit: bool = False,
+        tiers: list[dict[str, Any]] | None = None,
+    ) -> StepOutput:
         # Store as dict using JSON mode to keep datetimes serializable
         state["research"] = research.model_dump(mode="json")
+        state["research_cache_hit"] = cache_hit
+        state["research_tiers"] = tiers or []
+        state.pop("research_raw", None)
+        AgentOSCandidateWorkflow._mark_step_done(state, "deep_research")
         return StepOutput(
             step_name="deep_research",
             executor_name="run_research",
             success=True,
-            content={"citations": len(research.citations)},
+            content={
+                "citations": len(research.citations),
+                "cache_hit": cache_hit,
+                "tiers": tiers or [],
+            },
+        )
+
+    def _research_flight_key(
+        self, state: dict[str, Any], context: dict[str, str]
+    ) -> str:
+        key = self._research_cache_key(context)
+        if _deprioritized(state):
+            # Fast-only research must not be handed to a full-depth caller.
+            key = f"{key}:fast"
+        # A forced refresh must not be satisfied by a run that read the cache.
+        return f"{key}:refresh" if state.get("force_refresh") else key
+
+    def _refused_for_another_screen(
+        self, exc: BudgetExhaustedError, context: dict[str, str]
+    ) -> bool:
+        # A shared run is limited by the budget of the caller that started it;
+        # callers on other budgets (or none) must not be deferred by it.
+        if exc.budget is None or exc.budget is current_budget():
+            return False
+        self.logger.info(
+            "%s Shared research for %s was refused by another screen's budget; "
+            "running it under this screen's budget",
+            LOG_SEARCH,
+            context["candidate_name"],
+        )
+        return True
+
+    def _log_joined_research(self, context: dict[str, str]) -> None:
+        self.logger.info(
+            "%s Joined in-flight research for %s",
+            LOG_SUCCESS,
+            context["candidate_name"],
+        )
+
+    def _deep_research_step(
+        self, step_input: StepInput, run_context: RunContext
+    ) -> StepOutput:
+        state, context, resumed = self._prepare_research_step(step_input, run_context)
+        if resumed is not None:
+            return resumed
+
+        def research_once() -> tuple[
+            ExecutiveResearchResult, bool, list[dict[str, Any]]
+        ]:
+            cached = self._cached_research(state, context)
+            if cached is not None:
+                return cached, True, []
+            self._load_raw_research(state, context)
+            research, tiers = self._run_research_tiers(
+                context, self._research_tiers(state), state
+            )
+            if not _deprioritized(state):
+                self._store_research(context, research)
+            return research, False, tiers
+
+        with budget_step("research"):
+            try:
+                (research, cache_hit, tiers), joined = _research_flights.do(
+                    self._research_flight_key(state, context), research_once
+                )
+            except BudgetExhaustedError as exc:
+                if not self._refused_for_another_screen(exc, context):
+                    raise
+                (research, cache_hit, tiers), joined = research_once(), False
+        if joined:
+            self._log_joined_research(context)
+        return self._complete_research_step(
+            state, research, cache_hit=cache_hit, tiers=tiers
+        )
+
+    async def _adeep_research_step(
+        self, step_input: StepInput, run_context: RunContext
+    ) -> StepOutput:
+        state, context, resumed = self._prepare_research_step(step_input, run_context)
+        if resumed is not None:
+            return resumed
+
+        async def research_once() -> tuple[
+            ExecutiveResearchResult, bool, list[dict[str, Any]]
+        ]:
+            cached = await asyncio.to_thread(self._cached_research, state, context)
+            if cached is not None:
+                return cached, True, []
+            await asyncio.to_thread(self._load_raw_research, state, context)
+            research, tiers = await self._arun_research_tiers(
+                context, self._research_tiers(state), state
+            )
+            if not _deprioritized(state):
+                await asyncio.to_thread(self._store_research, context, research)
+            return research, False, tiers
+
+        with budget_step("research"):
+            try:
+                (research, cache_hit, tiers), joined = await _research_flights.ado(
+                    self._research_flight_key(state, context), research_once
+                )
+            except BudgetExhaustedError as exc:
+                if not self._refused_for_another_screen(exc, context):
+                    raise
+                (research, cache_hit, tiers), joined = await research_once(), False
+        if joined:
+            self._log_joined_research(context)
+        return self._complete_research_step(
+            state, research, cache_hit=cache_hit, tiers=tiers
         )
 
     def _quality_check_step(
@@ -359,6 +1328,9 @@ class AgentOSCandidateWorkflow:
             run_context.session_state = {}
 
         state = run_context.session_state.get("workflow_data", {})
+        resumed = self._resumed_step(state, "quality_check")
+        if resumed is not None:
+            return resumed
         research_data = state.get("research")
         if research_data is None:
             raise RuntimeError("Deep research step must run before quality check")
@@ -368,6 +1340,7 @@ class AgentOSCandidateWorkflow:
 
         quality_ok = check_research_quality(research)
         state["quality_ok"] = quality_ok
+        self._mark_step_done(state, "quality_check")
         self.logger.info(
             "%s Research quality check for %s → %s",
             LOG_SEARCH,
@@ -381,9 +1354,11 @@ class AgentOSCandidateWorkflow:
             content={"quality_ok": quality_ok},
         )
 
-    def _incremental_search_step(
-        self, step_input: StepInput, run_context: RunContext
-    ) -> StepOutput:
+    def _prepare_incremental_step(
+        self, run_context: RunContext
+    ) -> tuple[dict[str, Any], ExecutiveResearchResult | None]:
+        """Return workflow state plus research to supplement, or ``None`` to skip."""
+
         if run_context.session_state is None:
             run_context.session_state = {}
 
@@ -397,12 +1372,7 @@ class AgentOSCandidateWorkflow:
                 LOG_SUCCESS,
                 state.get("candidate_name", "candidate"),
             )
-            return StepOutput(
-                step_name="incremental_search",
-                executor_name="run_incremental_search",
-                success=True,
-                content={"skipped": True},
-            )
+            return state, None
 
         self.logger.info(
             "%s Running incremental search for %s",
@@ -410,14 +1380,34 @@ class AgentOSCandidateWorkflow:
             state.get("candidate_name", "candidate"),
         )
         # Reconstruct research object from dict if needed
-        research = reconstruct_research(research_data)
+        return state, reconstruct_research(research_data)
+
+    @staticmethod
+    def _incremental_kwargs(
+        state: dict[str, Any], research: ExecutiveResearchResult
+    ) -> dict[str, Any]:
+        """Keyword arguments for ``run_incremental_search`` and its async twin."""
+
+        return {
+            "candidate_name": state.get("candidate_name", "candidate"),
+            "initial_research": research,
+            "quality_gaps": research.gaps,
+            "role_spec_markdown": state.get("role_spec_markdown", ""),
+        }
+
+    @staticmethod
+    def _complete_incremental_step(
+        state: dict[str, Any], merged_research: ExecutiveResearchResult | None
+    ) -> StepOutput:
+        AgentOSCandidateWorkflow._mark_step_done(state, "incremental_search")
+        if merged_research is None:
+            return StepOutput(
+                step_name="incremental_search",
+                executor_name="run_incremental_search",
+                success=True,
+                content={"skipped": True},
+            )
 
-        merged_research = run_incremental_search(
-            candidate_name=state.get("candidate_name", "candidate"),
-            initial_research=research,
-            quality_gaps=research.gaps,
-            role_spec_markdown=state.get("role_spec_markdown", ""),
-        )
         # Store as dict for JSON serialization (SqliteDb persistence)
         state["research"] = merged_research.model_dump(mode="json")
         return StepOutput(
@@ -427,9 +1417,47 @@ class AgentOSCandidateWorkflow:
             content={"citations": len(merged_research.citations)},
         )
 
-    def _assessment_step(
+    def _incremental_search_step(
         self, step_input: StepInput, run_context: RunContext
     ) -> StepOutput:
+        resumed = self._resumed_step(
+            self._workflow_state(run_context), "incremental_search"
+        )
+        if resumed is not None:
+            return resumed
+        state, research = self._prepare_incremental_step(run_context)
+        if research is None:
+            return self._complete_incremental_step(state, None)
+
+        with budget_step("incremental_search"):
+            merged_research = run_incremental_search(
+                **self._incremental_kwargs(state, research)
+            )
+        return self._complete_incremental_step(state, merged_research)
+
+    async def _aincremental_search_step(
+        self, step_input: StepInput, run_context: RunContext
+    ) -> StepOutput:
+        resumed = self._resumed_step(
+            self._workflow_state(run_context), "incremental_search"
+        )
+        if resumed is not None:
+            return resumed
+        state, research = self._prepare_incremental_step(run_context)
+        if research is None:
+            return self._complete_incremental_step(state, None)
+
+        with budget_step("incremental_search"):
+            merged_research = await arun_incremental_search(
+                **self._incremental_kwargs(state, research)
+            )
+        return self._complete_incremental_step(state, merged_research)
+
+    def _prepare_assessment_step(
+        self, run_context: RunContext
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Return workflow state plus keyword arguments for the assessment call."""
+
         if run_context.session_state is None:
             run_context.session_state = {}
 
@@ -446,13 +1474,18 @@ class AgentOSCandidateWorkflow:
             LOG_SEARCH,
             state.get("candidate_name", "candidate"),
         )
-        assessment = assess_candidate(
-            research=research,
-            role_spec_markdown=state.get("role_spec_markdown", ""),
-            custom_instructions=state.get("custom_instructions"),
-        )
+        return state, {
+            "research": research,
+            "role_spec_markdown": state.get("role_spec_markdown", ""),
+            "custom_instructions": state.get("custom_instructions"),
+        }
+
+    def _complete_assessment_step(
+        self, state: dict[str, Any], assessment: AssessmentResult
+    ) -> StepOutput:
         # Store as dict for JSON serialization (SqliteDb persistence)
         state["assessment"] = assessment.model_dump(mode="json")
+        self._mark_step_done(state, "assessment", final=True)
         self.logger.info(
             "%s Assessment complete for %s (overall_score=%s)",
             LOG_SUCCESS,
@@ -465,3 +1498,173 @@ class AgentOSCandidateWorkflow:
             success=True,
             content={"assessment": assessment.model_dump(mode="json")},
         )
+
+    def _assessment_step(
+        self, step_input: StepInput, run_context: RunContext
+    ) -> StepOutput:
+        state, assessment_kwargs = self._prepare_assessment_step(run_context)
+        with budget_step("assessment"):
+            assessment = assess_candidate(**assessment_kwargs)
+        return self._complete_assessment_step(state, assessment)
+
+    async def _aassessment_step(
+        self, step_input: StepInput, run_context: RunContext
+    ) -> StepOutput:
+        state, assessment_kwargs = self._prepare_assessment_step(run_context)
+        with budget_step("assessment"):
+            assessment = await aassess_candidate(**assessment_kwargs)
+        return self._complete_assessment_step(state, assessment)
+
+    def _prepare_fanout_step(
+        self, run_context: RunContext
+    ) -> tuple[dict[str, Any], ExecutiveResearchResult, list[AssessmentTarget]]:
+        """Return workflow state, the shared research and the specs to score."""
+
+        if run_context.session_state is None:
+            run_context.session_state = {}
+
+        state = run_context.session_state.get("workflow_data", {})
+        research_data = state.get("research")
+        if research_data is None:
+            raise RuntimeError("Missing research payload before assessment")
+        targets = [
+            AssessmentTarget.model_validate(target)
+            for target in state.get("targets") or []
+        ]
+        if not targets:
+            raise RuntimeError("Fan-out run has no assessment targets")
+
+        self.logger.info(
+            "%s Starting %s assessments for %s from shared research",
+            LOG_SEARCH,
+            len(targets),
+            state.get("candidate_name", "candidate"),
+        )
+        return state, reconstruct_research(research_data), targets
+
+    @staticmethod
+    def _use_batched_assessment(targets: list[AssessmentTarget]) -> bool:
+        return settings.screening.batched_assessment and len(targets) > 1
+
+    def _log_batched_failure(self, state: dict[str, Any], exc: Exception) -> None:
+        # Retry spec by spec so one failing spec does not sink the others.
+        self.logger.warning(
+            "%s Batched assessment failed for %s (%s); assessing each spec separately",
+            LOG_ERROR,
+            state.get("candidate_name", "candidate"),
+            exc,
+        )
+
+    def _complete_fanout_step(
+        self,
+        state: dict[str, Any],
+        run_context: RunContext,
+        targets: list[AssessmentTarget],
+        outcomes: Sequence[AssessmentResult | BaseException],
+    ) -> StepOutput:
+        assessments: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        for target, outcome in zip(targets, outcomes):
+            if isinstance(outcome, AssessmentResult):
+                assessments[target.screen_id] = outcome.model_dump(mode="json")
+            elif isinstance(outcome, Exception):
+                errors[target.screen_id] = str(outcome)
+                self.logger.error(
+                    "%s Assessment for screen %s failed: %s",
+                    LOG_ERROR,
+                    target.screen_id,
+                    outcome,
+                )
+            else:
+                raise outcome
+
+        if not assessments:
+            raise RuntimeError(
+                f"All {len(targets)} assessments failed for "
+                f"{state.get('candidate_name', 'candidate')}: {errors}"
+            )
+
+        # Store as dicts for JSON serialization (SqliteDb persistence)
+        state["assessments"] = assessments
+        state["assessment_errors"] = errors
+        self._mark_step_done(state, "assessments", final=True)
+        self.logger.info(
+            "%s %s/%s assessments complete for %s",
+            LOG_SUCCESS,
+            len(assessments),
+            len(targets),
+            state.get("candidate_name", "candidate"),
+        )
+        return StepOutput(
+            step_name="assessments",
+            executor_name="assess_candidate",
+            success=True,
+            content={
+                "research_session_id": run_context.session_id,
+                "assessments": assessments,
+                "errors": errors,
+            },
+        )
+
+    def _fanout_assessment_step(
+        self, step_input: StepInput, run_context: RunContext
+    ) -> StepOutput:
+        state, research, targets = self._prepare_fanout_step(run_context)
+        if self._use_batched_assessment(targets):
+            try:
+                batched = assess_candidate_multi(research, targets)
+            except Exception as exc:
+                self._log_batched_failure(state, exc)
+            else:
+                return self._complete_fanout_step(
+                    state,
+                    run_context,
+                    targets,
+                    [batched[target.screen_id] for target in targets],
+                )
+
+        def assess(target: AssessmentTarget) -> AssessmentResult | BaseException:
+            try:
+                return assess_candidate(
+                    research=research,
+                    role_spec_markdown=target.role_spec_markdown,
+                    custom_instructions=target.custom_instructions,
+                )
+            except Exception as exc:
+                return exc
+
+        with ThreadPoolExecutor(
+            max_workers=len(targets), thread_name_prefix="fanout-assess"
+        ) as pool:
+            outcomes = list(pool.map(assess, targets))
+        return self._complete_fanout_step(state, run_context, targets, outcomes)
+
+    async def _afanout_assessment_step(
+        self, step_input: StepInput, run_context: RunContext
+    ) -> StepOutput:
+        state, research, targets = self._prepare_fanout_step(run_context)
+        if self._use_batched_assessment(targets):
+            try:
+                batched = await aassess_candidate_multi(research, targets)
+            except Exception as exc:
+                self._log_batched_failure(state, exc)
+            else:
+                return self._complete_fanout_step(
+                    state,
+                    run_context,
+                    targets,
+                    [batched[target.screen_id] for target in targets],
+                )
+
+        outcomes = await asyncio.gather(
+            *(
+                aassess_candidate(
+                    research=research,
+                    role_spec_markdown=target.role_spec_markdown,
+                    custom_instructions=target.custom_instructions,
+                )
+                for target in targets
+            ),
+            return_exceptions=True,
+        )
+        return self._complete_fanout_step(state, run_context, targets, outcomes)
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Benchmark the sync and async Airtable clients against a local stand-in.
+
+The stand-in is a threaded HTTP/1.1 server, run in a child process, that
+answers Airtable's create and update endpoints after a fixed delay (simulating
+API latency) and counts the TCP connections it accepts. Each client writes the
+same assessments with the same concurrency:
+
+- sync: ``AirtableClient.write_assessment`` on a thread pool, as the async
+  screening path does through ``asyncio.to_thread``;
+- async: ``AsyncAirtableClient.write_assessment`` gathered on one event loop.
+
+For each run it reports throughput, the connections the stand-in accepted and
+the peak number of threads in the benchmark process.
+
+Usage:
+    python scripts/benchmark_airtable_client.py --writes 500 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from pathlib import Path
+from urllib.request import urlopen
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# The stand-in needs no real credentials.
+os.environ.setdefault("AIRTABLE_API_KEY", "patBenchmark")
+os.environ.setdefault("AIRTABLE_BASE_ID", "appBenchmark")
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from demo.airtable_async import AsyncAirtableClient  # noqa: E402
+from demo.airtable_client import AirtableClient  # noqa: E402
+from demo.models import AssessmentResult, DimensionScore  # noqa: E402
+from demo.settings import settings  # noqa: E402
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Airtable stand-in that counts accepted connections."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, latency: float) -> None:
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.latency = latency
+        self.connections = 0
+        self.requests = 0
+        self._ids = count()
+        self._lock = threading.Lock()
+
+    def next_id(self) -> str:
+        with self._lock:
+            self.requests += 1
+            return f"rec{next(self._ids):08d}"
+
+    def process_request(self, request, client_address) -> None:  # type: ignore[no-untyped-def]
+        with self._lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections alive between requests
+    disable_nagle_algorithm = True
+    server: StandInServer
+
+    def do_GET(self) -> None:
+        # Counters for the benchmark; not an Airtable endpoint.
+        payload = json.dumps(
+            {"connections": self.server.connections, "requests": self.server.requests}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _respond(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        time.sleep(self.server.latency)
+        record_id = self.path.rsplit("/", 1)[-1]
+        if self.command == "POST":
+            record_id = self.server.next_id()
+        else:
+            self.server.next_id()
+        payload = json.dumps(
+            {
+                "id": record_id,
+                "createdTime": "2025-01-01T00:00:00.000Z",
+                "fields": body.get("fields", {}),
+            }
+        )
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload.encode())
+
+    do_POST = _respond
+    do_PATCH = _respond
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def sample_assessment() -> AssessmentResult:
+    return AssessmentResult(
+        overall_score=72.0,
+        overall_confidence="Medium",
+        dimension_scores=[
+            DimensionScore(
+                dimension="Leadership",
+                score=4,
+                evidence_level="Medium",
+                confidence="Medium",
+                reasoning="Benchmark payload.",
+            )
+        ],
+        summary="Benchmark assessment",
+    )
+
+
+def run_sync(writes: int, concurrency: int) -> None:
+    client = AirtableClient(settings.airtable.api_key, settings.airtable.base_id)
+    assessment = sample_assessment()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(
+            executor.map(
+                lambda n: client.write_assessment("recScreen", f"recC{n}", assessment),
+                range(writes),
+            )
+        )
+
+
+async def run_async(writes: int, concurrency: int) -> None:
+    assessment = sample_assessment()
+    semaphore = asyncio.Semaphore(concurrency)
+    async with AsyncAirtableClient(
+        settings.airtable.api_key, settings.airtable.base_id
+    ) as client:
+
+        async def write(n: int) -> str:
+            async with semaphore:
+                return await client.write_assessment(
+                    "recScreen", f"recC{n}", assessment
+                )
+
+        await asyncio.gather(*(write(n) for n in range(writes)))
+
+
+def serve(latency: float, urls: "multiprocessing.Queue[str]") -> None:
+    server = StandInServer(latency)
+    urls.put(server.url)
+    server.serve_forever()
+
+
+def measure(name: str, latency: float, run) -> None:  # type: ignore[no-untyped-def]
+    urls: multiprocessing.Queue[str] = multiprocessing.Queue()
+    process = multiprocessing.Process(target=serve, args=(latency, urls), daemon=True)
+    process.start()
+    settings.airtable.api_url = urls.get(timeout=10)
+
+    peak_threads = threading.active_count()
+    done = threading.Event()
+
+    def sample() -> None:
+        nonlocal peak_threads
+        while not done.wait(0.01):
+            peak_threads = max(peak_threads, threading.active_count())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        with urlopen(settings.airtable.api_url) as response:
+            stats = json.load(response)
+    finally:
+        done.set()
+        sampler.join()
+        process.terminate()
+    print(
+        f"{name:<6} {stats['requests']:>6} writes  {elapsed:>7.2f}s  "
+        f"{stats['requests'] / elapsed:>8.1f} writes/s  "
+        # The stats request opened one more connection.
+        f"{stats['connections'] - 1:>4} connections  "
+        # Less the main and sampler threads.
+        f"{peak_threads - 2:>4} client threads"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--writes", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="Stand-in response delay (s)"
+    )
+    args = parser.parse_args()
+
+    # Measure the clients, not the per-base request budget.
+    settings.airtable.rate_limit_enabled = False
+    settings.airtable.http_max_connections = args.concurrency
+    settings.airtable.idempotency_field = ""
+
+    print(
+        f"{args.writes} assessment writes, concurrency {args.concurrency}, "
+        f"{args.latency * 1000:.0f}ms stand-in latency"
+    )
+    measure("sync", args.latency, lambda: run_sync(args.writes, args.concurrency))
+    measure(
+        "async",
+        args.latency,
+        lambda: asyncio.run(run_async(args.writes, args.concurrency)),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from demo.agent_pool import reset_agent_pool
+from demo.assessment_cache import reset_assessment_cache
+from demo.blob_store import reset_research_blob_store
+from demo.llm_cache import reset_llm_cache
+from demo.rate_limit import reset_rate_limiters
+from demo.research_cache import reset_research_cache
+from demo.triage import reset_triage_stats
+from demo.usage import reset_usage_recorder
+
+
+@pytest.fixture(autouse=True)
+def _isolated_caches(tmp_path):
+    """Keep cross-screen caches out of tmp/ so mocked results never leak between tests."""
+
+    reset_research_cache()
+    reset_llm_cache()
+    reset_assessment_cache()
+    reset_usage_recorder()
+    reset_agent_pool()
+    reset_triage_stats()
+    reset_research_blob_store()
+    reset_rate_limiters()
+    with (
+        patch("demo.settings.settings.cache.db_path", str(tmp_path / "cache.db")),
+        patch(
+            "demo.settings.settings.cache.research_blob_dir",
+            str(tmp_path / "research_blobs"),
+        ),
+    ):
+        yield
+    reset_research_cache()
+    reset_llm_cache()
+    reset_assessment_cache()
+    reset_usage_recorder()
+    reset_agent_pool()
+    reset_triage_stats()
+    reset_research_blob_store()
+    reset_rate_limiters()
@@ -0,0 +1,196 @@
+"""Local stand-in for the OpenAI Responses API background lifecycle.
+
+``POST /v1/responses`` with ``background: true`` returns a ``queued``
+response; each ``GET /v1/responses/{id}`` advances it to ``in_progress`` and,
+after ``polls_until_done`` polls, to ``final_status`` (``completed`` with a
+markdown report and URL citations, or ``failed``). With ``hold_until``,
+nothing finishes before that many responses were submitted. ``POST
+.../cancel`` marks it ``cancelled``. Point a model at
+:attr:`ResponsesStubServer.base_url`.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Self
+
+__all__ = ["ResponsesStubServer"]
+
+
+class ResponsesStubServer:
+    """Threaded HTTP server simulating background responses."""
+
+    def __init__(
+        self,
+        *,
+        polls_until_done: int = 2,
+        hold_until: int = 0,
+        final_status: str = "completed",
+        markdown: str = "# Research report\n\nJane Smith is CFO at TechCorp.",
+        citations: tuple[tuple[str, str], ...] = (
+            ("https://example.com/jane", "Jane Smith profile"),
+        ),
+    ) -> None:
+        self.polls_until_done = polls_until_done
+        self.hold_until = hold_until
+        self.final_status = final_status
+        self.markdown = markdown
+        self.citations = citations
+        self.requests: list[dict[str, Any]] = []
+        self.polls: dict[str, int] = {}
+        self.cancelled: list[str] = []
+        self.max_outstanding = 0
+        self._statuses: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def _outstanding(self) -> int:
+        return sum(
+            status in ("queued", "in_progress") for status in self._statuses.values()
+        )
+
+    def create(self, body: dict[str, Any]) -> dict[str, Any]:
+        with self._lock:
+            self.requests.append(body)
+            response_id = f"resp_{len(self.requests)}"
+            self._statuses[response_id] = (
+                "queued" if body.get("background") else self.final_status
+            )
+            self.polls[response_id] = 0
+            self.max_outstanding = max(self.max_outstanding, self._outstanding())
+            return self._payload(response_id, body.get("model", ""))
+
+    def retrieve(self, response_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            if response_id not in self._statuses:
+                return None
+            if self._statuses[response_id] in ("queued", "in_progress"):
+                self.polls[response_id] += 1
+                done = (
+                    self.polls[response_id] >= self.polls_until_done
+                    and len(self.requests) >= self.hold_until
+                )
+                self._statuses[response_id] = (
+                    self.final_status if done else "in_progress"
+                )
+            return self._payload(response_id, "o4-mini-deep-research")
+
+    def cancel(self, response_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            if response_id not in self._statuses:
+                return None
+            self.cancelled.append(response_id)
+            self._statuses[response_id] = "cancelled"
+            return self._payload(response_id, "o4-mini-deep-research")
+
+    def _payload(self, response_id: str, model: str) -> dict[str, Any]:
+        status = self._statuses[response_id]
+        payload: dict[str, Any] = {
+            "id": response_id,
+            "object": "response",
+            "created_at": int(time.time()),
+            "model": model,
+            "status": status,
+            "background": True,
+            "output": [],
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": [],
+            "error": None,
+            "incomplete_details": None,
+        }
+        if status == "failed":
+            payload["error"] = {"code": "server_error", "message": "Research failed"}
+        if status == "completed":
+            payload["output"] = [
+                {
+                    "type": "message",
+                    "id": f"msg_{response_id}",
+                    "role": "assistant",
+                    "status": "completed",
+                    "content": [
+                        {
+                            "type": "output_text",
+                            "text": self.markdown,
+                            "annotations": [
+                                {
+                                    "type": "url_citation",
+                                    "url": url,
+                                    "title": title,
+                                    "start_index": 0,
+                                    "end_index": 1,
+                                }
+                                for url, title in self.citations
+                            ],
+                        }
+                    ],
+                }
+            ]
+            payload["usage"] = {
+                "input_tokens": 100,
+                "input_tokens_details": {"cached_tokens": 0},
+                "output_tokens": 400,
+                "output_tokens_details": {"reasoning_tokens": 0},
+                "total_tokens": 500,
+            }
+        return payload
+
+    # ------------------------------------------------------------------
+    # HTTP plumbing
+    # ------------------------------------------------------------------
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _send(self, payload: dict[str, Any] | None) -> None:
+                status = 200 if payload is not None else 404
+                body = json.dumps(
+                    payload
+                    if payload is not None
+                    else {"error": {"message": "No such response", "type": "invalid"}}
+                ).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                parts = self.path.rstrip("/").split("/")
+                if parts[-1] == "cancel":
+                    self._send(stub.cancel(parts[-2]))
+                else:
+                    self._send(stub.create(body))
+
+            def do_GET(self) -> None:
+                response_id = self.path.split("?")[0].rstrip("/").split("/")[-1]
+                self._send(stub.retrieve(response_id))
+
+        return Handler
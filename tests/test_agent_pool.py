@@ -0,0 +1,98 @@
+"""Tests for the shared agent pool."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import Mock, patch
+
+from demo.agent_pool import AgentPool, shared_http_client
+from demo.agents import assess_candidate, create_assessment_agent
+from tests.test_research_cache import _assessment, _research
+
+
+def test_agents_are_reused_per_kind_and_config() -> None:
+    pool = AgentPool(max_idle_per_key=2)
+    factory = Mock(side_effect=lambda **config: Mock(name=str(config)))
+
+    with pool.lease("research", factory, use_deep_research=True) as first:
+        pass
+    with pool.lease("research", factory, use_deep_research=True) as again:
+        assert again is first
+        with pool.lease("research", factory, use_deep_research=True) as other:
+            assert other is not first
+    with pool.lease("parser", factory) as parser:
+        assert parser is not first
+
+    assert factory.call_count == 3
+    assert pool.stats() == {
+        "created": 3,
+        "reused": 1,
+        "idle": {"research": 2, "parser": 1},
+    }
+
+
+def test_concurrent_callers_never_share_an_agent() -> None:
+    pool = AgentPool(max_idle_per_key=4)
+    active: set[int] = set()
+    clashes: list[int] = []
+    lock = threading.Lock()
+
+    def use() -> None:
+        for _ in range(50):
+            with pool.lease("assessment", Mock) as agent:
+                with lock:
+                    if id(agent) in active:
+                        clashes.append(id(agent))
+                    active.add(id(agent))
+                with lock:
+                    active.discard(id(agent))
+
+    threads = [threading.Thread(target=use) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert clashes == []
+    assert pool.stats()["created"] <= 8
+
+
+def test_async_client_is_dropped_when_the_event_loop_changes() -> None:
+    pool = AgentPool(max_idle_per_key=1)
+
+    async def lease() -> Mock:
+        with pool.lease("assessment", Mock) as agent:
+            agent.model.async_client = "bound-to-this-loop"
+            return agent
+
+    first = asyncio.run(lease())
+    with pool.lease("assessment", Mock) as agent:
+        assert agent.model.async_client == "bound-to-this-loop"
+
+    async def check() -> None:
+        with pool.lease("assessment", Mock) as agent:
+            assert agent is first
+            assert agent.model.async_client is None
+
+    asyncio.run(check())
+
+
+@patch("demo.agents.create_assessment_agent")
+def test_assessments_reuse_one_pooled_agent(mock_create_agent) -> None:
+    agent = Mock()
+    agent.model.id = "gpt-5-mini"
+    agent.run.return_value = Mock(content=_assessment())
+    mock_create_agent.return_value = agent
+
+    assess_candidate(_research(), "# Spec A")
+    assess_candidate(_research(), "# Spec B")
+
+    assert mock_create_agent.call_count == 1
+    assert agent.run.call_count == 2
+
+
+def test_models_share_one_http_client() -> None:
+    agent = create_assessment_agent()
+
+    assert agent.model.http_client is shared_http_client()
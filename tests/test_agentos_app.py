@@ -8,18 +8,33 @@ import pytest
 from fastapi.testclient import TestClient
 
 from demo import agentos_app
+from demo.job_queue import ScreenJobQueue
 from demo.screening_service import ScreenValidationError
 
 
 @pytest.fixture
-def client() -> TestClient:
+def screen_queue(tmp_path) -> ScreenJobQueue:
+    """Isolated job queue with the in-process worker disabled."""
+
+    queue = ScreenJobQueue(tmp_path / "screen_jobs.db")
+    with (
+        patch("demo.agentos_app.screen_job_queue", queue),
+        patch("demo.agentos_app.settings.job_queue.inprocess_worker", False),
+    ):
+        yield queue
+
+
+@pytest.fixture
+def client(screen_queue: ScreenJobQueue) -> TestClient:
     """FastAPI TestClient for the AgentOS app."""
 
     with TestClient(agentos_app.app) as test_client:
         yield test_client
 
 
-def test_agentos_screen_success(client: TestClient) -> None:
+def test_agentos_screen_success(
+    client: TestClient, screen_queue: ScreenJobQueue
+) -> None:
     """/screen returns 202 Accepted and queues processing in background."""
 
     expected = {
@@ -68,13 +83,37 @@ def test_agentos_screen_success(client: TestClient) -> None:
 
     # Disable auth for this test (default behavior when AGENTOS_SECURITY_KEY not set)
     with patch("demo.agentos_app.settings.agentos.security_key", None):
-        # Mock process_screen_direct to avoid background task execution
-        with patch("demo.agentos_app.process_screen_direct"):
-            response = client.post("/screen", json=payload)
+        response = client.post("/screen", json=payload)
 
     assert response.status_code == 202
     assert response.json() == expected
 
+    job = screen_queue.latest_for_screen("recScreen123")
+    assert job is not None
+    assert job.status == "queued"
+    assert job.payload["role_spec_markdown"] == "# Role Spec\n..."
+    assert [c["id"] for c in job.payload["candidates"]] == ["recCandidate123"]
+
+    with patch("demo.agentos_app.settings.agentos.security_key", None):
+        status_response = client.get("/screens/recScreen123/status")
+
+    assert status_response.status_code == 200
+    status_body = status_response.json()
+    assert status_body["job_id"] == job.job_id
+    assert status_body["status"] == "queued"
+    assert status_body["candidates_total"] == 1
+    assert status_body["candidates_completed"] == 0
+
+
+def test_screen_status_unknown_screen_returns_404(client: TestClient) -> None:
+    """Status endpoint reports 404 for screens that were never queued."""
+
+    with patch("demo.agentos_app.settings.agentos.security_key", None):
+        response = client.get("/screens/recMissing/status")
+
+    assert response.status_code == 404
+    assert response.json()["error"] == "not_found"
+
 
 @pytest.mark.skip(reason="Endpoint now uses background tasks - errors handled async")
 def test_agentos_screen_validation_error_from_workflow(client: TestClient) -> None:
@@ -104,7 +143,7 @@ def test_agentos_screen_validation_error_from_workflow(client: TestClient) -> No
     }
 
     with patch(
-        "demo.agentos_app.process_screen_direct",
+        "demo.agentos_app.screen_job_queue.enqueue",
         side_effect=ScreenValidationError(
             "Screen missing linked role spec.",
             {"role_spec_id": "Link a role spec"},
@@ -162,7 +201,7 @@ def test_agentos_screen_server_error(client: TestClient) -> None:
     }
 
     with patch(
-        "demo.agentos_app.process_screen_direct",
+        "demo.agentos_app.screen_job_queue.enqueue",
         side_effect=RuntimeError("boom"),
     ):
         response = client.post("/screen", json=payload)
@@ -227,10 +266,8 @@ def test_bearer_auth_disabled_allows_all_requests(client: TestClient) -> None:
 
     # Patch settings to disable security
     with patch("demo.agentos_app.settings.agentos.security_key", None):
-        # Mock process_screen_direct to avoid background execution
-        with patch("demo.agentos_app.process_screen_direct"):
-            # Request without Authorization header should succeed
-            response = client.post("/screen", json=payload)
+        # Request without Authorization header should succeed
+        response = client.post("/screen", json=payload)
 
     assert response.status_code == 202
     assert response.json()["status"] == "accepted"
@@ -380,14 +417,53 @@ def test_bearer_auth_enabled_accepts_valid_token(client: TestClient) -> None:
 
     # Patch settings to enable security
     with patch("demo.agentos_app.settings.agentos.security_key", "test-secret-key"):
-        # Mock process_screen_direct to avoid background execution
-        with patch("demo.agentos_app.process_screen_direct"):
-            # Request with correct token should succeed
-            response = client.post(
-                "/screen",
-                json=payload,
-                headers={"Authorization": "Bearer test-secret-key"},
-            )
+        # Request with correct token should succeed
+        response = client.post(
+            "/screen",
+            json=payload,
+            headers={"Authorization": "Bearer test-secret-key"},
+        )
 
     assert response.status_code == 202
     assert response.json()["status"] == "accepted"
+
+
+def test_concurrency_metrics_endpoint(client: TestClient) -> None:
+    """Adaptive concurrency window is exposed for monitoring."""
+
+    response = client.get("/metrics/concurrency")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["adaptive"] is True
+    assert body["window"] >= 1
+
+
+def test_cache_metrics_endpoint(client: TestClient) -> None:
+    """LLM response cache counters are exposed for monitoring."""
+
+    response = client.get("/metrics/cache")
+
+    assert response.status_code == 200
+    llm = response.json()["llm"]
+    assert llm["enabled"] is True
+    assert llm["hits"] == 0
+    assert llm["entries"] == 0
+
+
+def test_usage_metrics_endpoint(client: TestClient) -> None:
+    """Per-model prompt-cache usage is exposed for monitoring."""
+
+    response = client.get("/metrics/usage")
+
+    assert response.status_code == 200
+    assert isinstance(response.json()["models"], dict)
+
+
+def test_triage_metrics_endpoint(client: TestClient) -> None:
+    """Triage counters report how many expensive calls were avoided."""
+
+    response = client.get("/metrics/triage")
+
+    assert response.status_code == 200
+    assert response.json()["deep_research_avoided"] == 0
@@ -12,6 +12,7 @@ without making actual API calls. It verifies:
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from unittest.mock import Mock, patch
 
@@ -462,3 +463,37 @@ class TestAgentOSWorkflowWithMockedAPI:
 
         # Verify result
         assert isinstance(result, AssessmentResult)
+
+    @patch("demo.workflow.aassess_candidate")
+    @patch("demo.workflow.check_research_quality")
+    @patch("demo.workflow.arun_research")
+    def test_async_workflow_uses_async_agents(
+        self,
+        mock_arun_research,
+        mock_quality_check,
+        mock_aassess,
+        mock_parser_response: ExecutiveResearchResult,
+        mock_assessment_result: AssessmentResult,
+        mock_role_spec: str,
+        mock_candidate_data: dict,
+        workflow_runner: AgentOSCandidateWorkflow,
+    ) -> None:
+        """arun_candidate_workflow awaits the async research and assessment calls."""
+        mock_arun_research.return_value = mock_parser_response
+        mock_quality_check.return_value = True
+        mock_aassess.return_value = mock_assessment_result
+
+        result, research = asyncio.run(
+            workflow_runner.arun_candidate_workflow(
+                candidate_data=mock_candidate_data,
+                role_spec_markdown=mock_role_spec,
+                screen_id="recScreenAsync123",
+            )
+        )
+
+        mock_arun_research.assert_awaited_once()
+        mock_aassess.assert_awaited_once()
+        assert isinstance(research, ExecutiveResearchResult)
+        assert research.exec_name == "Jane Smith"
+        assert isinstance(result, AssessmentResult)
+        assert result.overall_score == 88.5
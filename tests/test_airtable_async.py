@@ -0,0 +1,176 @@
+"""Tests for the async Airtable client."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Callable
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from demo.airtable_async import AsyncAirtableClient
+from demo.screening_service import aprocess_screen_direct
+from tests.test_concurrency import _assessment
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def _replay(responses: list[httpx.Response], requests: list[httpx.Request]) -> Handler:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    return handler
+
+
+def _client(handler: Handler) -> AsyncAirtableClient:
+    http = httpx.AsyncClient(
+        base_url="https://airtable.test", transport=httpx.MockTransport(handler)
+    )
+    return AsyncAirtableClient("pat_test_key", "appAsyncBase/tblX", http_client=http)
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep():
+    # The limiter would spin on the patched sleep after a 429 cooldown.
+    with (
+        patch("demo.airtable_async.settings.airtable.rate_limit_enabled", False),
+        patch("demo.airtable_async.asyncio.sleep") as sleep,
+    ):
+        yield sleep
+
+
+def test_write_assessment_posts_fields_and_returns_record_id() -> None:
+    requests: list[httpx.Request] = []
+    client = _client(_replay([httpx.Response(200, json={"id": "recA1"})], requests))
+
+    record_id = asyncio.run(
+        client.write_assessment("recScreen", "recC1", _assessment(), None, None, "md")
+    )
+
+    assert record_id == "recA1"
+    (request,) = requests
+    assert request.method == "POST"
+    assert request.url.path == "/v0/appAsyncBase/Platform-Assessments"
+    fields = json.loads(request.content)["fields"]
+    assert fields["Screen"] == ["recScreen"]
+    assert fields["Assessment Markdown Report"] == "md"
+
+
+def test_rate_limited_create_is_retried(_no_sleep) -> None:
+    requests: list[httpx.Request] = []
+    client = _client(
+        _replay(
+            [
+                httpx.Response(429, headers={"Retry-After": "2"}),
+                httpx.Response(200, json={"id": "recLog1"}),
+            ],
+            requests,
+        )
+    )
+
+    record_id = asyncio.run(
+        client.log_automation_event(
+            action="Candidate Assessment",
+            event_type="State Change",
+            related_table="Platform-Screens",
+            related_record_ids=["recScreen"],
+            event_summary="done",
+        )
+    )
+
+    assert record_id == "recLog1"
+    assert len(requests) == 2
+    assert _no_sleep.call_args.args[0] >= 2
+
+
+def test_ambiguous_create_reuses_the_record_found_by_idempotency_key() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "POST":
+            # Airtable stored the record but the response was lost.
+            return httpx.Response(503)
+        key = json.loads(requests[0].content)["fields"]["Idempotency Key"]
+        assert key in request.url.params["filterByFormula"]
+        return httpx.Response(
+            200,
+            json={"records": [{"id": "recOld", "fields": {"Idempotency Key": key}}]},
+        )
+
+    client = _client(handler)
+
+    with patch(
+        "demo.airtable_async.settings.airtable.idempotency_field", "Idempotency Key"
+    ):
+        record_id = asyncio.run(
+            client.write_assessment("recScreen", "recC1", _assessment())
+        )
+
+    assert record_id == "recOld"
+    assert [request.method for request in requests] == ["POST", "GET"]
+
+
+def test_update_screen_status_patches_status_with_extra_fields() -> None:
+    requests: list[httpx.Request] = []
+    client = _client(
+        _replay([httpx.Response(502), httpx.Response(200, json={})], requests)
+    )
+
+    asyncio.run(
+        client.update_screen_status("recScreen", "Complete", fields={"Notes": "4/4"})
+    )
+
+    assert [request.method for request in requests] == ["PATCH", "PATCH"]
+    assert requests[-1].url.path == "/v0/appAsyncBase/Platform-Screens/recScreen"
+    assert json.loads(requests[-1].content) == {
+        "fields": {"Notes": "4/4", "Status": "Complete"}
+    }
+
+
+def test_failed_update_raises_runtime_error() -> None:
+    client = _client(_replay([httpx.Response(422)], []))
+
+    with pytest.raises(RuntimeError, match="status to Failed") as info:
+        asyncio.run(client.update_screen_status("recScreen", "Failed"))
+    assert isinstance(info.value.__cause__, httpx.HTTPStatusError)
+
+
+def test_async_screen_writes_assessments_through_the_async_client() -> None:
+    requests: list[httpx.Request] = []
+    async_airtable = _client(
+        _replay(
+            [httpx.Response(200, json={"id": f"recA{n}"}) for n in range(3)], requests
+        )
+    )
+    airtable = MagicMock()
+    candidates = [{"id": f"recC{n}", "name": f"C{n}"} for n in range(3)]
+
+    async def runner(*args):
+        return _assessment(), None
+
+    payload = asyncio.run(
+        aprocess_screen_direct(
+            screen_id="recScreen",
+            role_spec_markdown="# Spec",
+            candidates=candidates,
+            custom_instructions=None,
+            airtable=airtable,
+            logger=logging.getLogger("test.airtable_async"),
+            candidate_runner=runner,
+            max_concurrency=3,
+            async_airtable=async_airtable,
+        )
+    )
+
+    assert sorted(r["assessment_id"] for r in payload["results"]) == [
+        "recA0",
+        "recA1",
+        "recA2",
+    ]
+    assert len(requests) == 3
+    airtable.write_assessment.assert_not_called()
@@ -0,0 +1,163 @@
+"""Tests for the local Airtable outbox, its drainer and the replay CLI."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from demo.airtable_client import AirtableClient
+from demo.airtable_outbox import (
+    OUTBOX_DELIVERED,
+    OUTBOX_FAILED,
+    OUTBOX_PENDING,
+    OUTBOX_SUPERSEDED,
+    AirtableOutbox,
+    OutboxDrainer,
+    main,
+)
+from tests.test_airtable_retry import _http_error
+from tests.test_concurrency import _assessment
+
+
+@pytest.fixture
+def outbox(tmp_path) -> AirtableOutbox:
+    return AirtableOutbox(
+        tmp_path / "outbox.db", max_attempts=2, retry_backoff_seconds=0
+    )
+
+
+@pytest.fixture
+def api() -> MagicMock:
+    tables: dict[str, MagicMock] = {}
+
+    def table(base_id: str, name: str) -> MagicMock:
+        if name not in tables:
+            tables[name] = MagicMock()
+            tables[name].name = name
+        return tables[name]
+
+    api = MagicMock()
+    api.table.side_effect = table
+    with patch("demo.airtable_client.Api", return_value=api):
+        yield api
+
+
+def _client(outbox: AirtableOutbox) -> AirtableClient:
+    return AirtableClient("pat_test_key", "appOutboxBase", outbox=outbox)
+
+
+def test_failed_assessment_is_kept_and_delivered_by_the_drainer(
+    api, outbox, monkeypatch
+) -> None:
+    monkeypatch.setattr("demo.airtable_client.settings.airtable.max_retries", 0)
+    monkeypatch.setattr(
+        "demo.airtable_client.settings.airtable.idempotency_field", "Idempotency Key"
+    )
+    client = _client(outbox)
+    client.assessments.create.side_effect = [_http_error(503), {"id": "recA1"}]
+    client.assessments.all.return_value = []
+
+    with pytest.raises(RuntimeError, match="Failed to write assessment"):
+        client.write_assessment("recScreen", "recC1", _assessment())
+
+    (entry,) = outbox.entries("recScreen")
+    assert entry.status == OUTBOX_PENDING
+    assert "503" in entry.last_error
+    assert json.loads(entry.fields["Assessment JSON"])["summary"] == "Scored"
+
+    summary = OutboxDrainer(outbox, client).drain_once()
+
+    assert summary == {"delivered": 1, "failed": 0}
+    (entry,) = outbox.entries("recScreen")
+    assert (entry.status, entry.record_id) == (OUTBOX_DELIVERED, "recA1")
+    assert client.assessments.create.call_args.args[0] == entry.fields
+
+
+def test_timed_out_create_without_idempotency_field_waits_for_replay(
+    api, outbox
+) -> None:
+    """Airtable may have stored the record, so the drainer must not re-send it."""
+
+    client = _client(outbox)
+    client.assessments.create.side_effect = requests.Timeout("read timed out")
+
+    with pytest.raises(RuntimeError, match="Failed to write assessment"):
+        client.write_assessment("recScreen", "recC1", _assessment())
+
+    (entry,) = outbox.entries("recScreen")
+    assert entry.status == OUTBOX_FAILED
+    assert "read timed out" in entry.last_error
+
+    assert OutboxDrainer(outbox, client).drain_once() == {"delivered": 0, "failed": 0}
+    client.assessments.create.assert_called_once()
+
+
+def test_drainer_leaves_entries_with_an_inline_attempt_in_flight(api, outbox) -> None:
+    client = _client(outbox)
+    outbox.append(
+        client.ASSESSMENTS_TABLE, "create", {"Status": "Complete"}, screen_id="recS"
+    )
+
+    assert OutboxDrainer(outbox, client).drain_once() == {"delivered": 0, "failed": 0}
+    client.assessments.create.assert_not_called()
+
+
+def test_newer_status_update_supersedes_an_undelivered_one(api, outbox) -> None:
+    client = _client(outbox)
+    client.screens.update.side_effect = [_http_error(404), {}]
+
+    with pytest.raises(RuntimeError):
+        client.update_screen_status("recScreen", "Processing")
+    client.update_screen_status("recScreen", "Complete")
+
+    statuses = [
+        (entry.fields["Status"], entry.status) for entry in outbox.entries("recScreen")
+    ]
+    assert statuses == [
+        ("Processing", OUTBOX_SUPERSEDED),
+        ("Complete", OUTBOX_DELIVERED),
+    ]
+
+
+def test_replay_cli_redelivers_failed_entries(api, tmp_path, capsys) -> None:
+    outbox = AirtableOutbox(tmp_path / "outbox.db", max_attempts=1)
+    client = _client(outbox)
+    client.automation_log.create.side_effect = _http_error(422)
+    with pytest.raises(RuntimeError):
+        client.log_automation_event(
+            action="Candidate Assessment",
+            event_type="State Change",
+            related_table="Platform-Screens",
+            related_record_ids=["recScreen"],
+            event_summary="Screen recScreen completed",
+            screen_id="recScreen",
+        )
+    assert outbox.counts("recScreen") == {OUTBOX_FAILED: 1}
+
+    client.automation_log.create.side_effect = None
+    client.automation_log.create.return_value = {"id": "recLog1"}
+    with patch("demo.airtable_outbox.settings.outbox.db_path", str(outbox.db_path)):
+        assert main(["replay", "recScreen"]) == 0
+        assert main(["status", "recScreen"]) == 0
+
+    output = capsys.readouterr().out
+    assert "Replayed 1 entries for recScreen: 1 delivered, 0 failed" in output
+    assert "delivered  create Operations-Automation_Log" in output
+    assert "record=recLog1" in output
+
+
+def test_superseding_update_carries_fields_it_does_not_set(api, outbox) -> None:
+    client = _client(outbox)
+    client.screens.update.side_effect = [_http_error(422), {}]
+
+    with pytest.raises(RuntimeError):
+        client.update_screen_fields("recScreen", {"Notes": "2/4 assessed"})
+    client.update_screen_status("recScreen", "Complete")
+
+    assert client.screens.update.call_args.args == (
+        "recScreen",
+        {"Notes": "2/4 assessed", "Status": "Complete"},
+    )
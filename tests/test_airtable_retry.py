@@ -0,0 +1,129 @@
+"""Tests for Airtable rate limiting, retries and idempotent creates."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from demo.airtable_client import AirtableClient
+from demo.airtable_writer import AirtableBatchWriter
+from demo.rate_limit import (
+    RequestRateLimiter,
+    _MemoryBucketStore,
+    get_airtable_rate_limiter,
+)
+from tests.test_concurrency import _assessment
+
+
+def _http_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status} Client Error", response=response)
+
+
+def _client(writer: AirtableBatchWriter | None = None) -> AirtableClient:
+    tables: dict[str, MagicMock] = {}
+
+    def table(base_id: str, name: str) -> MagicMock:
+        tables[name] = MagicMock()
+        tables[name].name = name
+        return tables[name]
+
+    api = MagicMock()
+    api.table.side_effect = table
+    with patch("demo.airtable_client.Api", return_value=api):
+        return AirtableClient("pat_test_key", "appRetryBase", writer=writer)
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep():
+    with patch("demo.airtable_client.time.sleep") as sleep:
+        yield sleep
+
+
+def test_rate_limited_create_is_retried(_no_sleep) -> None:
+    client = _client()
+    client.assessments.create.side_effect = [_http_error(429), {"id": "recA1"}]
+    limiter = get_airtable_rate_limiter("appRetryBase")
+    assert limiter is not None
+
+    with patch.object(limiter, "cooldown") as cooldown:
+        record_id = client.write_assessment("recScreen", "recC1", _assessment())
+
+    assert record_id == "recA1"
+    assert client.assessments.create.call_count == 2
+    cooldown.assert_called_once_with(_no_sleep.call_args.args[0])
+    assert 0.5 <= _no_sleep.call_args.args[0] <= 1.0
+
+
+def test_ambiguous_create_is_not_retried_without_idempotency_key() -> None:
+    client = _client()
+    client.assessments.create.side_effect = _http_error(503)
+
+    with pytest.raises(RuntimeError, match="Failed to write assessment"):
+        client.write_assessment("recScreen", "recC1", _assessment())
+
+    client.assessments.create.assert_called_once()
+
+
+def test_status_update_retries_server_errors() -> None:
+    client = _client()
+    client.screens.update.side_effect = [_http_error(502), _http_error(500), {}]
+
+    client.update_screen_status("recScreen", "Complete")
+
+    assert client.screens.update.call_count == 3
+
+
+def test_retried_batch_reuses_records_airtable_already_created() -> None:
+    writer = AirtableBatchWriter(flush_seconds=60)
+    client = _client(writer)
+    table = client.assessments
+    sent: list[list[dict]] = []
+
+    def batch_create(records, typecast=False):
+        sent.append(records)
+        if len(sent) == 1:
+            # The first request timed out after Airtable stored two records.
+            stored.extend(
+                {"id": f"recOld{n}", "fields": fields}
+                for n, fields in enumerate(records[:2])
+            )
+            raise requests.Timeout("read timed out")
+        return [{"id": "recNew", "fields": fields} for fields in records]
+
+    stored: list[dict] = []
+    table.batch_create.side_effect = batch_create
+    table.all.side_effect = lambda formula: list(stored)
+
+    with patch(
+        "demo.airtable_client.settings.airtable.idempotency_field", "Idempotency Key"
+    ):
+        futures = [
+            client.submit_assessment("recScreen", f"recC{n}", _assessment())
+            for n in range(3)
+        ]
+        writer.flush()
+
+    assert [future.result() for future in futures] == ["recOld0", "recOld1", "recNew"]
+    keys = [fields["Idempotency Key"] for fields in sent[0]]
+    assert len(set(keys)) == 3
+    assert [fields["Idempotency Key"] for fields in sent[1]] == keys[2:]
+    assert all(key in table.all.call_args.kwargs["formula"] for key in keys)
+    writer.close()
+
+
+def test_request_limiter_spaces_requests_per_second() -> None:
+    limiter = RequestRateLimiter("airtable:appTest", 50, _MemoryBucketStore())
+    for _ in range(50):
+        limiter.acquire()
+
+    started = time.perf_counter()
+    for _ in range(5):
+        limiter.acquire()
+
+    # 50 requests/second refills one request every 20ms.
+    assert time.perf_counter() - started >= 0.08
@@ -0,0 +1,121 @@
+"""Tests for the buffered Airtable batch writer."""
+
+from __future__ import annotations
+
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from demo.airtable_client import AirtableClient
+from demo.airtable_writer import AirtableBatchWriter
+from demo.screening_service import process_screen_direct
+from tests.test_concurrency import _assessment
+
+
+def _table(name: str) -> MagicMock:
+    table = MagicMock()
+    table.name = name
+    counter = iter(range(1000))
+    table.batch_create.side_effect = lambda records, typecast=False: [
+        {"id": f"rec{name}{next(counter)}", "fields": fields} for fields in records
+    ]
+    return table
+
+
+def _client(writer: AirtableBatchWriter) -> AirtableClient:
+    tables = {
+        name: _table(name.split("-")[-1])
+        for name in (
+            "Platform-Screens",
+            "Platform-Assessments",
+            "Operations-Automation_Log",
+        )
+    }
+    api = MagicMock()
+    api.table.side_effect = lambda base_id, name: tables[name]
+    with patch("demo.airtable_client.Api", return_value=api):
+        return AirtableClient("pat_test_key", "appTestBase123", writer=writer)
+
+
+def test_creates_are_coalesced_into_batches_of_ten() -> None:
+    table = _table("T")
+    writer = AirtableBatchWriter(flush_seconds=60)
+
+    futures = [writer.create(table, {"n": n}) for n in range(23)]
+    # Two full batches were written by the creates that filled them.
+    assert [len(c.args[0]) for c in table.batch_create.call_args_list] == [10, 10]
+    assert not futures[-1].done()
+
+    writer.flush()
+
+    assert [len(c.args[0]) for c in table.batch_create.call_args_list] == [10, 10, 3]
+    assert [future.result() for future in futures] == [f"recT{n}" for n in range(23)]
+    writer.close()
+
+
+def test_buffer_is_flushed_after_the_interval() -> None:
+    table = _table("T")
+    writer = AirtableBatchWriter(flush_seconds=0.05)
+
+    plain = writer.create(table, {"n": 1})
+    typecast = writer.create(table, {"n": 2}, typecast=True)
+
+    assert {plain.result(timeout=2), typecast.result(timeout=2)} == {
+        "recT0",
+        "recT1",
+    }
+    assert sorted(c.kwargs["typecast"] for c in table.batch_create.call_args_list) == [
+        False,
+        True,
+    ]
+    writer.close()
+
+
+def test_batch_failure_fails_every_future_in_the_batch() -> None:
+    writer = AirtableBatchWriter(flush_seconds=60)
+    client = _client(writer)
+    client.assessments.batch_create.side_effect = RuntimeError("422 INVALID")
+
+    futures = [
+        client.submit_assessment("recScreen", f"recC{n}", _assessment())
+        for n in range(3)
+    ]
+    writer.flush()
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="Failed to write assessment") as info:
+            future.result()
+        assert str(info.value.__cause__) == "422 INVALID"
+    writer.close()
+
+
+def test_screen_writes_share_batch_requests() -> None:
+    writer = AirtableBatchWriter(flush_seconds=0.2)
+    client = _client(writer)
+    candidates = [{"id": f"recC{n}", "name": f"C{n}"} for n in range(4)]
+
+    payload = process_screen_direct(
+        screen_id="recScreen",
+        role_spec_markdown="# Spec",
+        candidates=candidates,
+        custom_instructions=None,
+        airtable=client,
+        logger=logging.getLogger("test.airtable_writer"),
+        candidate_runner=lambda *args: (_assessment(), None),
+        max_concurrency=4,
+    )
+
+    assert sorted(r["assessment_id"] for r in payload["results"]) == [
+        f"recAssessments{n}" for n in range(4)
+    ]
+    client.assessments.create.assert_not_called()
+    client.assessments.batch_create.assert_called_once()
+    client.automation_log.create.assert_not_called()
+    logged = [
+        fields["Event Type"]
+        for c in client.automation_log.batch_create.call_args_list
+        for fields in c.args[0]
+    ]
+    assert logged == ["Webhook Event", "State Change"]
+    writer.close()
@@ -0,0 +1,44 @@
+"""Tests for assessment memoization."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+from demo.agents import aassess_candidate, assess_candidate
+from demo.assessment_cache import assessment_cache_key
+from tests.test_research_cache import _assessment, _research
+
+
+def test_key_ignores_research_timestamp_and_whitespace() -> None:
+    rerun = _research()
+    rerun.research_timestamp = datetime(2026, 1, 1)
+    key = assessment_cache_key(_research(), "# Spec\n", None)
+
+    assert key == assessment_cache_key(rerun, "# Spec\r\n", "")
+    assert key != assessment_cache_key(_research(), "# Spec v2", None)
+    assert key != assessment_cache_key(_research(), "# Spec", "Weight fundraising")
+    changed = _research()
+    changed.research_summary = "Different findings"
+    assert key != assessment_cache_key(changed, "# Spec", None)
+    with patch("demo.assessment_cache.prompt_fingerprint", return_value="v2"):
+        assert key != assessment_cache_key(_research(), "# Spec", None)
+
+
+@patch("demo.agents.create_assessment_agent")
+def test_unchanged_candidates_skip_the_assessment_agent(mock_create_agent) -> None:
+    agent = Mock()
+    agent.model.id = "gpt-5-mini"
+    agent.run.return_value = Mock(content=_assessment())
+    agent.arun = AsyncMock(return_value=Mock(content=_assessment()))
+    mock_create_agent.return_value = agent
+
+    first = assess_candidate(_research(), "# Spec", "Focus on SaaS")
+    again = asyncio.run(aassess_candidate(_research(), "# Spec", "Focus on SaaS"))
+    edited = asyncio.run(aassess_candidate(_research(), "# Spec", "Focus on fintech"))
+
+    assert agent.run.call_count + agent.arun.call_count == 2
+    assert again.overall_score == first.overall_score
+    assert again.role_spec_used == "# Spec"
+    assert edited is not again
@@ -0,0 +1,98 @@
+"""Tests for background-mode Deep Research against a local stand-in server."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from agno.exceptions import ModelProviderError
+from agno.models.message import Message
+
+from demo.agents import create_research_agent
+from demo.background_responses import (
+    BackgroundOpenAIResponses,
+    BackgroundResponseTimeout,
+)
+from demo.usage import get_usage_recorder
+from tests.responses_stub_server import ResponsesStubServer
+
+
+@pytest.fixture(autouse=True)
+def _fast_polling():
+    with patch("demo.settings.settings.openai.deep_research_poll_seconds", 0.01):
+        yield
+
+
+def _model(server: ResponsesStubServer) -> BackgroundOpenAIResponses:
+    return BackgroundOpenAIResponses(
+        id="o4-mini-deep-research", api_key="sk-test", base_url=server.base_url
+    )
+
+
+def _invoke(model: BackgroundOpenAIResponses):
+    return model.invoke(
+        messages=[Message(role="user", content="Research Jane Smith")],
+        assistant_message=Message(role="assistant"),
+    )
+
+
+def test_research_agent_polls_background_response_to_completion() -> None:
+    with ResponsesStubServer(polls_until_done=3) as server:
+        agent = create_research_agent(background=True)
+        agent.model.base_url = server.base_url
+        agent.model.http_client = None
+        result = agent.run("Research Jane Smith")
+
+    assert isinstance(agent.model, BackgroundOpenAIResponses)
+    assert server.requests[0]["background"] is True
+    assert server.requests[0]["store"] is True
+    assert server.polls == {"resp_1": 3}
+    assert result.content == server.markdown
+    assert [citation.url for citation in result.citations.urls] == [
+        "https://example.com/jane"
+    ]
+    assert get_usage_recorder().snapshot()["o4-mini-deep-research"]["calls"] == 1
+
+
+def test_one_event_loop_keeps_many_responses_outstanding() -> None:
+    async def run(server: ResponsesStubServer) -> list[str]:
+        responses = await asyncio.gather(
+            *(
+                _model(server).ainvoke(
+                    messages=[Message(role="user", content=f"Candidate {index}")],
+                    assistant_message=Message(role="assistant"),
+                )
+                for index in range(20)
+            )
+        )
+        return [response.content for response in responses]
+
+    # Token buckets drained by earlier tests would serialize the submissions.
+    with (
+        patch("demo.settings.settings.rate_limit.enabled", False),
+        ResponsesStubServer(hold_until=20) as server,
+    ):
+        contents = asyncio.run(run(server))
+
+    assert contents == [server.markdown] * 20
+    assert server.max_outstanding == 20
+
+
+def test_failed_background_response_raises_provider_error() -> None:
+    with (
+        ResponsesStubServer(final_status="failed") as server,
+        pytest.raises(ModelProviderError, match="Research failed"),
+    ):
+        _invoke(_model(server))
+
+
+def test_response_exceeding_max_wait_is_cancelled() -> None:
+    with (
+        patch("demo.settings.settings.openai.deep_research_max_wait_seconds", 0.05),
+        ResponsesStubServer(polls_until_done=10**6) as server,
+        pytest.raises(BackgroundResponseTimeout),
+    ):
+        _invoke(_model(server))
+
+    assert server.cancelled == ["resp_1"]
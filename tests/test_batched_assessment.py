@@ -0,0 +1,73 @@
+"""Tests for multi-spec assessment in a single structured-output call."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+from demo.agents import (
+    _build_batched_assessment_prompt,
+    aassess_candidate_multi,
+    assess_candidate_multi,
+)
+from demo.models import BatchedAssessmentResult, SpecAssessmentResult
+from tests.test_fanout import TARGETS
+from tests.test_research_cache import _assessment, _research
+
+
+def _batch(*spec_ids: str) -> BatchedAssessmentResult:
+    return BatchedAssessmentResult(
+        assessments=[
+            SpecAssessmentResult(**_assessment().model_dump(), spec_id=spec_id)
+            for spec_id in spec_ids
+        ]
+    )
+
+
+def _agent(output: BatchedAssessmentResult) -> Mock:
+    agent = Mock()
+    agent.model.id = "gpt-5-mini"
+    agent.run.return_value = Mock(content=output)
+    agent.arun = AsyncMock(return_value=Mock(content=output))
+    return agent
+
+
+def test_prompt_sends_research_once_with_labelled_specs() -> None:
+    prompt = _build_batched_assessment_prompt(_research(), TARGETS)
+
+    assert prompt.count("CANDIDATE RESEARCH:") == 1
+    assert "ROLE SPECIFICATION [spec_id=S1]:\n# CFO at Pigment" in prompt
+    assert "CUSTOM INSTRUCTIONS [spec_id=S2]:\nWeight fundraising" in prompt
+
+
+@patch("demo.agents.assess_candidate")
+@patch("demo.agents.create_batched_assessment_agent")
+def test_one_call_returns_an_assessment_per_spec(mock_create, mock_single) -> None:
+    agent = _agent(_batch("S2", "s1"))
+    mock_create.return_value = agent
+
+    results = assess_candidate_multi(_research(), TARGETS)
+
+    agent.run.assert_called_once()
+    mock_single.assert_not_called()
+    assert list(results) == ["recPigment", "recMockingbird"]
+    assert results["recPigment"].role_spec_used == "# CFO at Pigment"
+    assert results["recMockingbird"].overall_score is not None
+
+    # Both specs are now memoized; a re-run makes no calls at all.
+    assess_candidate_multi(_research(), TARGETS)
+    assert mock_create.call_count == 1
+
+
+@patch("demo.agents.aassess_candidate", new_callable=AsyncMock)
+@patch("demo.agents.create_batched_assessment_agent")
+def test_falls_back_to_per_spec_calls_on_invalid_batch(
+    mock_create, mock_single
+) -> None:
+    mock_create.return_value = _agent(_batch("S1"))
+    mock_single.return_value = _assessment()
+
+    results = asyncio.run(aassess_candidate_multi(_research(), TARGETS))
+
+    assert mock_single.await_count == 2
+    assert set(results) == {"recPigment", "recMockingbird"}
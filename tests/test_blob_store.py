@@ -0,0 +1,119 @@
+"""Tests for the raw Deep Research blob store."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from demo.agents import arun_research, run_research
+from demo.blob_store import ResearchBlobStore, get_research_blob_store
+from demo.research_cache import research_cache_key
+from demo.screening_helpers import extract_candidate_context
+from demo.workflow import AgentOSCandidateWorkflow
+from tests.test_research_cache import CANDIDATE, _assessment, _research
+
+RAW = {"markdown": "# Jane Smith\nCFO at TechCorp", "citations": []}
+
+
+def test_put_and_get_round_trip(tmp_path) -> None:
+    store = ResearchBlobStore(tmp_path)
+
+    path = store.put("cand/../key", "screen_rec1_rec2", RAW)
+
+    assert path.parent.parent == tmp_path
+    assert store.get("cand/../key", "screen_rec1_rec2") == RAW
+    assert store.get("cand/../key", "other-run") is None
+    os.utime(path, (0, 0))
+    assert store.get("cand/../key", "screen_rec1_rec2", max_age_seconds=60) is None
+
+
+@patch("demo.agents.create_research_parser_agent")
+@patch("demo.agents.create_research_agent")
+def test_raw_output_is_saved_before_the_parser_runs(
+    mock_create_agent, mock_create_parser
+) -> None:
+    result = Mock(content="Deep Research report", citations=[])
+    mock_create_agent.return_value = Mock(run=Mock(return_value=result))
+    mock_create_parser.return_value = Mock(
+        run=Mock(side_effect=Exception("parser error"))
+    )
+
+    with pytest.raises(RuntimeError, match="Research parser failed"):
+        run_research(
+            candidate_name="Parser Fail",
+            current_title="CFO",
+            current_company="Acme",
+            run_key="screen_recS_recC",
+        )
+
+    store = get_research_blob_store()
+    assert store is not None
+    saved = store.get(research_cache_key("Parser Fail", "Acme"), "screen_recS_recC")
+    assert saved == {"markdown": "Deep Research report", "citations": []}
+
+
+@patch("demo.agents.create_research_parser_agent")
+@patch("demo.agents.create_research_agent")
+def test_async_research_saves_raw_output_off_the_event_loop(
+    mock_create_agent, mock_create_parser
+) -> None:
+    result = Mock(content="Deep Research report", citations=[])
+    mock_create_agent.return_value = Mock(arun=AsyncMock(return_value=result))
+    mock_create_parser.return_value = Mock(
+        arun=AsyncMock(return_value=Mock(content=_research()))
+    )
+    store = get_research_blob_store()
+    assert store is not None
+    put = store.put
+    writer_threads: list[int] = []
+
+    def record_put(*args, **kwargs):
+        writer_threads.append(threading.get_ident())
+        return put(*args, **kwargs)
+
+    async def research() -> int:
+        await arun_research(
+            candidate_name="Async Writer",
+            current_title="CFO",
+            current_company="Acme",
+            run_key="screen_recS_recC",
+        )
+        return threading.get_ident()
+
+    with patch.object(store, "put", side_effect=record_put):
+        loop_thread = asyncio.run(research())
+
+    assert len(writer_threads) == 1
+    assert writer_threads[0] != loop_thread
+    saved = store.get(research_cache_key("Async Writer", "Acme"), "screen_recS_recC")
+    assert saved == {"markdown": "Deep Research report", "citations": []}
+
+
+def test_workflow_reparses_saved_output_instead_of_running_deep_research() -> None:
+    workflow = AgentOSCandidateWorkflow(logging.getLogger("test.blob_store"))
+    screen_id = f"recScreen{uuid4().hex[:8]}"
+    session_id, _ = workflow._build_run_input(CANDIDATE, "# Spec", screen_id, None)
+    store = get_research_blob_store()
+    assert store is not None
+    context = extract_candidate_context(CANDIDATE)
+    store.put(workflow._research_cache_key(context), session_id, RAW)
+
+    with (
+        patch("demo.workflow.settings.openai.research_tiered", True),
+        patch("demo.workflow.run_research", return_value=_research()) as research,
+        patch("demo.workflow.check_research_quality", return_value=True),
+        patch("demo.workflow.assess_candidate", return_value=_assessment()),
+    ):
+        workflow.run_candidate_workflow(CANDIDATE, "# Spec", screen_id)
+
+    # The fast tier is skipped and the deep tier only re-parses the blob.
+    research.assert_called_once()
+    assert research.call_args.kwargs["use_deep_research"] is True
+    assert research.call_args.kwargs["raw_research"] == RAW
+    assert research.call_args.kwargs["run_key"] == session_id
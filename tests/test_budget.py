@@ -0,0 +1,244 @@
+"""Tests for per-screen spend budgets and cost-aware candidate ordering."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from agno.models.metrics import Metrics
+
+from demo.budget import (
+    BudgetExhaustedError,
+    ScreenBudget,
+    budget_step,
+    deep_research_allowance,
+    order_by_expected_fit,
+    usage_cost,
+    use_budget,
+)
+from demo.screening_service import LogSymbols, aprocess_screen_direct
+from demo.usage import ModelUsage, get_usage_recorder, track_usage
+from demo.workflow import AgentOSCandidateWorkflow
+from tests.test_research_cache import CANDIDATE, _assessment, _research
+from tests.test_research_tiers import CONTEXT
+
+logger = logging.getLogger("test.budget")
+
+PRICES = {"o4-mini-deep-research": {"input": 2.0, "cached_input": 0.5, "output": 8.0}}
+
+
+def _budget(max_usd: float, estimate_usd: float = 1.0) -> ScreenBudget:
+    return ScreenBudget(max_usd, deep_research_estimate_usd=estimate_usd, prices=PRICES)
+
+
+def _spend(model_id: str = "o4-mini-deep-research", input_tokens: int = 500_000):
+    # 500k uncached input tokens of Deep Research cost $1.00.
+    get_usage_recorder().record(
+        model_id, Metrics(input_tokens=input_tokens, output_tokens=0), 1.0
+    )
+
+
+def test_usage_cost_discounts_cached_tokens() -> None:
+    usage = ModelUsage()
+    usage.add(1_000_000, 400_000, 100_000, 1.0)
+
+    cost = usage_cost("o4-mini-deep-research", usage, PRICES)
+
+    assert cost == pytest.approx(0.6 * 2.0 + 0.4 * 0.5 + 0.1 * 8.0)
+    assert usage_cost("unknown-model", usage, PRICES) == 0.0
+
+
+def test_track_usage_scopes_nest() -> None:
+    with track_usage() as outer, track_usage() as inner:
+        _spend(input_tokens=10)
+
+    assert outer["o4-mini-deep-research"].input_tokens == 10
+    assert inner["o4-mini-deep-research"].input_tokens == 10
+
+
+def test_reservations_block_concurrent_launches_over_budget() -> None:
+    budget = _budget(max_usd=1.5)
+
+    with use_budget(budget), deep_research_allowance():
+        # The first launch holds $1.00 of the $1.50 cap until it finishes.
+        with pytest.raises(BudgetExhaustedError), deep_research_allowance():
+            pass
+        with budget_step("research"):
+            _spend(input_tokens=100_000)
+
+    assert budget.spent_usd == pytest.approx(0.2)
+    assert not budget.exhausted
+    snapshot = budget.snapshot()
+    assert snapshot["deep_research_launched"] == 1
+    assert snapshot["deep_research_refused"] == 1
+    assert snapshot["steps"]["research"] == {"spent_usd": 0.2, "tokens": 100_000}
+
+
+def test_allowance_is_a_noop_without_budget_or_for_fast_research() -> None:
+    budget = _budget(max_usd=0.5)
+
+    with deep_research_allowance():
+        pass
+    with use_budget(budget), deep_research_allowance(use_deep_research=False):
+        pass
+
+    assert budget.deep_research_launched == 0
+
+
+def test_from_settings_requires_a_cap() -> None:
+    assert ScreenBudget.from_settings() is None
+
+    budget = ScreenBudget.from_settings(max_usd=5.0)
+
+    assert budget is not None
+    assert budget.max_usd == 5.0
+    assert budget.max_tokens is None
+
+
+def test_order_by_expected_fit_puts_matching_titles_first() -> None:
+    candidates = [
+        {"id": "recCEO", "title": "CEO"},
+        {"id": "recAdvisor", "title": "Advisor"},
+        {"id": "recCFO", "title": "CFO"},
+        {"id": "recVPF", "title": "VP Finance"},
+    ]
+
+    assert order_by_expected_fit(candidates, "CFO") == [2, 3, 1, 0]
+    assert order_by_expected_fit(candidates, None) == [0, 1, 2, 3]
+
+
+def test_budget_exhaustion_keeps_fast_research_instead_of_escalating() -> None:
+    budget = _budget(max_usd=0.5)
+
+    def research(**kwargs):
+        result = _research()
+        result.research_model = "gpt-5"
+        return result
+
+    with (
+        patch("demo.workflow.settings.openai.research_tiered", True),
+        patch("demo.workflow.run_research", side_effect=research) as run,
+        patch("demo.workflow.check_research_quality", return_value=False),
+        use_budget(budget),
+    ):
+        workflow = AgentOSCandidateWorkflow(logging.getLogger("test.budget"))
+        result, tiers = workflow._run_research_tiers(CONTEXT)
+
+    assert run.call_count == 1
+    assert result.research_model == "gpt-5"
+    assert tiers[-1] == {"tier": "deep", "skipped": "budget_exhausted"}
+
+
+def test_screen_defers_candidates_once_budget_is_spent() -> None:
+    candidates = [
+        {"id": "recCEO", "name": "Casey CEO", "title": "CEO"},
+        {"id": "recCFO1", "name": "Fran CFO", "title": "CFO"},
+        {"id": "recCFO2", "name": "Finn Finance", "title": "VP Finance"},
+    ]
+    started: list[str] = []
+
+    async def runner(candidate, role_spec, screen_id, custom_instructions):
+        started.append(candidate["id"])
+        with budget_step("research"), deep_research_allowance():
+            await asyncio.sleep(0)
+            _spend()
+        return _assessment(), _research()
+
+    airtable = MagicMock()
+    airtable.write_assessment.side_effect = lambda **kwargs: (
+        f"recAssess_{kwargs['candidate_id']}"
+    )
+    airtable.write_deferred_assessment.return_value = "recDeferred"
+    budget = _budget(max_usd=2.0)
+
+    payload = asyncio.run(
+        aprocess_screen_direct(
+            screen_id="recScreen",
+            role_spec_markdown="# CFO spec",
+            candidates=candidates,
+            custom_instructions=None,
+            airtable=airtable,
+            logger=logger,
+            symbols=LogSymbols(),
+            candidate_runner=runner,
+            max_concurrency=1,
+            budget=budget,
+            role_type="CFO",
+        )
+    )
+
+    # Finance titles are researched first; the CEO no longer fits the budget.
+    assert started == ["recCFO1", "recCFO2", "recCEO"]
+    assert payload["status"] == "partial"
+    assert [result["candidate_id"] for result in payload["results"]] == [
+        "recCFO1",
+        "recCFO2",
+    ]
+    assert payload["candidates_deferred"] == 1
+    assert payload["deferred"][0]["candidate_id"] == "recCEO"
+    assert payload["deferred"][0]["assessment_id"] == "recDeferred"
+    assert payload["budget"]["spent_usd"] == 2.0
+    assert payload["budget"]["steps"]["research"]["spent_usd"] == 2.0
+    airtable.write_deferred_assessment.assert_called_once()
+    assert airtable.write_deferred_assessment.call_args.kwargs["candidate_id"] == (
+        "recCEO"
+    )
+
+
+def test_shared_research_refused_by_one_screen_does_not_defer_another() -> None:
+    workflow = AgentOSCandidateWorkflow(logging.getLogger("test.budget"))
+    load_raw = workflow._load_raw_research
+
+    def slow_load(state, context):
+        # Keep screen A's run in flight until screen B has joined it.
+        time.sleep(0.05)
+        load_raw(state, context)
+
+    airtable = MagicMock()
+    airtable.write_assessment.side_effect = lambda **kwargs: (
+        f"recAssess_{kwargs['screen_id']}"
+    )
+    airtable.write_deferred_assessment.return_value = "recDeferred"
+
+    async def screen(screen_id: str, budget: ScreenBudget | None, delay: float):
+        await asyncio.sleep(delay)
+        return await aprocess_screen_direct(
+            screen_id=screen_id,
+            role_spec_markdown="# CFO spec",
+            candidates=[CANDIDATE],
+            custom_instructions=None,
+            airtable=airtable,
+            logger=logger,
+            symbols=LogSymbols(),
+            candidate_runner=workflow.arun_candidate_workflow,
+            max_concurrency=1,
+            budget=budget,
+        )
+
+    async def screens():
+        return await asyncio.gather(
+            # Screen A cannot afford a single Deep Research launch.
+            screen("recScreenA", _budget(max_usd=1.0, estimate_usd=2.0), 0),
+            screen("recScreenB", None, 0.01),
+        )
+
+    with (
+        patch("demo.research_cache.settings.cache.research_enabled", False),
+        patch.object(workflow, "_load_raw_research", side_effect=slow_load),
+        patch("demo.workflow.arun_research", return_value=_research()) as research,
+        patch("demo.workflow.check_research_quality", return_value=True),
+        patch("demo.workflow.aassess_candidate", return_value=_assessment()),
+    ):
+        screen_a, screen_b = asyncio.run(screens())
+
+    assert screen_a["candidates_deferred"] == 1
+    assert "deferred" not in screen_b
+    assert screen_b["results"][0]["assessment_id"] == "recAssess_recScreenB"
+    research.assert_called_once()
+    airtable.write_deferred_assessment.assert_called_once()
+    assert airtable.write_deferred_assessment.call_args.kwargs["screen_id"] == (
+        "recScreenA"
+    )
@@ -0,0 +1,166 @@
+"""Tests for the AIMD adaptive concurrency controller."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import httpx
+import openai
+import pytest
+from agno.exceptions import ModelProviderError
+
+from demo.concurrency import (
+    CONGESTION_RATE_LIMIT,
+    CONGESTION_TIMEOUT,
+    AdaptiveConcurrencyController,
+    classify_congestion,
+    get_concurrency_controller,
+    reset_concurrency_controller,
+)
+from demo.models import AssessmentResult, DimensionScore
+from demo.screening_service import _adaptive_runner, aprocess_screen_direct
+
+
+@pytest.fixture(autouse=True)
+def _fresh_controller():
+    reset_concurrency_controller()
+    yield
+    reset_concurrency_controller()
+
+
+def _wrapped(cause: BaseException) -> RuntimeError:
+    """Mimic agents.py: RuntimeError raised from the provider error."""
+
+    try:
+        try:
+            raise cause
+        except BaseException as exc:
+            raise ModelProviderError(message=str(exc)) from exc
+    except ModelProviderError as provider_error:
+        try:
+            raise RuntimeError(
+                "Research agent failed after retries"
+            ) from provider_error
+        except RuntimeError as wrapped:
+            return wrapped
+
+
+def test_classify_congestion_walks_cause_chain() -> None:
+    request = httpx.Request("POST", "https://api.openai.com/v1/responses")
+
+    assert classify_congestion(RuntimeError("failed")) is None
+    rate_limited = RuntimeError("failed")
+    rate_limited.__cause__ = ModelProviderError(message="slow down", status_code=429)
+    assert classify_congestion(rate_limited) == CONGESTION_RATE_LIMIT
+    assert (
+        classify_congestion(_wrapped(openai.APITimeoutError(request=request)))
+        == CONGESTION_TIMEOUT
+    )
+    assert classify_congestion(ValueError("bad data")) is None
+    assert (
+        classify_congestion(ValueError("bad data"), elapsed=10_000)
+        == CONGESTION_TIMEOUT
+    )
+
+
+def test_window_grows_additively_and_halves_once_per_episode() -> None:
+    controller = AdaptiveConcurrencyController(4, min_limit=1, max_limit=8)
+
+    first = controller.acquire()
+    second = controller.acquire()
+    controller.release(first, succeeded=True)
+    assert controller.window == 5
+
+    # Both requests were in flight during the same congestion episode.
+    third = controller.acquire()
+    controller.release(second, succeeded=False, congestion=CONGESTION_RATE_LIMIT)
+    assert controller.window == 2
+    controller.release(third, succeeded=False, congestion=CONGESTION_RATE_LIMIT)
+    assert controller.window == 2
+
+    # Ordinary failures do not move the window; it never leaves its bounds.
+    controller.release(controller.acquire(), succeeded=False)
+    assert controller.window == 2
+    for _ in range(20):
+        controller.release(controller.acquire(), succeeded=True)
+    assert controller.window == 8
+    assert controller.snapshot()["congestion_events"] == 2
+
+
+def _assessment() -> AssessmentResult:
+    return AssessmentResult(
+        overall_score=70.0,
+        overall_confidence="Medium",
+        dimension_scores=[
+            DimensionScore(
+                dimension="Leadership",
+                score=4,
+                evidence_level="Medium",
+                confidence="Medium",
+                reasoning="Evidence of team leadership.",
+            )
+        ],
+        summary="Scored",
+        assessment_timestamp=datetime(2025, 11, 18, 12, 0, 0),
+    )
+
+
+def test_sync_runner_releases_its_slot_on_base_exceptions() -> None:
+    controller = AdaptiveConcurrencyController(1, max_limit=1)
+
+    def runner(*args):
+        raise SystemExit(1)
+
+    with pytest.raises(SystemExit):
+        _adaptive_runner(runner, controller)({"id": "recC0"}, "# Spec", "recS", None)
+
+    assert controller.snapshot()["in_flight"] == 0
+
+
+def test_screen_backs_off_on_rate_limits() -> None:
+    """Without a fixed cap the screen runs inside the adaptive window."""
+
+    airtable = MagicMock()
+    airtable.write_assessment.return_value = "recAssess"
+    candidates = [{"id": f"recC{i}", "name": f"C{i}"} for i in range(8)]
+    in_flight = 0
+    peak = 0
+
+    async def runner(candidate, role_spec, screen_id, custom_instructions):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if candidate["id"] == "recC0":
+            raise RuntimeError("Research agent failed") from ModelProviderError(
+                message="Rate limit reached", status_code=429
+            )
+        return _assessment(), None
+
+    with (
+        patch("demo.concurrency.settings.screening.max_concurrent_candidates", 2),
+        patch("demo.concurrency.settings.screening.adaptive_max_candidates", 4),
+    ):
+        controller = get_concurrency_controller()
+        payload = asyncio.run(
+            aprocess_screen_direct(
+                screen_id="recScreen",
+                role_spec_markdown="# Spec",
+                candidates=candidates,
+                custom_instructions=None,
+                airtable=airtable,
+                logger=logging.getLogger("test.concurrency"),
+                candidate_runner=runner,
+            )
+        )
+
+    assert payload["candidates_processed"] == 7
+    assert peak <= 4
+    snapshot = controller.snapshot()
+    assert snapshot["congestion_events"] == 1
+    assert snapshot["successes"] == 7
+    assert snapshot["in_flight"] == 0
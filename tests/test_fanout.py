@@ -0,0 +1,78 @@
+"""Tests for research-once, assess-many fan-out runs."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from unittest.mock import patch
+
+import pytest
+from agno.db.base import SessionType
+
+from demo.models import AssessmentTarget
+from demo.workflow import AgentOSCandidateWorkflow
+from tests.test_research_cache import CANDIDATE, _assessment, _research
+
+TARGETS = [
+    AssessmentTarget(screen_id="recPigment", role_spec_markdown="# CFO at Pigment"),
+    AssessmentTarget(
+        screen_id="recMockingbird",
+        role_spec_markdown="# CFO at Mockingbird",
+        custom_instructions="Weight fundraising",
+    ),
+]
+
+
+@pytest.fixture
+def workflow() -> AgentOSCandidateWorkflow:
+    # Per-spec path; batched assessment is covered in test_batched_assessment.py.
+    with patch("demo.workflow.settings.screening.batched_assessment", False):
+        yield AgentOSCandidateWorkflow(logging.getLogger("test.fanout"))
+
+
+def test_research_runs_once_for_every_role_spec(workflow) -> None:
+    with (
+        patch("demo.workflow.run_research", return_value=_research()) as research,
+        patch("demo.workflow.check_research_quality", return_value=True),
+        patch("demo.workflow.assess_candidate", return_value=_assessment()) as assess,
+    ):
+        result = workflow.run_candidate_fanout(CANDIDATE, TARGETS, force_refresh=True)
+
+    research.assert_called_once()
+    assert sorted(
+        call.kwargs["role_spec_markdown"] for call in assess.call_args_list
+    ) == ["# CFO at Mockingbird", "# CFO at Pigment"]
+    assert set(result.assessments) == {"recPigment", "recMockingbird"}
+    assert result.errors == {}
+    assert result.research == _research()
+
+    session = workflow.fanout_workflow.db.get_session(
+        result.session_id, session_type=SessionType.WORKFLOW
+    )
+    state = workflow._extract_workflow_state(session.session_data)
+    assert set(state["assessments"]) == {"recPigment", "recMockingbird"}
+    assert len(state["targets"]) == 2
+
+
+def test_async_fanout_reports_failed_specs_separately(workflow) -> None:
+    async def assess(research, role_spec_markdown, custom_instructions):
+        if "Mockingbird" in role_spec_markdown:
+            raise RuntimeError("Assessment agent failed")
+        return _assessment()
+
+    with (
+        patch("demo.workflow.arun_research", return_value=_research()),
+        patch("demo.workflow.check_research_quality", return_value=True),
+        patch("demo.workflow.aassess_candidate", side_effect=assess),
+    ):
+        result = asyncio.run(
+            workflow.arun_candidate_fanout(CANDIDATE, TARGETS, force_refresh=True)
+        )
+
+    assert list(result.assessments) == ["recPigment"]
+    assert result.errors == {"recMockingbird": "Assessment agent failed"}
+
+
+def test_fanout_requires_targets(workflow) -> None:
+    with pytest.raises(ValueError):
+        workflow.run_candidate_fanout(CANDIDATE, [])
@@ -0,0 +1,296 @@
+"""Tests for the durable screen job queue and its worker."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from demo.budget import BudgetExhaustedError
+from demo.job_queue import (
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    ScreenJobQueue,
+)
+from demo.models import AssessmentResult, DimensionScore
+from demo.screen_worker import ScreenJobWorker
+
+logger = logging.getLogger("test.job_queue")
+
+
+def _assessment(score: float) -> AssessmentResult:
+    return AssessmentResult(
+        overall_score=score,
+        overall_confidence="Medium",
+        dimension_scores=[
+            DimensionScore(
+                dimension="Leadership",
+                score=4,
+                evidence_level="Medium",
+                confidence="Medium",
+                reasoning="Evidence of team leadership.",
+            )
+        ],
+        summary=f"Scored {score}",
+        assessment_timestamp=datetime(2025, 11, 18, 12, 0, 0),
+    )
+
+
+def _payload(count: int = 3) -> dict:
+    return {
+        "role_spec_markdown": "# Spec",
+        "candidates": [
+            {"id": f"recC{index}", "name": f"Candidate {index}", "title": "CFO"}
+            for index in range(count)
+        ],
+        "custom_instructions": None,
+    }
+
+
+@pytest.fixture
+def queue(tmp_path) -> ScreenJobQueue:
+    return ScreenJobQueue(
+        tmp_path / "screen_jobs.db", max_attempts=2, retry_backoff_seconds=0
+    )
+
+
+@pytest.fixture
+def airtable() -> MagicMock:
+    client = MagicMock()
+    client.write_assessment.side_effect = lambda **kwargs: (
+        f"recAssess_{kwargs['candidate_id']}"
+    )
+    return client
+
+
+def _worker(queue, airtable, runner, **kwargs) -> ScreenJobWorker:
+    workflow_runner = MagicMock()
+    workflow_runner.arun_candidate_workflow = runner
+    return ScreenJobWorker(
+        queue,
+        airtable,
+        workflow_runner,
+        logger=logger,
+        worker_id=kwargs.pop("worker_id", "worker-1"),
+        lease_seconds=kwargs.pop("lease_seconds", 30),
+        heartbeat_seconds=kwargs.pop("heartbeat_seconds", 5),
+        poll_seconds=0.01,
+        concurrency=kwargs.pop("concurrency", None),
+    )
+
+
+def test_enqueue_deduplicates_active_screen(queue: ScreenJobQueue) -> None:
+    """A second webhook for a screen that is still queued reuses the job."""
+
+    first = queue.enqueue("recScreen", _payload())
+    second = queue.enqueue("recScreen", _payload())
+
+    assert first.job_id == second.job_id
+    assert first.status == JOB_QUEUED
+
+
+def test_expired_lease_is_reclaimed_and_exhausts_attempts(
+    queue: ScreenJobQueue,
+) -> None:
+    """A job whose worker stopped heartbeating is leased again, then failed."""
+
+    job = queue.enqueue("recScreen", _payload())
+
+    leased = queue.lease("worker-a", lease_seconds=0.01)
+    assert leased is not None and leased.job_id == job.job_id
+    assert leased.status == JOB_RUNNING
+    assert queue.lease("worker-b", lease_seconds=30) is None
+
+    time.sleep(0.02)
+    reclaimed = queue.lease("worker-b", lease_seconds=0.01)
+    assert reclaimed is not None
+    assert reclaimed.lease_owner == "worker-b"
+    assert reclaimed.attempts == 2
+    # The original worker can no longer heartbeat or complete the job.
+    assert queue.heartbeat(job.job_id, "worker-a", 30) is False
+    assert queue.complete(job.job_id, "worker-a", {}) is False
+
+    time.sleep(0.02)
+    assert queue.lease("worker-c", lease_seconds=30) is None
+    assert queue.get_job(job.job_id).status == JOB_FAILED
+
+
+def test_fail_requeues_until_max_attempts(queue: ScreenJobQueue) -> None:
+    job = queue.enqueue("recScreen", _payload())
+
+    queue.lease("worker-1", lease_seconds=30)
+    assert queue.fail(job.job_id, "worker-1", "Airtable unavailable") == JOB_QUEUED
+
+    queue.lease("worker-1", lease_seconds=30)
+    assert queue.fail(job.job_id, "worker-1", "Airtable unavailable") == JOB_FAILED
+
+    status = queue.latest_for_screen("recScreen").to_status()
+    assert status["status"] == JOB_FAILED
+    assert status["attempts"] == 2
+    assert status["error"] == "Airtable unavailable"
+
+
+def test_worker_completes_job_and_checkpoints_candidates(
+    queue: ScreenJobQueue, airtable: MagicMock
+) -> None:
+    async def runner(candidate, role_spec, screen_id, custom_instructions):
+        return _assessment(75.0), None
+
+    queue.enqueue("recScreen", _payload())
+    worker = _worker(queue, airtable, runner)
+
+    assert asyncio.run(worker.run_once()) is True
+
+    job = queue.latest_for_screen("recScreen")
+    assert job.status == JOB_SUCCEEDED
+    assert job.completed_candidates == 3
+    assert job.result["candidates_processed"] == 3
+    assert asyncio.run(worker.run_once()) is False
+
+
+def test_worker_resumes_without_rerunning_completed_candidates(
+    queue: ScreenJobQueue, airtable: MagicMock
+) -> None:
+    """A retried job skips candidates that were already written to Airtable."""
+
+    calls: list[str] = []
+    fail_airtable_status = {"remaining": 1}
+
+    def update_screen_status(screen_id, status, error_message=None, fields=None):
+        if status == "Complete" and fail_airtable_status["remaining"]:
+            fail_airtable_status["remaining"] -= 1
+            raise RuntimeError("Airtable unavailable")
+
+    airtable.update_screen_status.side_effect = update_screen_status
+
+    async def runner(candidate, role_spec, screen_id, custom_instructions):
+        calls.append(candidate["id"])
+        return _assessment(60.0), None
+
+    job = queue.enqueue("recScreen", _payload())
+    worker = _worker(queue, airtable, runner)
+
+    asyncio.run(worker.run_once())
+    assert queue.get_job(job.job_id).status == JOB_QUEUED
+    assert calls == ["recC0", "recC1", "recC2"]
+
+    asyncio.run(worker.run_once())
+    finished = queue.get_job(job.job_id)
+    assert finished.status == JOB_SUCCEEDED
+    assert finished.attempts == 2
+    # No candidate was screened twice; the payload still lists all of them.
+    assert calls == ["recC0", "recC1", "recC2"]
+    assert [r["candidate_id"] for r in finished.result["results"]] == [
+        "recC0",
+        "recC1",
+        "recC2",
+    ]
+
+
+def test_worker_resume_reassesses_deferred_candidates(
+    queue: ScreenJobQueue, airtable: MagicMock
+) -> None:
+    """A candidate deferred by the budget is not checkpointed as done."""
+
+    calls: list[str] = []
+    attempts = {"count": 0}
+
+    def update_screen_status(screen_id, status, error_message=None, fields=None):
+        if status == "Complete" and attempts["count"] == 1:
+            raise RuntimeError("Airtable unavailable")
+
+    airtable.update_screen_status.side_effect = update_screen_status
+    airtable.write_deferred_assessment.return_value = "recDeferred"
+
+    async def runner(candidate, role_spec, screen_id, custom_instructions):
+        calls.append(candidate["id"])
+        if candidate["id"] == "recC1" and attempts["count"] == 1:
+            raise BudgetExhaustedError("Screen budget spent")
+        return _assessment(60.0), None
+
+    job = queue.enqueue("recScreen", _payload())
+    worker = _worker(queue, airtable, runner)
+
+    attempts["count"] = 1
+    asyncio.run(worker.run_once())
+    assert queue.get_job(job.job_id).status == JOB_QUEUED
+    assert queue.get_job(job.job_id).completed_candidates == 2
+
+    attempts["count"] = 2
+    asyncio.run(worker.run_once())
+    finished = queue.get_job(job.job_id)
+    assert finished.status == JOB_SUCCEEDED
+    assert calls == ["recC0", "recC1", "recC2", "recC1"]
+    assert finished.result["candidates_processed"] == 3
+    assert "deferred" not in finished.result
+
+
+def test_worker_runs_queued_screens_concurrently(
+    queue: ScreenJobQueue, airtable: MagicMock
+) -> None:
+    """Each candidate waits until both screens are in flight."""
+
+    started: set[str] = set()
+
+    async def run() -> None:
+        both_running = asyncio.Event()
+
+        async def runner(candidate, role_spec, screen_id, custom_instructions):
+            started.add(screen_id)
+            if len(started) == 2:
+                both_running.set()
+            await both_running.wait()
+            return _assessment(70.0), None
+
+        worker = _worker(queue, airtable, runner, concurrency=2)
+        stop = asyncio.Event()
+        task = asyncio.create_task(worker.run_forever(stop))
+        await asyncio.wait_for(both_running.wait(), timeout=2)
+        while any(
+            queue.latest_for_screen(screen_id).status != JOB_SUCCEEDED
+            for screen_id in ("recScreenA", "recScreenB")
+        ):
+            await asyncio.sleep(0.01)
+        stop.set()
+        await task
+
+    queue.enqueue("recScreenA", _payload(1))
+    queue.enqueue("recScreenB", _payload(1))
+    asyncio.run(run())
+
+    assert started == {"recScreenA", "recScreenB"}
+
+
+def test_worker_abandons_job_when_lease_is_lost(
+    queue: ScreenJobQueue, airtable: MagicMock
+) -> None:
+    """Losing the lease (e.g. to a faster worker) cancels the running job."""
+
+    async def runner(candidate, role_spec, screen_id, custom_instructions):
+        await asyncio.sleep(1)
+        return _assessment(60.0), None
+
+    job = queue.enqueue("recScreen", _payload(1))
+    worker = _worker(
+        queue, airtable, runner, lease_seconds=0.01, heartbeat_seconds=0.05
+    )
+
+    async def run() -> None:
+        task = asyncio.create_task(worker.run_once())
+        await asyncio.sleep(0.03)
+        # Another worker reclaims the expired lease before our heartbeat.
+        assert queue.lease("worker-2", lease_seconds=30) is not None
+        await task
+
+    asyncio.run(run())
+
+    current = queue.get_job(job.job_id)
+    assert current.status == JOB_RUNNING
+    assert current.lease_owner == "worker-2"
+    airtable.write_assessment.assert_not_called()
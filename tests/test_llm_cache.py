@@ -0,0 +1,81 @@
+"""Tests for the content-addressed LLM response cache."""
+
+from __future__ import annotations
+
+from datetime import date
+from unittest.mock import Mock, patch
+
+from demo.agents import assess_candidate
+from demo.llm_cache import LLMResponseCache, get_llm_cache, llm_cache_key
+from demo.models import AssessmentResult, ExecutiveResearchResult
+from tests.test_research_cache import _assessment, _research
+
+
+def test_key_covers_prompt_model_schema_and_catalog() -> None:
+    key = llm_cache_key("assessment", "gpt-5-mini", "prompt", AssessmentResult)
+
+    assert key == llm_cache_key("assessment", "gpt-5-mini", "prompt", AssessmentResult)
+    assert key != llm_cache_key("assessment", "gpt-5", "prompt", AssessmentResult)
+    assert key != llm_cache_key("assessment", "gpt-5-mini", "prompt!", AssessmentResult)
+    assert key != llm_cache_key(
+        "assessment", "gpt-5-mini", "prompt", ExecutiveResearchResult
+    )
+    with patch("demo.llm_cache.prompt_fingerprint", return_value="edited"):
+        assert key != llm_cache_key(
+            "assessment", "gpt-5-mini", "prompt", AssessmentResult
+        )
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path) -> None:
+    entry_size = len(_research().model_dump_json().encode("utf-8"))
+    cache = LLMResponseCache(tmp_path / "cache.db", max_bytes=entry_size * 2)
+
+    for key in ("a", "b"):
+        cache.put(key, _research(), prompt_name="research_parser", model_id="m")
+    assert cache.get("a", ExecutiveResearchResult) is not None
+    cache.put("c", _research(), prompt_name="research_parser", model_id="m")
+
+    assert cache.get("b", ExecutiveResearchResult) is None
+    assert cache.get("a", ExecutiveResearchResult) is not None
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+
+
+@patch("demo.assessment_cache.settings.cache.assessment_enabled", False)
+@patch("demo.agents.create_assessment_agent")
+def test_repeat_assessment_is_served_from_cache(mock_create_agent) -> None:
+    agent = Mock()
+    agent.model.id = "gpt-5-mini"
+    agent.run.return_value = Mock(content=_assessment())
+    mock_create_agent.return_value = agent
+
+    first = assess_candidate(_research(), "# Spec")
+    second = assess_candidate(_research(), "# Spec")
+    assess_candidate(_research(), "# Other spec")
+
+    assert agent.run.call_count == 2
+    assert second is not first
+    assert second.summary == first.summary
+    assert second.role_spec_used == "# Spec"
+    cache = get_llm_cache()
+    assert cache is not None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+@patch("demo.assessment_cache.settings.cache.assessment_enabled", False)
+@patch("demo.agents.create_assessment_agent")
+def test_cached_assessment_is_reused_after_the_date_changes(mock_create_agent) -> None:
+    agent = Mock()
+    agent.model.id = "gpt-5-mini"
+    agent.run.return_value = Mock(content=_assessment())
+    mock_create_agent.return_value = agent
+
+    for today in (date(2025, 1, 1), date(2025, 1, 2)):
+        with patch("demo.agents.date") as mock_date:
+            mock_date.today.return_value = today
+            assess_candidate(_research(), "# Spec")
+
+    assert agent.run.call_count == 1
+    assert "Today's date: 2025-01-01" in agent.run.call_args.args[0]
@@ -0,0 +1,156 @@
+"""Tests for the stage-pipelined screening runner."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from agno.db.base import SessionType
+
+from demo.models import AssessmentResult, DimensionScore, ExecutiveResearchResult
+from demo.pipeline import StagedScreeningPipeline
+from demo.workflow import AgentOSCandidateWorkflow
+
+
+def _research(name: str) -> ExecutiveResearchResult:
+    return ExecutiveResearchResult(
+        exec_name=name,
+        current_role="CFO",
+        current_company="TechCorp",
+        research_summary=f"Summary for {name}",
+        research_timestamp=datetime(2025, 11, 18, 12, 0, 0),
+    )
+
+
+def _assessment(name: str) -> AssessmentResult:
+    return AssessmentResult(
+        overall_score=80.0,
+        overall_confidence="High",
+        dimension_scores=[
+            DimensionScore(
+                dimension="Financial Leadership",
+                score=4,
+                evidence_level="High",
+                confidence="High",
+                reasoning="Strong track record",
+            )
+        ],
+        summary=f"Assessment for {name}",
+        assessment_timestamp=datetime(2025, 11, 18, 12, 0, 0),
+    )
+
+
+@pytest.fixture
+def workflow_runner() -> AgentOSCandidateWorkflow:
+    return AgentOSCandidateWorkflow(logging.getLogger("test.pipeline"))
+
+
+def _candidates(count: int) -> list[dict[str, str]]:
+    return [
+        {"id": f"recPipe{index}", "name": f"Candidate {index}", "title": "CFO"}
+        for index in range(count)
+    ]
+
+
+@patch("demo.workflow.check_research_quality", return_value=True)
+def test_pipeline_overlaps_research_and_assessment(
+    _mock_quality, workflow_runner: AgentOSCandidateWorkflow
+) -> None:
+    """Assessment of early candidates starts while later research is running."""
+
+    events: list[tuple[str, str]] = []
+
+    async def fake_research(**kwargs):
+        events.append(("research_start", kwargs["candidate_name"]))
+        await asyncio.sleep(0.03)
+        events.append(("research_end", kwargs["candidate_name"]))
+        return _research(kwargs["candidate_name"])
+
+    async def fake_assess(research, role_spec_markdown, custom_instructions=None):
+        events.append(("assessment_start", research.exec_name))
+        await asyncio.sleep(0.01)
+        return _assessment(research.exec_name)
+
+    async def run() -> list[tuple[AssessmentResult, ExecutiveResearchResult]]:
+        pipeline = StagedScreeningPipeline(
+            workflow_runner,
+            research_workers=1,
+            quality_workers=1,
+            assessment_workers=1,
+        )
+        try:
+            return await asyncio.gather(
+                *(
+                    pipeline.run_candidate(candidate, "# Spec", "recScreenPipe1")
+                    for candidate in _candidates(3)
+                )
+            )
+        finally:
+            await pipeline.shutdown()
+
+    with (
+        patch("demo.workflow.arun_research", side_effect=fake_research),
+        patch("demo.workflow.aassess_candidate", side_effect=fake_assess),
+    ):
+        outputs = asyncio.run(run())
+
+    assert [research.exec_name for _, research in outputs] == [
+        "Candidate 0",
+        "Candidate 1",
+        "Candidate 2",
+    ]
+    assert all(isinstance(assessment, AssessmentResult) for assessment, _ in outputs)
+    # Candidate 0 is assessed before Candidate 1's research finishes.
+    assert events.index(("assessment_start", "Candidate 0")) < events.index(
+        ("research_end", "Candidate 1")
+    )
+
+
+@patch("demo.workflow.check_research_quality", return_value=True)
+def test_pipeline_isolates_failures_and_persists_sessions(
+    _mock_quality, workflow_runner: AgentOSCandidateWorkflow
+) -> None:
+    """A failing research stage fails only that candidate; others persist sessions."""
+
+    async def fake_research(**kwargs):
+        if kwargs["candidate_name"] == "Candidate 1":
+            raise RuntimeError("Research agent failed")
+        return _research(kwargs["candidate_name"])
+
+    async def fake_assess(research, role_spec_markdown, custom_instructions=None):
+        return _assessment(research.exec_name)
+
+    async def run() -> tuple[list, dict]:
+        pipeline = StagedScreeningPipeline(workflow_runner)
+        try:
+            outputs = await asyncio.gather(
+                *(
+                    pipeline.run_candidate(candidate, "# Spec", "recScreenPipe2")
+                    for candidate in _candidates(3)
+                ),
+                return_exceptions=True,
+            )
+            return outputs, pipeline.stats()
+        finally:
+            await pipeline.shutdown()
+
+    with (
+        patch("demo.workflow.arun_research", side_effect=fake_research),
+        patch("demo.workflow.aassess_candidate", side_effect=fake_assess),
+    ):
+        outputs, stats = asyncio.run(run())
+
+    assert isinstance(outputs[1], RuntimeError)
+    assert outputs[0][1].exec_name == "Candidate 0"
+    assert outputs[2][1].exec_name == "Candidate 2"
+    assert stats["research"]["failed"] == 1
+    assert stats["assessment"]["processed"] == 2
+
+    session = workflow_runner.async_workflow.db.get_session(
+        "screen_recScreenPipe2_recPipe0", session_type=SessionType.WORKFLOW
+    )
+    workflow_data = session.session_data["session_state"]["workflow_data"]
+    assert workflow_data["assessment"]["summary"] == "Assessment for Candidate 0"
@@ -0,0 +1,110 @@
+"""Tests for the shared per-model OpenAI rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from agno.exceptions import ModelProviderError
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.openai import OpenAIResponses
+from agno.models.response import ModelResponse
+
+from demo.agents import create_assessment_agent
+from demo.rate_limit import (
+    ModelRateLimiter,
+    RateLimitedOpenAIResponses,
+    _MemoryBucketStore,
+    _SqliteBucketStore,
+    get_rate_limiter,
+    reset_rate_limiters,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_limiters():
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+def test_request_bucket_blocks_after_capacity() -> None:
+    """Once a minute's worth of requests is spent the next call waits to refill."""
+
+    limiter = ModelRateLimiter("gpt-test", 600, 1_000_000, _MemoryBucketStore())
+    for _ in range(600):
+        limiter.acquire(10)
+
+    started = time.perf_counter()
+    limiter.acquire(10)
+    # 600 rpm refills one request every 0.1s.
+    assert time.perf_counter() - started >= 0.05
+
+
+def test_token_bucket_reconciles_actual_usage() -> None:
+    """Under-estimated calls consume the difference from the token bucket."""
+
+    store = _MemoryBucketStore()
+    limiter = ModelRateLimiter("gpt-test", 1000, 6000, store)
+
+    limiter.acquire(1000)
+    limiter.reconcile(estimated_tokens=1000, actual_tokens=6000)
+
+    requests = limiter._requests(100)
+    assert store.take(requests) > 0
+
+
+def test_sqlite_store_is_shared_between_instances(tmp_path) -> None:
+    """Two stores on the same file see each other's consumption (multi-process)."""
+
+    db_path = tmp_path / "rate_limits.db"
+    first = ModelRateLimiter("gpt-test", 2, 1000, _SqliteBucketStore(db_path))
+    second = ModelRateLimiter("gpt-test", 2, 1000, _SqliteBucketStore(db_path))
+
+    first.acquire(10)
+    first.acquire(10)
+
+    assert second._store.take(second._requests(10)) > 0
+
+
+def test_agents_share_limiter_per_model() -> None:
+    agent = create_assessment_agent()
+
+    assert isinstance(agent.model, RateLimitedOpenAIResponses)
+    assert get_rate_limiter("gpt-5-mini") is get_rate_limiter(agent.model.id)
+    assert get_rate_limiter("unknown-model") is None
+
+
+def test_model_acquires_before_call_and_cools_down_on_429() -> None:
+    model = RateLimitedOpenAIResponses(id="gpt-5-mini")
+    messages = [Message(role="user", content="x" * 400)]
+    limiter = get_rate_limiter("gpt-5-mini")
+    assert limiter is not None
+
+    response = ModelResponse(content="ok")
+    response.response_usage = Metrics(total_tokens=50)
+
+    with (
+        patch.object(limiter, "aacquire", wraps=limiter.aacquire) as acquire,
+        patch.object(limiter, "reconcile", wraps=limiter.reconcile) as reconcile,
+        patch.object(OpenAIResponses, "ainvoke", return_value=response),
+    ):
+        result = asyncio.run(model.ainvoke(messages, Message(role="assistant")))
+
+    assert result is response
+    estimate = acquire.call_args.args[0]
+    assert estimate >= 100
+    reconcile.assert_called_once_with(estimate, 50)
+
+    error = ModelProviderError(message="Rate limit reached", status_code=429)
+    with (
+        patch.object(limiter, "cooldown") as cooldown,
+        patch.object(OpenAIResponses, "invoke", side_effect=error),
+        pytest.raises(ModelProviderError),
+    ):
+        model.invoke(messages, Message(role="assistant"))
+
+    cooldown.assert_called_once()
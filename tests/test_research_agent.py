@@ -3,11 +3,13 @@
 Tests the Deep Research agent creation, execution, and result parsing.
 """
 
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from demo.agents import (
+    arun_research,
     create_research_agent,
     run_research,
     _extract_summary,
@@ -32,10 +34,53 @@ class TestCreateResearchAgent:
         assert agent.retries == 2
         assert agent.delay_between_retries == 1
 
-    def test_create_agent_fast_mode_not_implemented(self):
-        """Test fast mode raises NotImplementedError (Phase 2+)."""
-        with pytest.raises(NotImplementedError, match="Fast mode.*Phase 2"):
-            create_research_agent(use_deep_research=False)
+    def test_create_agent_fast_mode(self):
+        """Test fast mode returns gpt-5 + web search with structured output."""
+        agent = create_research_agent(use_deep_research=False)
+
+        assert agent.name == "Fast Research Agent"
+        assert agent.model.id == "gpt-5"
+        assert agent.tools == [{"type": "web_search_preview"}]
+        assert agent.output_schema is ExecutiveResearchResult
+
+
+class TestRunFastResearch:
+    """Tests for run_research in fast mode."""
+
+    @patch("demo.agents.create_research_parser_agent")
+    @patch("demo.agents.create_research_agent")
+    def test_fast_mode_skips_the_parser(
+        self, mock_create_agent, mock_create_parser
+    ) -> None:
+        """Fast mode returns the agent's structured output without a parser call."""
+        mock_agent = Mock()
+        mock_agent.run.return_value = Mock(
+            content=ExecutiveResearchResult(
+                exec_name="John Doe",
+                current_role="CFO",
+                current_company="Acme Corp",
+                research_summary="Fast summary",
+                citations=[
+                    Citation(url=f"https://example.com/{i}", title=str(i), snippet="")
+                    for i in range(3)
+                ],
+            ),
+            citations=None,
+        )
+        mock_create_agent.return_value = mock_agent
+
+        result = run_research(
+            candidate_name="John Doe",
+            current_title="CFO",
+            current_company="Acme Corp",
+            use_deep_research=False,
+        )
+
+        mock_create_agent.assert_called_once_with(use_deep_research=False)
+        mock_create_parser.assert_not_called()
+        assert result.research_model == "gpt-5"
+        assert result.research_summary == "Fast summary"
+        assert len(result.citations) == 3
 
 
 class TestRunResearch:
@@ -296,6 +341,71 @@ Led finance teams of 20+ across multiple companies.
         assert result.citations[0].url == "https://example.com/one"
 
 
+class TestArunResearch:
+    """Tests for the async arun_research counterpart."""
+
+    @patch("demo.agents.create_research_parser_agent")
+    @patch("demo.agents.create_research_agent")
+    def test_arun_research_awaits_agents(
+        self,
+        mock_create_agent,
+        mock_create_parser,
+    ) -> None:
+        """arun_research awaits Agent.arun for both research and parsing."""
+        mock_result = Mock()
+        mock_result.content = "Research"
+        mock_result.citations = [{"url": "https://example.com/one", "title": "One"}]
+        mock_agent = Mock()
+        mock_agent.arun = AsyncMock(return_value=mock_result)
+        mock_create_agent.return_value = mock_agent
+
+        parser_agent = Mock()
+        parser_agent.arun = AsyncMock(
+            return_value=ExecutiveResearchResult(
+                exec_name="Async Case",
+                current_role="CFO",
+                current_company="Sample",
+                research_summary="Summary",
+            )
+        )
+        mock_create_parser.return_value = parser_agent
+
+        result = asyncio.run(
+            arun_research(
+                candidate_name="Async Case",
+                current_title="CFO",
+                current_company="Sample",
+            )
+        )
+
+        mock_agent.arun.assert_awaited_once()
+        parser_agent.arun.assert_awaited_once()
+        mock_agent.run.assert_not_called()
+        assert result.citations[0].url == "https://example.com/one"
+        assert result.research_model == "o4-mini-deep-research"
+
+    @patch("demo.agents.create_research_parser_agent")
+    @patch("demo.agents.create_research_agent")
+    def test_arun_research_raises_on_agent_failure(
+        self,
+        mock_create_agent,
+        mock_create_parser,
+    ) -> None:
+        """Async research wraps agent failures in RuntimeError."""
+        mock_agent = Mock()
+        mock_agent.arun = AsyncMock(side_effect=Exception("API timeout"))
+        mock_create_agent.return_value = mock_agent
+
+        with pytest.raises(RuntimeError, match="Research agent failed.*after retries"):
+            asyncio.run(
+                arun_research(
+                    candidate_name="Error Test",
+                    current_title="CEO",
+                    current_company="Fail Corp",
+                )
+            )
+
+
 class TestExtractSummary:
     """Tests for _extract_summary helper function."""
 
@@ -0,0 +1,95 @@
+"""Tests for the cross-screen Deep Research cache."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from demo.models import AssessmentResult, DimensionScore, ExecutiveResearchResult
+from demo.research_cache import ResearchCache, research_cache_key
+from demo.workflow import AgentOSCandidateWorkflow
+
+
+def _research() -> ExecutiveResearchResult:
+    return ExecutiveResearchResult(
+        exec_name="Jane Smith",
+        current_role="CFO",
+        current_company="TechCorp",
+        research_summary="Finance leader",
+        research_timestamp=datetime(2025, 11, 18, 12, 0, 0),
+    )
+
+
+def _assessment() -> AssessmentResult:
+    return AssessmentResult(
+        overall_score=80.0,
+        overall_confidence="High",
+        dimension_scores=[
+            DimensionScore(
+                dimension="Financial Leadership",
+                score=4,
+                evidence_level="High",
+                confidence="High",
+                reasoning="Led two fundraises.",
+            )
+        ],
+        summary="Strong candidate",
+        assessment_timestamp=datetime(2025, 11, 18, 12, 0, 0),
+    )
+
+
+CANDIDATE = {
+    "id": "recCandidate123",
+    "name": "Jane Smith",
+    "current_title": "CFO",
+    "current_company": "TechCorp",
+    "linkedin_url": "https://www.linkedin.com/in/jane-smith/",
+}
+
+
+def test_cache_key_ignores_formatting_differences() -> None:
+    key = research_cache_key(
+        "Jane Smith", "TechCorp", "https://www.linkedin.com/in/jane-smith/"
+    )
+
+    assert key == research_cache_key(
+        "  jane  SMITH ", "techcorp", "uk.linkedin.com/in/Jane-Smith"
+    )
+    assert key != research_cache_key("Jane Smith", "OtherCo", None)
+
+
+def test_entries_expire_after_ttl(tmp_path) -> None:
+    cache = ResearchCache(tmp_path / "cache.db", ttl_seconds=60)
+    cache.put("k", _research(), candidate_name="Jane Smith", current_company="TechCorp")
+
+    assert cache.get("k") == _research()
+    with patch("demo.research_cache.time.time", return_value=10**12):
+        assert cache.get("k") is None
+    assert cache.get("missing") is None
+
+
+@pytest.mark.parametrize("force_refresh", [False, True])
+def test_second_screen_reuses_research_unless_forced(force_refresh: bool) -> None:
+    workflow = AgentOSCandidateWorkflow(logging.getLogger("test.research_cache"))
+
+    with (
+        patch("demo.workflow.run_research", return_value=_research()) as research,
+        patch("demo.workflow.check_research_quality", return_value=True),
+        patch("demo.workflow.assess_candidate", return_value=_assessment()),
+    ):
+        workflow.run_candidate_workflow(
+            CANDIDATE, "# Spec A", f"recScreen{uuid4().hex[:8]}"
+        )
+        _, research_result = workflow.run_candidate_workflow(
+            CANDIDATE,
+            "# Spec B",
+            f"recScreen{uuid4().hex[:8]}",
+            force_refresh=force_refresh,
+        )
+
+    assert research.call_count == (2 if force_refresh else 1)
+    assert research_result == _research()
@@ -0,0 +1,92 @@
+"""Tests for tiered research (fast mode first, Deep Research on a quality miss)."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from agno.models.metrics import Metrics
+
+from demo.models import ExecutiveResearchResult
+from demo.usage import get_usage_recorder
+from demo.workflow import AgentOSCandidateWorkflow
+from tests.test_research_cache import _research
+
+CONTEXT = {
+    "candidate_name": "Jane Smith",
+    "current_title": "CFO",
+    "current_company": "TechCorp",
+    "linkedin_url": "",
+}
+
+
+def _tiered_research(**kwargs) -> ExecutiveResearchResult:
+    model_id = "o4-mini-deep-research" if kwargs["use_deep_research"] else "gpt-5"
+    get_usage_recorder().record(
+        model_id, Metrics(input_tokens=100, output_tokens=10), 0.1
+    )
+    research = _research()
+    research.research_model = model_id
+    return research
+
+
+@pytest.fixture
+def workflow():
+    with patch("demo.workflow.settings.openai.research_tiered", True):
+        yield AgentOSCandidateWorkflow(logging.getLogger("test.research_tiers"))
+
+
+def test_fast_research_escalates_on_quality_miss(workflow) -> None:
+    with (
+        patch("demo.workflow.run_research", side_effect=_tiered_research) as research,
+        patch(
+            "demo.workflow.check_research_quality",
+            side_effect=lambda result: result.research_model != "gpt-5",
+        ),
+    ):
+        result, tiers = workflow._run_research_tiers(CONTEXT)
+
+    assert [call.kwargs["use_deep_research"] for call in research.call_args_list] == [
+        False,
+        True,
+    ]
+    assert result.research_model == "o4-mini-deep-research"
+    assert [(tier["tier"], tier["escalated"]) for tier in tiers] == [
+        ("fast", True),
+        ("deep", False),
+    ]
+    assert tiers[0]["models"] == ["gpt-5"]
+    assert tiers[1]["input_tokens"] == 100
+
+
+def test_fast_research_that_passes_is_kept(workflow) -> None:
+    arun = AsyncMock(side_effect=_tiered_research)
+    with (
+        patch("demo.workflow.arun_research", arun),
+        patch("demo.workflow.check_research_quality", return_value=True),
+    ):
+        result, tiers = asyncio.run(workflow._arun_research_tiers(CONTEXT))
+
+    assert arun.await_count == 1
+    assert result.research_model == "gpt-5"
+    assert tiers[0]["tier"] == "fast"
+    assert tiers[0]["quality_ok"] is True
+    assert tiers[0]["output_tokens"] == 10
+
+
+def test_fast_research_failure_escalates(workflow) -> None:
+    def fail_fast(**kwargs) -> ExecutiveResearchResult:
+        if not kwargs["use_deep_research"]:
+            raise RuntimeError("fast research agent failed")
+        return _research()
+
+    with (
+        patch("demo.workflow.run_research", side_effect=fail_fast),
+        patch("demo.workflow.check_research_quality", return_value=True),
+    ):
+        _, tiers = workflow._run_research_tiers(CONTEXT)
+
+    assert tiers[0]["error"] == "fast research agent failed"
+    assert tiers[1]["tier"] == "deep"
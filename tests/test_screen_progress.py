@@ -0,0 +1,150 @@
+"""Tests for debounced screen progress reporting."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from unittest.mock import MagicMock
+
+from demo.airtable_writer import AirtableBatchWriter
+from demo.screen_progress import ScreenProgressReporter
+from demo.screening_service import aprocess_screen_direct, process_screen_direct
+from tests.test_airtable_writer import _client
+from tests.test_concurrency import _assessment
+
+FIELD = "Progress"
+
+
+def _reporter(airtable: MagicMock, interval: float) -> ScreenProgressReporter:
+    return ScreenProgressReporter(
+        airtable, "recScreen", 5, field=FIELD, interval_seconds=interval
+    )
+
+
+def _wait_for_calls(mock: MagicMock, count: int) -> None:
+    deadline = time.monotonic() + 2
+    while mock.call_count < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert mock.call_count == count
+
+
+def test_changes_within_the_interval_are_merged_into_the_final_fields() -> None:
+    airtable = MagicMock()
+    progress = _reporter(airtable, interval=60)
+
+    progress.started()
+    _wait_for_calls(airtable.update_screen_fields, 1)
+    for _ in range(3):
+        progress.started()
+    progress.finished({"candidate_id": "recC0"}, None)
+    progress.finished({"candidate_id": "recC1", "status": "deferred"}, None)
+    progress.finished(None, {"candidate_id": "recC2", "error": "boom"})
+
+    assert progress.close() == {
+        FIELD: "1/5 assessed, 1 failed, 1 deferred, 1 in progress"
+    }
+    time.sleep(0.05)
+    airtable.update_screen_fields.assert_called_once_with(
+        "recScreen", {FIELD: "0/5 assessed, 0 failed, 1 in progress"}
+    )
+
+
+def test_pushes_are_spaced_by_the_interval() -> None:
+    airtable = MagicMock()
+    progress = _reporter(airtable, interval=0.2)
+
+    progress.resumed(2)
+    _wait_for_calls(airtable.update_screen_fields, 1)
+    progress.started()
+    progress.finished({"candidate_id": "recC2"}, None)
+    progress.started()
+    time.sleep(0.1)
+    airtable.update_screen_fields.assert_called_once()
+
+    _wait_for_calls(airtable.update_screen_fields, 2)
+    assert airtable.update_screen_fields.call_args.args[1] == {
+        FIELD: "3/5 assessed, 0 failed, 1 in progress"
+    }
+    progress.close()
+
+
+def test_failed_push_is_logged_not_raised(caplog) -> None:
+    airtable = MagicMock()
+    airtable.update_screen_fields.side_effect = RuntimeError("Airtable down")
+    progress = _reporter(airtable, interval=60)
+
+    with caplog.at_level(logging.WARNING, logger="demo.screen_progress"):
+        progress.started()
+        _wait_for_calls(airtable.update_screen_fields, 1)
+        progress.close()
+
+    assert "Failed to report progress for screen recScreen" in caplog.text
+
+
+def test_final_progress_is_sent_with_the_complete_status(monkeypatch) -> None:
+    monkeypatch.setattr("demo.screen_progress.settings.screening.progress_field", FIELD)
+    writer = AirtableBatchWriter(flush_seconds=0.05)
+    client = _client(writer)
+    candidates = [{"id": f"recC{n}", "name": f"C{n}"} for n in range(4)]
+
+    async def runner(*args):
+        return _assessment(), None
+
+    asyncio.run(
+        aprocess_screen_direct(
+            screen_id="recScreen",
+            role_spec_markdown="# Spec",
+            candidates=candidates,
+            custom_instructions=None,
+            airtable=client,
+            logger=logging.getLogger("test.screen_progress"),
+            candidate_runner=runner,
+            max_concurrency=2,
+        )
+    )
+
+    final = client.screens.update.call_args_list[-1]
+    assert final.args == (
+        "recScreen",
+        {FIELD: "4/4 assessed, 0 failed, 0 in progress", "Status": "Complete"},
+    )
+    writer.close()
+
+
+def test_progress_can_be_disabled(monkeypatch) -> None:
+    airtable = MagicMock()
+    monkeypatch.setattr("demo.screen_progress.settings.screening.progress_field", FIELD)
+    monkeypatch.setattr(
+        "demo.screen_progress.settings.screening.progress_enabled", False
+    )
+
+    process_screen_direct(
+        screen_id="recScreen",
+        role_spec_markdown="# Spec",
+        candidates=[{"id": "recC0", "name": "C0"}],
+        custom_instructions=None,
+        airtable=airtable,
+        logger=logging.getLogger("test.screen_progress"),
+        candidate_runner=lambda *args: (_assessment(), None),
+    )
+
+    airtable.update_screen_fields.assert_not_called()
+    assert airtable.update_screen_status.call_args.kwargs["fields"] is None
+
+
+def test_progress_is_off_until_a_field_is_configured() -> None:
+    airtable = MagicMock()
+
+    process_screen_direct(
+        screen_id="recScreen",
+        role_spec_markdown="# Spec",
+        candidates=[{"id": "recC0", "name": "C0"}],
+        custom_instructions=None,
+        airtable=airtable,
+        logger=logging.getLogger("test.screen_progress"),
+        candidate_runner=lambda *args: (_assessment(), None),
+    )
+
+    airtable.update_screen_fields.assert_not_called()
+    assert airtable.update_screen_status.call_args.kwargs["fields"] is None
@@ -0,0 +1,214 @@
+"""Tests for the screening service batch executors and screen entrypoints."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from demo.models import AssessmentResult, DimensionScore
+from demo.screening_service import (
+    LogSymbols,
+    _process_candidate_batch,
+    aprocess_screen_direct,
+    process_screen_direct,
+)
+
+logger = logging.getLogger("test.screening_service")
+
+
+def _assessment(score: float) -> AssessmentResult:
+    return AssessmentResult(
+        overall_score=score,
+        overall_confidence="Medium",
+        dimension_scores=[
+            DimensionScore(
+                dimension="Leadership",
+                score=4,
+                evidence_level="Medium",
+                confidence="Medium",
+                reasoning="Evidence of team leadership.",
+            )
+        ],
+        summary=f"Scored {score}",
+        assessment_timestamp=datetime(2025, 11, 18, 12, 0, 0),
+    )
+
+
+@pytest.fixture
+def airtable() -> MagicMock:
+    """Airtable client double that returns a record ID per candidate."""
+
+    client = MagicMock()
+    client.write_assessment.side_effect = lambda **kwargs: (
+        f"recAssess_{kwargs['candidate_id']}"
+    )
+    return client
+
+
+@pytest.fixture
+def candidates() -> list[dict[str, str]]:
+    return [
+        {"id": f"recC{index}", "name": f"Candidate {index}", "title": "CFO"}
+        for index in range(6)
+    ]
+
+
+def test_batch_preserves_input_order(airtable, candidates) -> None:
+    """Results come back in payload order even when later candidates finish first."""
+
+    def runner(candidate, role_spec, screen_id, custom_instructions):
+        index = int(candidate["id"].removeprefix("recC"))
+        time.sleep(0.01 * (len(candidates) - index))
+        return _assessment(float(index)), None
+
+    results, errors = _process_candidate_batch(
+        candidates=candidates,
+        role_spec_markdown="# Spec",
+        screen_id="recScreen",
+        airtable=airtable,
+        candidate_runner=runner,
+        logger=logger,
+        symbols=LogSymbols(),
+        max_concurrency=6,
+    )
+
+    assert errors == []
+    assert [r["candidate_id"] for r in results] == [c["id"] for c in candidates]
+    assert [r["assessment_id"] for r in results] == [
+        f"recAssess_{c['id']}" for c in candidates
+    ]
+
+
+def test_batch_respects_max_concurrency(airtable, candidates) -> None:
+    """No more than ``max_concurrency`` candidates run at the same time."""
+
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def runner(candidate, role_spec, screen_id, custom_instructions):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return _assessment(50.0), None
+
+    results, _ = _process_candidate_batch(
+        candidates=candidates,
+        role_spec_markdown="# Spec",
+        screen_id="recScreen",
+        airtable=airtable,
+        candidate_runner=runner,
+        logger=logger,
+        symbols=LogSymbols(),
+        max_concurrency=2,
+    )
+
+    assert len(results) == len(candidates)
+    assert 1 < peak <= 2
+
+
+def test_batch_isolates_candidate_failures(airtable, candidates) -> None:
+    """A failing candidate is reported in errors without affecting others."""
+
+    def runner(candidate, role_spec, screen_id, custom_instructions):
+        if candidate["id"] == "recC2":
+            raise RuntimeError("Research agent failed")
+        return _assessment(70.0), None
+
+    batch = [*candidates[:4], {"name": "No ID"}]
+    results, errors = _process_candidate_batch(
+        candidates=batch,
+        role_spec_markdown="# Spec",
+        screen_id="recScreen",
+        airtable=airtable,
+        candidate_runner=runner,
+        logger=logger,
+        symbols=LogSymbols(),
+        max_concurrency=3,
+    )
+
+    assert [r["candidate_id"] for r in results] == ["recC0", "recC1", "recC3"]
+    assert errors == [
+        {"candidate_id": "recC2", "error": "Research agent failed"},
+        {"candidate_id": "unknown", "error": "Candidate record missing ID."},
+    ]
+
+
+def test_process_screen_direct_returns_ordered_payload(airtable, candidates) -> None:
+    """End-to-end service call aggregates results and updates screen status."""
+
+    def runner(candidate, role_spec, screen_id, custom_instructions):
+        return _assessment(80.0), None
+
+    payload = process_screen_direct(
+        screen_id="recScreen",
+        role_spec_markdown="# Spec",
+        candidates=candidates,
+        custom_instructions=None,
+        airtable=airtable,
+        logger=logger,
+        candidate_runner=runner,
+        max_concurrency=4,
+    )
+
+    assert payload["status"] == "success"
+    assert payload["candidates_total"] == len(candidates)
+    assert payload["candidates_processed"] == len(candidates)
+    assert [r["candidate_id"] for r in payload["results"]] == [
+        c["id"] for c in candidates
+    ]
+    statuses = [
+        call.kwargs.get("status")
+        for call in airtable.update_screen_status.call_args_list
+    ]
+    assert statuses == ["Processing", "Complete"]
+
+
+def test_aprocess_screen_direct_multiplexes_candidates(airtable, candidates) -> None:
+    """Async service bounds in-flight candidates and keeps payload order."""
+
+    in_flight = 0
+    peak = 0
+
+    async def runner(candidate, role_spec, screen_id, custom_instructions):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        index = int(candidate["id"].removeprefix("recC"))
+        await asyncio.sleep(0.01 * (len(candidates) - index))
+        in_flight -= 1
+        if index == 1:
+            raise RuntimeError("Assessment agent failed")
+        return _assessment(float(index)), None
+
+    payload = asyncio.run(
+        aprocess_screen_direct(
+            screen_id="recScreen",
+            role_spec_markdown="# Spec",
+            candidates=candidates,
+            custom_instructions=None,
+            airtable=airtable,
+            logger=logger,
+            candidate_runner=runner,
+            max_concurrency=3,
+        )
+    )
+
+    assert peak == 3
+    assert payload["status"] == "partial"
+    assert [r["candidate_id"] for r in payload["results"]] == [
+        c["id"] for c in candidates if c["id"] != "recC1"
+    ]
+    assert payload["errors"] == [
+        {"candidate_id": "recC1", "error": "Assessment agent failed"}
+    ]
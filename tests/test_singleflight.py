@@ -0,0 +1,98 @@
+"""Tests for in-flight call coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from unittest.mock import patch
+
+from demo.singleflight import SingleFlight
+from demo.workflow import AgentOSCandidateWorkflow, _research_flights
+from tests.test_research_cache import CANDIDATE, _assessment, _research
+
+
+def test_concurrent_threads_share_one_execution() -> None:
+    flight: SingleFlight[int] = SingleFlight()
+    calls = 0
+    started = threading.Event()
+
+    def work() -> int:
+        nonlocal calls
+        calls += 1
+        started.set()
+        time.sleep(0.05)
+        return 42
+
+    results: list[tuple[int, bool]] = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", work)))
+    leader.start()
+    started.wait()
+    results.append(flight.do("k", work))
+    leader.join()
+
+    assert calls == 1
+    assert sorted(results) == [(42, False), (42, True)]
+    assert flight.in_flight() == 0
+    # Finished calls are not cached.
+    assert flight.do("k", work) == (42, False)
+
+
+def test_followers_share_errors_and_take_over_from_cancelled_leader() -> None:
+    flight: SingleFlight[str] = SingleFlight()
+
+    async def failing() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("research failed")
+
+    async def slow() -> str:
+        await asyncio.sleep(10)
+        return "leader"
+
+    async def fast() -> str:
+        return "follower"
+
+    async def scenario() -> str:
+        results = await asyncio.gather(
+            flight.ado("a", failing), flight.ado("a", failing), return_exceptions=True
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert flight.executions == 1
+
+        leader = asyncio.create_task(flight.ado("b", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.ado("b", fast))
+        await asyncio.sleep(0)
+        leader.cancel()
+        value, joined = await follower
+        assert not joined
+        return value
+
+    assert asyncio.run(scenario()) == "follower"
+
+
+def test_overlapping_screens_run_research_once() -> None:
+    workflow = AgentOSCandidateWorkflow(logging.getLogger("test.singleflight"))
+
+    async def slow_research(**_: object):
+        await asyncio.sleep(0.05)
+        return _research()
+
+    async def screens():
+        return await asyncio.gather(
+            workflow.arun_candidate_workflow(CANDIDATE, "# CFO", "recScreenSF1"),
+            workflow.arun_candidate_workflow(CANDIDATE, "# COO", "recScreenSF2"),
+        )
+
+    with (
+        patch("demo.research_cache.settings.cache.research_enabled", False),
+        patch("demo.workflow.arun_research", side_effect=slow_research) as research,
+        patch("demo.workflow.check_research_quality", return_value=True),
+        patch("demo.workflow.aassess_candidate", return_value=_assessment()),
+    ):
+        results = asyncio.run(screens())
+
+    research.assert_called_once()
+    assert _research_flights.in_flight() == 0
+    assert [research_result for _, research_result in results] == [_research()] * 2
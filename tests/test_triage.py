@@ -0,0 +1,139 @@
+"""Tests for the pre-screen triage step."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from demo.models import TriageResult
+from demo.pipeline import StagedScreeningPipeline
+from demo.research_cache import get_research_cache, research_cache_key
+from demo.triage import get_triage_stats, triage_by_title
+from demo.workflow import AgentOSCandidateWorkflow
+from tests.test_research_cache import _assessment, _research
+
+CTO_CANDIDATE = {
+    "id": "recCandidateCTO",
+    "name": "Jonathan Hyman",
+    "title": "Cofounder & CTO",
+    "company": "Braze",
+    "linkedin": "",
+    "bio": "Built Braze's engineering org from zero.",
+}
+
+
+@pytest.mark.parametrize(
+    ("title", "role_type", "verdict", "conclusive"),
+    [
+        ("VP Finance", "CFO", "advance", True),
+        ("CFO", "Chief Financial Officer", "advance", True),
+        ("Cofounder & CTO", "CFO", "deprioritize", False),
+        ("Founder", "CFO", "advance", False),
+        ("Founder & CEO", "Chief of Staff", "advance", True),
+    ],
+)
+def test_title_triage(title: str, role_type: str, verdict: str, conclusive: bool):
+    decision = triage_by_title(title, role_type)
+
+    assert (decision.verdict, decision.conclusive) == (verdict, conclusive)
+
+
+@pytest.fixture
+def workflow():
+    with patch("demo.workflow.settings.screening.triage_enabled", True):
+        yield AgentOSCandidateWorkflow(logging.getLogger("test.triage"))
+
+
+def _run(workflow: AgentOSCandidateWorkflow, verdict: str):
+    with (
+        patch(
+            "demo.workflow.triage_candidate_fit",
+            return_value=TriageResult(verdict=verdict, reason="Engineering only"),
+        ) as triage,
+        patch("demo.workflow.run_research", return_value=_research()) as research,
+        patch("demo.workflow.check_research_quality", return_value=True),
+        patch("demo.workflow.assess_candidate", return_value=_assessment()),
+    ):
+        assessment, result = workflow.run_candidate_workflow(
+            CTO_CANDIDATE,
+            "# CFO Spec",
+            f"recScreen{uuid4().hex[:8]}",
+            role_type="CFO",
+        )
+    return triage, research, assessment, result
+
+
+def test_dropped_candidates_skip_research_and_assessment(workflow) -> None:
+    triage, research, assessment, result = _run(workflow, "drop")
+
+    assert triage.call_args.kwargs["bio"] == CTO_CANDIDATE["bio"]
+    research.assert_not_called()
+    assert result is None
+    assert assessment.overall_score is None
+    assert assessment.summary.startswith("Not researched")
+    assert get_triage_stats().snapshot() == {
+        "evaluated": 1,
+        "model_checks": 1,
+        "advanced": 0,
+        "deprioritized": 0,
+        "dropped": 1,
+        "deep_research_avoided": 1,
+        "assessments_avoided": 1,
+    }
+
+
+def test_deprioritized_candidates_get_fast_research_only(workflow) -> None:
+    _, research, assessment, _ = _run(workflow, "deprioritize")
+
+    assert research.call_args.kwargs["use_deep_research"] is False
+    assert assessment.summary == _assessment().summary
+    assert (
+        get_research_cache().get(research_cache_key("Jonathan Hyman", "Braze", ""))
+        is None
+    )
+    assert get_triage_stats().snapshot()["deep_research_avoided"] == 1
+
+
+def test_triage_is_skipped_without_role_type(workflow) -> None:
+    with (
+        patch("demo.workflow.triage_candidate_fit") as triage,
+        patch("demo.workflow.run_research", return_value=_research()) as research,
+        patch("demo.workflow.check_research_quality", return_value=True),
+        patch("demo.workflow.assess_candidate", return_value=_assessment()),
+    ):
+        workflow.run_candidate_workflow(
+            CTO_CANDIDATE, "# CFO Spec", f"recScreen{uuid4().hex[:8]}"
+        )
+
+    triage.assert_not_called()
+    assert research.call_args.kwargs["use_deep_research"] is True
+    assert get_triage_stats().snapshot()["evaluated"] == 0
+
+
+def test_pipeline_resolves_dropped_candidates_at_the_research_stage(workflow) -> None:
+    async def run():
+        pipeline = StagedScreeningPipeline(workflow)
+        try:
+            return await pipeline.run_candidate(
+                CTO_CANDIDATE, "# CFO Spec", "recScreenTriage", role_type="CFO"
+            )
+        finally:
+            await pipeline.shutdown()
+
+    research = AsyncMock()
+    with (
+        patch(
+            "demo.workflow.atriage_candidate_fit",
+            AsyncMock(return_value=TriageResult(verdict="drop", reason="CTO")),
+        ),
+        patch("demo.workflow.arun_research", research),
+    ):
+        assessment, result = asyncio.run(run())
+
+    research.assert_not_awaited()
+    assert result is None
+    assert assessment.assessment_model == "triage:model"
@@ -0,0 +1,68 @@
+"""Tests for stable prompt prefixes and prompt-cache usage recording."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from unittest.mock import patch
+
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.openai import OpenAIResponses
+from agno.models.response import ModelResponse
+
+from demo.agents import (
+    _build_assessment_prompt,
+    _build_batched_assessment_prompt,
+    create_assessment_agent,
+    create_research_agent,
+)
+from demo.rate_limit import RateLimitedOpenAIResponses
+from demo.usage import get_usage_recorder
+from tests.test_fanout import TARGETS
+from tests.test_research_cache import _research
+
+
+def test_assessment_prompts_share_a_prefix_up_to_the_research() -> None:
+    other = _research()
+    other.exec_name = "Alex Doe"
+    first = _build_assessment_prompt(_research(), "# Spec", "Focus on SaaS")
+    second = _build_assessment_prompt(other, "# Spec", "Focus on SaaS")
+
+    prefix = os.path.commonprefix([first, second])
+    assert prefix.endswith("CANDIDATE RESEARCH:\nCandidate: ")
+    assert "Focus on SaaS" in prefix
+    batched = _build_batched_assessment_prompt(_research(), TARGETS)
+    assert batched.index("CANDIDATE RESEARCH:") > batched.index("[spec_id=S2]")
+
+
+def test_system_messages_carry_no_timestamp() -> None:
+    for agent in (create_research_agent(), create_assessment_agent()):
+        assert agent.add_datetime_to_context is False
+
+
+def test_model_calls_record_cached_tokens() -> None:
+    model = RateLimitedOpenAIResponses(id="gpt-untracked")
+    response = ModelResponse(content="ok")
+    response.response_usage = Metrics(
+        input_tokens=2000, cache_read_tokens=1536, output_tokens=100
+    )
+    messages = [Message(role="user", content="x")]
+
+    with patch.object(OpenAIResponses, "ainvoke", return_value=response):
+        asyncio.run(model.ainvoke(messages, Message(role="assistant")))
+    with patch.object(
+        OpenAIResponses,
+        "invoke",
+        return_value=ModelResponse(
+            content="ok", response_usage=Metrics(input_tokens=2000)
+        ),
+    ):
+        model.invoke(messages, Message(role="assistant"))
+
+    usage = get_usage_recorder().snapshot()["gpt-untracked"]
+    assert usage["calls"] == 2
+    assert usage["cached_calls"] == 1
+    assert usage["cache_hit_rate"] == round(1536 / 4000, 3)
+    assert usage["avg_latency_cached"] is not None
+    assert usage["avg_latency_uncached"] is not None
@@ -0,0 +1,156 @@
+"""Tests for resuming candidate workflows from the first incomplete step."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from demo.workflow import AgentOSCandidateWorkflow
+from tests.test_research_cache import CANDIDATE, _assessment, _research
+
+RAW = {"markdown": "# Jane Smith\nCFO at TechCorp", "citations": []}
+
+
+def _screen_id() -> str:
+    return f"recScreen{uuid4().hex[:8]}"
+
+
+def _run(workflow: AgentOSCandidateWorkflow, screen_id: str, **kwargs):
+    return workflow.run_candidate_workflow(CANDIDATE, "# CFO spec", screen_id, **kwargs)
+
+
+def test_rerun_after_assessment_failure_skips_research() -> None:
+    workflow = AgentOSCandidateWorkflow(logging.getLogger("test.resume"))
+    screen_id = _screen_id()
+
+    with (
+        patch("demo.workflow.run_research", return_value=_research()) as research,
+        patch("demo.workflow.check_research_quality", return_value=True) as quality,
+        patch(
+            "demo.workflow.assess_candidate",
+            side_effect=RuntimeError("assessment parser failed"),
+        ),
+        pytest.raises(RuntimeError, match="assessment parser failed"),
+    ):
+        _run(workflow, screen_id)
+
+    with (
+        patch("demo.workflow.run_research", return_value=_research()) as rerun,
+        patch("demo.workflow.check_research_quality", return_value=True) as requality,
+        patch("demo.workflow.assess_candidate", return_value=_assessment()),
+    ):
+        assessment, research_result = _run(workflow, screen_id)
+
+    assert research.call_count == 1
+    assert quality.call_count == 1
+    assert rerun.call_count == 0
+    assert requality.call_count == 0
+    assert assessment == _assessment()
+    assert research_result == _research()
+
+
+def test_parser_failure_reuses_checkpointed_deep_research() -> None:
+    workflow = AgentOSCandidateWorkflow(logging.getLogger("test.resume"))
+    screen_id = _screen_id()
+    raw_inputs: list[object] = []
+
+    def research(**kwargs):
+        raw_inputs.append(kwargs.get("raw_research"))
+        if kwargs.get("raw_research") is None:
+            kwargs["on_raw_research"](dict(RAW))
+            raise RuntimeError("parser returned invalid JSON")
+        return _research()
+
+    with (
+        patch("demo.workflow.settings.openai.research_tiered", False),
+        patch("demo.workflow.run_research", side_effect=research),
+        patch("demo.workflow.check_research_quality", return_value=True),
+        patch("demo.workflow.assess_candidate", return_value=_assessment()),
+    ):
+        assessment, _ = _run(workflow, screen_id)
+
+    # The step retry parses the saved markdown instead of calling Deep Research.
+    assert raw_inputs == [None, RAW]
+    assert assessment == _assessment()
+
+
+def test_force_rerun_repeats_completed_steps() -> None:
+    workflow = AgentOSCandidateWorkflow(logging.getLogger("test.resume"))
+    screen_id = _screen_id()
+
+    with (
+        patch("demo.workflow.run_research", return_value=_research()),
+        patch("demo.workflow.check_research_quality", return_value=True),
+        patch(
+            "demo.workflow.assess_candidate",
+            side_effect=RuntimeError("assessment parser failed"),
+        ),
+        pytest.raises(RuntimeError, match="assessment parser failed"),
+    ):
+        _run(workflow, screen_id)
+
+    with (
+        patch("demo.workflow.run_research", return_value=_research()),
+        patch("demo.workflow.check_research_quality", return_value=True) as quality,
+        patch("demo.workflow.assess_candidate", return_value=_assessment()),
+    ):
+        _run(workflow, screen_id, force_rerun=True)
+
+    assert quality.call_count == 1
+
+
+def test_completed_or_changed_runs_start_fresh() -> None:
+    workflow = AgentOSCandidateWorkflow(logging.getLogger("test.resume"))
+    screen_id = _screen_id()
+
+    with (
+        patch("demo.workflow.run_research", return_value=_research()),
+        patch("demo.workflow.check_research_quality", return_value=True) as quality,
+        patch("demo.workflow.assess_candidate", return_value=_assessment()) as assess,
+    ):
+        _run(workflow, screen_id)
+        _run(workflow, screen_id)
+        workflow.run_candidate_workflow(CANDIDATE, "# New spec", screen_id)
+
+    assert quality.call_count == 3
+    assert assess.call_count == 3
+
+
+def test_async_rerun_resumes_after_assessment_failure() -> None:
+    workflow = AgentOSCandidateWorkflow(logging.getLogger("test.resume"))
+    screen_id = _screen_id()
+
+    async def failing_assessment(**kwargs):
+        raise RuntimeError("assessment parser failed")
+
+    async def assessment(**kwargs):
+        return _assessment()
+
+    async def research(**kwargs):
+        return _research()
+
+    async def run() -> None:
+        with (
+            patch("demo.workflow.arun_research", side_effect=research) as first,
+            patch("demo.workflow.check_research_quality", return_value=True),
+            patch("demo.workflow.aassess_candidate", side_effect=failing_assessment),
+            pytest.raises(RuntimeError, match="assessment parser failed"),
+        ):
+            await workflow.arun_candidate_workflow(CANDIDATE, "# CFO", screen_id)
+        with (
+            patch("demo.workflow.arun_research", side_effect=research) as second,
+            patch("demo.workflow.check_research_quality", return_value=True),
+            patch("demo.workflow.aassess_candidate", side_effect=assessment),
+        ):
+            result, _ = await workflow.arun_candidate_workflow(
+                CANDIDATE, "# CFO", screen_id
+            )
+        assert first.call_count == 1
+        assert second.call_count == 0
+        assert result == _assessment()
+
+    asyncio.run(run())